@@ -41,6 +41,7 @@ except PackageNotFoundError:
 # ── Core ──────────────────────────────────────────────────────────────────
 from .figure   import Figure, SubplotGrid
 from .layout   import Axes, grid
+from .report   import Report
 from .themes   import themes
 from .utils    import normalize
 from .plot     import plot
@@ -66,6 +67,7 @@ from .kde           import KDESeries
 from .raincloud     import RaincloudSeries
 from .stat_annotation import StatAnnotation, pvalue_to_label
 from .violin_plot   import ViolinPlotSeries
+from .sketch        import LogBucketSketch
 
 # ── Financial ────────────────────────────────────────────────────────────
 from .candlestick   import CandlestickSeries
@@ -73,6 +75,7 @@ from .waterfall     import WaterfallSeries
 
 # ── Hierarchical ─────────────────────────────────────────────────────────
 from .treemap       import TreemapSeries
+from .hierarchy     import HierarchyIndex
 
 # ── Streaming / real-time ────────────────────────────────────────────────
 from .streaming     import StreamingSeries
@@ -100,7 +103,7 @@ from .gantt            import GanttSeries
 from .clustermap       import clustermap
 from .facet_grid       import FacetGrid
 from .regplot          import regplot
-from .choropleth       import ChoroplethSeries
+from .choropleth       import ChoroplethSeries, GeoBaseMap
 from .vega_lite        import to_vega_lite, save_vega_lite
 from .suggest          import suggest, Recommendation
 from .sparkline        import SparklineSeries, sparkline_svg
@@ -112,6 +115,7 @@ from .downsample       import (
     voxel_thin_2d, voxel_thin_3d, lttb_3d,
     decimate_grid, cull_faces,
     enable as ds_enable, disable as ds_disable, is_enabled as ds_is_enabled,
+    cache_info as ds_cache_info, cache_clear as ds_cache_clear,
     AUTO_THRESHOLD,
 )
 
@@ -126,7 +130,7 @@ from . import accessor as _accessor  # noqa: F401
 
 __all__ = [
     # Core
-    "Figure", "SubplotGrid", "Axes", "grid", "themes", "normalize",
+    "Figure", "SubplotGrid", "Axes", "grid", "Report", "themes", "normalize",
     "plot", "from_prompt",
     # Colormaps
     "apply_colormap", "colormap_colors", "list_colormaps", "get_colormap",
@@ -136,11 +140,11 @@ __all__ = [
     "HeatmapSeries", "BoxPlotSeries",
     # Statistical
     "ECDFSeries", "RaincloudSeries", "ViolinPlotSeries",
-    "StatAnnotation", "pvalue_to_label",
+    "StatAnnotation", "pvalue_to_label", "LogBucketSketch",
     # Financial
     "CandlestickSeries", "WaterfallSeries",
     # Hierarchical
-    "TreemapSeries",
+    "TreemapSeries", "HierarchyIndex",
     # Streaming
     "StreamingSeries",
     # Advanced
@@ -155,9 +159,11 @@ __all__ = [
     "voxel_thin_2d", "voxel_thin_3d", "lttb_3d",
     "decimate_grid", "cull_faces",
     "ds_enable", "ds_disable", "ds_is_enabled", "AUTO_THRESHOLD",
+    "ds_cache_info", "ds_cache_clear",
     "StackedBarSeries", "BumpChartSeries", "GanttSeries",
     "suggest", "Recommendation",
     "clustermap", "FacetGrid", "regplot", "ChoroplethSeries",
+    "GeoBaseMap",
     "to_vega_lite", "save_vega_lite",
     "SparklineSeries", "sparkline_svg",
     # 3D
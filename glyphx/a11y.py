@@ -9,6 +9,10 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from .utils import _is_empty
+
 if TYPE_CHECKING:
     from .figure import Figure
 
@@ -79,7 +83,7 @@ def generate_alt_text(fig: Figure) -> str:
             )
             continue
 
-        if not x_vals or not y_vals:
+        if _is_empty(x_vals) or _is_empty(y_vals):
             continue
 
         lbl = f'Series "{s.label}"' if getattr(s, "label", None) else "Series"
@@ -90,16 +94,14 @@ def generate_alt_text(fig: Figure) -> str:
 
         # Range (numeric y only)
         try:
-            numeric_y = [float(v) for v in y_vals]
-            numeric_x = list(x_vals)
-            mn  = min(numeric_y)
-            mx  = max(numeric_y)
-            # Use enumerate to find indices safely
-            mn_idx = next(i for i, v in enumerate(numeric_y) if v == mn)
-            mx_idx = next(i for i, v in enumerate(numeric_y) if v == mx)
-
-            mn_x = numeric_x[mn_idx] if mn_idx < len(numeric_x) else "?"
-            mx_x = numeric_x[mx_idx] if mx_idx < len(numeric_x) else "?"
+            numeric_y = np.asarray(y_vals, dtype=float)
+            mn_idx = int(np.nanargmin(numeric_y))
+            mx_idx = int(np.nanargmax(numeric_y))
+            mn  = numeric_y[mn_idx]
+            mx  = numeric_y[mx_idx]
+
+            mn_x = x_vals[mn_idx] if mn_idx < len(x_vals) else "?"
+            mx_x = x_vals[mx_idx] if mx_idx < len(x_vals) else "?"
 
             parts.append(
                 f"Ranges from {mn:.3g} (at {mn_x}) "
@@ -26,6 +26,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -46,11 +47,27 @@ class GlyphXAccessor:
 
     # ── Internal helpers ─────────────────────────────────────────────────
 
-    def _col(self, name: str | None) -> list | None:
-        """Return column as list, or None if name is None / not in df."""
+    def _col(self, name: str | None) -> np.ndarray | None:
+        """Return column as a NumPy array, or None if name is None / not in df.
+
+        Uses ``Series.to_numpy()``, which is a zero-copy view for numeric
+        columns, instead of materialising a Python list.
+        """
         if name is None or name not in self._df.columns:
             return None
-        return self._df[name].tolist()
+        return self._df[name].to_numpy()
+
+    def _x_col(self, name: str | None) -> np.ndarray:
+        """Return column ``name``, falling back to the row positions."""
+        col = self._col(name)
+        return np.arange(len(self._df)) if col is None else col
+
+    def _y_col(self, name: str | None) -> np.ndarray:
+        """Return column ``name``, falling back to the first numeric column."""
+        col = self._col(name)
+        if col is None:
+            col = self._df.select_dtypes("number").iloc[:, 0].to_numpy()
+        return col
 
     def _fig(
         self,
@@ -120,15 +137,15 @@ class GlyphXAccessor:
             theme_colors = fig.theme.get("colors", ["#1f77b4", "#ff7f0e", "#2ca02c"])
             for i, (grp_val, grp_df) in enumerate(self._df.groupby(hue)):
                 fig.add(LineSeries(
-                    grp_df[x].tolist() if x else list(range(len(grp_df))),
-                    grp_df[y].tolist() if y else grp_df.select_dtypes("number").iloc[:, 0].tolist(),
+                    grp_df[x].to_numpy() if x else np.arange(len(grp_df)),
+                    grp_df[y].to_numpy() if y else grp_df.select_dtypes("number").iloc[:, 0].to_numpy(),
                     color=theme_colors[i % len(theme_colors)],
                     label=str(grp_val),
                     linestyle=linestyle,
                 ))
         else:
-            x_data = self._col(x) or list(range(len(self._df)))
-            y_data = self._col(y) or self._df.select_dtypes("number").iloc[:, 0].tolist()
+            x_data = self._x_col(x)
+            y_data = self._y_col(y)
             err    = self._col(yerr)
             fig.add(LineSeries(
                 x_data, y_data,
@@ -191,8 +208,8 @@ class GlyphXAccessor:
                 for i, hv in enumerate(hue_vals):
                     mask   = self._df[hue] == hv
                     grp_df = self._df[mask].copy()
-                    x_data = grp_df[x].tolist()
-                    y_data = grp_df[num_col].tolist()
+                    x_data = grp_df[x].to_numpy()
+                    y_data = grp_df[num_col].to_numpy()
                     fig.add(BarSeries(
                         x_data, y_data,
                         color=theme_colors[i % len(theme_colors)],
@@ -225,8 +242,8 @@ class GlyphXAccessor:
                         label=str(grp),
                     ))
         else:
-            x_data = self._col(x) or list(range(len(self._df)))
-            y_data = self._col(y) or self._df.select_dtypes("number").iloc[:, 0].tolist()
+            x_data = self._x_col(x)
+            y_data = self._y_col(y)
             err    = self._col(yerr)
             fig.add(BarSeries(
                 x_data, y_data,
@@ -265,15 +282,15 @@ class GlyphXAccessor:
             theme_colors = fig.theme.get("colors", ["#1f77b4", "#ff7f0e", "#2ca02c"])
             for i, (grp_val, grp_df) in enumerate(self._df.groupby(hue)):
                 fig.add(ScatterSeries(
-                    grp_df[x].tolist() if x else list(range(len(grp_df))),
-                    grp_df[y].tolist() if y else grp_df.select_dtypes("number").iloc[:, 0].tolist(),
+                    grp_df[x].to_numpy() if x else np.arange(len(grp_df)),
+                    grp_df[y].to_numpy() if y else grp_df.select_dtypes("number").iloc[:, 0].to_numpy(),
                     color=theme_colors[i % len(theme_colors)],
                     label=str(grp_val),
                     size=size, marker=marker,
                 ))
         else:
-            x_data = self._col(x) or list(range(len(self._df)))
-            y_data = self._col(y) or self._df.select_dtypes("number").iloc[:, 0].tolist()
+            x_data = self._x_col(x)
+            y_data = self._y_col(y)
             fig.add(ScatterSeries(
                 x_data, y_data,
                 color=color, label=label or y,
@@ -301,7 +318,7 @@ class GlyphXAccessor:
         from .series import HistogramSeries
 
         target = col or self._df.select_dtypes("number").columns[0]
-        data   = self._df[target].dropna().tolist()
+        data   = self._df[target].dropna().to_numpy()
 
         fig = self._fig(title, theme, "top-right", width, height,
                         xlabel or target, ylabel or "Count", auto_display)
@@ -355,7 +372,8 @@ class GlyphXAccessor:
         from .series import PieSeries
 
         lbl_data = self._col(labels)
-        val_data = self._col(values) or self._df.select_dtypes("number").iloc[:, 0].tolist()
+        lbl_data = None if lbl_data is None else lbl_data.tolist()
+        val_data = self._y_col(values).tolist()
 
         fig = self._fig(title, theme, False, width, height, None, None, auto_display)
         fig.add(PieSeries(val_data, labels=lbl_data, **kwargs))
@@ -375,8 +393,8 @@ class GlyphXAccessor:
         """Create a donut chart. Returns :class:`~glyphx.Figure`."""
         from .series import DonutSeries
 
-        lbl_data = [str(v) for v in (self._col(labels) or range(len(self._df)))]
-        val_data = self._col(values) or self._df.select_dtypes("number").iloc[:, 0].tolist()
+        lbl_data = [str(v) for v in self._x_col(labels)]
+        val_data = self._y_col(values).tolist()
 
         fig = self._fig(title, theme, False, width, height, None, None, auto_display)
         fig.add(DonutSeries(val_data, labels=lbl_data, **kwargs))
@@ -126,6 +126,12 @@
     allPoints.forEach(el => wirePoint(el, allPoints));
   }
 
+  // Charts mounted later (glyphx.Report): arrows move within the chart
+  (window.glyphxMounters = window.glyphxMounters || []).push(svg => {
+    const points = Array.from(svg.querySelectorAll(POINT_SEL));
+    points.forEach(el => wirePoint(el, points));
+  });
+
   if (document.readyState === 'loading') {
     document.addEventListener('DOMContentLoaded', init);
   } else {
@@ -211,6 +211,9 @@
   });
 
   // -- Init ------------------------------------------------------------------
+  // Charts mounted later (glyphx.Report) are wired through this hook
+  (window.glyphxMounters = window.glyphxMounters || []).push(wireChart);
+
   function init() {
     document.querySelectorAll('svg[data-glyphx]').forEach(wireChart);
   }
@@ -0,0 +1,131 @@
+/**
+ * GlyphX Report runtime
+ *
+ * Every chart of a glyphx.Report is shipped inert -- an SVG inside a
+ * <template>, or gzip + base64 text inside a data <script> -- and mounted
+ * into its placeholder only when it scrolls near the viewport.  The page
+ * therefore parses and lays out a handful of SVGs at load, not hundreds.
+ *
+ * Per-chart wiring (zoom, brush, keyboard) runs through window.glyphxMounters;
+ * tooltips and legend toggles are delegated from the document so they
+ * cover charts mounted at any time.
+ */
+(function () {
+  'use strict';
+
+  const SLOT_SEL = '.gx-slot';
+
+  // -- Decode a chart payload into a DocumentFragment ----------------------
+  function payload(slot) {
+    const src = document.getElementById(slot.dataset.src);
+    if (!src) return Promise.resolve(null);
+    if (src.tagName === 'TEMPLATE') {
+      return Promise.resolve(src.content.cloneNode(true));
+    }
+    const bytes = Uint8Array.from(atob(src.textContent.trim()), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream()
+      .pipeThrough(new DecompressionStream('gzip'));
+    return new Response(stream).text().then(text => {
+      const t = document.createElement('template');
+      t.innerHTML = text;
+      return t.content;
+    });
+  }
+
+  // -- Mount one chart (once) ----------------------------------------------
+  function mount(slot) {
+    if (slot.dataset.mounted) return Promise.resolve();
+    slot.dataset.mounted = '1';
+    return payload(slot).then(frag => {
+      if (!frag) return;
+      slot.replaceChildren(frag);
+      slot.classList.add('gx-mounted');
+      slot.querySelectorAll('svg[data-glyphx]').forEach(svg => {
+        (window.glyphxMounters || []).forEach(fn => {
+          try { fn(svg); } catch (_) {}
+        });
+      });
+    });
+  }
+
+  function mountAll() {
+    return Promise.all(Array.from(document.querySelectorAll(SLOT_SEL), mount));
+  }
+
+  // -- Lazy mounting ---------------------------------------------------------
+  function init() {
+    const slots = document.querySelectorAll(SLOT_SEL);
+    if (!('IntersectionObserver' in window)) { mountAll(); return; }
+    const io = new IntersectionObserver(entries => {
+      entries.forEach(e => {
+        if (e.isIntersecting) { io.unobserve(e.target); mount(e.target); }
+      });
+    }, { rootMargin: '600px 0px' });
+    slots.forEach(s => io.observe(s));
+
+    // Table-of-contents jumps mount their target before scrolling to it
+    document.querySelectorAll('.gx-toc a[href^="#"]').forEach(a => {
+      a.addEventListener('click', () => {
+        const target = document.getElementById(a.getAttribute('href').slice(1));
+        const slot = target && target.querySelector(SLOT_SEL);
+        if (slot) mount(slot);
+      });
+    });
+  }
+
+  // Printing needs every chart in the DOM
+  window.addEventListener('beforeprint', mountAll);
+  window.glyphxMountAll = mountAll;
+
+  // -- Delegated tooltip -----------------------------------------------------
+  function tipHtml(el) {
+    const get = a => el.getAttribute(a);
+    let html = '';
+    if (get('data-label')) html += `<div class="tt-label">${get('data-label')}</div>`;
+    if (get('data-q1')) {
+      html += `<div class="tt-row">Q1: ${(+get('data-q1')).toFixed(3)}</div>` +
+              `<div class="tt-row">Median: ${(+get('data-q2')).toFixed(3)}</div>` +
+              `<div class="tt-row">Q3: ${(+get('data-q3')).toFixed(3)}</div>`;
+    } else {
+      if (get('data-x') !== null) html += `<div class="tt-row">x: ${get('data-x')}</div>`;
+      if (get('data-y') !== null) html += `<div class="tt-row">y: ${get('data-y')}</div>`;
+      if (get('data-value'))      html += `<div class="tt-row">value: ${get('data-value')}</div>`;
+    }
+    return html || el.textContent;
+  }
+
+  document.addEventListener('mouseover', e => {
+    const el  = e.target.closest && e.target.closest('.glyphx-point');
+    const tip = document.getElementById('glyphx-tooltip');
+    if (!el || !tip) return;
+    tip.innerHTML = tipHtml(el);
+    tip.style.display = 'block';
+  });
+  document.addEventListener('mousemove', e => {
+    const tip = document.getElementById('glyphx-tooltip');
+    if (!tip || tip.style.display !== 'block') return;
+    tip.style.left = (e.clientX + 14) + 'px';
+    tip.style.top  = (e.clientY + 14) + 'px';
+  });
+  document.addEventListener('mouseout', e => {
+    const el  = e.target.closest && e.target.closest('.glyphx-point');
+    const tip = document.getElementById('glyphx-tooltip');
+    if (el && tip) tip.style.display = 'none';
+  });
+
+  // -- Delegated legend toggle, scoped to the legend's own chart -------------
+  document.addEventListener('click', e => {
+    const leg = e.target.closest && e.target.closest('.legend-icon, .legend-label');
+    if (!leg || !leg.dataset.target) return;
+    const svg = leg.closest('svg') || document;
+    svg.querySelectorAll('.' + leg.dataset.target).forEach(el => {
+      el.style.display = el.style.display === 'none' ? '' : 'none';
+    });
+  });
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
@@ -5,10 +5,7 @@
  * Mouse drag   -> pan  (only when Shift is NOT held -- Shift+drag = brush)
  */
 (function () {
-  const svgs = document.querySelectorAll('svg[data-glyphx]');
-  if (!svgs.length) return;
-
-  svgs.forEach(svg => {
+  function wireZoom(svg) {
     let viewBox   = svg.getAttribute('viewBox').split(' ').map(Number);
     let isPanning = false;
     let startX    = 0, startY = 0;
@@ -68,5 +65,9 @@
 
     // Store original viewBox for reset
     svg.dataset.originalViewBox = viewBox.join(' ');
-  });
+  }
+
+  // Charts mounted later (glyphx.Report) are wired through this hook
+  (window.glyphxMounters = window.glyphxMounters || []).push(wireZoom);
+  document.querySelectorAll('svg[data-glyphx]').forEach(wireZoom);
 })();
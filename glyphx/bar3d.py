@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import numpy as np
-from .projection3d import Camera3D, normalize, _format_3d_tick
+from .projection3d import Camera3D, normalize_array, _format_3d_tick
 from .colormaps     import apply_colormap, colormap_colors
 from .utils         import svg_escape
 
@@ -63,8 +63,8 @@ class Bar3DSeries:
         return apply_colormap(norm, self.cmap)
 
     def to_svg(self, cam: Camera3D, x_range, y_range, z_range) -> str:
-        xn, xlo, xhi = normalize(self.x_1d)
-        yn, ylo, yhi = normalize(self.y_1d)
+        xn, xlo, xhi = normalize_array(self.x_1d)
+        yn, ylo, yhi = normalize_array(self.y_1d)
 
         # Scale bar dims proportionally
         x_span = xhi - xlo or 1
@@ -72,44 +72,39 @@ class Bar3DSeries:
         dx_n = self._dx / x_span
         dy_n = self._dy / y_span
 
-        all_z = self.z_vals
-        z_max = max(all_z)
         zn_scale = lambda z: z / (self._z_max or 1) * 1.8 - 0.9
 
-        bars = []
         if self.paired:
-            for i, (xi, yi, zi) in enumerate(zip(xn, yn, self.z_vals)):
-                bars.append((xi, yi, zi, self._bar_color(zi)))
+            bx = np.asarray(xn)
+            by = np.asarray(yn)
+            bz = np.asarray(self.z_vals, dtype=float)
         else:
-            nx, ny = len(self.x_1d), len(self.y_1d)
-            for j in range(ny):
-                for i in range(nx):
-                    zi = self.z_mat[j][i]
-                    bars.append((xn[i], yn[j], zi, self._bar_color(zi)))
-
-        # Sort back-to-front
-        def _bar_depth(b):
-            return cam.project(b[0], b[1], 0).depth
-        bars.sort(key=_bar_depth)
+            gx, gy = np.meshgrid(xn, yn)
+            bx, by = gx.ravel(), gy.ravel()
+            bz = np.asarray(self.z_mat, dtype=float).ravel()
+
+        # Sort back-to-front by the projected depth of each bar's base
+        _, _, base_depth = cam.project_array(bx, by, 0.0)
+        order = np.argsort(base_depth, kind="stable")
+        bx, by, bz = bx[order], by[order], bz[order]
+
+        # 8 corners of every bar box, projected in one call: shape (n, 8)
+        hw, hd = dx_n / 2, dy_n / 2
+        sx  = np.array([-1, 1, 1, -1, -1, 1, 1, -1]) * hw
+        sy  = np.array([-1, -1, 1, 1, -1, -1, 1, 1]) * hd
+        top = np.array([False] * 4 + [True] * 4)
+        cz  = np.where(top, zn_scale(bz)[:, None], -0.9)
+        cpx, cpy, _ = cam.project_array(bx[:, None] + sx, by[:, None] + sy, cz)
+        cpx, cpy = cpx.tolist(), cpy.tolist()
 
         elements: list[str] = []
-        for bx, by, bz, col in bars:
-            bz_n = zn_scale(bz)
-            hw = dx_n / 2
-            hd = dy_n / 2
-
-            # 8 corners of the bar box
-            corners_3d = [
-                (bx-hw, by-hd, -0.9),  (bx+hw, by-hd, -0.9),
-                (bx+hw, by+hd, -0.9),  (bx-hw, by+hd, -0.9),
-                (bx-hw, by-hd, bz_n),  (bx+hw, by-hd, bz_n),
-                (bx+hw, by+hd, bz_n),  (bx-hw, by+hd, bz_n),
-            ]
-            c = [cam.project(*pt) for pt in corners_3d]
+        for b, zi in enumerate(bz.tolist()):
+            col = self._bar_color(zi)
+            r, g, b_ = int(col[1:3],16), int(col[3:5],16), int(col[5:7],16)
+            xs_, ys_ = cpx[b], cpy[b]
 
             def face(indices, shade=1.0):
-                pts = " ".join(f"{c[k].px:.1f},{c[k].py:.1f}" for k in indices)
-                r, g, b_ = int(col[1:3],16), int(col[3:5],16), int(col[5:7],16)
+                pts = " ".join(f"{xs_[k]:.1f},{ys_[k]:.1f}" for k in indices)
                 sr = min(255, int(r * shade))
                 sg = min(255, int(g * shade))
                 sb = min(255, int(b_ * shade))
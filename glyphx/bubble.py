@@ -150,11 +150,16 @@ class BubbleSeries(BaseSeries):
             elements.append(
                 f'<circle class="glyphx-point {self.css_class}" '
                 f'cx="{px:.2f}" cy="{py:.2f}" r="{radius:.2f}" '
-                f'fill="{fill}" fill-opacity="{self.alpha}" '
-                f'stroke="{self.stroke}" stroke-width="{self.stroke_width}" '
-                f'{tooltip}/>'
+                f'fill="{fill}" {tooltip}/>'
             )
 
+        # Paint shared by every bubble is set once on the enclosing group
+        if elements:
+            elements.insert(0, f'<g fill-opacity="{self.alpha}" '
+                               f'stroke="{self.stroke}" '
+                               f'stroke-width="{self.stroke_width}">')
+            elements.append("</g>")
+
         # Colorbar if using c= encoding
         if self._c_norm is not None and self.c is not None:
             from .colormaps import render_colorbar_svg
@@ -15,15 +15,81 @@ Standard financial chart showing open, high, low, close for each period.
         close=[153, 149, 155, 158, 160],
     ))
     fig.show()
+
+Long series (e.g. a year of 1-minute bars) are resampled at render time
+to roughly one candle per few pixels, and drawn as one merged path per
+up/down color instead of two elements per candle.
 """
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
+from .downsample import AUTO_THRESHOLD
 from .series import BaseSeries
 from .utils import svg_escape
 
 
+#: Pixels per candle used when ``resample=True``.
+DEFAULT_CANDLE_PX: float = 3.0
+
+
+def resample_ohlc(open, high, low, close, max_candles: int,   # noqa: A002
+                  volume=None) -> dict:
+    """
+    Aggregate consecutive candles into at most ``max_candles`` buckets.
+
+    Buckets hold an equal number of consecutive rows.  Each keeps the
+    open of its first row, the highest high, the lowest low, the close of
+    its last row and the summed volume, all computed with ``reduceat``.
+
+    Args:
+        open, high, low, close: Price columns of equal length.
+        max_candles: Upper bound on the number of output candles.
+        volume:      Optional volume column.
+
+    Returns:
+        Dict of arrays ``start`` / ``stop`` (row range of each bucket),
+        ``open``, ``high``, ``low``, ``close`` and ``volume`` (``None``
+        when no volume was given).
+    """
+    o = np.asarray(open,  dtype=float)
+    h = np.asarray(high,  dtype=float)
+    l = np.asarray(low,   dtype=float)
+    c = np.asarray(close, dtype=float)
+    n = len(o)
+    size   = max(1, math.ceil(n / max(1, int(max_candles))))
+    starts = np.arange(0, n, size)
+    stops  = np.minimum(starts + size, n)
+    if n == 0:
+        empty = np.zeros(0)
+        return {"start": starts, "stop": stops, "open": empty, "high": empty,
+                "low": empty, "close": empty,
+                "volume": None if volume is None else empty}
+    return {
+        "start":  starts,
+        "stop":   stops,
+        "open":   o[starts],
+        "high":   np.maximum.reduceat(h, starts),
+        "low":    np.minimum.reduceat(l, starts),
+        "close":  c[stops - 1],
+        "volume": (None if volume is None
+                   else np.add.reduceat(np.asarray(volume, dtype=float), starts)),
+    }
+
+
+def _scale_array(scale, values: np.ndarray) -> np.ndarray:
+    """Apply an axis scale to an array, per value if it is scalar-only."""
+    try:
+        out = np.asarray(scale(values), dtype=float)
+        if out.shape == values.shape:
+            return out
+    except (TypeError, ValueError):
+        pass
+    return np.array([scale(float(v)) for v in values], dtype=float)
+
+
 class CandlestickSeries(BaseSeries):
     """
     OHLC candlestick chart.
@@ -38,6 +104,14 @@ class CandlestickSeries(BaseSeries):
         down_color:     Fill color when close < open (bearish).
         candle_width:   Fraction of the available slot width (0–1).
         label:          Legend label.
+        volume:         Optional per-candle volume (shown in tooltips and
+                        summed when candles are resampled).
+        threshold:      Candle count above which the series is drawn as
+                        merged paths (default :data:`AUTO_THRESHOLD`).
+        resample:       Above ``threshold``, resample to about one candle
+                        per :data:`DEFAULT_CANDLE_PX` pixels (``True``),
+                        per the given number of pixels, or not at all
+                        (``False``).  See :func:`resample_ohlc`.
     """
 
     def __init__(
@@ -51,6 +125,9 @@ class CandlestickSeries(BaseSeries):
         down_color: str = "#d73027",
         candle_width: float = 0.6,
         label: str | None = None,
+        volume: list[float] | None = None,
+        threshold: int | None = None,
+        resample: bool | float = True,
     ) -> None:
         self.dates        = dates
         self.open_prices  = list(open)
@@ -60,6 +137,10 @@ class CandlestickSeries(BaseSeries):
         self.up_color     = up_color
         self.down_color   = down_color
         self.candle_width = candle_width
+        self.volume       = list(volume) if volume is not None else None
+        self.threshold    = threshold
+        self.resample     = resample
+        self.last_downsample_info = None
 
         # Build x/y for Axes domain computation
         all_prices = self.high_prices + self.low_prices
@@ -83,6 +164,11 @@ class CandlestickSeries(BaseSeries):
         slot_px = (ax.width - 2 * ax.padding) / n      # type: ignore[union-attr]
         body_px      = slot_px * self.candle_width
 
+        _thresh = self.threshold if self.threshold is not None else AUTO_THRESHOLD
+        if n > _thresh:
+            return self._merged_svg(ax, scale_y, slot_px)
+        self.last_downsample_info = None
+
         for i, (date, o, h, l, c) in enumerate(zip(
             self.dates,
             self.open_prices, self.high_prices,
@@ -107,10 +193,13 @@ class CandlestickSeries(BaseSeries):
             # Body (open–close)
             body_top = min(py_o, py_c)
             body_h   = max(abs(py_o - py_c), 1)    # at least 1px visible
+            value    = f"O:{o} H:{h} L:{l} C:{c}"
+            if self.volume is not None:
+                value += f" V:{self.volume[i]}"
             tooltip  = (
                 f'data-x="{svg_escape(str(date))}" '
                 f'data-label="{svg_escape(self.label or str(date))}" '
-                f'data-value="O:{o} H:{h} L:{l} C:{c}"'
+                f'data-value="{value}"'
             )
             elements.append(
                 f'<rect class="glyphx-point {self.css_class}" '
@@ -120,3 +209,63 @@ class CandlestickSeries(BaseSeries):
             )
 
         return "\n".join(elements)
+
+    def _merged_svg(self, ax: object, scale_y, slot_px: float) -> str:
+        """
+        Resampled candles as one wick path and one body path per color.
+
+        Used above ``threshold``: per-candle elements would overlap at
+        sub-pixel widths, so candles are bucketed (see
+        :func:`resample_ohlc`) and every wick / body of one color becomes
+        a subpath of a single ``<path>``.
+        """
+        n = len(self.dates)
+        plot_w = ax.width - 2 * ax.padding     # type: ignore[union-attr]
+        if self.resample is False:
+            max_candles = n
+        else:
+            px = DEFAULT_CANDLE_PX if self.resample is True else float(self.resample)
+            max_candles = max(1, int(plot_w / max(px, 1e-9)))
+        b = resample_ohlc(self.open_prices, self.high_prices,
+                          self.low_prices, self.close_prices,
+                          max_candles, self.volume)
+        n_out = len(b["start"])
+        if n_out < n:
+            self.last_downsample_info = {
+                'algorithm': 'OHLC',
+                'original_n': n,
+                'thinned_n': n_out,
+            }
+        else:
+            self.last_downsample_info = None
+
+        cx   = _scale_array(ax.scale_x, (b["start"] + b["stop"]) / 2.0)   # type: ignore[union-attr]
+        py_o = _scale_array(scale_y, b["open"])
+        py_h = _scale_array(scale_y, b["high"])
+        py_l = _scale_array(scale_y, b["low"])
+        py_c = _scale_array(scale_y, b["close"])
+        body_w = (b["stop"] - b["start"]) * slot_px * self.candle_width
+        top    = np.minimum(py_o, py_c)
+        height = np.maximum(np.abs(py_o - py_c), 1)    # at least 1px visible
+        up     = b["close"] >= b["open"]
+
+        elements: list[str] = []
+        for mask, color in ((up, self.up_color), (~up, self.down_color)):
+            k = int(mask.sum())
+            if not k:
+                continue
+            wicks = np.column_stack([cx[mask], py_h[mask], py_l[mask]]).ravel().tolist()
+            x0    = cx[mask] - body_w[mask] / 2
+            w     = body_w[mask]
+            bodies = np.column_stack([x0, top[mask], w, height[mask], -w]).ravel().tolist()
+            elements.append(
+                f'<path class="{self.css_class}" '
+                f'd="{"M%.2f,%.2fV%.2f" * k % tuple(wicks)}" '
+                f'stroke="{color}" stroke-width="1.5" fill="none"/>'
+            )
+            elements.append(
+                f'<path class="{self.css_class}" '
+                f'd="{"M%.2f,%.2fh%.2fv%.2fh%.2fZ" * k % tuple(bodies)}" '
+                f'fill="{color}"/>'
+            )
+        return "\n".join(elements)
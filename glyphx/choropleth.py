@@ -21,12 +21,18 @@ no CDN dependency -- pure SVG paths projected from GeoJSON coordinates.
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import math
+import os
+import tempfile
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 
 from .colormaps import apply_colormap, colormap_colors
+from .hierarchy import _concat_ranges
 from .utils     import svg_escape, _format_tick
 
 
@@ -42,66 +48,417 @@ def _mercator_xy(lon: float, lat: float) -> tuple[float, float]:
     return x, y
 
 
-def _project_coords(
-    coords: list,
-    lon_min: float, lon_max: float,
-    y_min:   float, y_max:   float,
-    width:   float, height:  float,
-    pad:     float = 10,
-) -> list[tuple[float, float]]:
-    """Project GeoJSON coordinate pairs to pixel (x, y)."""
-    result = []
-    plot_w = width  - 2 * pad
-    plot_h = height - 2 * pad
+def _mercator_array(lon, lat) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised :func:`_mercator_xy` over arrays of degrees."""
+    x = np.radians(lon)
+    lat_r = np.radians(np.clip(lat, -85.05, 85.05))
+    y = np.log(np.tan(np.pi / 4 + lat_r / 2))
+    return x, y
+
 
-    for pair in coords:
+# ---------------------------------------------------------------------------
+# GeoJSON flattening
+# ---------------------------------------------------------------------------
+
+def _ring_array(ring) -> np.ndarray:
+    """``(n, 2)`` float array of a ring's (lon, lat) pairs; bad pairs dropped."""
+    try:
+        arr = np.asarray(ring, dtype=float)
+        if arr.ndim == 2 and arr.shape[1] >= 2:
+            arr = arr[:, :2]
+            return arr[np.isfinite(arr).all(axis=1)]
+    except (TypeError, ValueError):
+        pass
+    pairs = []
+    for pair in ring or []:
         try:
-            lon, lat = float(pair[0]), float(pair[1])
-        except (TypeError, IndexError):
+            pairs.append((float(pair[0]), float(pair[1])))
+        except (TypeError, IndexError, ValueError):
             continue
-        mx, my = _mercator_xy(lon, lat)
-        px = pad + (mx - lon_min) / max(lon_max - lon_min, 1e-9) * plot_w
-        py = pad + (y_max - my)   / max(y_max  - y_min,   1e-9) * plot_h
-        result.append((px, py))
-    return result
-
+    return np.asarray(pairs, dtype=float).reshape(-1, 2)
 
-def _coord_bounds(features: list) -> tuple[float, float, float, float]:
-    """Find mercator (x_min, x_max, y_min, y_max) across all features."""
-    all_lons: list[float] = []
-    all_ys:   list[float] = []
 
-    def _walk(coords, depth=0):
-        if not coords:
-            return
-        if isinstance(coords[0], (int, float)):
+def _walk_pairs(coords) -> list[tuple[float, float]]:
+    """All coordinate pairs nested anywhere in ``coords`` (iterative)."""
+    out: list[tuple[float, float]] = []
+    stack = [coords]
+    while stack:
+        c = stack.pop()
+        if not c or isinstance(c, (str, bytes)):
+            continue
+        if isinstance(c[0], (int, float)):
             try:
-                mx, my = _mercator_xy(float(coords[0]), float(coords[1]))
-                all_lons.append(mx); all_ys.append(my)
-            except Exception:
+                out.append((float(c[0]), float(c[1])))
+            except (TypeError, IndexError, ValueError):
                 pass
-        else:
-            for sub in coords:
-                _walk(sub, depth + 1)
+        elif isinstance(c, (list, tuple)):
+            stack.extend(reversed(c))
+    return out
 
+
+def _flatten_features(features: list) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flatten the polygon rings of every feature into contiguous arrays.
+
+    Returns:
+        ``(coords, ring_offsets, feature_offsets, extra)`` where ``coords``
+        is an ``(n, 2)`` array of (lon, lat) pairs for every drawable ring,
+        ring ``r`` spans ``coords[ring_offsets[r]:ring_offsets[r + 1]]``,
+        feature ``f`` owns rings ``feature_offsets[f]:feature_offsets[f + 1]``
+        and ``extra`` holds the pairs of non-polygon geometries, which only
+        count towards the map bounds.
+    """
+    rings: list[np.ndarray] = []
+    ring_offsets = [0]
+    feature_offsets = [0]
+    extra: list[tuple[float, float]] = []
     for feat in features:
-        geo = feat.get("geometry") or {}
-        _walk(geo.get("coordinates", []))
+        geo    = feat.get("geometry") or {}
+        gtype  = geo.get("type", "")
+        coords = geo.get("coordinates", [])
+        if gtype == "Polygon":
+            polys = [coords]
+        elif gtype == "MultiPolygon":
+            polys = coords
+        else:
+            polys = []
+            extra.extend(_walk_pairs(coords))
+        for poly in polys:
+            for ring in poly:
+                arr = _ring_array(ring)
+                if len(arr):
+                    rings.append(arr)
+                    ring_offsets.append(ring_offsets[-1] + len(arr))
+        feature_offsets.append(len(rings))
+    coords = np.concatenate(rings) if rings else np.zeros((0, 2))
+    return (coords, np.asarray(ring_offsets, dtype=np.intp),
+            np.asarray(feature_offsets, dtype=np.intp),
+            np.asarray(extra, dtype=float).reshape(-1, 2))
+
 
-    if not all_lons:
-        return -math.pi, math.pi, -2.0, 2.0
-    return min(all_lons), max(all_lons), min(all_ys), max(all_ys)
+# ---------------------------------------------------------------------------
+# Simplification and path formatting
+# ---------------------------------------------------------------------------
+
+def _douglas_peucker(
+    x: np.ndarray, y: np.ndarray, offsets: np.ndarray, tolerance: float,
+    anchors: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Boolean mask of the points kept by Douglas–Peucker, for many polylines.
+
+    Polyline ``r`` spans ``offsets[r]:offsets[r + 1]``.  All pending
+    segments of all polylines are split together, one vectorised pass per
+    recursion level, so the cost is a few dozen NumPy passes however many
+    rings there are.  The first and last point of each polyline, and any
+    ``anchors``, are kept; simplification runs between consecutive kept
+    points.
+    """
+    keep   = np.zeros(len(x), dtype=bool)
+    starts = offsets[:-1][offsets[1:] > offsets[:-1]]
+    ends   = offsets[1:][offsets[1:] > offsets[:-1]] - 1
+    keep[starts] = True
+    keep[ends]   = True
+    if anchors is not None:
+        keep |= anchors
+    tol2 = tolerance * tolerance
+
+    fixed = np.flatnonzero(keep)
+    line  = np.searchsorted(offsets, fixed, side="right")
+    same  = line[1:] == line[:-1]
+    seg_i, seg_j = fixed[:-1][same], fixed[1:][same]
+    while True:
+        pending = seg_j - seg_i >= 2
+        seg_i, seg_j = seg_i[pending], seg_j[pending]
+        if not seg_i.size:
+            return keep
+        counts = seg_j - seg_i - 1
+        pts    = _concat_ranges(seg_i + 1, counts)
+        seg_of = np.repeat(np.arange(seg_i.size), counts)
+
+        ix, iy = x[seg_i], y[seg_i]
+        dx, dy = x[seg_j] - ix, y[seg_j] - iy
+        sx, sy = x[pts] - ix[seg_of], y[pts] - iy[seg_of]
+        seg2 = (dx * dx + dy * dy)[seg_of]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d2 = np.where(seg2 > 0,
+                          (sx * dy[seg_of] - sy * dx[seg_of]) ** 2 / seg2,
+                          sx * sx + sy * sy)   # closed ring: distance to endpoint
+
+        # First farthest point of every segment
+        seg_max = np.maximum.reduceat(d2, np.cumsum(counts) - counts)
+        cand    = np.flatnonzero(d2 == seg_max[seg_of])
+        first   = cand[np.r_[True, seg_of[cand][1:] != seg_of[cand][:-1]]]
+
+        split = seg_max > tol2
+        mid   = pts[first][split]
+        keep[mid] = True
+        seg_i = np.concatenate([seg_i[split], mid])
+        seg_j = np.concatenate([mid, seg_j[split]])
+
+
+def _simplify_rings(
+    px: np.ndarray, py: np.ndarray, ring_offsets: np.ndarray, tolerance: float,
+    anchors: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simplify every ring at a pixel ``tolerance``.
+
+    A vectorised pre-pass keeps only the first and last point of each run
+    of consecutive points in the same ``tolerance``-sized pixel cell (a
+    rule that reads the same in both directions, so a border shared by
+    two rings is thinned identically); batched Douglas–Peucker then runs
+    on what is left.  ``anchors`` (see :func:`_topology_anchors`) always
+    survive.  Rings reduced to fewer than three points are below the
+    output resolution and dropped (they keep an empty span so ring indices
+    stay aligned).
+
+    Returns:
+        ``(px, py, ring_offsets)`` of the simplified rings.
+    """
+    n = len(px)
+    if n == 0:
+        return px, py, ring_offsets
+    n_rings = len(ring_offsets) - 1
+    ring_id = np.repeat(np.arange(n_rings), np.diff(ring_offsets))
+    cx = np.floor(px / tolerance)
+    cy = np.floor(py / tolerance)
+    moved = (cx[1:] != cx[:-1]) | (cy[1:] != cy[:-1])
+    keep = np.ones(n, dtype=bool)
+    keep[1:-1] = moved[:-1] | moved[1:]
+    if anchors is not None:
+        keep |= anchors
+    nonempty = ring_offsets[1:] > ring_offsets[:-1]
+    keep[ring_offsets[:-1][nonempty]]    = True
+    keep[ring_offsets[1:][nonempty] - 1] = True
+
+    idx = np.flatnonzero(keep)
+    sub_offsets = np.zeros(n_rings + 1, dtype=np.intp)
+    np.cumsum(np.bincount(ring_id[idx], minlength=n_rings), out=sub_offsets[1:])
+    idx = idx[_douglas_peucker(px[idx], py[idx], sub_offsets, tolerance,
+                               None if anchors is None else anchors[idx])]
+
+    counts = np.bincount(ring_id[idx], minlength=n_rings)
+    idx = idx[counts[ring_id[idx]] >= 3]
+    counts[counts < 3] = 0
+    offsets = np.zeros(n_rings + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    return px[idx], py[idx], offsets
+
+
+def _topology_anchors(coords: np.ndarray, ring_offsets: np.ndarray) -> np.ndarray:
+    """
+    Vertices that must survive simplification for borders to stay shared.
 
+    A vertex's share count is the number of distinct rings it appears in.
+    The ends of every run of shared vertices (where the count changes
+    along a ring), junctions of three or more rings and every ring's start
+    vertex are anchored in *every* ring that contains them.  Between two
+    anchors a shared border then holds the same points in each neighbour,
+    so it simplifies to the same polyline and no slivers or gaps open up.
 
-def _coords_to_path(ring: list[tuple[float, float]]) -> str:
-    """Convert a list of pixel (x,y) points to an SVG path 'd' string."""
-    if not ring:
-        return ""
-    parts = [f"M {ring[0][0]:.2f},{ring[0][1]:.2f}"]
-    for x, y in ring[1:]:
-        parts.append(f"L {x:.2f},{y:.2f}")
-    parts.append("Z")
-    return " ".join(parts)
+    Returns:
+        Boolean mask over ``coords``.
+    """
+    n = len(coords)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    n_rings = len(ring_offsets) - 1
+    ring_id = np.repeat(np.arange(n_rings), np.diff(ring_offsets))
+    keys = np.ascontiguousarray(coords, dtype=float).view(np.complex128).ravel()
+    _, vid = np.unique(keys, return_inverse=True)
+    vid = vid.ravel()
+
+    pairs = np.sort(vid.astype(np.int64) * n_rings + ring_id)
+    pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]]
+    share = np.bincount(pairs // n_rings, minlength=int(vid.max()) + 1)[vid]
+
+    anchors = share >= 3
+    edge = (share[1:] != share[:-1]) & (ring_id[1:] == ring_id[:-1])
+    anchors[1:]  |= edge & (share[1:] > 1)
+    anchors[:-1] |= edge & (share[:-1] > 1)
+    starts = ring_offsets[:-1][np.diff(ring_offsets) > 0]
+    anchors |= np.isin(vid, vid[starts]) & (share > 1)
+    return anchors
+
+
+def _ring_paths(px: np.ndarray, py: np.ndarray, ring_offsets: np.ndarray) -> list[str]:
+    """
+    SVG path ``d`` string per ring, produced by one ``%`` format per ring.
+
+    Empty rings give ``""``.
+    """
+    flat = np.column_stack([px, py]).ravel().tolist()
+    out: list[str] = []
+    for s, e in zip(ring_offsets[:-1].tolist(), ring_offsets[1:].tolist()):
+        n = e - s
+        if n == 0:
+            out.append("")
+            continue
+        template = "M %.2f,%.2f" + " L %.2f,%.2f" * (n - 1) + " Z"
+        out.append(template % tuple(flat[2 * s:2 * e]))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# GeoBaseMap
+# ---------------------------------------------------------------------------
+
+_CACHE_VERSION = 1
+
+
+class GeoBaseMap:
+    """
+    Reusable base map: projected, simplified path strings per feature.
+
+    Dashboards often draw the same boundaries (countries, states,
+    counties) many times with different data.  A ``GeoBaseMap`` flattens
+    and projects the GeoJSON once and caches each feature's path ``d``
+    string per canvas size, in memory and optionally on disk.  Every
+    :class:`ChoroplethSeries` built on it then only computes colors and
+    tooltips, an O(features) render instead of O(vertices).
+
+    Args:
+        geojson:   GeoJSON FeatureCollection dict or a list of features.
+        simplify:  Douglas–Peucker tolerance in output pixels (``0``
+                   disables).
+        preserve_topology: Simplify borders shared by neighbouring
+                   features identically so adjacent polygons stay
+                   gap-free (default ``True``).
+        cache_dir: Directory where path strings are stored per canvas
+                   size, keyed on a digest of the geometry and settings,
+                   so later processes skip the work entirely.
+        max_sizes: Number of canvas sizes kept in memory.
+
+    Example::
+
+        base = GeoBaseMap(counties, simplify=0.5, cache_dir=".glyphx-cache")
+        for day, values in daily.items():
+            fig = Figure(width=900, height=500, auto_display=False)
+            fig.add(ChoroplethSeries(base, values, key="fips"))
+    """
+
+    def __init__(
+        self,
+        geojson:           dict | list,
+        simplify:          float             = 0.0,
+        preserve_topology: bool              = True,
+        cache_dir:         str | Path | None = None,
+        max_sizes:         int               = 8,
+    ) -> None:
+        from .downsample import _ResultCache
+
+        if isinstance(geojson, dict):
+            self.features = geojson.get("features", [])
+        else:
+            self.features = list(geojson)
+        self.simplify          = float(simplify)
+        self.preserve_topology = preserve_topology
+        self.cache_dir         = Path(cache_dir) if cache_dir is not None else None
+
+        # Flatten rings once and project to Mercator in one pass
+        self._coords, self._ring_offsets, self._feature_offsets, extra = (
+            _flatten_features(self.features)
+        )
+        self._mx, self._my = _mercator_array(self._coords[:, 0], self._coords[:, 1])
+        ex, ey = _mercator_array(extra[:, 0], extra[:, 1])
+        all_x = np.concatenate([self._mx, ex])
+        all_y = np.concatenate([self._my, ey])
+        if len(all_x):
+            self.bounds = (float(all_x.min()), float(all_x.max()),
+                           float(all_y.min()), float(all_y.max()))
+        else:
+            self.bounds = (-math.pi, math.pi, -2.0, 2.0)
+
+        self._anchors: np.ndarray | None = None
+        self._digest:  str | None        = None
+        self._cache = _ResultCache(max_sizes)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def paths(self, width: float, height: float, pad: float = 10) -> list[str]:
+        """
+        Combined path ``d`` string per feature for a canvas size.
+
+        Looked up in memory, then in ``cache_dir``, and only built (and
+        stored in both) on a miss.  Features without drawable rings give
+        ``""``.
+        """
+        key = (float(width), float(height), float(pad))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[0]
+        paths = self._load(key)
+        if paths is None:
+            paths = self._build(*key)
+            self._store(key, paths)
+        self._cache.put(key, (paths,))
+        return paths
+
+    def _build(self, width: float, height: float, pad: float) -> list[str]:
+        lon_min, lon_max, y_min, y_max = self.bounds
+        plot_w = width  - 2 * pad
+        plot_h = height - 2 * pad
+        px = pad + (self._mx - lon_min) / max(lon_max - lon_min, 1e-9) * plot_w
+        py = pad + (y_max - self._my)   / max(y_max  - y_min,   1e-9) * plot_h
+        offsets = self._ring_offsets
+        if self.simplify > 0:
+            if self.preserve_topology and self._anchors is None:
+                self._anchors = _topology_anchors(self._coords, offsets)
+            px, py, offsets = _simplify_rings(
+                px, py, offsets, self.simplify,
+                self._anchors if self.preserve_topology else None,
+            )
+
+        rings = _ring_paths(px, py, offsets)
+        fo = self._feature_offsets.tolist()
+        return [" ".join(d for d in rings[a:b] if d) for a, b in zip(fo[:-1], fo[1:])]
+
+    # ------------------------------------------------------------------
+    # Disk cache
+    # ------------------------------------------------------------------
+
+    def _cache_file(self, key: tuple) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        if self._digest is None:
+            h = hashlib.blake2b(digest_size=16)
+            for arr in (self._coords, self._ring_offsets, self._feature_offsets):
+                h.update(np.ascontiguousarray(arr).view(np.uint8))
+            h.update(repr((self.bounds, self.simplify, self.preserve_topology,
+                           _CACHE_VERSION)).encode())
+            self._digest = h.hexdigest()
+        width, height, pad = key
+        return self.cache_dir / f"basemap-{self._digest}-{width:g}x{height:g}-{pad:g}.json"
+
+    def _load(self, key: tuple) -> list[str] | None:
+        path = self._cache_file(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            paths = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(paths, list) or len(paths) != len(self.features):
+            return None
+        return paths
+
+    def _store(self, key: tuple, paths: list[str]) -> None:
+        path = self._cache_file(key)
+        if path is None:
+            return
+        # Write-then-rename so concurrent renders never read a partial file;
+        # the cache is best effort, so I/O errors are not fatal.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, delete=False, suffix=".tmp"
+            ) as fh:
+                json.dump(paths, fh)
+            os.replace(fh.name, path)
+        except OSError:
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +473,8 @@ class ChoroplethSeries:
 
     Args:
         geojson:    GeoJSON FeatureCollection dict (``{"type":"FeatureCollection",
-                    "features":[...]}``) or a list of feature dicts.
+                    "features":[...]}``), a list of feature dicts, or a
+                    :class:`GeoBaseMap` to reuse its cached paths.
         data:       ``{feature_key: numeric_value}`` mapping.
         key:        GeoJSON feature property name that matches ``data`` keys.
         cmap:       Colormap name.
@@ -126,11 +484,20 @@ class ChoroplethSeries:
         alpha:      Fill opacity.
         label:      Legend / tooltip label.
         title:      Chart title (forwarded to Figure).
+        simplify:   Douglas–Peucker tolerance in output pixels (``0``
+                    disables).  ``0.5`` is visually lossless and shrinks
+                    detailed maps (e.g. county boundaries) many times over.
+                    Ignored when ``geojson`` is a :class:`GeoBaseMap`.
+
+    GeoJSON rings are flattened once at construction into one coordinate
+    array with ring offsets and projected to Mercator in a single
+    vectorised pass; the per-size pixel paths are cached between renders.
+    Pass a shared :class:`GeoBaseMap` to reuse that work across series.
     """
 
     def __init__(
         self,
-        geojson:         dict | list,
+        geojson:         dict | list | GeoBaseMap,
         data:            dict[str, float],
         key:             str              = "name",
         cmap:            str              = "viridis",
@@ -140,6 +507,7 @@ class ChoroplethSeries:
         alpha:           float            = 0.90,
         label:           str | None       = None,
         title:           str | None       = None,
+        simplify:        float            = 0.0,
     ) -> None:
         self.cmap          = cmap
         self.data          = data
@@ -152,11 +520,11 @@ class ChoroplethSeries:
         self.title         = title
         self.css_class     = f"series-{id(self) % 100000}"
 
-        # Extract feature list
-        if isinstance(geojson, dict):
-            self._features = geojson.get("features", [])
+        if isinstance(geojson, GeoBaseMap):
+            self.basemap = geojson
         else:
-            self._features = list(geojson)
+            self.basemap = GeoBaseMap(geojson, simplify=simplify)
+        self._features = self.basemap.features
 
         # Value range
         vals = [v for v in data.values() if v is not None]
@@ -177,47 +545,29 @@ class ChoroplethSeries:
         norm = (float(val) - self._vmin) / self._vspan
         return apply_colormap(norm, self.cmap)
 
+    def _feature_paths(self, width: float, height: float,
+                       pad: float = 10) -> list[str]:
+        """Combined path ``d`` string per feature at a canvas size (cached)."""
+        return self.basemap.paths(width, height, pad)
+
     def to_svg(self, ax: object = None) -> str:  # type: ignore
         W = getattr(ax, "width",  800) if ax else 800
         H = getattr(ax, "height", 500) if ax else 500
         font = ax.theme.get("font", "sans-serif") if ax else "sans-serif"   # type: ignore
         tc   = ax.theme.get("text_color", "#000") if ax else "#000"         # type: ignore
 
-        lon_min, lon_max, y_min, y_max = _coord_bounds(self._features)
+        feature_paths = self._feature_paths(W, H)
 
         elements: list[str] = []
 
-        def _render_ring(ring_coords, color):
-            pts = _project_coords(ring_coords, lon_min, lon_max,
-                                   y_min, y_max, W, H)
-            return _coords_to_path(pts)
-
-        for feat in self._features:
-            geo   = feat.get("geometry") or {}
+        for feat, combined in zip(self._features, feature_paths):
             color = self._feature_color(feat)
             props = feat.get("properties") or {}
             name  = props.get(self.key, "")
             val   = self.data.get(name)
             tip   = f'{svg_escape(str(name))}: {_format_tick(val)}' if val is not None else svg_escape(str(name))
 
-            gtype = geo.get("type", "")
-            coords = geo.get("coordinates", [])
-
-            paths: list[str] = []
-            if gtype == "Polygon":
-                for ring in coords:
-                    d = _render_ring(ring, color)
-                    if d:
-                        paths.append(d)
-            elif gtype == "MultiPolygon":
-                for poly in coords:
-                    for ring in poly:
-                        d = _render_ring(ring, color)
-                        if d:
-                            paths.append(d)
-
-            if paths:
-                combined = " ".join(paths)
+            if combined:
                 elements.append(
                     f'<path class="glyphx-point {self.css_class}" '
                     f'd="{combined}" '
@@ -5,6 +5,7 @@ After installation, the ``glyphx`` command is available::
 
     glyphx plot sales.csv --x month --y revenue --kind bar --theme dark -o chart.html
     glyphx suggest data.csv
+    glyphx serve --port 8765 --workers 4
     glyphx version
 
 Use ``glyphx <command> --help`` for full argument documentation.
@@ -32,6 +33,7 @@ def main(argv: list[str] | None = None) -> int:
             "  glyphx plot sales.csv --x month --y revenue --kind bar -o chart.html\n"
             "  glyphx plot data.csv --y price --kind hist --bins 20\n"
             "  glyphx suggest data.csv\n"
+            "  glyphx serve --port 8765 --workers 4\n"
             "  glyphx version\n"
         ),
     )
@@ -41,6 +43,7 @@ def main(argv: list[str] | None = None) -> int:
 
     _add_plot_parser(sub)
     _add_suggest_parser(sub)
+    _add_serve_parser(sub)
     _add_version_parser(sub)
 
     args = parser.parse_args(argv)
@@ -60,6 +63,8 @@ def _add_plot_parser(sub: argparse._SubParsersAction) -> None:  # type: ignore[t
         epilog=(
             "Supported input formats : .csv  .tsv  .json  .jsonl  .xlsx  .xls\n"
             "Supported output formats: .svg  .html  .png  .jpg  .pptx\n"
+            "Pre-compressed outputs  : .svgz  .svg.gz  .html.gz  (gzip)\n"
+            "                          .svg.br  .html.br  (Brotli; needs glyphx[brotli])\n"
         ),
     )
 
@@ -128,6 +133,7 @@ def _cmd_plot(args: argparse.Namespace) -> int:
     _info(f"Loaded {len(df):,} rows × {len(df.columns)} columns from {path.name}")
 
     # ── Build chart ───────────────────────────────────────────────────────
+    import numpy as np
     from glyphx import Figure
     from glyphx.series import (
         LineSeries, BarSeries, ScatterSeries,
@@ -182,20 +188,21 @@ def _cmd_plot(args: argparse.Namespace) -> int:
         y_col = args.y or df.select_dtypes("number").columns[0]
         if args.x and args.x in df.columns:
             for i, (grp, gdf) in enumerate(df.groupby(args.groupby)):
-                x_data = gdf[args.x].tolist()
-                y_data = gdf[y_col].tolist()
+                x_data = gdf[args.x].to_numpy()
+                y_data = gdf[y_col].to_numpy()
                 clr    = theme_colors[i % len(theme_colors)]
                 fig.add(_series_for(kind, x_data, y_data, clr, str(grp)))
         else:
             agg_df = df.groupby(args.groupby)[y_col].agg(args.agg).reset_index()
-            x_data = agg_df[args.groupby].tolist()
-            y_data = agg_df[y_col].tolist()
+            x_data = agg_df[args.groupby].to_numpy()
+            y_data = agg_df[y_col].to_numpy()
             fig.add(_series_for(kind, x_data, y_data, args.color, args.label or y_col))
 
     else:
-        x_data = df[args.x].tolist() if args.x and args.x in df.columns else list(range(len(df)))
-        y_data = (df[args.y].tolist() if args.y and args.y in df.columns
-                  else df.select_dtypes("number").iloc[:, 0].tolist())
+        x_data = (df[args.x].to_numpy() if args.x and args.x in df.columns
+                  else np.arange(len(df)))
+        y_data = (df[args.y].to_numpy() if args.y and args.y in df.columns
+                  else df.select_dtypes("number").iloc[:, 0].to_numpy())
         fig.add(_series_for(kind, x_data, y_data, args.color, args.label or args.y))
 
     # ── Save ──────────────────────────────────────────────────────────────
@@ -325,6 +332,79 @@ def _suggest_charts(df) -> list[tuple[str, str]]:
     return [(rank, text) for _, rank, text in suggestions]
 
 
+# ---------------------------------------------------------------------------
+# serve sub-command
+# ---------------------------------------------------------------------------
+
+def _add_serve_parser(sub: argparse._SubParsersAction) -> None:  # type: ignore[type-arg]
+    p = sub.add_parser(
+        "serve",
+        help="Run a local HTTP chart-rendering service.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=(
+            "Render JSON chart specs to SVG, HTML or PNG over HTTP on a "
+            "pre-warmed worker pool, with an LRU result cache."
+        ),
+        epilog=(
+            "Endpoints: POST /render[?format=svg|html|png]  GET /healthz  GET /metrics\n"
+            "Example  : curl -s localhost:8765/render -d '{\"kind\": \"bar\", "
+            "\"x\": [\"a\", \"b\"], \"y\": [3, 5]}'\n"
+        ),
+    )
+    p.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    p.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Render processes (default: CPU count; 0 renders in-process)")
+    p.add_argument("--cache-size", type=int, default=256,
+                   help="Maximum cached responses (default: 256; 0 disables)")
+    p.add_argument("--cache-mb", type=float, default=64,
+                   help="Maximum cache size in MiB (default: 64)")
+    p.add_argument("--timeout", type=float, default=30.0,
+                   help="Per-render timeout in seconds (default: 30)")
+    p.add_argument("--max-points", type=int, default=1_000_000,
+                   help="Largest accepted spec, in data values (default: 1000000)")
+    p.add_argument("--max-pixels", type=int, default=4096 * 4096,
+                   help="Largest accepted PNG, in output pixels (default: 16777216)")
+    p.set_defaults(func=_cmd_serve)
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    """Execute the ``serve`` sub-command."""
+    import asyncio
+    from glyphx.serve import ChartServer
+
+    try:
+        server = ChartServer(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            cache_size=args.cache_size,
+            cache_bytes=int(args.cache_mb * (1 << 20)),
+            timeout=args.timeout,
+            max_points=args.max_points,
+            max_pixels=args.max_pixels,
+        )
+    except ValueError as exc:
+        _err(str(exc))
+        return 1
+
+    async def serve() -> None:
+        host, port = await server.start()
+        n    = server.workers
+        pool = f"{n} worker{'s' if n > 1 else ''}" if n else "in-process"
+        _info(f"Serving charts on http://{host}:{port} ({pool}) — Ctrl+C to stop")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        _info("Stopped")
+    except OSError as exc:
+        _err(f"Could not start server: {exc}")
+        return 1
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # version sub-command
 # ---------------------------------------------------------------------------
@@ -0,0 +1,395 @@
+"""
+GlyphX element coalescing -- merge same-style SVG primitives into paths.
+
+Many series emit thousands of identically styled primitives: bar and
+histogram ``<rect>`` elements, error-bar ``<line>`` triplets, grid lines,
+swarm ``<circle>`` markers, contour cells.  Browsers pay per DOM node, so
+:func:`coalesce_svg` rewrites every group of same-style sibling
+primitives as a single ``<path>`` with one subpath per element::
+
+    <rect x="10" y="20" width="5" height="30" fill="#1f77b4"/>
+    <rect x="20" y="10" width="5" height="40" fill="#1f77b4"/>
+
+becomes::
+
+    <path d="M10,20h5v30h-5Z M20,10h5v40h-5Z" fill="#1f77b4"/>
+
+It is used by ``Figure(coalesce=True)``, which passes every rendered
+fragment (axes, grid, each series) through it separately so the paint
+order between fragments never changes.
+
+Rules:
+
+- Only ``<rect>``, ``<line>`` and ``<circle>`` elements are merged, and
+  only with siblings: elements inside different ``<g>`` groups never
+  merge, and nothing inside ``<defs>``, ``<clipPath>``, ``<marker>``,
+  ``<pattern>``, ``<mask>``, ``<symbol>`` or text is touched.
+- Elements merge when every presentation attribute (fill, stroke,
+  opacity, dash, class, clip-path...) is identical.  Any other attribute
+  (``rx``, ``transform``, ``id``...) keeps the element as is.
+- Interactive data points (``data-*`` tooltip attributes) are kept as
+  individual nodes unless ``interactive=False``, which drops their
+  tooltips and merges them too -- for static exports.
+- A group's path takes the place of its last member, so earlier members
+  are painted later than before.  A member stays a separate element when
+  that would move it past an overlapping sibling of another style (an
+  error bar past the next bar, a grid line past a label), so the paint
+  order of every overlapping pair is preserved.  Sibling bounds come from
+  their attributes; groups, paths and transformed elements count as
+  covering everything.  Where translucent same-style primitives overlap,
+  the overlap is painted once.
+"""
+from __future__ import annotations
+
+import math
+import re
+
+import numpy as np
+
+# Attributes that only style an element; identical values are required
+# for two primitives to share a path.
+_STYLE_ATTRS = frozenset({
+    "fill", "fill-opacity", "fill-rule", "stroke", "stroke-width",
+    "stroke-opacity", "stroke-dasharray", "stroke-dashoffset",
+    "stroke-linecap", "stroke-linejoin", "stroke-miterlimit", "opacity",
+    "class", "clip-path", "shape-rendering", "vector-effect",
+})
+
+# Geometry attributes per mergeable element, with their SVG defaults
+# (``None`` marks a required attribute).
+_GEOMETRY = {
+    "rect":   {"x": "0", "y": "0", "width": None, "height": None},
+    "line":   {"x1": "0", "y1": "0", "x2": "0", "y2": "0"},
+    "circle": {"cx": "0", "cy": "0", "r": None},
+}
+
+# Attributes that only carry interactivity (tooltips, focus, ARIA).
+_INTERACTIVE_PREFIXES = ("data-", "aria-")
+_INTERACTIVE_ATTRS    = frozenset({"tabindex", "role"})
+
+# Containers whose children must never be merged or moved.
+_OPAQUE = frozenset({
+    "defs", "clippath", "marker", "pattern", "mask", "symbol", "text",
+    "textpath", "a", "switch", "foreignobject", "lineargradient",
+    "radialgradient", "filter",
+})
+# Raw-text elements skipped wholesale (their content may contain "<").
+_RAW = ("script", "style")
+
+# Elements that paint nothing themselves; siblings may move past them.
+_NON_PAINTING = frozenset({
+    "defs", "clippath", "marker", "pattern", "mask", "symbol",
+    "lineargradient", "radialgradient", "filter", "title", "desc",
+    "metadata", "style", "script",
+})
+_UNBOUNDED = (-math.inf, -math.inf, math.inf, math.inf)
+# Above this many member/sibling overlap tests per group, only runs of
+# consecutive same-style siblings are merged.
+_MAX_PAIRS = 20_000_000
+# Refinement passes before falling back to runs of consecutive siblings.
+_MAX_PASSES = 8
+
+_TAG  = re.compile(r"<(/?)([A-Za-z][\w:.-]*)([^>]*?)(/?)>")
+_ATTR = re.compile(r'\s*([^\s=/>]+)\s*=\s*"([^"]*)"')
+
+
+def _parse_attrs(text: str) -> list[tuple[str, str]] | None:
+    """Attribute ``(name, value)`` pairs, or ``None`` if not all parse."""
+    attrs, pos = [], 0
+    for m in _ATTR.finditer(text):
+        if m.start() != pos:
+            return None
+        attrs.append((m.group(1), m.group(2)))
+        pos = m.end()
+    return attrs if not text[pos:].strip() else None
+
+
+def _num(v: float) -> str:
+    """Compact path number (3 decimals, trailing zeros stripped)."""
+    s = f"{v:.3f}".rstrip("0").rstrip(".")
+    return "0" if s in ("-0", "") else s
+
+
+def _subpath(tag: str, geom: dict[str, str]) -> str | None:
+    """Path data for one primitive, or ``None`` if it would not render."""
+    try:
+        vals = {k: float(v) for k, v in geom.items()}
+    except ValueError:
+        return None
+    if not all(math.isfinite(v) for v in vals.values()):
+        return None
+    if tag == "rect":
+        if vals["width"] <= 0 or vals["height"] <= 0:
+            return None
+        w = _num(vals["width"])
+        return f'M{_num(vals["x"])},{_num(vals["y"])}h{w}v{_num(vals["height"])}h-{w}Z'
+    if tag == "line":
+        return (f'M{_num(vals["x1"])},{_num(vals["y1"])}'
+                f'L{_num(vals["x2"])},{_num(vals["y2"])}')
+    r = vals["r"]
+    if r <= 0:
+        return None
+    d, rr = _num(2 * r), _num(r)
+    return (f'M{_num(vals["cx"] - r)},{_num(vals["cy"])}'
+            f'a{rr},{rr} 0 1,0 {d},0a{rr},{rr} 0 1,0 -{d},0Z')
+
+
+def _bounds(tag: str, attrs: list[tuple[str, str]] | None,
+            content: str = "") -> tuple[float, float, float, float] | None:
+    """
+    Painted bounds ``(x0, y0, x1, y1)`` of a sibling element.
+
+    ``None`` for elements that paint nothing; unbounded for anything whose
+    extent cannot be read off its own attributes.
+    """
+    if tag in _NON_PAINTING:
+        return None
+    if attrs is None:
+        return _UNBOUNDED
+    a = dict(attrs)
+    if "transform" in a or (tag != "text" and tag not in _GEOMETRY):
+        return _UNBOUNDED
+    try:
+        if tag == "text":
+            if any(k in a for k in ("dx", "dy", "rotate", "textLength")):
+                return _UNBOUNDED
+            size  = float(a["font-size"])
+            x, y  = float(a.get("x", 0)), float(a.get("y", 0))
+            width = size * len(content)             # no glyph is wider than 1em
+            anchor = a.get("text-anchor", "start")
+            x0 = x - width if anchor == "end" else x - width / 2 if anchor == "middle" else x
+            return (x0, y - size, x0 + width, y + size / 2)
+        stroked = a.get("stroke", "none") != "none"
+        pad = float(a.get("stroke-width", 1)) / 2 if stroked or tag == "line" else 0.0
+        if tag == "rect":
+            x, y = float(a.get("x", 0)), float(a.get("y", 0))
+            return (x - pad, y - pad, x + float(a["width"]) + pad,
+                    y + float(a["height"]) + pad)
+        if tag == "line":
+            x1, y1 = float(a.get("x1", 0)), float(a.get("y1", 0))
+            x2, y2 = float(a.get("x2", 0)), float(a.get("y2", 0))
+            # Butt caps (the default) add nothing along an axis-aligned line
+            butt = a.get("stroke-linecap", "butt") == "butt"
+            px = 0.0 if butt and y1 == y2 and x1 != x2 else pad
+            py = 0.0 if butt and x1 == x2 and y1 != y2 else pad
+            return (min(x1, x2) - px, min(y1, y2) - py,
+                    max(x1, x2) + px, max(y1, y2) + py)
+        cx, cy = float(a.get("cx", 0)), float(a.get("cy", 0))
+        r = float(a["r"]) + pad
+        return (cx - r, cy - r, cx + r, cy + r)
+    except (KeyError, ValueError):
+        return _UNBOUNDED
+
+
+def _merge_plan(items: list[tuple]) -> list[list[int]]:
+    """
+    Member indices of each group to merge, emitted at its last member.
+
+    ``items`` are one container's painting siblings in document order, as
+    ``(start, end, bounds, key, subpath)``.  Moving a member to its group's
+    last position paints it after every sibling in between whose own final
+    position is earlier.  Members that would cover such a sibling they
+    overlap leave the group and are cut into segments, each emitted before
+    the final position of every sibling its members overlap; this repeats
+    until no overlapping pair changes order.  Runs of consecutive members
+    are always safe, so they are what is merged above ``_MAX_PAIRS``
+    overlap tests per group or when ``_MAX_PASSES`` passes do not settle.
+    """
+    by_key: dict[tuple, list[int]] = {}
+    for i, item in enumerate(items):
+        if item[3] is not None:
+            by_key.setdefault(item[3], []).append(i)
+    groups = [g for g in by_key.values() if len(g) > 1]
+    if not groups:
+        return []
+    n     = len(items)
+    boxes = np.array([item[2] for item in items], dtype=float)
+
+    for _ in range(_MAX_PASSES):
+        emit = np.arange(n)
+        for g in groups:
+            emit[g] = g[-1]
+        changed, kept = False, []
+        for g in groups:
+            members = np.asarray(g)
+            cand    = np.arange(g[0] + 1, g[-1])
+            cand    = cand[emit[cand] < g[-1]]      # painted before the group now
+            if not cand.size:
+                kept.append(g)
+                continue
+            # Earliest final position among the siblings each member would
+            # wrongly cover: its segment must be emitted before it
+            cemit = emit[cand]
+            if len(g) * cand.size > _MAX_PAIRS:
+                after = np.searchsorted(cand, members)
+                tail  = np.append(np.minimum.accumulate(cemit[::-1])[::-1], n)
+                first = tail[after]
+            else:
+                first = np.full(len(g), n)
+                xb    = boxes[cand]
+                step  = max(1, 1_000_000 // cand.size)
+                for c in range(0, len(g), step):
+                    idx = members[c:c + step]
+                    mb  = boxes[idx]
+                    hit = ((mb[:, None, 0] < xb[None, :, 2]) & (xb[None, :, 0] < mb[:, None, 2])
+                           & (mb[:, None, 1] < xb[None, :, 3]) & (xb[None, :, 1] < mb[:, None, 3])
+                           & (idx[:, None] < cand[None, :]))
+                    first[c:c + step] = np.where(hit, cemit[None, :], n).min(axis=1)
+            # Members without conflicts stay in the group; the others are
+            # cut into segments that each end before their deadline
+            free = [m for m, f in zip(g, first.tolist()) if f >= n]
+            if len(free) == len(g):
+                kept.append(g)
+                continue
+            changed = True
+            if len(free) > 1:
+                kept.append(free)
+            segment, deadline = [], n
+            for m, f in zip(g, first.tolist()):
+                if f >= n:
+                    continue
+                if m > deadline:
+                    if len(segment) > 1:
+                        kept.append(segment)
+                    segment, deadline = [], n
+                segment.append(m)
+                deadline = min(deadline, f)
+            if len(segment) > 1:
+                kept.append(segment)
+        groups = kept
+        if not changed:
+            return groups
+    # Not settled: merge only runs of consecutive members
+    runs = []
+    for g in groups:
+        for run in np.split(np.asarray(g), np.flatnonzero(np.diff(g) > 1) + 1):
+            if len(run) > 1:
+                runs.append(run.tolist())
+    return runs
+
+
+def _style_key(tag: str, attrs: list[tuple[str, str]],
+               interactive: bool) -> tuple | None:
+    """Grouping key for a primitive (``None`` if it cannot be merged)."""
+    geometry = _GEOMETRY[tag]
+    geom: dict[str, str] = {}
+    style: list[tuple[str, str]] = []
+    for name, value in attrs:
+        if name in geometry:
+            geom[name] = value
+        elif name in _STYLE_ATTRS:
+            if tag == "line" and name in ("fill", "fill-opacity", "fill-rule"):
+                continue            # lines are never filled
+            if name == "class" and not interactive:
+                value = " ".join(c for c in value.split() if c != "glyphx-point")
+                if not value:
+                    continue
+            style.append((name, value))
+        elif name.startswith(_INTERACTIVE_PREFIXES) or name in _INTERACTIVE_ATTRS:
+            if interactive:
+                return None
+        else:
+            return None
+    if interactive and any(n == "class" and "glyphx-point" in v.split() for n, v in style):
+        return None
+    for name, default in geometry.items():
+        if name not in geom:
+            if default is None:
+                return None
+            geom[name] = default
+    d = _subpath(tag, geom)
+    if d is None:
+        return None
+    family = "stroke" if tag == "line" else "area"
+    return (family, tuple(style)), d
+
+
+def coalesce_svg(svg: str, interactive: bool = True) -> str:
+    """
+    Merge same-style sibling ``<rect>``/``<line>``/``<circle>`` elements.
+
+    Args:
+        svg:         An SVG fragment (or document).
+        interactive: Keep primitives that carry tooltips / ARIA attributes
+                     as individual nodes (default).  ``False`` merges them
+                     too and drops those attributes.
+
+    Returns:
+        The fragment with each group of two or more mergeable siblings
+        replaced by one ``<path>``.  Fragments with nothing to merge are
+        returned unchanged.
+    """
+    # container id -> painting children as (start, end, bounds, key, subpath)
+    siblings: dict[int, list[tuple]] = {}
+    stack: list[tuple[str, int]] = [("", 0)]      # (tag name, container id)
+    next_id, pos = 1, 0
+    while True:
+        m = _TAG.search(svg, pos)
+        if m is None:
+            break
+        pos = m.end()
+        closing, name, rest, self_closing = m.groups()
+        lname = name.lower()
+        if closing:
+            for k in range(len(stack) - 1, 0, -1):
+                if stack[k][0] == lname:
+                    del stack[k:]
+                    break
+            continue
+        parent = stack[-1][1]
+        if lname in _RAW and not self_closing:
+            end = svg.find(f"</{name}", pos)
+            pos = len(svg) if end < 0 else end
+            continue
+        if parent < 0:
+            if not self_closing:
+                stack.append((lname, parent))
+            continue
+        attrs = _parse_attrs(rest)
+        if not self_closing:
+            # Children of opaque containers get a negative id: never merged
+            content = ""
+            if lname == "text":
+                end = svg.find("</text", pos)
+                content = re.sub(r"<[^>]*>", "", svg[pos:end if end >= 0 else len(svg)])
+            bounds = _bounds(lname, attrs, content)
+            if bounds is not None:
+                siblings.setdefault(parent, []).append((m.start(), m.end(), bounds, None, None))
+            stack.append((lname, -next_id if lname in _OPAQUE else next_id))
+            next_id += 1
+            continue
+        keyed = (_style_key(lname, attrs, interactive)
+                 if attrs is not None and lname in _GEOMETRY else None)
+        bounds = _bounds(lname, attrs)
+        if keyed is None and bounds is None:
+            continue
+        key, d = keyed if keyed is not None else (None, None)
+        siblings.setdefault(parent, []).append((m.start(), m.end(), bounds, key, d))
+
+    edits: list[tuple[int, int, str]] = []
+    for items in siblings.values():
+        for group in _merge_plan(items):
+            family, style = items[group[0]][3]
+            attrs = "".join(f' {n}="{v}"' for n, v in style)
+            if family == "stroke":
+                attrs += ' fill="none"'
+            d = " ".join(items[i][4] for i in group)
+            for i in group[:-1]:
+                s, e = items[i][0], items[i][1]
+                # Drop the element together with its line break
+                if svg.startswith("\n", e):
+                    e += 1
+                edits.append((s, e, ""))
+            start, end = items[group[-1]][0], items[group[-1]][1]
+            edits.append((start, end, f'<path d="{d}"{attrs}/>'))
+    if not edits:
+        return svg
+
+    edits.sort()
+    out, last = [], 0
+    for s, e, text in edits:
+        out.append(svg[last:s])
+        out.append(text)
+        last = e
+    out.append(svg[last:])
+    return "".join(out)
@@ -131,6 +131,54 @@ def apply_colormap(value: float, cmap: str | list[str] = "viridis") -> str:
     )
 
 
+def colormap_rgb_array(values, cmap: str | list[str] = "viridis"):
+    """
+    Map an array of ``[0, 1]`` scalars to RGB bytes.
+
+    Interpolation and rounding match :func:`apply_colormap` exactly, so
+    ``colormap_rgb_array(v)[i]`` is the RGB triple of
+    ``apply_colormap(v[i])``.
+
+    Args:
+        values: Array-like of normalised values.
+        cmap:   Colormap name or a custom list of hex stops.
+
+    Returns:
+        ``np.ndarray`` of dtype ``uint8`` and shape ``(n, 3)`` (flattened).
+    """
+    import numpy as np
+
+    stops = cmap if isinstance(cmap, list) else get_colormap(cmap)
+    rgb   = np.array([_hex_to_rgb(c) for c in stops], dtype=float)
+    v     = np.clip(np.asarray(values, dtype=float).ravel(), 0.0, 1.0)
+
+    n  = len(stops) - 1
+    lo = np.minimum((v * n).astype(np.intp), n - 1)
+    t  = (v * n - lo)[:, None]
+    c1, c2 = rgb[lo], rgb[lo + 1]
+    return np.round(c1 + t * (c2 - c1)).astype(np.uint8)
+
+
+def apply_colormap_array(values, cmap: str | list[str] = "viridis") -> list[str]:
+    """
+    Vectorised :func:`apply_colormap`: map an array of ``[0, 1]`` scalars
+    to hex color strings.
+
+    Interpolation and rounding match :func:`apply_colormap` exactly; the
+    final hex strings are produced with one format call per value.
+
+    Args:
+        values: Array-like of normalised values.
+        cmap:   Colormap name or a custom list of hex stops.
+
+    Returns:
+        List of hex color strings, one per value (flattened).
+    """
+    out = colormap_rgb_array(values, cmap).astype(int)
+    packed = (out[:, 0] << 16) | (out[:, 1] << 8) | out[:, 2]
+    return [f"#{p:06x}" for p in packed.tolist()]
+
+
 def colormap_colors(cmap: str, n: int) -> list[str]:
     """
     Sample ``n`` evenly-spaced colors from a colormap.
@@ -39,13 +39,26 @@ Downsampling metadata
 ---------------------
 After rendering each series exposes ``series.last_downsample_info``
 — a dict with keys ``algorithm``, ``original_n``, ``thinned_n``.
+
+Result cache
+------------
+2-D line and scatter results are memoised in a bounded, thread-safe LRU
+keyed on the input arrays plus the pixel width, threshold and algorithm.
+Series pass their ``_data_version`` so the arrays are keyed by identity
+(O(1) per render); direct calls without a version fall back to a BLAKE2
+digest of the data.  Re-rendering the same figure (``show``, ``save``,
+``share``, ``__eq__``, live frames) downsamples only once.  Inspect it
+with ``cache_info()`` and reset it with ``cache_clear()``.
 """
 from __future__ import annotations
 
+import hashlib
+import itertools
 import math
 import threading
 import warnings
 import weakref
+from collections import OrderedDict
 import numpy as np
 from typing import TYPE_CHECKING
 
@@ -87,6 +100,172 @@ M4_THRESHOLD:   int = 50_000
 MIN_FACE_AREA:  float = 0.5
 
 
+# ---------------------------------------------------------------------------
+# 2-D result cache -- bounded LRU keyed on data identity/digest + parameters
+# ---------------------------------------------------------------------------
+
+DEFAULT_CACHE_SIZE: int = 32
+
+
+class _ResultCache:
+    """
+    Thread-safe bounded LRU used to memoise 2-D downsampling results.
+
+    Keys are built by the callers from ``_data_key`` plus the algorithm
+    parameters, so a cached entry is only returned for the same arrays at
+    the same data version, or for byte-identical data when no version is
+    known.  Cached arrays are marked read-only because the same objects
+    are handed to every caller.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits    = 0
+        self.misses  = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock  = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value: tuple) -> None:
+        for arr in value:
+            if isinstance(arr, np.ndarray):
+                arr.flags.writeable = False
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits   = 0
+            self.misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = max(0, int(maxsize))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "hits":    self.hits,
+                "misses":  self.misses,
+                "size":    len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+_ds2d_cache = _ResultCache()
+
+
+_tokens: dict = {}
+_token_counter = itertools.count()
+_tokens_lock   = threading.Lock()
+
+
+def _array_token(arr: np.ndarray) -> int:
+    """
+    Return an integer that identifies ``arr`` for as long as it is alive.
+
+    Unlike ``id()``, a token is never reused: the entry is dropped when the
+    array is garbage-collected, and a new array at the same address gets a
+    fresh token.
+    """
+    ident = id(arr)
+    with _tokens_lock:
+        entry = _tokens.get(ident)
+        if entry is not None and entry[0]() is arr:
+            return entry[1]
+
+        def _drop(ref, ident=ident):
+            with _tokens_lock:
+                if _tokens.get(ident, (None,))[0] is ref:
+                    del _tokens[ident]
+
+        token = next(_token_counter)
+        _tokens[ident] = (weakref.ref(arr, _drop), token)
+        return token
+
+
+def _content_key(arr: np.ndarray) -> tuple:
+    """
+    Fingerprint an array by length, dtype and a BLAKE2 digest of its bytes.
+
+    A full linear pass over the data — roughly a third of the cost of
+    M4+LTTB on the same input — so it is only used when the caller has no
+    data version to key on.  It cannot return stale results after an
+    in-place mutation.
+    """
+    contiguous = np.ascontiguousarray(arr)
+    digest = hashlib.blake2b(contiguous.view(np.uint8), digest_size=16).digest()
+    return (contiguous.shape, contiguous.dtype.str, digest)
+
+
+def _data_key(x, y, version) -> tuple:
+    """
+    Cache-key component for a pair of input columns.
+
+    With a ``version`` (a series' ``_data_version``) the key is the identity
+    of ``x`` and ``y`` plus that counter — O(1), so cache hits no longer
+    scan the data.  Without one, both arrays are digested.
+    """
+    if version is not None and isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
+        return ("version", _array_token(x), _array_token(y), len(x), version)
+    return ("content", _content_key(np.asarray(x)), _content_key(np.asarray(y)))
+
+
+def cache_info() -> dict:
+    """
+    Return hit/miss counters for the 2-D downsampling cache.
+
+    Returns:
+        Dict with keys ``hits``, ``misses``, ``size`` and ``maxsize``.
+    """
+    return _ds2d_cache.info()
+
+
+def cache_clear() -> None:
+    """Empty the 2-D downsampling cache and reset its counters."""
+    _ds2d_cache.clear()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """
+    Change the number of results kept by the 2-D downsampling cache.
+
+    ``0`` disables caching entirely; the least recently used entries are
+    evicted when shrinking.
+    """
+    _ds2d_cache.resize(maxsize)
+
+
+def _x_column(x) -> np.ndarray:
+    """
+    Return line X values as an ndarray for bucketing.
+
+    Signed-integer columns — notably the int64 epoch view of a
+    ``datetime64`` time axis — are used as-is, without a float copy;
+    everything else is converted to ``float``.
+    """
+    arr = np.asarray(x)
+    return arr if arr.dtype.kind == "i" else np.asarray(arr, dtype=float)
+
+
 # ---------------------------------------------------------------------------
 # LTTB -- fully vectorised inner loop
 # ---------------------------------------------------------------------------
@@ -104,7 +283,7 @@ def lttb(
     and ``np.argmax`` selects the winner — no Python loop inside the bucket.
 
     Args:
-        x:          X values (1-D, numeric).
+        x:          X values (1-D, numeric; signed-integer X is kept as-is).
         y:          Y values (1-D, numeric, same length as x).
         threshold:  Maximum number of output points (>= 3).
 
@@ -114,7 +293,7 @@ def lttb(
     Raises:
         ValueError: If lengths differ or threshold < 3.
     """
-    x_arr = np.asarray(x, dtype=float)
+    x_arr = _x_column(x)
     y_arr = np.asarray(y, dtype=float)
     n = len(x_arr)
 
@@ -205,14 +384,15 @@ def m4(
     a ``UserWarning``.
 
     Args:
-        x:           X values (1-D, numeric, monotone).
+        x:           X values (1-D, numeric, monotone; signed-integer X is
+                     kept as-is).
         y:           Y values (1-D, numeric, same length as x).
         pixel_width: Canvas width in pixels.
 
     Returns:
         ``(x_down, y_down)`` -- NumPy arrays.
     """
-    x_arr = np.asarray(x, dtype=float)
+    x_arr = _x_column(x)
     y_arr = np.asarray(y, dtype=float)
     n = len(x_arr)
 
@@ -294,6 +474,7 @@ def maybe_downsample_line(
     pixel_width: int = 800,
     threshold: int = AUTO_THRESHOLD,
     m4_threshold: int = M4_THRESHOLD,
+    version: int | None = None,
 ) -> tuple[np.ndarray | list, np.ndarray | list]:
     """
     Two-stage downsampling pipeline for ordered 2-D line data.
@@ -301,6 +482,14 @@ def maybe_downsample_line(
     Stage 1 -- M4  : if n > ``m4_threshold``, reduce via M4.
     Stage 2 -- LTTB: if still > ``threshold``, apply LTTB.
 
+    Results are memoised in the 2-D result cache; the returned arrays are
+    read-only when downsampling took place.  Pass ``version`` (the caller's
+    data version, bumped on every change to ``x``/``y``) to key the cache
+    on array identity instead of hashing the data on every call.
+
+    Signed-integer X (e.g. the int64 epoch view of a ``datetime64`` column)
+    is bucketed directly without a float copy and returned as integers.
+
     Respects the thread-local kill-switch.
     """
     if not _enabled():
@@ -310,7 +499,12 @@ def maybe_downsample_line(
     if n <= threshold:
         return x, y
 
-    x_arr = np.asarray(x, dtype=float)
+    key = ("M4+LTTB", _data_key(x, y, version), pixel_width, threshold, m4_threshold)
+    cached = _ds2d_cache.get(key)
+    if cached is not None:
+        return cached
+
+    x_arr = _x_column(x)
     y_arr = np.asarray(y, dtype=float)
 
     if n > m4_threshold:
@@ -319,6 +513,7 @@ def maybe_downsample_line(
     if len(x_arr) > threshold:
         x_arr, y_arr = lttb(x_arr, y_arr, threshold)
 
+    _ds2d_cache.put(key, (x_arr, y_arr))
     return x_arr, y_arr
 
 
@@ -359,6 +554,7 @@ def voxel_thin_2d(
     y: list | np.ndarray,
     c: list | np.ndarray | None = None,
     max_points: int = AUTO_THRESHOLD,
+    version: int | None = None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
     """
     2-D voxel grid thinning for unordered scatter data.
@@ -369,7 +565,9 @@ def voxel_thin_2d(
     reducing the dominant cost from O(n log n) to O(n log n) sort by
     cell + O(n) scan.
 
-    The dtype of ``c`` is preserved in the output.
+    The dtype of ``c`` is preserved in the output.  The kept indices are
+    memoised in the 2-D result cache, so ``c`` does not affect the key;
+    ``version`` keys it on array identity as in ``maybe_downsample_line``.
 
     Respects the thread-local kill-switch.
 
@@ -377,6 +575,7 @@ def voxel_thin_2d(
         x, y:       Coordinates (1-D, same length).
         c:          Optional per-point values (threaded through).
         max_points: Target maximum output points.
+        version:    Caller's data version, or ``None`` to hash the data.
 
     Returns:
         ``(x_thin, y_thin, c_thin)``
@@ -384,6 +583,7 @@ def voxel_thin_2d(
     Raises:
         ValueError: If x and y have different lengths.
     """
+    x_src, y_src = x, y
     x_arr = np.asarray(x, dtype=float)
     y_arr = np.asarray(y, dtype=float)
 
@@ -397,6 +597,24 @@ def voxel_thin_2d(
     if not _enabled() or len(x_arr) <= max_points:
         return x_arr, y_arr, c_arr
 
+    key = ("voxel-2D", _data_key(x_src, y_src, version), max_points)
+    cached = _ds2d_cache.get(key)
+    if cached is not None:
+        kept = cached[0]
+    else:
+        kept = _voxel_keep_2d(x_arr, y_arr, max_points)
+        _ds2d_cache.put(key, (kept,))
+
+    c_out = c_arr[kept] if c_arr is not None else None
+    return x_arr[kept], y_arr[kept], c_out
+
+
+def _voxel_keep_2d(
+    x_arr: np.ndarray,
+    y_arr: np.ndarray,
+    max_points: int,
+) -> np.ndarray:
+    """Return the sorted indices kept by 2-D voxel thinning."""
     grid_k = max(1, int(math.ceil(math.sqrt(max_points))))
 
     x_min, x_max = x_arr.min(), x_arr.max()
@@ -433,10 +651,7 @@ def voxel_thin_2d(
         seg = dist_sorted[cs:ce]
         best_local[ci] = cs + int(np.argmin(seg))  # position in cell_order
 
-    kept = np.sort(cell_order[best_local])
-
-    c_out = c_arr[kept] if c_arr is not None else None
-    return x_arr[kept], y_arr[kept], c_out
+    return np.sort(cell_order[best_local])
 
 
 # ---------------------------------------------------------------------------
@@ -472,14 +687,8 @@ def _project_vectorised(
     cam: "Camera3D",
 ) -> tuple[np.ndarray, np.ndarray]:
     """Vectorised orthographic projection matching Camera3D.project()."""
-    cos_az, sin_az = cam._cos_az, cam._sin_az
-    cos_el, sin_el = cam._cos_el, cam._sin_el
-
-    rx =  xn * cos_az + yn * sin_az
-    ry = -xn * sin_az + yn * cos_az
-    fz = -ry * sin_el - zn * cos_el
-
-    return cam.cx + rx * cam.scale, cam.cy - fz * cam.scale
+    px, py, _ = cam.project_array(xn, yn, zn)
+    return px, py
 
 
 # ---------------------------------------------------------------------------
@@ -505,7 +714,7 @@ def lttb_3d(
     Raises:
         ValueError: If x, y, z have different lengths.
     """
-    from .projection3d import normalize
+    from .projection3d import normalize_array
 
     x_arr = np.asarray(x, dtype=float)
     y_arr = np.asarray(y, dtype=float)
@@ -530,9 +739,9 @@ def lttb_3d(
     if cam_cache is not None and cam_cache[0] == cache_key:
         return cam_cache[1]
 
-    xn = np.asarray(normalize(x_arr)[0], dtype=float)
-    yn = np.asarray(normalize(y_arr)[0], dtype=float)
-    zn = np.asarray(normalize(z_arr)[0], dtype=float)
+    xn = normalize_array(x_arr)[0]
+    yn = normalize_array(y_arr)[0]
+    zn = normalize_array(z_arr)[0]
     px, py = _project_vectorised(xn, yn, zn, cam)
 
     # Reuse vectorised LTTB on (px, py) — same algorithm, screen coords
@@ -733,14 +942,23 @@ def cull_faces(
             px[fi, vi] = p.px
             py[fi, vi] = p.py
 
-    idx_next = np.array([1, 2, 3, 0])
-    cross    = (px * py[:, idx_next] - px[:, idx_next] * py).sum(axis=1)
-    areas    = np.abs(cross) * 0.5
-
-    mask = areas >= min_area
+    mask = quad_areas(px, py) >= min_area
     return [f for f, keep in zip(faces, mask) if keep]
 
 
+def quad_areas(px: np.ndarray, py: np.ndarray) -> np.ndarray:
+    """
+    Screen areas of quads given as ``(..., 4)`` vertex coordinate arrays.
+
+    Array counterpart of :func:`cull_faces` for renderers that already hold
+    projected vertices as NumPy arrays: keep faces with
+    ``quad_areas(px, py) >= MIN_FACE_AREA``.
+    """
+    idx_next = np.array([1, 2, 3, 0])
+    cross    = (px * py[..., idx_next] - px[..., idx_next] * py).sum(axis=-1)
+    return np.abs(cross) * 0.5
+
+
 # ---------------------------------------------------------------------------
 # SVG annotation helper
 # ---------------------------------------------------------------------------
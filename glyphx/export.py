@@ -0,0 +1,238 @@
+"""
+GlyphX batch raster export -- SVG to PNG on a process pool.
+
+Rasterizing is the slow step of any bulk export: ``Figure.save("x.png")``
+converts one chart at a time on the calling thread.  :func:`rasterize_many`
+renders each chart's SVG in the calling process and fans the SVG -> PNG
+conversion out to worker processes, keeping at most ``max_pending`` jobs
+in flight so memory stays bounded however many charts are queued::
+
+    from glyphx.export import rasterize_many, build_pptx
+
+    pngs  = rasterize_many(figures, workers=8, dpi=192)          # bytes
+    paths = rasterize_many([(fig, f"out/{i}.png")                 # files
+                            for i, fig in enumerate(figures)], workers=8)
+    build_pptx(figures, "weekly.pptx", workers=8)                # one deck
+
+Rasters come from ``cairosvg`` when it is installed and from the built-in
+NumPy rasterizer (:mod:`glyphx.raster`) otherwise; ``backend=`` forces
+either one.  Results are returned in input order.
+"""
+from __future__ import annotations
+
+import io
+import os
+from collections import deque
+from typing import Any, Iterable, Iterator
+
+_BACKENDS = ("auto", "cairosvg", "builtin")
+
+
+def _png_bytes(svg: str, scale: float = 1.0, backend: str = "auto") -> bytes:
+    """
+    Rasterize ``svg`` to PNG bytes with the requested backend.
+
+    ``"auto"`` uses cairosvg when it (and libcairo) can be imported and
+    the built-in rasterizer otherwise.
+
+    Raises:
+        ValueError:   For an unknown ``backend``.
+        RuntimeError: If ``backend="cairosvg"`` and cairosvg is unavailable.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"backend must be one of {_BACKENDS}, got {backend!r}.")
+    if backend != "builtin":
+        try:
+            import cairosvg
+        except (ImportError, OSError):     # OSError: libcairo missing
+            if backend == "cairosvg":
+                raise RuntimeError(
+                    "The cairosvg backend requires cairosvg.  Install it with:\n"
+                    "    pip install cairosvg"
+                )
+        else:
+            return cairosvg.svg2png(bytestring=svg.encode(), scale=scale)
+    from .raster import svg_to_png
+    return svg_to_png(svg, scale=scale)
+
+
+def _rasterize_job(svg: str, scale: float, backend: str, filename: str | None):
+    """Worker task: PNG bytes, or the path of the file written."""
+    if filename is None:
+        return _png_bytes(svg, scale, backend)
+    if str(filename).lower().endswith(".png"):
+        data = _png_bytes(svg, scale, backend)
+        with open(filename, "wb") as f:
+            f.write(data)
+    else:
+        from .utils import write_svg_file
+        write_svg_file(svg, filename, dpi=scale * 96)
+    return filename
+
+
+def _as_svg(chart: Any) -> str:
+    if isinstance(chart, str):
+        return chart
+    if hasattr(chart, "render_svg"):
+        return chart.render_svg()
+    raise TypeError("Expected a Figure or an SVG string.")
+
+
+def iter_rasterize(
+    items: Iterable[Any],
+    workers: int | None = None,
+    dpi: int = 96,
+    backend: str = "auto",
+    max_pending: int | None = None,
+) -> Iterator[bytes | str]:
+    """
+    Lazily rasterize charts on a process pool, yielding results in order.
+
+    Args:
+        items:       Charts (Figures or SVG strings) or ``(chart, filename)``
+                     pairs.  Items are consumed only as pool slots free up.
+        workers:     Worker processes (default: CPU count).  ``0`` or ``1``
+                     rasterizes in the calling process.
+        dpi:         Output resolution (96 = one pixel per SVG unit).
+        backend:     ``"auto"``, ``"cairosvg"`` or ``"builtin"``.
+        max_pending: Jobs in flight at once (default ``2 * workers``);
+                     bounds the SVGs and PNGs held in memory.
+
+    Yields:
+        PNG bytes for bare charts; the filename for ``(chart, filename)``
+        pairs, written by the worker (``.png`` with ``backend``, other
+        extensions via ``write_svg_file``).
+
+    Raises:
+        ValueError: For an unknown ``backend`` or negative ``workers``.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"backend must be one of {_BACKENDS}, got {backend!r}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("workers must be >= 0.")
+    scale = dpi / 96.0
+
+    def jobs():
+        for item in items:
+            if isinstance(item, tuple):
+                chart, filename = item
+            else:
+                chart, filename = item, None
+            yield _as_svg(chart), scale, backend, filename
+
+    if workers <= 1:
+        for job in jobs():
+            yield _rasterize_job(*job)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    window  = max(1, max_pending or 2 * workers)
+    pending: deque = deque()
+    pool    = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for job in jobs():
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_rasterize_job, *job))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def rasterize_many(
+    items: Iterable[Any],
+    workers: int | None = None,
+    dpi: int = 96,
+    backend: str = "auto",
+    max_pending: int | None = None,
+) -> list[bytes | str]:
+    """
+    Rasterize many charts on a process pool.
+
+    Eager form of :func:`iter_rasterize` (same arguments): returns the list
+    of PNG bytes / written filenames in input order.  When writing files,
+    only the filenames are held, so memory stays bounded by ``max_pending``.
+    """
+    return list(iter_rasterize(items, workers=workers, dpi=dpi,
+                               backend=backend, max_pending=max_pending))
+
+
+def _add_chart_slide(prs, png: bytes, title: str | None) -> None:
+    """Append a blank 16:9 slide holding ``png`` under an optional title."""
+    from pptx.util import Inches, Pt
+    from pptx.enum.text import PP_ALIGN
+
+    slide   = prs.slides.add_slide(prs.slide_layouts[6])   # blank layout
+    slide_w = prs.slide_width
+    slide_h = prs.slide_height
+
+    # -- Optional title text box -------------------------------------------
+    top_offset = Inches(0)
+    if title:
+        txBox = slide.shapes.add_textbox(
+            Inches(0.3), Inches(0.1), slide_w - Inches(0.6), Inches(0.55)
+        )
+        tf = txBox.text_frame
+        tf.text = title
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        tf.paragraphs[0].runs[0].font.size = Pt(22)
+        tf.paragraphs[0].runs[0].font.bold = True
+        top_offset = Inches(0.65)
+
+    # -- Insert chart PNG --------------------------------------------------
+    pic_h = slide_h - top_offset - Inches(0.1)
+    pic_w = min(slide_w - Inches(0.4), pic_h * (slide_w / slide_h))
+    left  = (slide_w - pic_w) // 2
+    slide.shapes.add_picture(io.BytesIO(png), left, top_offset, pic_w, pic_h)
+
+
+def build_pptx(
+    charts: Iterable[Any],
+    filename: str,
+    titles: Iterable[str | None] | None = None,
+    workers: int | None = None,
+    dpi: int = 192,
+    backend: str = "auto",
+) -> str:
+    """
+    Build one PowerPoint deck with a slide per chart.
+
+    Charts are rasterized on a process pool (:func:`iter_rasterize`) and
+    added to the deck as each PNG arrives.  Requires ``python-pptx``::
+
+        pip install "glyphx[pptx]"
+
+    Args:
+        charts:   Figures or SVG strings, one slide each.
+        filename: Output ``.pptx`` path.
+        titles:   Slide titles (default: each figure's ``title``).
+        workers:  Worker processes (default: CPU count).
+        dpi:      Raster resolution (default 192, i.e. 2x).
+        backend:  ``"auto"``, ``"cairosvg"`` or ``"builtin"``.
+
+    Returns:
+        ``filename``.
+
+    Raises:
+        RuntimeError: If python-pptx is not installed.
+    """
+    try:
+        from pptx import Presentation
+    except ImportError:
+        raise RuntimeError(
+            "PPTX export requires python-pptx.  Install it with:\n"
+            "    pip install \"glyphx[pptx]\""
+        )
+    charts = list(charts)
+    titles = list(titles) if titles is not None else [
+        None if isinstance(c, str) else getattr(c, "title", None) for c in charts]
+    prs = Presentation()
+    pngs = iter_rasterize(charts, workers=workers, dpi=dpi, backend=backend)
+    for i, png in enumerate(pngs):
+        _add_chart_slide(prs, png, titles[i] if i < len(titles) else None)
+    prs.save(filename)
+    return filename
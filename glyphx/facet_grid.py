@@ -161,22 +161,22 @@ class FacetGrid:
                     series = None
                     if kind == "scatter" and x and y:
                         series = ScatterSeries(
-                            sub[x].tolist(), sub[y].tolist(),
+                            sub[x].to_numpy(), sub[y].to_numpy(),
                             color=color, label=label, **kwargs
                         )
                     elif kind == "line" and x and y:
                         series = LineSeries(
-                            sub[x].tolist(), sub[y].tolist(),
+                            sub[x].to_numpy(), sub[y].to_numpy(),
                             color=color, label=label, **kwargs
                         )
                     elif kind == "bar" and x and y:
                         series = BarSeries(
-                            sub[x].tolist(), sub[y].tolist(),
+                            sub[x].to_numpy(), sub[y].to_numpy(),
                             color=color, label=label, **kwargs
                         )
                     elif kind == "hist" and x:
                         series = HistogramSeries(
-                            sub[x].dropna().tolist(),
+                            sub[x].dropna().to_numpy(),
                             color=color, label=label, **kwargs
                         )
                     elif kind == "kde" and x:
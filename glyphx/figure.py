@@ -3,7 +3,6 @@ GlyphX Figure: top-level chart canvas with rendering, display, and export.
 """
 from __future__ import annotations
 
-import re
 import webbrowser
 from tempfile import NamedTemporaryFile
 from typing import Any
@@ -13,8 +12,10 @@ from .utils import (
     wrap_svg_with_template,
     write_svg_file,
     wrap_svg_canvas,
+    new_chart_id,
     draw_legend,
     svg_escape,
+    _is_empty,
 )
 
 
@@ -45,6 +46,16 @@ class Figure:
         legend:       Legend position string, or ``False`` to suppress.
         xscale:       ``"linear"`` or ``"log"``.
         yscale:       ``"linear"`` or ``"log"``.
+        coalesce:     Merge same-style primitives (bars, grid and error-bar
+                      lines, markers) into one ``<path>`` per style group
+                      to cut the DOM node count.  ``True`` keeps tooltip
+                      carrying data points as individual nodes; ``"all"``
+                      merges those too (static output without tooltips).
+                      See :mod:`glyphx.coalesce`.
+        css_classes:  Move repeated presentation attributes (fill, stroke,
+                      font...) into one ``<style>`` block of generated
+                      classes scoped to this chart.  See
+                      :mod:`glyphx.styleclasses`.
     """
 
     def __init__(
@@ -60,7 +71,13 @@ class Figure:
         legend: str | bool | None = "outside-right",
         xscale: str = "linear",
         yscale: str = "linear",
+        coalesce: bool | str = False,
+        css_classes: bool = False,
     ) -> None:
+        if coalesce not in (False, True, "all"):
+            raise ValueError(
+                f"coalesce must be True, False or 'all', got {coalesce!r}."
+            )
         self.width        = width
         self.height       = height
         self.padding      = padding
@@ -70,6 +87,8 @@ class Figure:
         self.auto_display = auto_display
         self.xscale       = xscale
         self.yscale       = yscale
+        self.coalesce     = coalesce
+        self.css_classes  = css_classes
 
         from .themes import themes
         self._theme_name: str = (
@@ -661,7 +680,9 @@ class Figure:
         if self.axes._y_domain:
             ymin, ymax = self.axes._y_domain
         elif self.series:
-            all_y = [v for s, _ in self.series for v in (s.y or []) if v is not None]
+            all_y = [v for s, _ in self.series
+                     if not _is_empty(getattr(s, "y", None))
+                     for v in s.y if v is not None]
             ymin, ymax = (min(all_y), max(all_y)) if all_y else (0, 1)
         else:
             ymin, ymax = 0, 1
@@ -676,7 +697,13 @@ class Figure:
         if self.axes._x_domain:
             xmin, xmax = self.axes._x_domain
         elif self.series:
-            all_x = [v for s, _ in self.series for v in (getattr(s, "_numeric_x", None) or s.x or []) if v is not None]
+            all_x = []
+            for s, _ in self.series:
+                xs = getattr(s, "_numeric_x", None)
+                if _is_empty(xs):
+                    xs = getattr(s, "x", None)
+                if not _is_empty(xs):
+                    all_x.extend(v for v in xs if v is not None)
             xmin, xmax = (min(all_x), max(all_x)) if all_x else (0, 1)
         else:
             xmin, xmax = 0, 1
@@ -855,6 +882,13 @@ class Figure:
 
     # -- Rendering --------------------------------------------------------
 
+    def _coalesced(self, fragment: str) -> str:
+        """Pass one rendered fragment through the coalescer when enabled."""
+        if not self.coalesce:
+            return fragment
+        from .coalesce import coalesce_svg
+        return coalesce_svg(fragment, interactive=self.coalesce != "all")
+
     def render_svg(self, viewbox: bool = False) -> str:
         """
         Render the complete figure and return an SVG string.
@@ -868,6 +902,9 @@ class Figure:
             Complete SVG document markup.
         """
         svg_parts: list[str] = []
+        # Generated up front so series can scope their element ids with it
+        cid = new_chart_id()
+        self.axes.chart_id = cid
 
         if any(a["arrow"] for a in self._annotations):
             svg_parts.append(self._arrow_marker_def())
@@ -936,10 +973,12 @@ class Figure:
                     if not ax:
                         continue
                     ax.finalize()
+                    ax.chart_id = cid
                     group = f'<g transform="translate({c * cell_w},{r * cell_h})">'
-                    group += ax.render_axes() + ax.render_grid()
+                    group += self._coalesced(ax.render_axes())
+                    group += self._coalesced(ax.render_grid())
                     for s in ax.series:
-                        group += s.to_svg(ax)
+                        group += self._coalesced(s.to_svg(ax))
                     if getattr(ax, "legend_pos", None):
                         group += draw_legend(
                             ax.series,
@@ -954,7 +993,8 @@ class Figure:
 
         # -- Single-axes ---------------------------------------------------
         elif self.series and any(
-            hasattr(s, "x") and hasattr(s, "y") and s.x and s.y
+            hasattr(s, "x") and hasattr(s, "y")
+            and not _is_empty(s.x) and not _is_empty(s.y)
             for s, _ in self.series
         ):
             if not self.axes.series:
@@ -962,11 +1002,12 @@ class Figure:
                     self.axes.add_series(s, use_y2)
 
             self.axes.finalize()
-            svg_parts.append(self.axes.render_axes())
-            svg_parts.append(self.axes.render_grid())
+            svg_parts.append(self._coalesced(self.axes.render_axes()))
+            svg_parts.append(self._coalesced(self.axes.render_grid()))
 
             for series, use_y2 in self.series:
-                svg_parts.append(series.to_svg(self.axes, use_y2=use_y2))
+                svg_parts.append(self._coalesced(
+                    series.to_svg(self.axes, use_y2=use_y2)))
 
             if self._annotations and self.axes.scale_x and self.axes.scale_y:
                 svg_parts.append(self._render_annotations(
@@ -996,7 +1037,7 @@ class Figure:
         # -- Axis-free (pie, donut, etc.) ----------------------------------
         elif self.series:
             for series, _ in self.series:
-                svg_parts.append(series.to_svg(self.axes))
+                svg_parts.append(self._coalesced(series.to_svg(self.axes)))
 
         # Detect math text ($...$) in the rendered SVG content for MathJax
         _svg_content = "\n".join(svg_parts)
@@ -1007,11 +1048,14 @@ class Figure:
             width=self.width,
             height=self.height,
             has_math=_has_math,
+            chart_id=cid,
         )
 
         # -- Accessibility injection ---------------------------------------
-        chart_id = re.search(r'id="(glyphx-chart-[^"]+)"', raw_svg)
-        cid      = chart_id.group(1) if chart_id else "glyphx-chart-0"
+
+        if self.css_classes:
+            from .styleclasses import dedupe_styles
+            raw_svg = dedupe_styles(raw_svg, cid)
 
         from .a11y import inject_aria
         return inject_aria(
@@ -1094,10 +1138,15 @@ class Figure:
         Save the rendered figure to disk.
 
         Supported extensions: ``.svg``, ``.html``, ``.png``, ``.jpg``,
-        ``.pptx``.  PNG/JPG/PPTX require optional extras::
+        ``.pptx``, and the pre-compressed ``.svgz`` / ``.svg.gz`` /
+        ``.html.gz`` (gzip) and ``.svg.br`` / ``.html.br`` (Brotli).
+        JPG/PPTX and Brotli require optional extras; PNG uses cairosvg
+        when installed and the built-in rasterizer (:mod:`glyphx.raster`)
+        otherwise::
 
-            pip install "glyphx[export]"    # PNG/JPG
+            pip install "glyphx[export]"    # PNG/JPG via cairosvg
             pip install "glyphx[pptx]"      # PowerPoint
+            pip install "glyphx[brotli]"    # .br artifacts
 
         Args:
             filename: Output path.  Extension determines the format.
@@ -1120,6 +1169,37 @@ class Figure:
             write_svg_file(svg, filename, dpi=dpi)
         return self
 
+    def to_bytes(self, format: str = "svg", compress: str | None = None) -> bytes:
+        """
+        Render the figure to encoded, optionally compressed, bytes.
+
+        Suited to uploading pre-compressed artifacts to object storage
+        (serve with ``Content-Encoding: gzip`` / ``br``).  The document is
+        encoded and compressed chunk by chunk, so only the rendered SVG and
+        the compressed output are held in memory.
+
+        Args:
+            format:   ``"svg"`` or ``"html"`` (the interactive page written
+                      by ``save("chart.html")``).
+            compress: ``None`` (plain UTF-8), ``"gzip"`` or ``"br"``
+                      (requires ``brotli``).
+
+        Returns:
+            The document bytes.
+
+        Raises:
+            ValueError:   For an unknown ``format`` or ``compress``.
+            RuntimeError: If ``"br"`` is requested and brotli is not installed.
+
+        Example::
+
+            body = fig.to_bytes("svg", compress="gzip")
+            bucket.put("chart.svg", body, ContentEncoding="gzip")
+        """
+        from .utils import document_parts, iter_encoded
+        parts = document_parts(self.render_svg(), format)
+        return b"".join(iter_encoded(parts, compress))
+
 
     def tight_layout(self) -> "Figure":
         """
@@ -1281,66 +1361,17 @@ def _save_as_pptx(svg: str, filename: str, title: str | None = None) -> None:
     """
     Save an SVG as a PNG-embedded PowerPoint slide.
 
-    Requires ``python-pptx`` and ``cairosvg``::
+    Requires ``python-pptx``::
 
         pip install "glyphx[pptx]"
 
-    The SVG is rasterised to PNG at 2x resolution, then inserted as a
-    full-slide picture in a blank 16:9 presentation.
+    The SVG is rasterised to PNG at 2x resolution (cairosvg, or the
+    built-in rasterizer without it), then inserted as a full-slide picture
+    in a blank 16:9 presentation.  See :func:`glyphx.export.build_pptx`
+    for multi-slide decks.
     """
-    try:
-        import cairosvg
-    except (ImportError, OSError):
-        raise RuntimeError(
-            "PPTX export requires cairosvg and the system libcairo library.  "
-            "Install with:\n"
-            "    pip install \"glyphx[pptx]\"\n"
-            "On macOS: brew install cairo"
-        )
-    try:
-        from pptx import Presentation
-        from pptx.util import Inches, Pt
-        from pptx.enum.text import PP_ALIGN
-    except ImportError:
-        raise RuntimeError(
-            "PPTX export requires python-pptx.  Install it with:\n"
-            "    pip install \"glyphx[pptx]\""
-        )
-
-    import io
-
-    # -- SVG -> PNG at 2x for crisp rendering ------------------------------
-    png_bytes = cairosvg.svg2png(bytestring=svg.encode(), scale=2)
-    png_stream = io.BytesIO(png_bytes)
-
-    # -- Build presentation ------------------------------------------------
-    prs    = Presentation()
-    blank  = prs.slide_layouts[6]          # completely blank layout
-    slide  = prs.slides.add_slide(blank)
-
-    slide_w = prs.slide_width
-    slide_h = prs.slide_height
-
-    # -- Optional title text box -------------------------------------------
-    top_offset = Inches(0)
-    if title:
-        txBox = slide.shapes.add_textbox(
-            Inches(0.3), Inches(0.1), slide_w - Inches(0.6), Inches(0.55)
-        )
-        tf = txBox.text_frame
-        tf.text = title
-        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-        tf.paragraphs[0].runs[0].font.size = Pt(22)
-        tf.paragraphs[0].runs[0].font.bold = True
-        top_offset = Inches(0.65)
-
-    # -- Insert chart PNG --------------------------------------------------
-    pic_h = slide_h - top_offset - Inches(0.1)
-    pic_w = min(slide_w - Inches(0.4), pic_h * (slide_w / slide_h))
-    left  = (slide_w - pic_w) // 2
-
-    slide.shapes.add_picture(png_stream, left, top_offset, pic_w, pic_h)
-    prs.save(filename)
+    from .export import build_pptx
+    build_pptx([svg], filename, titles=[title], workers=0, dpi=192)
 
 
 # ---------------------------------------------------------------------------
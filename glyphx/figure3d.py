@@ -23,6 +23,7 @@ Usage::
 """
 from __future__ import annotations
 
+import base64
 import json
 import math
 import tempfile
@@ -32,7 +33,7 @@ from typing import Any
 
 import numpy as np
 
-from .projection3d import Camera3D, normalize, axis_ticks, _format_3d_tick
+from .projection3d import Camera3D, axis_ticks, _format_3d_tick
 from .themes        import themes as _themes
 from .utils         import svg_escape
 
@@ -196,6 +197,30 @@ canvas { display:block; }
 const DATA    = {data_json};
 const THEME   = {theme_json};
 const LABELS  = {labels_json};
+const RANGES  = {ranges_json};
+
+// Typed-array payload: base64 little-endian bytes -> TypedArray view
+function unpack(b64, Type) {
+  const bin = atob(b64), n = bin.length;
+  const bytes = new Uint8Array(n);
+  for (let i = 0; i < n; i++) bytes[i] = bin.charCodeAt(i);
+  return Type === Uint8Array ? bytes : new Type(bytes.buffer);
+}
+
+// Normalised [-1, 1] coordinate -> data value, rounded to the axis resolution
+function unnorm(p, r) {
+  const span = (r[1] - r[0]) || 1;
+  const v = r[0] + (p + 1) / 2 * span;
+  const e = Math.floor(Math.log10(span)) - 5;
+  return e < 0 ? Math.round(v * 10 ** -e) / 10 ** -e
+               : Math.round(v / 10 ** e) * 10 ** e;
+}
+
+// Data (x, y, z) of vertex i of a Three.js position array (Y-up order)
+function dataXYZ(pos, i) {
+  return [unnorm(pos[i*3], RANGES.x), unnorm(pos[i*3+2], RANGES.y),
+          unnorm(pos[i*3+1], RANGES.z)];
+}
 
 function fmtV(v) {
   const a = Math.abs(v);
@@ -438,22 +463,16 @@ DATA.forEach((series, si) => {
 
   // -- Scatter -------------------------------------------------------
   if (series.type === 'scatter') {
-    const N = series.x.length;
-    const positions = new Float32Array(N*3);
-    const colors    = new Float32Array(N*3);
-    for (let i=0; i<N; i++) {
-      positions[i*3]   = series.nx[i];
-      positions[i*3+1] = series.nz[i];
-      positions[i*3+2] = series.ny[i];
-      const c = new THREE.Color(series.colors[i]);
-      colors[i*3]=c.r; colors[i*3+1]=c.g; colors[i*3+2]=c.b;
-    }
     const geom = new THREE.BufferGeometry();
-    geom.setAttribute('position', new THREE.BufferAttribute(positions, 3));
-    geom.setAttribute('color',    new THREE.BufferAttribute(colors,    3));
-    geom.userData = { xs:series.x, ys:series.y, zs:series.z, label:series.label };
+    geom.setAttribute('position',
+      new THREE.BufferAttribute(unpack(series.pos, Float32Array), 3));
+    if (series.rgb)
+      geom.setAttribute('color',
+        new THREE.BufferAttribute(unpack(series.rgb, Uint8Array), 3, true));
+    geom.userData = { label:series.label };
     const mat = new THREE.PointsMaterial({
-      size: series.size*0.012, vertexColors:true,
+      size: series.size*0.012, vertexColors: !!series.rgb,
+      color: series.rgb ? 0xffffff : new THREE.Color(series.color),
       transparent:true, opacity:series.alpha, sizeAttenuation:true
     });
     const pts = new THREE.Points(geom, mat);
@@ -463,9 +482,9 @@ DATA.forEach((series, si) => {
 
   // -- Line ---------------------------------------------------------
   if (series.type === 'line') {
-    const pts3 = series.nx.map((nx,i) =>
-      new THREE.Vector3(nx, series.nz[i], series.ny[i]));
-    const g = new THREE.BufferGeometry().setFromPoints(pts3);
+    const g = new THREE.BufferGeometry();
+    g.setAttribute('position',
+      new THREE.BufferAttribute(unpack(series.pos, Float32Array), 3));
     const m = new THREE.LineBasicMaterial({
       color: new THREE.Color(series.color), linewidth:series.width
     });
@@ -475,28 +494,22 @@ DATA.forEach((series, si) => {
   // -- Surface ------------------------------------------------------
   if (series.type === 'surface') {
     const M = series.ny, N = series.nx;
-    const positions = new Float32Array(M*N*3);
-    const colors    = new Float32Array(M*N*3);
-    for (let j=0; j<M; j++) for (let i=0; i<N; i++) {
-      const idx=(j*N+i)*3;
-      positions[idx]   = series.nxArr[i];
-      positions[idx+1] = series.nz[j][i];
-      positions[idx+2] = series.nyArr[j];
-      const c = new THREE.Color(series.face_colors[j][i]);
-      colors[idx]=c.r; colors[idx+1]=c.g; colors[idx+2]=c.b;
-    }
-    const indices=[];
+    const indices = new Uint32Array(Math.max(M-1, 0)*Math.max(N-1, 0)*6);
+    let k = 0;
     for (let j=0; j<M-1; j++) for (let i=0; i<N-1; i++) {
       const a=j*N+i, b=a+1, c=a+N, d=c+1;
-      indices.push(a,c,b, b,c,d);
+      indices[k++]=a; indices[k++]=c; indices[k++]=b;
+      indices[k++]=b; indices[k++]=c; indices[k++]=d;
     }
     const geom = new THREE.BufferGeometry();
-    geom.setAttribute('position', new THREE.BufferAttribute(positions,3));
-    geom.setAttribute('color',    new THREE.BufferAttribute(colors,3));
-    geom.setIndex(indices);
+    geom.setAttribute('position',
+      new THREE.BufferAttribute(unpack(series.pos, Float32Array), 3));
+    geom.setAttribute('color',
+      new THREE.BufferAttribute(unpack(series.rgb, Uint8Array), 3, true));
+    geom.setIndex(new THREE.BufferAttribute(indices, 1));
     geom.computeVertexNormals();
     geom.userData = {
-      xs:series.xData, ys:series.yData, zs:series.zData,
+      xs:series.xData, ys:series.yData,
       M, N, nxArr:series.nxArr, nyArr:series.nyArr
     };
     const mat = new THREE.MeshPhongMaterial({
@@ -517,15 +530,19 @@ DATA.forEach((series, si) => {
 
   // -- Bar3D --------------------------------------------------------
   if (series.type === 'bar3d') {
-    series.bars.forEach(bar => {
-      const geom = new THREE.BoxGeometry(bar.ndx*0.88, bar.nz, bar.ndy*0.88);
+    const pos = unpack(series.pos, Float32Array);
+    const rgb = unpack(series.rgb, Uint8Array);
+    for (let b=0; b<series.n; b++) {
+      const bnx = pos[b*3], bnz = pos[b*3+1], bny = pos[b*3+2];
+      const geom = new THREE.BoxGeometry(series.ndx*0.88, bnz, series.ndy*0.88);
       const mat  = new THREE.MeshPhongMaterial({
-        color:new THREE.Color(bar.color), transparent:true, opacity:series.alpha
+        color:new THREE.Color(rgb[b*3]/255, rgb[b*3+1]/255, rgb[b*3+2]/255),
+        transparent:true, opacity:series.alpha
       });
       const mesh = new THREE.Mesh(geom, mat);
-      mesh.position.set(bar.nx, -1 + bar.nz/2, bar.ny);
+      mesh.position.set(bnx, -1 + bnz/2, bny);
       group.add(mesh);
-    });
+    }
   }
 
   scene.add(group);
@@ -589,33 +606,34 @@ cv.addEventListener('mousemove', e => {
     // -- Scatter tooltip ------------------------------------------
     if (obj.isPoints) {
       const ud  = obj.geometry.userData;
-      const idx = hit.index;
-      if (ud && ud.xs) {
-        const lbl = ud.label ? `<b>${ud.label}</b>\n` : '';
-        tip.innerHTML = lbl +
-          `x: ${fmtV(ud.xs[idx])}\ny: ${fmtV(ud.ys[idx])}\nz: ${fmtV(ud.zs[idx])}`;
-        tip.style.display = 'block';
-        tip.style.left = (e.clientX+14)+'px';
-        tip.style.top  = (e.clientY-20)+'px';
-      }
+      const [xv, yv, zv] = dataXYZ(obj.geometry.attributes.position.array, hit.index);
+      const lbl = ud && ud.label ? `<b>${ud.label}</b>\n` : '';
+      tip.innerHTML = lbl + `x: ${fmtV(xv)}\ny: ${fmtV(yv)}\nz: ${fmtV(zv)}`;
+      tip.style.display = 'block';
+      tip.style.left = (e.clientX+14)+'px';
+      tip.style.top  = (e.clientY-20)+'px';
     }
 
     // -- Surface value probe --------------------------------------
     if (obj.isMesh && surfaceMeshes.includes(obj)) {
       const ud = obj.geometry.userData;
-      if (ud && ud.xs && ud.ys && ud.zs) {
+      if (ud && ud.xs && ud.ys) {
         // Find nearest grid vertex to hit point in normalised coords
         const p = hit.point;   // THREE.Vector3 in normalised space
-        // nxArr/nyArr map column/row indices to normalised coords
-        let bestI=0, bestJ=0, bestDist=Infinity;
+        // nxArr/nyArr map column/row indices to normalised coords; the
+        // squared distance is separable, so search columns and rows apart
+        let bestI=0, bestJ=0, dI=Infinity, dJ=Infinity;
+        for (let i=0; i<ud.N; i++) {
+          const d = (ud.nxArr[i]-p.x)**2;
+          if (d < dI) { dI=d; bestI=i; }
+        }
         for (let j=0; j<ud.M; j++) {
-          for (let i=0; i<ud.N; i++) {
-            const nx = ud.nxArr[i], ny = ud.nyArr[j];
-            const d = (nx-p.x)**2 + (ny-p.z)**2;
-            if (d < bestDist) { bestDist=d; bestI=i; bestJ=j; }
-          }
+          const d = (ud.nyArr[j]-p.z)**2;
+          if (d < dJ) { dJ=d; bestJ=j; }
         }
-        const xv = ud.xs[bestI], yv = ud.ys[bestJ], zv = ud.zs[bestJ][bestI];
+        const pos = obj.geometry.attributes.position.array;
+        const xv = ud.xs[bestI], yv = ud.ys[bestJ];
+        const zv = unnorm(pos[(bestJ*ud.N+bestI)*3+1], RANGES.z);
         tip.innerHTML = `x: ${fmtV(xv)}\ny: ${fmtV(yv)}\nz: <b>${fmtV(zv)}</b>`;
         tip.style.display = 'block';
         tip.style.left = (e.clientX+14)+'px';
@@ -648,7 +666,6 @@ cv.addEventListener('click', e => {
   if (!hit.object.isPoints) { clearSelection(); return; }
 
   const idx = hit.index;
-  const ud  = hit.object.geometry.userData;
 
   // Toggle selection
   if (selectionIdx === idx) {
@@ -656,11 +673,9 @@ cv.addEventListener('click', e => {
   } else {
     selectionIdx = idx;
     // Show enlarged version of the selected point via readout
-    if (ud && ud.xs) {
-      readout.style.display = 'block';
-      readout.innerHTML =
-        `Selected: x=${fmtV(ud.xs[idx])}, y=${fmtV(ud.ys[idx])}, z=${fmtV(ud.zs[idx])}`;
-    }
+    const [xv, yv, zv] = dataXYZ(hit.object.geometry.attributes.position.array, idx);
+    readout.style.display = 'block';
+    readout.innerHTML = `Selected: x=${fmtV(xv)}, y=${fmtV(yv)}, z=${fmtV(zv)}`;
   }
 });
 
@@ -697,6 +712,12 @@ _FORMAT_TICK_JS = """function(v){
 }"""
 
 
+def _b64_array(values, dtype: str) -> str:
+    """Base64 of ``values`` packed as a contiguous typed array of ``dtype``."""
+    arr = np.ascontiguousarray(values, dtype=dtype)
+    return base64.b64encode(arr.tobytes()).decode("ascii")
+
+
 # ---------------------------------------------------------------------------
 # Figure3D
 # ---------------------------------------------------------------------------
@@ -817,20 +838,29 @@ class Figure3D:
     # Rendering
     # ------------------------------------------------------------------
 
-    def _all_xyz(self):
-        """Collect all X, Y, Z values across all series."""
-        xs, ys, zs = [], [], []
-        for s in self._series:
-            if hasattr(s, "x"): xs.extend(s.x if s.x else [])
-            if hasattr(s, "y"): ys.extend(s.y if s.y else [])
-            if hasattr(s, "z"): zs.extend(s.z if s.z else [])
-            if hasattr(s, "x_1d"): xs.extend(s.x_1d)
-            if hasattr(s, "y_1d"): ys.extend(s.y_1d)
-            if hasattr(s, "z_mat"):
-                for row in s.z_mat:
-                    zs.extend(row)
-            if hasattr(s, "z_vals"): zs.extend(s.z_vals)
-        return xs, ys, zs
+    def _data_ranges(self):
+        """
+        ``(lo, hi)`` of all X, Y and Z values across series.
+
+        Reduces each series column with NumPy instead of concatenating
+        every value into Python lists.  Returns ``None`` if there is no
+        X data.
+        """
+        axes = (("x", "x_1d"), ("y", "y_1d"), ("z", "z_mat", "z_vals"))
+        ranges = []
+        for attrs in axes:
+            lo, hi = math.inf, -math.inf
+            for s in self._series:
+                for a in attrs:
+                    v = getattr(s, a, None)
+                    if v is None or len(v) == 0:
+                        continue
+                    arr = np.asarray(v, dtype=float)
+                    lo, hi = min(lo, float(arr.min())), max(hi, float(arr.max()))
+            ranges.append((lo, hi))
+        if ranges[0][0] > ranges[0][1]:
+            return None
+        return tuple(ranges)
 
     def render_svg(self) -> str:
         """Render a static orthographic SVG projection."""
@@ -842,15 +872,11 @@ class Figure3D:
         cam = Camera3D(azimuth=self.azimuth, elevation=self.elevation,
                        cx=cx, cy=cy, scale=scale)
 
-        xs, ys, zs = self._all_xyz()
-        if not xs: return f'<svg width="{W}" height="{H}" xmlns="http://www.w3.org/2000/svg"></svg>'
+        ranges = self._data_ranges()
+        if ranges is None: return f'<svg width="{W}" height="{H}" xmlns="http://www.w3.org/2000/svg"></svg>'
 
-        xn, xlo, xhi = normalize(xs)
-        yn, ylo, yhi = normalize(ys)
-        zn, zlo, zhi = normalize(zs)
-        x_range = (xlo, xhi)
-        y_range = (ylo, yhi)
-        z_range = (zlo, zhi)
+        x_range, y_range, z_range = ranges
+        (xlo, xhi), (ylo, yhi), (zlo, zhi) = ranges
 
         bg    = self.theme.get("background", "#ffffff")
         tc    = self.theme.get("text_color",  "#000000")
@@ -878,59 +904,57 @@ class Figure3D:
         box_edges   = [(0,1),(1,2),(2,3),(3,0),
                        (4,5),(5,6),(6,7),(7,4),
                        (0,4),(1,5),(2,6),(3,7)]
-        cp = [cam.project(*v) for v in box_corners]
+        bc = np.array(box_corners, dtype=float)
+        bpx, bpy, _ = cam.project_array(bc[:, 0], bc[:, 1], bc[:, 2])
+        bpx, bpy = bpx.tolist(), bpy.tolist()
 
         for a, b in box_edges:
             parts.append(
-                f'<line x1="{cp[a].px:.1f}" y1="{cp[a].py:.1f}" '
-                f'x2="{cp[b].px:.1f}" y2="{cp[b].py:.1f}" '
+                f'<line x1="{bpx[a]:.1f}" y1="{bpy[a]:.1f}" '
+                f'x2="{bpx[b]:.1f}" y2="{bpy[b]:.1f}" '
                 f'stroke="{ac}" stroke-width="1" opacity="0.5"/>'
             )
 
-        # -- Floor grid ----------------------------------------------------
-        for k in range(6):
-            v = -1 + k * 0.4
-            for (ax1,bx1,ay1,by1) in [
-                (v,-1,v,-1), (v, 1,v,-1),
-                (-1,v,-1,v), (-1,v, 1,v),
-            ]:
-                pass  # simplified: draw X and Y grid lines on floor (Z=-1)
-        for k in range(6):
-            v = -1 + k * 0.4
-            pa = cam.project(v, -1, -1); pb = cam.project(v, 1, -1)
-            pc = cam.project(-1, v, -1); pd = cam.project(1, v, -1)
-            for p1, p2 in [(pa, pb), (pc, pd)]:
+        # -- Floor grid (Z = -1): X lines then Y lines per step -------------
+        v     = -1 + np.arange(6) * 0.4
+        ones  = np.ones_like(v)
+        gx    = np.stack([v, v, -ones, ones], axis=1)     # pa, pb, pc, pd
+        gy    = np.stack([-ones, ones, v, v], axis=1)
+        gpx, gpy, _ = cam.project_array(gx, gy, -1.0)
+        for row_x, row_y in zip(gpx.tolist(), gpy.tolist()):
+            for a, b in ((0, 1), (2, 3)):
                 parts.append(
-                    f'<line x1="{p1.px:.1f}" y1="{p1.py:.1f}" '
-                    f'x2="{p2.px:.1f}" y2="{p2.py:.1f}" '
+                    f'<line x1="{row_x[a]:.1f}" y1="{row_y[a]:.1f}" '
+                    f'x2="{row_x[b]:.1f}" y2="{row_y[b]:.1f}" '
                     f'stroke="{gc}" stroke-width="0.6" opacity="0.5"/>'
                 )
 
         # -- Tick labels ----------------------------------------------------
         NTICKS = 4
-        for k in range(NTICKS + 1):
-            t = -1 + k * 2 / NTICKS
+        t    = -1 + np.arange(NTICKS + 1) * 2 / NTICKS
+        m1   = -np.ones_like(t)
+        xtx, xty, _ = cam.project_array(t, m1, m1)
+        ytx, yty, _ = cam.project_array(m1, t, m1)
+        ztx, zty, _ = cam.project_array(m1, m1, t)
+        for k, tk in enumerate(t.tolist()):
             # X ticks
-            data_v = xlo + (t + 1) / 2 * (xhi - xlo)
-            p = cam.project(t, -1, -1)
+            data_v = xlo + (tk + 1) / 2 * (xhi - xlo)
             parts.append(
-                f'<text x="{p.px:.1f}" y="{p.py + 14:.1f}" text-anchor="middle" '
+                f'<text x="{xtx[k]:.1f}" y="{xty[k] + 14:.1f}" text-anchor="middle" '
                 f'font-size="9" font-family="{font}" fill="{tc}">'
                 f'{_format_3d_tick(data_v)}</text>'
             )
             # Y ticks
-            data_v = ylo + (t + 1) / 2 * (yhi - ylo)
-            p = cam.project(-1, t, -1)
+            data_v = ylo + (tk + 1) / 2 * (yhi - ylo)
             parts.append(
-                f'<text x="{p.px - 6:.1f}" y="{p.py + 4:.1f}" text-anchor="end" '
+                f'<text x="{ytx[k] - 6:.1f}" y="{yty[k] + 4:.1f}" text-anchor="end" '
                 f'font-size="9" font-family="{font}" fill="{tc}">'
                 f'{_format_3d_tick(data_v)}</text>'
             )
             # Z ticks
-            data_v = zlo + (t + 1) / 2 * (zhi - zlo)
-            p = cam.project(-1, -1, t)
+            data_v = zlo + (tk + 1) / 2 * (zhi - zlo)
             parts.append(
-                f'<text x="{p.px - 6:.1f}" y="{p.py + 4:.1f}" text-anchor="end" '
+                f'<text x="{ztx[k] - 6:.1f}" y="{zty[k] + 4:.1f}" text-anchor="end" '
                 f'font-size="9" font-family="{font}" fill="{tc}">'
                 f'{_format_3d_tick(data_v)}</text>'
             )
@@ -956,60 +980,89 @@ class Figure3D:
         parts.append("</svg>")
         return "\n".join(parts)
 
-    def render_html(self) -> str:
-        """Render a complete interactive HTML document with Three.js."""
-        xs, ys, zs = self._all_xyz()
-        if not xs:
-            return "<html><body><p>No data.</p></body></html>"
+    def _threejs_payload(self, ranges) -> list[dict]:
+        """
+        Per-series data for the Three.js page, as packed typed arrays.
+
+        Coordinates are normalised to ``[-1, 1]`` with NumPy and sent as
+        base64 ``Float32Array`` bytes in Three.js order (X, Z-up, Y);
+        per-vertex colors are sent as RGB bytes.  The page decodes them
+        straight into ``BufferGeometry`` attributes and recovers data
+        values for tooltips from the positions and ``ranges``.
+        """
+        from .colormaps import colormap_rgb_array
 
-        xn, xlo, xhi = normalize(xs)
-        yn, ylo, yhi = normalize(ys)
-        zn, zlo, zhi = normalize(zs)
+        (xlo, xhi), (ylo, yhi), (zlo, zhi) = ranges
+        sx = xhi - xlo or 1.0
+        sy = yhi - ylo or 1.0
+        sz = zhi - zlo or 1.0
 
-        def nx(v): return (v - xlo) / (xhi - xlo) * 2 - 1
-        def ny(v): return (v - ylo) / (yhi - ylo) * 2 - 1
-        def nz(v): return (v - zlo) / (zhi - zlo) * 2 - 1
+        def nx(v): return (np.asarray(v, dtype=float) - xlo) / sx * 2 - 1
+        def ny(v): return (np.asarray(v, dtype=float) - ylo) / sy * 2 - 1
+        def nz(v): return (np.asarray(v, dtype=float) - zlo) / sz * 2 - 1
+
+        def positions(x, y, z):
+            # Y-up for the Three.js camera: swap y and z
+            return _b64_array(np.column_stack([nx(x), nz(z), ny(y)]), "<f4")
 
-        # Normalise per series for Three.js (Y-up: swap y↔z for Three.js camera)
         data_list = []
         for s in self._series:
             d = s.to_threejs_data()
-            if d["type"] == "scatter":
-                d["nx"] = [nx(v) for v in s.x]
-                d["ny"] = [ny(v) for v in s.y]
-                d["nz"] = [nz(v) for v in s.z]
-            elif d["type"] == "line":
-                d["nx"] = [nx(v) for v in s.x]
-                d["ny"] = [ny(v) for v in s.y]
-                d["nz"] = [nz(v) for v in s.z]
+            out = {k: v for k, v in d.items()
+                   if k not in ("x", "y", "z", "colors", "bars")}
+            if d["type"] in ("scatter", "line"):
+                out["n"]   = len(s.x)
+                out["pos"] = positions(s.x, s.y, s.z)
+                if d["type"] == "scatter":
+                    out["color"] = s.color
+                    out["rgb"]   = None
+                    if s.c is not None:
+                        c_arr = np.asarray(s.c, dtype=float)
+                        lo, hi = c_arr.min(), c_arr.max()
+                        out["rgb"] = _b64_array(
+                            colormap_rgb_array((c_arr - lo) / (hi - lo or 1.0), s.cmap),
+                            "u1",
+                        )
             elif d["type"] == "surface":
-                z_arr = np.asarray(s.z_mat, dtype=float)
-                # Normalised grid arrays for Three.js geometry
-                d["nxArr"] = [nx(v) for v in s.x_1d]
-                d["nyArr"] = [ny(v) for v in s.y_1d]
-                d["nz"]    = [[nz(float(v)) for v in row] for row in z_arr]
-                d["nx"]    = len(s.x_1d)
-                d["ny"]    = len(s.y_1d)
-                # Raw data for surface value probe tooltip
-                d["xData"] = s.x_1d
-                d["yData"] = s.y_1d
-                d["zData"] = s.z_mat
-                from .colormaps import apply_colormap
-                zmin, zmax = float(z_arr.min()), float(z_arr.max())
-                span = zmax - zmin or 1
-                d["face_colors"] = [
-                    [apply_colormap((float(v)-zmin)/span, s.cmap) for v in row]
-                    for row in z_arr
-                ]
+                z_arr  = np.asarray(s._z_grid, dtype=float)
+                gx, gy = np.meshgrid(nx(s.x_1d), ny(s.y_1d))
+                out["nx"]    = len(s.x_1d)
+                out["ny"]    = len(s.y_1d)
+                out["nxArr"] = nx(s.x_1d).tolist()
+                out["nyArr"] = ny(s.y_1d).tolist()
+                # Raw grid axes for the surface value probe tooltip
+                out["xData"] = list(s.x_1d)
+                out["yData"] = list(s.y_1d)
+                out["pos"] = _b64_array(
+                    np.stack([gx, nz(z_arr), gy], axis=-1).reshape(-1, 3), "<f4"
+                )
+                out["rgb"] = _b64_array(
+                    colormap_rgb_array((z_arr - s._z_min) / s._z_span, s.cmap), "u1"
+                )
             elif d["type"] == "bar3d":
-                sx = xhi - xlo or 1; sy = yhi - ylo or 1; sz = zhi - zlo or 1
-                for bar in d["bars"]:
-                    bar["nx"]  = nx(bar["x"])
-                    bar["ny"]  = ny(bar["y"])
-                    bar["nz"]  = nz(bar["z"])
-                    bar["ndx"] = bar["dx"] / sx * 2
-                    bar["ndy"] = bar["dy"] / sy * 2
-            data_list.append(d)
+                if s.paired:
+                    bx, by = np.asarray(s.x_1d, dtype=float), np.asarray(s.y_1d, dtype=float)
+                else:
+                    bx, by = (g.ravel() for g in np.meshgrid(s.x_1d, s.y_1d))
+                bz = np.asarray(s.z_vals, dtype=float)
+                out["n"]   = len(bz)
+                out["pos"] = positions(bx, by, bz)
+                out["rgb"] = _b64_array(
+                    colormap_rgb_array((bz - s._z_min) / s._z_span, s.cmap), "u1"
+                )
+                out["ndx"] = s._dx / sx * 2
+                out["ndy"] = s._dy / sy * 2
+            data_list.append(out)
+        return data_list
+
+    def render_html(self) -> str:
+        """Render a complete interactive HTML document with Three.js."""
+        ranges = self._data_ranges()
+        if ranges is None:
+            return "<html><body><p>No data.</p></body></html>"
+
+        (xlo, xhi), (ylo, yhi), (zlo, zhi) = ranges
+        data_list = self._threejs_payload(ranges)
 
         # Tick labels
         def make_ticks(lo, hi, n=4):
@@ -1056,6 +1109,8 @@ class Figure3D:
                 "grid": theme.get("grid_color",  "#ccc"),
             }),
             "{labels_json}":    json.dumps(labels),
+            "{ranges_json}":    json.dumps({"x": [xlo, xhi], "y": [ylo, yhi],
+                                            "z": [zlo, zhi]}),
             "{legend_html}":    legend_html,
             "{legend_display}": legend_display,
             "{_format_tick_js}": _FORMAT_TICK_JS,
@@ -0,0 +1,151 @@
+"""
+GlyphX compiled hierarchy index shared by sunburst and treemap charts.
+
+Hierarchical charts receive their tree as two parallel lists — node
+``labels`` and the ``parents`` label of each node (``""`` for a root).
+:class:`HierarchyIndex` compiles those lists once into flat NumPy arrays
+so that every later question (children of a node, depth, top-level
+ancestor, subtree totals) is an O(1) lookup or a single vectorised pass
+instead of a walk over label dictionaries::
+
+    from glyphx.hierarchy import HierarchyIndex
+
+    idx = HierarchyIndex(
+        labels =["Total", "Sales", "APAC", "EMEA", "Eng"],
+        parents=["",      "Total", "Sales", "Sales", "Total"],
+    )
+    idx.children(idx.position["Sales"])       # array([2, 3])
+    idx.subtree_sums([0, 0, 4200, 3100, 2800])  # bottom-up totals
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def _concat_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenate ``arange(s, s + c)`` for every ``(s, c)`` pair, vectorised."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.intp)
+    offsets = np.cumsum(counts) - counts
+    return (np.arange(total, dtype=np.intp)
+            - np.repeat(offsets, counts) + np.repeat(starts, counts))
+
+
+class HierarchyIndex:
+    """
+    Array-backed index over a ``labels`` / ``parents`` hierarchy.
+
+    Built in linear time.  Children are stored in CSR form (``child_index``
+    sliced by ``child_offsets``) in input order, and nodes are visited
+    breadth-first, level by level, without recursion — so trees of any
+    depth are safe.  Nodes whose parent label is ``""`` or unknown are
+    roots; nodes that cannot be reached from a root (i.e. that sit on a
+    parent cycle) get ``depth == -1`` and are skipped by every pass.
+
+    Args:
+        labels:  Node labels.  If a label repeats, the last occurrence is
+                 the one children attach to.
+        parents: Parent label of each node.
+
+    Attributes:
+        labels (list[str]):        The node labels.
+        position (dict):           ``label -> node index``.
+        parent (np.ndarray):       Parent index per node (``-1`` for roots).
+        child_offsets (np.ndarray): CSR offsets, length ``n + 1``.
+        child_index (np.ndarray):  Child node indices, grouped by parent.
+        depth (np.ndarray):        Depth per node (roots are 0).
+        top (np.ndarray):          Index of each node's depth-1 ancestor
+                                   (itself at depth 1, ``-1`` for roots).
+        root (np.ndarray):         Index of each node's root (``-1`` if
+                                   unreachable).
+        levels (list[np.ndarray]): Node indices per depth, breadth-first.
+        roots (np.ndarray):        Root node indices, in input order.
+
+    Raises:
+        ValueError: If ``labels`` and ``parents`` differ in length.
+    """
+
+    def __init__(self, labels, parents) -> None:
+        if len(labels) != len(parents):
+            raise ValueError("labels and parents must have the same length.")
+        n = len(labels)
+        self.labels   = list(labels)
+        self.position = {lbl: i for i, lbl in enumerate(self.labels)}
+        self.parent   = np.fromiter(
+            (self.position.get(p, -1) if p != "" else -1 for p in parents),
+            dtype=np.intp, count=n,
+        )
+
+        # CSR children: a stable sort on parent keeps input order per parent
+        has_parent = self.parent >= 0
+        nodes      = np.flatnonzero(has_parent)
+        order      = np.argsort(self.parent[nodes], kind="stable")
+        self.child_index   = nodes[order]
+        counts             = np.bincount(self.parent[nodes], minlength=n)
+        self.child_offsets = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(counts, out=self.child_offsets[1:])
+
+        # Breadth-first levels, depth and top-level ancestor
+        self.roots = np.flatnonzero(~has_parent)
+        self.depth = np.full(n, -1, dtype=np.intp)
+        self.top   = np.full(n, -1, dtype=np.intp)
+        self.root  = np.full(n, -1, dtype=np.intp)
+        self.levels: list[np.ndarray] = []
+        frontier = self.roots
+        while frontier.size:
+            d = len(self.levels)
+            self.depth[frontier] = d
+            self.root[frontier]  = (frontier if d == 0
+                                    else self.root[self.parent[frontier]])
+            if d == 1:
+                self.top[frontier] = frontier
+            elif d > 1:
+                self.top[frontier] = self.top[self.parent[frontier]]
+            self.levels.append(frontier)
+            frontier = self.child_index[_concat_ranges(
+                self.child_offsets[frontier],
+                self.child_offsets[frontier + 1] - self.child_offsets[frontier],
+            )]
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def children(self, node: int) -> np.ndarray:
+        """Indices of the children of ``node``, in input order."""
+        return self.child_index[self.child_offsets[node]:self.child_offsets[node + 1]]
+
+    def n_children(self) -> np.ndarray:
+        """Number of children of every node."""
+        return np.diff(self.child_offsets)
+
+    def subtree_sums(self, values, explicit_internal: bool = False) -> np.ndarray:
+        """
+        Total value of every subtree, in one bottom-up pass over the levels.
+
+        Args:
+            values: One value per node; leaves contribute their own value.
+            explicit_internal: If ``True``, an internal node with a positive
+                value keeps that value instead of the sum of its children
+                (the sunburst convention for partially aggregated input).
+
+        Returns:
+            np.ndarray: Float totals per node (``0`` for unreachable nodes).
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape != (len(self),):
+            raise ValueError("values must have one entry per node.")
+        summed    = np.zeros(len(self))
+        child_sum = np.zeros(len(self))
+        internal  = self.n_children() > 0
+        for level in reversed(self.levels):
+            own = values[level]
+            if explicit_internal:
+                use_children = internal[level] & ~(own > 0)
+            else:
+                use_children = internal[level]
+            summed[level] = np.where(use_children, child_sum[level], own)
+            parents = self.parent[level]
+            keep    = parents >= 0
+            np.add.at(child_sum, parents[keep], summed[level][keep])
+        return summed
@@ -5,12 +5,93 @@ When ``hue=`` is supplied, the series automatically splits data by group
 and colour-codes each.  This closes the last remaining Seaborn advantage
 where ``sns.boxplot(data=df, x="treatment", y="score", hue="sex")``
 renders grouped boxes per category.
+
+All three series share one vectorised engine: the hue column is
+factorized once into integer codes (:func:`factorize_hue`), groups are
+split with a single stable argsort (:func:`split_by_hue`), and grouped
+histograms are counted with one ``np.bincount`` over
+``group * n_bins + bin`` (:func:`hue_histograms`) — no per-group Python
+mask or filter pass.
 """
 from __future__ import annotations
 
+import numpy as np
+
 from .colormaps import colormap_colors
 
 
+def factorize_hue(hue_data) -> tuple[np.ndarray, list[str]]:
+    """
+    Factorize a hue column into integer codes and string group labels.
+
+    Groups are identified by ``str(value)`` and listed in order of first
+    appearance.  The column is factorized on its raw values (a hash pass
+    in pandas) and only the unique values are stringified.
+
+    Args:
+        hue_data: 1-D array-like of hue values.
+
+    Returns:
+        tuple: ``(codes, groups)`` — an ``intp`` array with one code per
+               observation and the list of group labels.
+    """
+    import pandas as pd
+    arr = np.asarray(hue_data)
+    if arr.dtype.kind not in "biufUSO":
+        arr = arr.astype(object)
+    codes, uniques = pd.factorize(arr, use_na_sentinel=False)
+    labels = [str(u) for u in uniques]
+    groups = list(dict.fromkeys(labels))
+    if len(groups) != len(labels):
+        # Distinct raw values with the same text (e.g. 1 and "1") merge
+        remap = np.array([groups.index(lbl) for lbl in labels], dtype=np.intp)
+        codes = remap[codes]
+    return np.asarray(codes, dtype=np.intp), groups
+
+
+def hue_color_map(
+    groups:  list[str],
+    palette: list[str] | None = None,
+    cmap:    str              = "viridis",
+) -> dict[str, str]:
+    """Map each hue group to a colour from ``palette`` or ``cmap``."""
+    palette = palette or colormap_colors(cmap, max(len(groups), 2))
+    return {g: palette[i % len(palette)] for i, g in enumerate(groups)}
+
+
+def split_by_hue(values, codes: np.ndarray, n_groups: int) -> list[np.ndarray]:
+    """
+    Split ``values`` into one array per hue code with a single stable sort.
+
+    Observation order is preserved within each group.
+    """
+    values = np.asarray(values)
+    order  = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=n_groups))[:-1]
+    return np.split(values[order], bounds)
+
+
+def hue_histograms(values, codes: np.ndarray, n_groups: int,
+                   edges: np.ndarray) -> np.ndarray:
+    """
+    Count a histogram per hue group in one pass.
+
+    Bin assignment follows ``np.histogram`` (half-open bins, last bin
+    closed; values outside ``edges`` and ``NaN`` are dropped), then a single
+    ``np.bincount`` over ``group * n_bins + bin`` fills every group at once.
+
+    Returns:
+        np.ndarray: ``(n_groups, n_bins)`` integer counts.
+    """
+    values = np.asarray(values, dtype=float)
+    n_bins = len(edges) - 1
+    bins   = np.searchsorted(edges, values, side="right") - 1
+    bins[values == edges[-1]] = n_bins - 1
+    keep   = (bins >= 0) & (bins < n_bins)
+    flat   = codes[keep] * n_bins + bins[keep]
+    return np.bincount(flat, minlength=n_groups * n_bins).reshape(n_groups, n_bins)
+
+
 def apply_hue(
     data:        list,
     categories:  list | None,
@@ -21,6 +102,11 @@ def apply_hue(
     """
     Split ``data`` by ``hue_data`` and return grouped arrays.
 
+    With ``categories=None``, ``data`` is one flat array and ``hue_data``
+    has one label per value.  Otherwise ``data`` holds one array per
+    category and ``hue_data`` labels the observations of all categories
+    concatenated in order; every (category, hue) pair becomes a group.
+
     Returns
     -------
     grouped_data  : list of arrays, one per (category, hue_group) pair
@@ -30,29 +116,30 @@ def apply_hue(
     if hue_data is None:
         return [data], categories or [""], [None]
 
-    # Map each observation to its hue group
-    unique_hues = list(dict.fromkeys(str(h) for h in hue_data))
-    palette     = hue_palette or colormap_colors(cmap, max(len(unique_hues), 2))
+    codes, unique_hues = factorize_hue(hue_data)
+    colors = hue_color_map(unique_hues, hue_palette, cmap)
+    n_hue  = len(unique_hues)
 
     if categories is None:
         # Single distribution per hue value
-        grouped_data   = [
-            [v for v, h in zip(data, hue_data) if str(h) == hv]
-            for hv in unique_hues
-        ]
+        grouped_data   = split_by_hue(data, codes, n_hue)
         grouped_cats   = unique_hues
-        grouped_colors = [palette[i % len(palette)] for i in range(len(unique_hues))]
+        grouped_colors = [colors[hv] for hv in unique_hues]
     else:
         # Multi-category: interleave (cat, hue) pairs
         grouped_data   = []
         grouped_cats   = []
         grouped_colors = []
+        start = 0
         for cat, cat_data in zip(categories, data):
-            cat_hue_data = list(cat_data) if hasattr(cat_data, "__iter__") else [cat_data]
-            for i, hv in enumerate(unique_hues):
-                # Within this category, keep only observations for this hue value
-                grouped_data.append(cat_hue_data)  # full group; hue filtering is caller's job
+            cat_arr   = np.atleast_1d(np.asarray(cat_data))
+            cat_codes = codes[start:start + len(cat_arr)]
+            start    += len(cat_arr)
+            for hv, part in zip(unique_hues, split_by_hue(cat_arr, cat_codes, n_hue)):
+                if part.size == 0:
+                    continue
+                grouped_data.append(part)
                 grouped_cats.append(f"{cat} / {hv}")
-                grouped_colors.append(palette[i % len(palette)])
+                grouped_colors.append(colors[hv])
 
     return grouped_data, grouped_cats, grouped_colors
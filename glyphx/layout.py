@@ -5,13 +5,17 @@ GlyphX layout module: Axes scaling, tick/grid rendering, and multi-figure grid l
 import math
 import datetime as _dt
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Datetime helpers
 # ---------------------------------------------------------------------------
 
 def _is_datetime(val) -> bool:
-    """Return True if val is any date/datetime/Timestamp type."""
+    """Return True if val is any date/datetime/Timestamp/datetime64 type."""
+    if isinstance(val, np.datetime64):
+        return True
     try:
         import pandas as pd
         if isinstance(val, (pd.Timestamp, pd.DatetimeTZDtype)):
@@ -33,6 +37,8 @@ def _to_timestamp(val) -> float:
         return val.timestamp()
     if isinstance(val, _dt.date):
         return _dt.datetime(val.year, val.month, val.day).timestamp()
+    if isinstance(val, np.datetime64):
+        return float((val - np.datetime64(0, "s")) / np.timedelta64(1, "s"))
     return float(val)
 
 
@@ -53,7 +59,233 @@ def _format_datetime_tick(ts: float, span_seconds: float) -> str:
     return dt.strftime("%Y")              # > 2 years → 2024
 
 
-from .utils import _format_tick, svg_escape
+# Seconds per tick for fixed-length datetime64 units.  Calendar units
+# ("Y", "M") have no fixed length and are converted instead of viewed.
+_DT64_UNIT_SECONDS = {
+    "W": 604800, "D": 86400, "h": 3600, "m": 60, "s": 1,
+    "ms": 1e-3, "us": 1e-6, "ns": 1e-9, "ps": 1e-12, "fs": 1e-15, "as": 1e-18,
+}
+
+_NAT = np.iinfo(np.int64).min
+
+
+def _epoch_view(values):
+    """
+    Return a datetime64 column as ``(int64 ticks, seconds per tick)``.
+
+    For fixed-length units the ticks are a zero-copy ``view`` of the
+    column's buffer — pandas ``datetime64[ns]`` data is never boxed into
+    Timestamps or copied into a float array.  ``NaT`` is ``INT64_MIN``.
+
+    Args:
+        values (np.ndarray): 1-D ``datetime64`` array.
+
+    Returns:
+        tuple: ``(ticks, scale)`` with ``ticks * scale`` in Unix seconds.
+    """
+    unit, count = np.datetime_data(values.dtype)
+    if unit not in _DT64_UNIT_SECONDS:
+        values = values.astype("datetime64[s]")
+        unit, count = "s", 1
+    return values.view(np.int64), _DT64_UNIT_SECONDS[unit] * count
+
+
+def _ticks_to_seconds(ticks, scale) -> np.ndarray:
+    """Convert int64 epoch ticks to float seconds, mapping ``NaT`` to ``nan``."""
+    ticks = np.asarray(ticks)
+    out = ticks * float(scale)
+    if ticks.dtype == np.int64:
+        out[ticks == _NAT] = np.nan
+    return out
+
+
+def _epoch_extent(values):
+    """Return ``(min, max)`` Unix seconds of a datetime64 column, or ``None``."""
+    ticks, scale = _epoch_view(values)
+    if ticks.size == 0:
+        return None
+    lo, hi = ticks.min(), ticks.max()
+    if lo == _NAT:                       # NaT present: mask it out
+        valid = ticks[ticks != _NAT]
+        if valid.size == 0:
+            return None
+        lo = valid.min()
+    return float(lo) * scale, float(hi) * scale
+
+
+# Candidate tick steps, finest first: (datetime64 unit, count, ~seconds).
+_DT_TICK_STEPS = [
+    ("s", 1, 1), ("s", 5, 5), ("s", 15, 15), ("s", 30, 30),
+    ("m", 1, 60), ("m", 5, 300), ("m", 15, 900), ("m", 30, 1800),
+    ("h", 1, 3600), ("h", 3, 10800), ("h", 6, 21600), ("h", 12, 43200),
+    ("D", 1, 86400), ("D", 2, 172800), ("W", 1, 604800), ("W", 2, 1209600),
+    ("M", 1, 2629746), ("M", 3, 7889238), ("M", 6, 15778476),
+    ("Y", 1, 31556952), ("Y", 2, 63113904), ("Y", 5, 157784760),
+    ("Y", 10, 315569520), ("Y", 25, 788923800), ("Y", 50, 1577847600),
+    ("Y", 100, 3155695200),
+]
+
+_MONTH_ABBR = np.array(["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+
+
+def _datetime_ticks(d_min: float, d_max: float, n: int = 5):
+    """
+    Calendar-aligned tick positions and labels for a time axis.
+
+    Picks the finest step from :data:`_DT_TICK_STEPS` that yields at most
+    ``n`` ticks, then places ticks on whole minute / hour / day / Monday /
+    month / year boundaries (UTC) with ``np.arange`` on ``datetime64`` values.
+    Labels are built for all ticks at once with ``np.char``: ``HH:MM``
+    within a day (a date at midnight), ``15 Jan`` for days and weeks,
+    ``Jan 2024`` for months and ``2024`` for years.
+
+    Args:
+        d_min (float): Domain start in Unix seconds.
+        d_max (float): Domain end in Unix seconds.
+        n (int): Target maximum number of ticks.
+
+    Returns:
+        tuple: ``(positions, labels)`` — float seconds and strings.  Both
+               are empty if the domain is degenerate.
+    """
+    span = d_max - d_min
+    if not (span > 0 and math.isfinite(span)):
+        return [], []
+    n = max(int(n), 1)
+    unit, count, _ = next(
+        (st for st in _DT_TICK_STEPS if span / st[2] <= n), _DT_TICK_STEPS[-1]
+    )
+    base = "D" if unit == "W" else unit
+    step = 7 * count if unit == "W" else count
+
+    lo = np.datetime64(int(math.ceil(d_min)), "s").astype(f"datetime64[{base}]")
+    hi = np.datetime64(int(math.floor(d_max)), "s").astype(f"datetime64[{base}]")
+    lo_i = int(lo.astype(np.int64))
+    if lo.astype("datetime64[s]") < np.datetime64(int(math.ceil(d_min)), "s"):
+        lo_i += 1
+    # 1970-01-01 was a Thursday; shift so weekly ticks land on Mondays.
+    offset = 4 if unit == "W" else 0
+    lo_i = -(-(lo_i - offset) // step) * step + offset
+    ticks = np.arange(lo_i, int(hi.astype(np.int64)) + 1, step).astype(
+        f"datetime64[{base}]")
+    if ticks.size == 0:
+        return [], []
+
+    t_s   = ticks.astype("datetime64[s]").astype(np.int64)
+    t_mon = ticks.astype("datetime64[M]").astype(np.int64)
+    year  = (t_mon // 12 + 1970).astype(str)
+    month = _MONTH_ABBR[t_mon % 12]
+    if base == "Y":
+        labels = year
+    elif base == "M":
+        labels = np.char.add(np.char.add(month, " "), year)
+    else:
+        day = (ticks.astype("datetime64[D]")
+               - ticks.astype("datetime64[M]")).astype(np.int64) + 1
+        date_lbl = np.char.add(np.char.add(day.astype(str), " "), month)
+        if base == "D":
+            labels = date_lbl
+        else:
+            def _two(v):
+                return np.char.zfill(v.astype(str), 2)
+            clock = np.char.add(np.char.add(_two(t_s // 3600 % 24), ":"),
+                                _two(t_s // 60 % 60))
+            if base == "s":
+                clock = np.char.add(np.char.add(clock, ":"), _two(t_s % 60))
+            labels = np.where(t_s % 86400 == 0, date_lbl, clock)
+    secs = t_s.astype(float)
+    return secs.tolist(), labels.tolist()
+
+
+from .utils import _format_tick, svg_escape, _is_empty
+
+
+# ---------------------------------------------------------------------------
+# Domain helpers
+# ---------------------------------------------------------------------------
+
+def _cached_on_series(s, name, compute, depends=None):
+    """
+    Memoise ``compute()`` on series ``s`` until its data changes.
+
+    Entries are keyed on ``s._data_version`` (bumped whenever ``x`` or ``y``
+    is assigned) plus the identity of both columns, so re-rendering a figure
+    — or computing the Y2 domain after the primary one — reuses the result.
+    ``depends`` adds any other input of ``compute`` to the key.  Series
+    without a data version are never cached.
+    """
+    version = getattr(s, "_data_version", None)
+    if version is None:
+        return compute()
+    key   = (version, id(s.x), id(s.y), depends)
+    cache = s.__dict__.setdefault("_domain_cache", {})
+    hit   = cache.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = compute()
+    cache[name] = (key, value)
+    return value
+
+
+def _x_kind(values) -> str:
+    """Classify an X column as ``"category"``, ``"datetime"`` or ``"numeric"``."""
+    if getattr(values, "dtype", None) is not None and values.dtype.kind == "M":
+        return "datetime"
+    first = values[0]
+    if isinstance(first, str):
+        return "category"
+    if _is_datetime(first):
+        return "datetime"
+    return "numeric"
+
+
+def _to_timestamps(values) -> np.ndarray:
+    """Convert a datetime column to float Unix seconds (``NaT`` → ``nan``)."""
+    if getattr(values, "dtype", None) is not None and values.dtype.kind == "M":
+        return _ticks_to_seconds(*_epoch_view(values))
+    return np.fromiter((_to_timestamp(v) for v in values),
+                       dtype=float, count=len(values))
+
+
+def _factorize(values):
+    """Return ``(codes, uniques)`` with uniques in first-appearance order."""
+    import pandas as pd
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object),
+                                  use_na_sentinel=False)
+    return codes, list(uniques)
+
+
+def _category_labels(s) -> dict:
+    """
+    Return ``{x position: category label}`` for a categorical series.
+
+    Series factorized by :meth:`Axes.compute_domain` carry their unique
+    categories and positions, so this is O(number of categories); series
+    that set ``_x_categories`` themselves are mapped row by row.
+    """
+    ticks = getattr(s, "_x_category_ticks", None)
+    if ticks is not None:
+        positions, uniques = ticks
+        return dict(zip(positions.tolist(), uniques))
+    cats = getattr(s, "_x_categories", None)
+    if not cats:
+        return {}
+    nx = getattr(s, "_numeric_x", None)
+    if nx is None:
+        nx = [i + 0.5 for i in range(len(cats))]
+    return dict(zip(nx, cats))
+
+
+def _extent(values):
+    """Return ``(nanmin, nanmax)`` of a numeric column, or ``None`` if empty."""
+    try:
+        arr = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return min(values), max(values)
+    if arr.size == 0 or np.isnan(arr).all():
+        return None
+    return float(np.nanmin(arr)), float(np.nanmax(arr))
 
 
 class Axes:
@@ -106,6 +338,10 @@ class Axes:
         self.series    = []
         self.y2_series = []
 
+        # id of the <svg> being rendered (set by Figure.render_svg); series
+        # prefix their element ids with it so ids stay unique on a page
+        self.chart_id: str | None = None
+
         # Computed domains (set by finalize())
         self._x_domain  = None
         self._y_domain  = None
@@ -367,7 +603,7 @@ class Axes:
                     for s in self.series + self.y2_series:
                         cats = getattr(s, "_x_categories", None)
                         nxs  = getattr(s, "_numeric_x",   None)
-                        if cats and nxs:
+                        if cats and nxs is not None:
                             for cat, nx in zip(cats, nxs):
                                 if str(cat) == str(v):
                                     return nx
@@ -436,53 +672,79 @@ class Axes:
             tuple: ``(x_domain, y_domain)`` each as ``(min, max)`` or
                    ``(None, None)`` if no valid data is found.
         """
-        x_vals = []
-        y_vals = []
+        usable = [
+            s for s in series_list
+            if hasattr(s, "x") and hasattr(s, "y")
+            and not _is_empty(s.x) and not _is_empty(s.y)
+        ]
+        kinds = {id(s): _cached_on_series(s, "x_kind", lambda s=s: _x_kind(s.x))
+                 for s in usable}
 
         # Build a global category order across all categorical series so that
         # series each carrying a different single category (e.g. groupby bars)
-        # receive unique, non-overlapping x positions.
-        global_cats: list = []
-        for s in series_list:
-            if not hasattr(s, "x") or not s.x:
+        # receive unique, non-overlapping x positions.  Each series is
+        # factorized once (cached until its data changes); only the small
+        # per-series category lists are merged here.
+        cat_to_pos: dict = {}
+        for s in usable:
+            if kinds[id(s)] != "category":
                 continue
-            if isinstance(s.x[0], str) and not _is_datetime(s.x[0]):
-                for cat in s.x:
-                    if cat not in global_cats:
-                        global_cats.append(cat)
-
-        cat_to_pos: dict = {cat: i + 0.5 for i, cat in enumerate(global_cats)}
+            _, uniques = _cached_on_series(s, "factorize",
+                                           lambda s=s: _factorize(s.x))
+            for cat in uniques:
+                if cat not in cat_to_pos:
+                    cat_to_pos[cat] = len(cat_to_pos) + 0.5
 
-        for s in series_list:
-            if not hasattr(s, "x") or not hasattr(s, "y"):
-                continue
-            if not s.x or not s.y:
-                continue
+        x_lo = y_lo = math.inf
+        x_hi = y_hi = -math.inf
+        for s in usable:
+            kind = kinds[id(s)]
 
             # Handle categorical X: store numeric mapping without mutation
-            if isinstance(s.x[0], str):
-                s._numeric_x    = [cat_to_pos[cat] for cat in s.x]
-                s._x_categories = list(s.x)
-                numeric_x = s._numeric_x
-            elif _is_datetime(s.x[0]):
-                # Convert datetime/Timestamp to float epoch seconds
-                timestamps = [_to_timestamp(v) for v in s.x]
-                s._numeric_x   = timestamps
+            if kind == "category":
+                codes, uniques = _cached_on_series(s, "factorize",
+                                                   lambda s=s: _factorize(s.x))
+                positions = np.array([cat_to_pos[cat] for cat in uniques])
+                # Same array every render while the layout holds, so caches
+                # keyed on its identity (downsampling) keep hitting
+                s._numeric_x    = _cached_on_series(
+                    s, "numeric_x", lambda p=positions, c=codes: p[c],
+                    depends=positions.tobytes())
+                s._x_categories = _cached_on_series(s, "categories", s.x.tolist)
+                s._x_category_ticks = (positions, uniques)
+                x_ext = (float(positions.min()), float(positions.max()))
+            elif kind == "datetime":
+                s.__dict__.pop("_x_category_ticks", None)
                 s._datetime_x  = True   # flag for tick formatter
-                numeric_x = timestamps
+                if s.x.dtype.kind == "M" and getattr(s, "_native_datetime", False):
+                    # Series renders from the zero-copy int64 view itself
+                    s.__dict__.pop("_numeric_x", None)
+                    x_ext = _cached_on_series(s, "x_extent",
+                                              lambda s=s: _epoch_extent(s.x))
+                else:
+                    # Convert datetime/Timestamp to float epoch seconds
+                    timestamps = _cached_on_series(
+                        s, "timestamps", lambda s=s: _to_timestamps(s.x))
+                    s._numeric_x = timestamps
+                    x_ext = _cached_on_series(s, "x_extent",
+                                              lambda t=timestamps: _extent(t))
             else:
-                numeric_x = s.x
+                s.__dict__.pop("_x_category_ticks", None)
+                x_ext = _cached_on_series(s, "x_extent", lambda s=s: _extent(s.x))
 
-            x_vals.extend(numeric_x)
-            y_vals.extend(s.y)
+            y_ext = _cached_on_series(s, "y_extent", lambda s=s: _extent(s.y))
+            if x_ext is None or y_ext is None:
+                continue
+            x_lo, x_hi = min(x_lo, x_ext[0]), max(x_hi, x_ext[1])
+            y_lo, y_hi = min(y_lo, y_ext[0]), max(y_hi, y_ext[1])
 
-        if not x_vals or not y_vals:
+        if x_lo > x_hi or y_lo > y_hi:
             return None, None
 
-        x_domain = (min(x_vals) - 0.5, max(x_vals) + 0.5)
+        x_domain = (x_lo - 0.5, x_hi + 0.5)
 
-        y_min = min(y_vals)
-        y_max = max(y_vals)
+        y_min = y_lo
+        y_max = y_hi
 
         # Detect which series types anchor the Y baseline at zero
         _zero_anchor_types = ("BarSeries", "HistogramSeries",
@@ -663,11 +925,7 @@ class Axes:
         # ------------------------------------------------------------------
         all_categories: dict = {}
         for s in list(self.series) + list(self.y2_series):
-            if hasattr(s, "_x_categories") and s._x_categories:
-                nx = getattr(s, "_numeric_x",
-                             [i + 0.5 for i in range(len(s._x_categories))])
-                for pos, cat in zip(nx, s._x_categories):
-                    all_categories[pos] = cat
+            all_categories.update(_category_labels(s))
 
         # ------------------------------------------------------------------
         # Helper: generate tick values for a numeric domain
@@ -779,7 +1037,14 @@ class Axes:
         y_label_off = 16 if not rotate else 8
 
         if all_categories:
-            for x_v, label in all_categories.items():
+            cat_items = list(all_categories.items())
+            plot_w    = self.width - 2 * pad
+            if len(cat_items) > plot_w:
+                # More categories than pixels (e.g. 100k candles): labels
+                # would be unreadable, so keep about one per 80 px.
+                step      = _math.ceil(len(cat_items) / max(1, plot_w // 80))
+                cat_items = cat_items[::step]
+            for x_v, label in cat_items:
                 x_p     = self.scale_x(x_v)
                 y_label = self.height - pad + y_label_off
                 rot     = rot_tfm.format(x_p=x_p, y_label=y_label) if rotate else ""
@@ -796,12 +1061,20 @@ class Axes:
         else:
             _has_dt = any(getattr(s, "_datetime_x", False) for s in self.series)
             _span   = (self._x_domain[1] - self._x_domain[0]) if _has_dt else 0
-            _x_tick_vals = (
-                list(self._xticks)
-                if self._xticks is not None
-                else _tick_vals(self._x_domain[0], self._x_domain[1],
-                                ticks, self.xscale == "log")
-            )
+            _dt_vals, _dt_lbls = ([], [])
+            if _has_dt and self._xticks is None and self.xscale != "log":
+                _dt_vals, _dt_lbls = _datetime_ticks(
+                    self._x_domain[0], self._x_domain[1], ticks)
+            if len(_dt_vals) >= 2:
+                _x_tick_vals = _dt_vals
+            else:
+                _dt_lbls = []
+                _x_tick_vals = (
+                    list(self._xticks)
+                    if self._xticks is not None
+                    else _tick_vals(self._x_domain[0], self._x_domain[1],
+                                    ticks, self.xscale == "log")
+                )
             _x_tick_lbls = self._xticklabels
             for idx_x, x_v in enumerate(_x_tick_vals):
                 if not (self._x_domain[0] <= x_v <= self._x_domain[1]):
@@ -814,6 +1087,8 @@ class Axes:
                     tick_label = _x_tick_lbls[idx_x]
                 elif self._tick_formatter is not None:
                     tick_label = str(self._tick_formatter(x_v))
+                elif _dt_lbls:
+                    tick_label = _dt_lbls[idx_x]
                 elif _has_dt:
                     tick_label = _format_datetime_tick(x_v, _span)
                 else:
@@ -900,9 +1175,9 @@ class Axes:
         tick_spacing   = plot_w / ticks
         # Check categorical labels first
         for s in self.series:
-            cats = getattr(s, "_x_categories", None)
+            cats = _category_labels(s)
             if cats:
-                max_len = max(len(str(c)) for c in cats)
+                max_len = max(len(str(c)) for c in cats.values())
                 return max_len * 6.5 > tick_spacing * 0.85
         # Numeric labels
         max_len = max(
@@ -1,7 +1,7 @@
 """GlyphX Line3DSeries — connected polyline in 3D space."""
 from __future__ import annotations
 
-from .projection3d import Camera3D, normalize, _format_3d_tick
+from .projection3d import Camera3D, normalize_array, _format_3d_tick
 from .utils         import svg_escape
 
 
@@ -57,12 +57,12 @@ class Line3DSeries:
         else:
             self.last_downsample_info = None
 
-        xn, *_ = normalize(x_plot)
-        yn, *_ = normalize(y_plot)
-        zn, *_ = normalize(z_plot)
+        xn, *_ = normalize_array(x_plot)
+        yn, *_ = normalize_array(y_plot)
+        zn, *_ = normalize_array(z_plot)
 
-        pts  = [cam.project(x, y, z) for x, y, z in zip(xn, yn, zn)]
-        pts_str = " ".join(f"{p.px:.1f},{p.py:.1f}" for p in pts)
+        px, py, _ = cam.project_array(xn, yn, zn)
+        pts_str = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(px.tolist(), py.tolist()))
         dash = self._DASH.get(self.linestyle, "")
         return (
             f'<polyline points="{pts_str}" fill="none" '
@@ -0,0 +1,108 @@
+"""
+GlyphX marker symbols shared by point series.
+
+Every marker shape is defined once, centred on the origin, and then
+placed per point -- either by ``<use>`` references to a single ``<defs>``
+entry (interactive points that carry their own tooltip attributes) or as
+one relative subpath per point inside a single ``<path>`` (static points)::
+
+    from glyphx.markers import marker_defs, marker_use
+
+    svg  = marker_defs("s1-m", "triangle", 5)
+    svg += marker_use("s1-m", 120.5, 80.25, 'fill="#1f77b4"')
+
+Shapes: ``"circle"``, ``"square"``, ``"triangle"``, ``"diamond"`` and
+``"cross"``.  ``size`` is the circle radius; the other shapes span the same
+``2 * size`` box except ``"square"``, which keeps its historical
+``size``-wide side.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+MARKERS = ("circle", "square", "triangle", "diamond", "cross")
+
+_SIN60 = math.sqrt(3) / 2
+
+
+def _fmt(v: float) -> str:
+    """Compact coordinate (2 decimals, trailing zeros stripped)."""
+    s = f"{v:.2f}".rstrip("0").rstrip(".")
+    return "0" if s in ("-0", "") else s
+
+
+def _outline(marker: str, size: float) -> list[tuple[float, float]]:
+    """Polygon vertices of a non-circular marker, centred on the origin."""
+    s = float(size)
+    if marker == "square":
+        h = s / 2
+        return [(-h, -h), (h, -h), (h, h), (-h, h)]
+    if marker == "triangle":
+        return [(0.0, -s), (s * _SIN60, s / 2), (-s * _SIN60, s / 2)]
+    if marker == "diamond":
+        return [(0.0, -s), (s, 0.0), (0.0, s), (-s, 0.0)]
+    if marker == "cross":
+        t = s / 3
+        return [(-t, -s), (t, -s), (t, -t), (s, -t), (s, t), (t, t),
+                (t, s), (-t, s), (-t, t), (-s, t), (-s, -t), (-t, -t)]
+    raise ValueError(f"Unknown marker {marker!r}; expected one of {MARKERS}.")
+
+
+def _relative_shape(marker: str, size: float) -> tuple[float, float, str]:
+    """
+    Start offset and relative path data of one marker.
+
+    Returns ``(dx, dy, d)``: a subpath for a point at ``(x, y)`` is
+    ``M{x + dx},{y + dy}{d}``.
+    """
+    if marker == "circle":
+        r = _fmt(size)
+        d = _fmt(2 * size)
+        return -float(size), 0.0, f"a{r},{r} 0 1,0 {d},0a{r},{r} 0 1,0 -{d},0Z"
+    pts  = _outline(marker, size)
+    x0, y0 = pts[0]
+    steps = "".join(f"l{_fmt(bx - ax)},{_fmt(by - ay)}"
+                    for (ax, ay), (bx, by) in zip(pts, pts[1:]))
+    return x0, y0, steps + "Z"
+
+
+def marker_defs(marker_id: str, marker: str, size: float) -> str:
+    """
+    ``<defs>`` block holding one marker shape with the given ``id``.
+
+    The shape carries no paint, so each ``<use>`` sets its own ``fill``.
+    """
+    if marker == "circle":
+        shape = f'<circle id="{marker_id}" r="{_fmt(size)}"/>'
+    elif marker == "square":
+        h = _fmt(-size / 2)
+        shape = (f'<rect id="{marker_id}" x="{h}" y="{h}" '
+                 f'width="{_fmt(size)}" height="{_fmt(size)}"/>')
+    else:
+        dx, dy, d = _relative_shape(marker, size)
+        shape = f'<path id="{marker_id}" d="M{_fmt(dx)},{_fmt(dy)}{d}"/>'
+    return f"<defs>{shape}</defs>"
+
+
+def marker_use(marker_id: str, x: float, y: float, attrs: str = "") -> str:
+    """A ``<use>`` placing marker ``marker_id`` at ``(x, y)``."""
+    sep = " " if attrs else ""
+    return f'<use href="#{marker_id}" x="{_fmt(x)}" y="{_fmt(y)}"{sep}{attrs}/>'
+
+
+def marker_path_data(marker: str, size: float, xs, ys) -> str:
+    """
+    Path data drawing ``marker`` at every ``(xs[i], ys[i])``.
+
+    One absolute move plus the shared relative shape per point, so the
+    whole set renders as a single ``<path>``.  Non-finite points are
+    skipped.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    ok = np.isfinite(xs) & np.isfinite(ys)
+    dx, dy, d = _relative_shape(marker, size)
+    return " ".join(f"M{_fmt(x)},{_fmt(y)}{d}" for x, y in
+                    zip((xs[ok] + dx).tolist(), (ys[ok] + dy).tolist()))
@@ -9,6 +9,8 @@ from __future__ import annotations
 import math
 from typing import NamedTuple
 
+import numpy as np
+
 
 class Projected(NamedTuple):
     px: float    # screen X pixel
@@ -23,6 +25,14 @@ def normalize(values: list[float]) -> tuple[list[float], float, float]:
     return [(v - lo) / span * 2 - 1 for v in values], lo, hi
 
 
+def normalize_array(values) -> tuple[np.ndarray, float, float]:
+    """Vectorised :func:`normalize`: return ``(ndarray in [-1, 1], min, max)``."""
+    arr = np.asarray(values, dtype=float)
+    lo, hi = float(arr.min()), float(arr.max())
+    span = hi - lo or 1.0
+    return (arr - lo) / span * 2 - 1, lo, hi
+
+
 class Camera3D:
     """
     Orthographic camera for projecting 3D data to 2D SVG.
@@ -78,6 +88,27 @@ class Camera3D:
 
         return Projected(px, py, fy)  # fy = depth
 
+    def project_array(self, x, y, z) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Project arrays of normalised 3D points in one vectorised pass.
+
+        Inputs broadcast against each other (e.g. a ``(ny, 1)`` column of Y
+        values against a ``(1, nx)`` row of X values projects a whole grid).
+
+        Returns:
+            ``(px, py, depth)`` arrays, matching :meth:`project` point for
+            point.  Back-to-front (painter's) order is
+            ``np.argsort(depth, kind="stable")``.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        rx =  x * self._cos_az + y * self._sin_az
+        ry = -x * self._sin_az + y * self._cos_az
+        fy =  ry * self._cos_el - z * self._sin_el
+        fz = -ry * self._sin_el - z * self._cos_el
+        return self.cx + rx * self.scale, self.cy - fz * self.scale, fy
+
     def project_all(
         self,
         xs: list[float],
@@ -85,7 +116,8 @@ class Camera3D:
         zs: list[float],
     ) -> list[Projected]:
         """Project a batch of points."""
-        return [self.project(x, y, z) for x, y, z in zip(xs, ys, zs)]
+        px, py, depth = self.project_array(xs, ys, zs)
+        return [Projected(*t) for t in zip(px.tolist(), py.tolist(), depth.tolist())]
 
 
 def axis_ticks(lo: float, hi: float, n: int = 5) -> list[float]:
@@ -90,18 +90,21 @@ class RaincloudSeries:
             cx = ax.scale_x(i + 0.5)  # 0-indexed, matches domain x positions  # type: ignore[union-attr]
 
             # ── 1. Jittered raw points (left side) ───────────────────────
+            # Paint shared by the whole category is set once on a group
             jitter = rng.uniform(-self.jitter_width, 0, size=len(arr))
+            elements.append(f'<g fill="{color}" fill-opacity="0.55">')
+            point_label = svg_escape(self.label or cat)
             for val, jit in zip(arr, jitter):
                 py = scale_y(float(val))
                 px = cx + jit - self.jitter_width * 0.5
                 elements.append(
                     f'<circle class="glyphx-point {self.css_class}" '
                     f'cx="{px:.1f}" cy="{py:.1f}" r="{self.point_radius}" '
-                    f'fill="{color}" fill-opacity="0.55" '
                     f'data-x="{svg_escape(cat)}" '
                     f'data-y="{val:.3g}" '
-                    f'data-label="{svg_escape(self.label or cat)}"/>'
+                    f'data-label="{point_label}"/>'
                 )
+            elements.append("</g>")
 
             # ── 2. Half-violin (right side) ───────────────────────────────
             kde    = _numpy_kde(arr)
@@ -0,0 +1,1055 @@
+"""
+GlyphX built-in rasterizer -- PNG export without cairo.
+
+``save("chart.png")`` normally goes through ``cairosvg``, which needs the
+system ``libcairo`` library and a full SVG/CSS engine.  This module renders
+the SVG subset GlyphX itself emits with NumPy alone, so raster export works
+in any environment that can import GlyphX, is fast enough to run per request,
+and parallelises across processes (no native state)::
+
+    from glyphx.raster import rasterize, svg_to_png
+
+    rgba = rasterize(fig.render_svg(), scale=2)      # (H, W, 4) uint8 array
+    png  = svg_to_png(fig.render_svg())              # PNG file bytes
+
+Supported:
+
+- ``<rect>`` (incl. rounded corners), ``<circle>``, ``<ellipse>``,
+  ``<line>``, ``<polyline>``, ``<polygon>`` and ``<path>`` (every command;
+  curves and arcs are flattened to within 0.1 px).
+- ``<g>`` groups with ``transform``, inherited presentation attributes,
+  group ``opacity``, ``<use>`` references into ``<defs>`` and ``<marker>``
+  arrowheads.
+- Paint from attributes, ``style=""`` and the class rules of ``<style>``
+  blocks (``Figure(css_classes=True)``), including ``var(--name)``.
+- Fill rules, opacities, ``stroke-dasharray`` and round/square caps.
+- ``<text>`` in a bundled 5x7 bitmap font, area-resampled to the font
+  size, with ``text-anchor``, ``dominant-baseline``, bold and rotation.
+
+Shapes are scan converted with 4 sub-scanlines per pixel row and exact
+horizontal coverage, then composited in premultiplied float32.  Joins are
+rounded, gradients, clip paths and filters are not supported, and text is a
+fixed-pitch stand-in for the browser font -- use ``cairosvg`` where
+typographic fidelity matters.
+"""
+from __future__ import annotations
+
+import functools
+import html
+import math
+import re
+import struct
+import zlib
+
+import numpy as np
+
+from .coalesce import _TAG
+
+# Sub-scanlines sampled per pixel row (vertical anti-aliasing).
+_SUB = 4
+# Maximum deviation of a flattened curve from the true curve, in pixels.
+_TOLERANCE = 0.1
+
+_ATTR    = re.compile(r"""([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_MARKUP  = re.compile(r"<[^>]*>")
+_NUMBER  = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_TOKEN = re.compile(
+    r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_TRANSFORM  = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)")
+_CSS_RULE   = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_CSS_VAR    = re.compile(r"var\(\s*(--[\w-]+)\s*(?:,\s*([^)]*))?\)")
+
+# Containers whose content is only drawn by reference (or never).
+_UNRENDERED = frozenset({
+    "defs", "marker", "symbol", "clippath", "mask", "pattern",
+    "lineargradient", "radialgradient", "filter", "title", "desc",
+    "metadata", "style", "script", "foreignobject",
+})
+_CONTAINERS = frozenset({"g", "a", "svg", "switch"})
+# Elements whose content is text, not markup.
+_TEXT_LIKE  = frozenset({"text", "style", "script", "title", "desc", "metadata"})
+
+# Presentation properties inherited by children.
+_INHERITED = frozenset({
+    "fill", "fill-opacity", "fill-rule", "stroke", "stroke-width",
+    "stroke-opacity", "stroke-dasharray", "stroke-dashoffset",
+    "stroke-linecap", "stroke-linejoin", "font-size", "font-weight",
+    "text-anchor", "dominant-baseline", "visibility", "color",
+})
+_LOCAL = frozenset({"opacity", "display", "marker-start", "marker-end"})
+
+_DEFAULT_STYLE = {"fill": "black", "stroke": "none", "stroke-width": "1",
+                  "font-size": "16"}
+
+
+# ---------------------------------------------------------------------------
+# Colours
+# ---------------------------------------------------------------------------
+
+_NAMED = {
+    "black": "000000", "white": "ffffff", "red": "ff0000", "green": "008000",
+    "blue": "0000ff", "yellow": "ffff00", "cyan": "00ffff", "aqua": "00ffff",
+    "magenta": "ff00ff", "fuchsia": "ff00ff", "gray": "808080",
+    "grey": "808080", "silver": "c0c0c0", "maroon": "800000",
+    "olive": "808000", "lime": "00ff00", "navy": "000080", "purple": "800080",
+    "teal": "008080", "orange": "ffa500", "pink": "ffc0cb", "brown": "a52a2a",
+    "gold": "ffd700", "crimson": "dc143c", "coral": "ff7f50",
+    "tomato": "ff6347", "salmon": "fa8072", "indigo": "4b0082",
+    "violet": "ee82ee", "orchid": "da70d6", "khaki": "f0e68c",
+    "beige": "f5f5dc", "ivory": "fffff0", "lavender": "e6e6fa",
+    "turquoise": "40e0d0", "tan": "d2b48c", "chocolate": "d2691e",
+    "firebrick": "b22222", "darkred": "8b0000", "darkgreen": "006400",
+    "darkblue": "00008b", "darkorange": "ff8c00", "steelblue": "4682b4",
+    "skyblue": "87ceeb", "royalblue": "4169e1", "dodgerblue": "1e90ff",
+    "slategray": "708090", "slategrey": "708090", "seagreen": "2e8b57",
+    "forestgreen": "228b22", "limegreen": "32cd32", "lightgray": "d3d3d3",
+    "lightgrey": "d3d3d3", "darkgray": "a9a9a9", "darkgrey": "a9a9a9",
+    "dimgray": "696969", "dimgrey": "696969", "gainsboro": "dcdcdc",
+    "whitesmoke": "f5f5f5", "lightblue": "add8e6", "lightgreen": "90ee90",
+    "goldenrod": "daa520", "sienna": "a0522d", "peru": "cd853f",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color(value: str) -> tuple[float, float, float, float] | None:
+    """``(r, g, b, a)`` in ``0..1`` for a CSS colour, ``None`` for no paint."""
+    v = value.strip().lower()
+    if not v or v in ("none", "transparent") or v.startswith("url("):
+        return None
+    v = _NAMED.get(v, v)
+    h = v[1:] if v.startswith("#") else v
+    if re.fullmatch(r"[0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8}", h):
+        if len(h) <= 4:
+            h = "".join(c * 2 for c in h)
+        a = int(h[6:8], 16) / 255 if len(h) == 8 else 1.0
+        return (int(h[0:2], 16) / 255, int(h[2:4], 16) / 255,
+                int(h[4:6], 16) / 255, a)
+    m = re.fullmatch(r"rgba?\(([^)]*)\)", v)
+    if m:
+        parts = [p for p in re.split(r"[\s,/]+", m.group(1)) if p]
+        if len(parts) < 3:
+            return (0.0, 0.0, 0.0, 1.0)
+        rgb = [float(p[:-1]) / 100 if p.endswith("%") else float(p) / 255
+               for p in parts[:3]]
+        a = 1.0
+        if len(parts) > 3:
+            a = float(parts[3][:-1]) / 100 if parts[3].endswith("%") else float(parts[3])
+        return (*(min(max(c, 0.0), 1.0) for c in rgb), min(max(a, 0.0), 1.0))
+    return (0.0, 0.0, 0.0, 1.0)        # unknown name: SVG's initial black
+
+
+# ---------------------------------------------------------------------------
+# Bitmap font
+# ---------------------------------------------------------------------------
+
+# Printable ASCII (0x20-0x7E), 5 columns per glyph, bit 0 = top row.
+_FONT_5X7 = bytes.fromhex(
+    "0000000000" "00005f0000" "0007000700" "147f147f14" "242a7f2a12"
+    "2313086462" "3649552250" "0005030000" "001c224100" "0041221c00"
+    "082a1c2a08" "08083e0808" "0050300000" "0808080808" "0060600000"
+    "2010080402" "3e5149453e" "00427f4000" "4261514946" "2141454b31"
+    "1814127f10" "2745454539" "3c4a494930" "0171090503" "3649494936"
+    "064949291e" "0036360000" "0056360000" "0814224100" "1414141414"
+    "0041221408" "0201510906" "324979413e" "7e1111117e" "7f49494936"
+    "3e41414122" "7f4141221c" "7f49494941" "7f09090101" "3e41415132"
+    "7f0808087f" "00417f4100" "2040413f01" "7f08142241" "7f40404040"
+    "7f0204027f" "7f0408107f" "3e4141413e" "7f09090906" "3e4151215e"
+    "7f09192946" "4649494931" "01017f0101" "3f4040403f" "1f2040201f"
+    "7f2018207f" "6314081463" "0304780403" "6151494543" "007f414100"
+    "0204081020" "0041417f00" "0402010204" "4040404040" "0001020400"
+    "2054545478" "7f48444438" "3844444420" "384444487f" "3854545418"
+    "087e090102" "0c5252523e" "7f08040478" "00447d4000" "2040443d00"
+    "007f102844" "00417f4000" "7c04180478" "7c08040478" "3844444438"
+    "7c14141408" "081414187c" "7c08040408" "4854545420" "043f444020"
+    "3c4040207c" "1c2040201c" "3c4030403c" "4428102844" "0c5050503c"
+    "4464544c44" "0008364100" "00007f0000" "0041360800" "0201020402"
+)
+_GLYPHS = ((np.frombuffer(_FONT_5X7, dtype=np.uint8).reshape(95, 1, 5)
+            >> np.arange(7, dtype=np.uint8).reshape(1, 7, 1)) & 1).astype(np.float64)
+
+# Characters outside ASCII drawn as their nearest ASCII look-alike.
+_ASCII_FALLBACK = {
+    "−": "-", "–": "-", "—": "-", "‐": "-",
+    "×": "x", "·": ".", "•": "*", "…": "...",
+    "‘": "'", "’": "'", "“": '"', "”": '"',
+    " ": " ", "°": "o", "µ": "u", "≤": "<",
+    "≥": ">", "±": "+",
+}
+
+
+def _text_bitmap(text: str, bold: bool) -> np.ndarray:
+    """``(7, 6 * len)`` glyph coverage of ``text`` (5 columns + 1 spacing)."""
+    codes = [ord(c) - 32 if " " <= c <= "~" else 31 for c in text]
+    cells = np.zeros((len(codes), 7, 6))
+    cells[:, :, :5] = _GLYPHS[codes]
+    if bold:
+        cells[:, :, 1:] = np.maximum(cells[:, :, 1:], cells[:, :, :-1])
+    return cells.transpose(1, 0, 2).reshape(7, -1)
+
+
+def _box_weights(n_px: int, origin: float, unit: float, n_cells: int) -> np.ndarray:
+    """Overlap of pixel ``[p, p+1)`` with cell ``[origin + c*unit, +unit)``."""
+    p  = np.arange(n_px, dtype=np.float64)[:, None]
+    c0 = origin + np.arange(n_cells) * unit
+    return np.clip(np.minimum(p + 1, c0 + unit) - np.maximum(p, c0), 0.0, 1.0)
+
+
+# ---------------------------------------------------------------------------
+# Geometry
+# ---------------------------------------------------------------------------
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def _compose(m, n):
+    """Affine ``m * n`` (apply ``n`` first); matrices as SVG ``(a..f)``."""
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (a * A + c * B, b * A + d * B, a * C + c * D, b * C + d * D,
+            a * E + c * F + e, b * E + d * F + f)
+
+
+def _transform(text: str):
+    """Parse an SVG ``transform`` attribute."""
+    m = _IDENTITY
+    for name, args in _TRANSFORM.findall(text):
+        v = [float(x) for x in _NUMBER.findall(args)]
+        if name == "matrix" and len(v) == 6:
+            t = tuple(v)
+        elif name == "translate" and v:
+            t = (1.0, 0.0, 0.0, 1.0, v[0], v[1] if len(v) > 1 else 0.0)
+        elif name == "scale" and v:
+            t = (v[0], 0.0, 0.0, v[1] if len(v) > 1 else v[0], 0.0, 0.0)
+        elif name == "rotate" and v:
+            r = math.radians(v[0])
+            cs, sn = math.cos(r), math.sin(r)
+            t = (cs, sn, -sn, cs, 0.0, 0.0)
+            if len(v) >= 3:
+                t = _compose(_compose((1.0, 0.0, 0.0, 1.0, v[1], v[2]), t),
+                             (1.0, 0.0, 0.0, 1.0, -v[1], -v[2]))
+        elif name == "skewX" and v:
+            t = (1.0, 0.0, math.tan(math.radians(v[0])), 1.0, 0.0, 0.0)
+        elif name == "skewY" and v:
+            t = (1.0, math.tan(math.radians(v[0])), 0.0, 1.0, 0.0, 0.0)
+        else:
+            continue
+        m = _compose(m, t)
+    return m
+
+
+def _apply(m, pts: np.ndarray) -> np.ndarray:
+    a, b, c, d, e, f = m
+    x, y = pts[:, 0], pts[:, 1]
+    return np.column_stack((a * x + c * y + e, b * x + d * y + f))
+
+
+def _scale_of(m) -> float:
+    """Mean linear scale of an affine (device pixels per user unit)."""
+    return math.sqrt(abs(m[0] * m[3] - m[1] * m[2])) or 1.0
+
+
+def _segments(radius: float, sweep: float) -> int:
+    """Chords needed to keep an arc of ``radius`` px within tolerance."""
+    if radius <= _TOLERANCE:
+        return 2
+    step = 2 * math.acos(max(1 - _TOLERANCE / radius, -1.0))
+    return max(2, min(1024, math.ceil(abs(sweep) / step)))
+
+
+def _ellipse_points(cx, cy, rx, ry, k) -> list[tuple[float, float]]:
+    n = max(8, _segments(max(rx, ry) * k, 2 * math.pi))
+    t = np.linspace(0, 2 * math.pi, n, endpoint=False)
+    # Vertices pushed out so the polygon keeps the ellipse's area
+    g = math.sqrt((2 * math.pi / n) / math.sin(2 * math.pi / n))
+    return list(zip((cx + g * rx * np.cos(t)).tolist(), (cy + g * ry * np.sin(t)).tolist()))
+
+
+def _arc_points(x1, y1, rx, ry, phi, large, sweep, x2, y2, k):
+    """Points of an SVG elliptical arc after ``(x1, y1)`` (SVG spec F.6.5)."""
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or (x1 == x2 and y1 == y2):
+        return [(x2, y2)]
+    cp, sp = math.cos(math.radians(phi)), math.sin(math.radians(phi))
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p, y1p = cp * dx + sp * dy, -sp * dx + cp * dy
+    lam = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if lam > 1:
+        rx, ry = rx * math.sqrt(lam), ry * math.sqrt(lam)
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    den = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coef = math.sqrt(max(0.0, num / den)) if den else 0.0
+    if large == sweep:
+        coef = -coef
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    cx = cp * cxp - sp * cyp + (x1 + x2) / 2
+    cy = sp * cxp + cp * cyp + (y1 + y2) / 2
+    t1 = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    dt = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - t1
+    if sweep and dt < 0:
+        dt += 2 * math.pi
+    elif not sweep and dt > 0:
+        dt -= 2 * math.pi
+    n = _segments(max(rx, ry) * k, dt)
+    t = t1 + dt * np.arange(1, n + 1) / n
+    step = abs(dt) / n
+    g = math.sqrt(step / math.sin(step)) if 0 < step < math.pi else 1.0
+    ct, st = g * np.cos(t), g * np.sin(t)   # area-preserving, as in _ellipse_points
+    xs = cx + rx * cp * ct - ry * sp * st
+    ys = cy + rx * sp * ct + ry * cp * st
+    pts = list(zip(xs.tolist(), ys.tolist()))
+    pts[-1] = (x2, y2)
+    return pts
+
+
+def _bezier_points(p0, ctrl, k):
+    """Points of a quadratic/cubic Bezier after ``p0`` (``ctrl`` ends at the end point)."""
+    pts = np.array([p0, *ctrl], dtype=np.float64)
+    length = float(np.hypot(*np.diff(pts, axis=0).T).sum()) * k
+    n = max(2, min(256, math.ceil(math.sqrt(length / _TOLERANCE) / 2)))
+    t = np.arange(1, n + 1)[:, None] / n
+    u = 1 - t
+    if len(pts) == 3:
+        out = u * u * pts[0] + 2 * u * t * pts[1] + t * t * pts[2]
+    else:
+        out = (u ** 3 * pts[0] + 3 * u * u * t * pts[1]
+               + 3 * u * t * t * pts[2] + t ** 3 * pts[3])
+    return [tuple(p) for p in out.tolist()]
+
+
+def _path_subpaths(d: str, k: float):
+    """Flatten path data into ``[(points, closed), ...]`` in user space."""
+    tokens = _PATH_TOKEN.findall(d)
+    subpaths, pts = [], []
+    x = y = sx = sy = 0.0
+    last_ctrl, last_cmd = None, ""
+    cmd, i, n = None, 0, len(tokens)
+
+    def nums(count):
+        nonlocal i
+        vals = tokens[i:i + count]
+        if len(vals) < count or any(v.isalpha() for v in vals):
+            raise ValueError
+        i += count
+        return [float(v) for v in vals]
+
+    def finish(closed):
+        nonlocal pts
+        if len(pts) > 1:
+            subpaths.append((pts, closed))
+        pts = []
+
+    try:
+        while i < n:
+            if tokens[i].isalpha():
+                cmd = tokens[i]
+                i += 1
+                if cmd in "Zz":
+                    finish(True)
+                    x, y = sx, sy
+                    last_ctrl, last_cmd = None, "Z"
+                    continue
+            elif cmd is None or cmd in "Zz":
+                break
+            rel = cmd.islower()
+            c = cmd.upper()
+            ox, oy = (x, y) if rel else (0.0, 0.0)
+            ctrl = None
+            if c != "M" and not pts:
+                pts = [(x, y)]                  # drawing on after a "Z"
+            if c == "M":
+                px, py = nums(2)
+                finish(False)
+                x, y = sx, sy = px + ox, py + oy
+                pts = [(x, y)]
+                cmd = "l" if rel else "L"      # implicit lineto
+            elif c == "L":
+                px, py = nums(2)
+                x, y = px + ox, py + oy
+                pts.append((x, y))
+            elif c == "H":
+                x = nums(1)[0] + ox
+                pts.append((x, y))
+            elif c == "V":
+                y = nums(1)[0] + oy
+                pts.append((x, y))
+            elif c in "CS":
+                if c == "C":
+                    v = nums(6)
+                    c1 = (v[0] + ox, v[1] + oy)
+                    v = v[2:]
+                else:
+                    v = nums(4)
+                    c1 = ((2 * x - last_ctrl[0], 2 * y - last_ctrl[1])
+                          if last_ctrl and last_cmd in "CS" else (x, y))
+                ctrl = (v[0] + ox, v[1] + oy)
+                end = (v[2] + ox, v[3] + oy)
+                pts.extend(_bezier_points((x, y), [c1, ctrl, end], k))
+                x, y = end
+            elif c in "QT":
+                if c == "Q":
+                    v = nums(4)
+                    ctrl = (v[0] + ox, v[1] + oy)
+                    v = v[2:]
+                else:
+                    v = nums(2)
+                    ctrl = ((2 * x - last_ctrl[0], 2 * y - last_ctrl[1])
+                            if last_ctrl and last_cmd in "QT" else (x, y))
+                end = (v[0] + ox, v[1] + oy)
+                pts.extend(_bezier_points((x, y), [ctrl, end], k))
+                x, y = end
+            elif c == "A":
+                rx, ry, phi, large, sweep, px, py = nums(7)
+                end = (px + ox, py + oy)
+                pts.extend(_arc_points(x, y, rx, ry, phi, large != 0,
+                                       sweep != 0, end[0], end[1], k))
+                x, y = end
+            else:
+                break
+            last_ctrl, last_cmd = ctrl, c
+    except ValueError:
+        pass                                # render up to the first error, like SVG
+    finish(False)
+    return subpaths
+
+
+def _num(value, default: float = 0.0) -> float:
+    if value is None:
+        return default
+    m = _NUMBER.match(str(value).strip())
+    return float(m.group()) if m else default
+
+
+def _length(value: str, default: float = 16.0) -> float:
+    """A CSS length in px (``px``/``pt``/``em`` units)."""
+    v = str(value).strip()
+    n = _num(v, default)
+    if v.endswith("pt"):
+        return n * 4 / 3
+    if v.endswith("em") or v.endswith("rem"):
+        return n * 16
+    return n
+
+
+def _shape_subpaths(tag: str, attrs: dict, k: float):
+    """User-space geometry of a basic shape as ``[(points, closed), ...]``."""
+    g = attrs.get
+    if tag == "rect":
+        x, y = _num(g("x")), _num(g("y"))
+        w, h = _num(g("width")), _num(g("height"))
+        if w <= 0 or h <= 0:
+            return []
+        rx, ry = g("rx"), g("ry")
+        rx = _num(rx if rx is not None else ry)
+        ry = _num(ry if ry is not None else rx)
+        rx, ry = min(max(rx, 0.0), w / 2), min(max(ry, 0.0), h / 2)
+        if rx <= 0 or ry <= 0:
+            return [([(x, y), (x + w, y), (x + w, y + h), (x, y + h)], True)]
+        n = max(2, _segments(max(rx, ry) * k, math.pi / 2))
+        pts = []
+        for cx, cy, a0 in ((x + w - rx, y + ry, -90), (x + w - rx, y + h - ry, 0),
+                           (x + rx, y + h - ry, 90), (x + rx, y + ry, 180)):
+            t = np.radians(a0 + 90 * np.arange(n + 1) / n)
+            pts.extend(zip((cx + rx * np.cos(t)).tolist(), (cy + ry * np.sin(t)).tolist()))
+        return [(pts, True)]
+    if tag == "circle":
+        r = _num(g("r"))
+        return [(_ellipse_points(_num(g("cx")), _num(g("cy")), r, r, k), True)] if r > 0 else []
+    if tag == "ellipse":
+        rx, ry = _num(g("rx")), _num(g("ry"))
+        if rx <= 0 or ry <= 0:
+            return []
+        return [(_ellipse_points(_num(g("cx")), _num(g("cy")), rx, ry, k), True)]
+    if tag == "line":
+        return [([(_num(g("x1")), _num(g("y1"))), (_num(g("x2")), _num(g("y2")))], False)]
+    if tag in ("polyline", "polygon"):
+        v = [float(n) for n in _NUMBER.findall(g("points", ""))]
+        pts = list(zip(v[0:len(v) - 1:2], v[1::2]))
+        return [(pts, tag == "polygon")] if len(pts) > 1 else []
+    if tag == "path":
+        return _path_subpaths(g("d", ""), k)
+    return []
+
+
+# ---------------------------------------------------------------------------
+# Scan conversion
+# ---------------------------------------------------------------------------
+
+def _ring_edges(rings: list[np.ndarray]):
+    """Edges ``(x0, y0, x1, y1)`` of implicitly closed device-space rings."""
+    rings = [r for r in rings if len(r) >= 2]
+    if not rings:
+        return None
+    pts  = np.concatenate(rings)
+    lens = np.array([len(r) for r in rings])
+    ends = np.cumsum(lens)
+    nxt  = np.arange(1, len(pts) + 1)
+    nxt[ends - 1] = ends - lens
+    return pts[:, 0], pts[:, 1], pts[nxt, 0], pts[nxt, 1]
+
+
+def _scan(shapes, width: int, height: int, evenodd: bool = False):
+    """
+    Anti-aliased coverage of one or more shapes.
+
+    Each shape (a tuple of edge arrays) is filled with its own winding
+    rule; where shapes overlap their coverage adds up, clipped to 1.
+
+    Returns:
+        ``(x0, y0, coverage)`` -- a float array covering the clipped
+        bounding box at ``(x0, y0)`` -- or ``None`` if nothing is covered.
+    """
+    parts = [(s, np.full(len(s[0]), i)) for i, s in enumerate(shapes) if s is not None]
+    if not parts:
+        return None
+    ex0, ey0, ex1, ey1 = (np.concatenate([p[0][j] for p in parts]) for j in range(4))
+    group = np.concatenate([p[1] for p in parts])
+    ok = np.isfinite(ex0) & np.isfinite(ey0) & np.isfinite(ex1) & np.isfinite(ey1) & (ey0 != ey1)
+    if not ok.any():
+        return None
+    ex0, ey0, ex1, ey1, group = ex0[ok], ey0[ok], ex1[ok], ey1[ok], group[ok]
+
+    bx0 = max(int(math.floor(min(ex0.min(), ex1.min()))), 0)
+    bx1 = min(int(math.ceil(max(ex0.max(), ex1.max()))), width)
+    by0 = max(int(math.floor(min(ey0.min(), ey1.min()))), 0)
+    by1 = min(int(math.ceil(max(ey0.max(), ey1.max()))), height)
+    if bx1 <= bx0 or by1 <= by0:
+        return None
+
+    # Crossings of every edge with every sub-scanline y = (k + 0.5) / _SUB
+    up  = ey1 > ey0
+    lo  = np.where(up, ey0, ey1)
+    hi  = np.where(up, ey1, ey0)
+    k0  = np.maximum(np.ceil(lo * _SUB - 0.5), by0 * _SUB).astype(np.int64)
+    k1  = np.minimum(np.ceil(hi * _SUB - 0.5), by1 * _SUB).astype(np.int64)
+    cnt = np.maximum(k1 - k0, 0)
+    total = int(cnt.sum())
+    if not total:
+        return None
+    idx = np.repeat(np.arange(len(cnt)), cnt)
+    k   = np.repeat(k0, cnt) + (np.arange(total) - np.repeat(np.cumsum(cnt) - cnt, cnt))
+    t   = ((k + 0.5) / _SUB - ey0[idx]) / (ey1[idx] - ey0[idx])
+    xs  = ex0[idx] + t * (ex1[idx] - ex0[idx]) - bx0
+    g   = group[idx]
+
+    # Per sub-scanline and shape, crossings in x order; a closed shape's
+    # crossings on one line always sum to zero winding, so a running total
+    # over the sorted list restarts at each (line, shape) block.
+    order = np.lexsort((xs, g, k))
+    k, xs = k[order], xs[order]
+    if evenodd:
+        inside = np.arange(len(xs)) % 2 == 0
+    else:
+        inside = np.cumsum(np.where(up[idx[order]], 1, -1)) != 0
+    i = np.flatnonzero(inside[:-1])
+
+    W, R = bx1 - bx0, by1 - by0
+    a = np.clip(xs[i], 0, W)
+    b = np.clip(xs[i + 1], 0, W)
+    keep = b > a
+    a, b, row = a[keep], b[keep], (k[i][keep] // _SUB) - by0
+    # Exact horizontal coverage of each span [a, b): full pixels between
+    # the end pixels as a step (cumulative sum), fractional ends added.
+    C  = W + 1
+    ka = np.floor(a).astype(np.int64)
+    kb = np.floor(b).astype(np.int64)
+    ia, ib = row * C + ka, row * C + kb
+    steps = (np.bincount(ia, minlength=R * C) - np.bincount(ib, minlength=R * C))
+    frac  = (np.bincount(ib, weights=b - kb, minlength=R * C)
+             - np.bincount(ia, weights=a - ka, minlength=R * C))
+    cov = (np.cumsum(steps.reshape(R, C), axis=1) + frac.reshape(R, C))[:, :W]
+    return bx0, by0, np.clip(cov / _SUB, 0.0, 1.0)
+
+
+# ---------------------------------------------------------------------------
+# Stroking
+# ---------------------------------------------------------------------------
+
+def _disk_edges(centers: np.ndarray, r: float):
+    """Edges of a polygonal disk at every centre (same winding as stroke quads)."""
+    n = 8 if r < 3 else 16
+    t = -2 * np.pi * np.arange(n) / n
+    ring = np.column_stack((np.cos(t), np.sin(t))) * r
+    p = centers[:, None, :] + ring[None, :, :]
+    q = np.roll(p, -1, axis=1)
+    return p[..., 0].ravel(), p[..., 1].ravel(), q[..., 0].ravel(), q[..., 1].ravel()
+
+
+def _dash_segments(P: np.ndarray, pattern: list[float], offset: float):
+    """Start and end points of the dashes along polyline ``P``."""
+    s = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(P, axis=0).T))))
+    total = s[-1]
+    pat = pattern * 2 if len(pattern) % 2 else pattern
+    period = sum(pat)
+    if total <= 0 or period <= 0:
+        return P[:-1], P[1:]
+    start = -(offset % period)
+    reps = math.ceil((total - start) / period) + 1
+    if reps * len(pat) > 1_000_000:
+        return P[:-1], P[1:]                # too fine to matter: solid
+    cum = np.concatenate(([0.0], np.cumsum(pat)))
+    bounds = (start + np.arange(reps)[:, None] * period + cum[None, :-1]).ravel()
+    cuts = np.unique(np.concatenate((s, bounds[(bounds > 0) & (bounds < total)])))
+    mids = (cuts[:-1] + cuts[1:]) / 2
+    on = (np.searchsorted(cum, (mids - start) % period, side="right") - 1) % 2 == 0
+    a, b = cuts[:-1][on], cuts[1:][on]
+    return (np.column_stack((np.interp(a, s, P[:, 0]), np.interp(a, s, P[:, 1]))),
+            np.column_stack((np.interp(b, s, P[:, 0]), np.interp(b, s, P[:, 1]))))
+
+
+def _stroke_edges(paths, hw: float, dash, offset: float, cap: str):
+    """Outline of a stroke of half-width ``hw`` as one shape's edges."""
+    starts, ends, dots = [], [], []
+    for P, closed in paths:
+        if len(P) < 2:
+            continue
+        if closed and not np.array_equal(P[0], P[-1]):
+            P = np.vstack((P, P[:1]))
+        if dash:
+            a, b = _dash_segments(P, dash, offset)
+            starts.append(a)
+            ends.append(b)
+            continue
+        if not closed and cap == "square":
+            P = P.copy()
+            for i, j in ((0, 1), (-1, -2)):
+                d = P[i] - P[j]
+                L = math.hypot(*d)
+                if L > 0:
+                    P[i] = P[i] + d / L * hw
+        starts.append(P[:-1])
+        ends.append(P[1:])
+        if hw >= 0.75:                          # round joins
+            dots.append(P[:-1] if closed else P[1:-1])
+        if not closed and cap == "round":
+            dots.append(P[[0, -1]])
+    if not starts:
+        return None
+    p0, p1 = np.concatenate(starts), np.concatenate(ends)
+    d = p1 - p0
+    L = np.hypot(d[:, 0], d[:, 1])
+    keep = L > 1e-9
+    p0, p1, d, L = p0[keep], p1[keep], d[keep], L[keep]
+    nrm = np.column_stack((-d[:, 1], d[:, 0])) / L[:, None] * hw
+    quads = np.stack((p0 + nrm, p1 + nrm, p1 - nrm, p0 - nrm), axis=1)
+    nxt = np.roll(quads, -1, axis=1)
+    edges = [(quads[..., 0].ravel(), quads[..., 1].ravel(),
+              nxt[..., 0].ravel(), nxt[..., 1].ravel())]
+    if dots:
+        centers = np.concatenate(dots)
+        if len(centers):
+            edges.append(_disk_edges(centers, hw))
+    return tuple(np.concatenate([e[j] for e in edges]) for j in range(4))
+
+
+# ---------------------------------------------------------------------------
+# Renderer
+# ---------------------------------------------------------------------------
+
+def _parse_tree(svg: str):
+    """Light element tree ``[tag, attrs, children, text]`` plus ids and CSS."""
+    svg  = _COMMENT.sub("", svg)
+    low  = svg.lower()
+    root = ["#document", {}, [], ""]
+    stack, ids, css = [root], {}, []
+    pos = 0
+    while True:
+        m = _TAG.search(svg, pos)
+        if m is None:
+            break
+        pos = m.end()
+        closing, name, rest, self_closing = m.groups()
+        tag = name.lower()
+        if closing:
+            for i in range(len(stack) - 1, 0, -1):
+                if stack[i][0] == tag:
+                    del stack[i:]
+                    break
+            continue
+        attrs = {a.group(1): a.group(2) if a.group(2) is not None else a.group(3)
+                 for a in _ATTR.finditer(rest)}
+        node = [tag, attrs, [], ""]
+        stack[-1][2].append(node)
+        if "id" in attrs:
+            ids[attrs["id"]] = node
+        if self_closing:
+            continue
+        if tag in _TEXT_LIKE:
+            end = low.find(f"</{tag}", pos)
+            end = len(svg) if end < 0 else end
+            body = svg[pos:end]
+            if tag == "style":
+                css.append(body)
+            elif tag == "text":
+                node[3] = html.unescape(_MARKUP.sub("", body))
+            pos = end
+            continue
+        stack.append(node)
+    return root, ids, "".join(css)
+
+
+def _parse_css(css: str):
+    """Class rules ``{name: [(prop, value), ...]}`` and ``--custom`` properties."""
+    classes: dict[str, list[tuple[str, str]]] = {}
+    variables: dict[str, str] = {}
+    for selectors, body in _CSS_RULE.findall(css.replace("<![CDATA[", "").replace("]]>", "")):
+        decls = _declarations(body)
+        for n, v in decls:
+            if n.startswith("--"):
+                variables.setdefault(n, v)
+        for sel in selectors.split(","):
+            parts = sel.split()
+            last = parts[-1] if parts else ""
+            if re.fullmatch(r"\.[\w-]+", last):
+                classes.setdefault(last[1:], []).extend(decls)
+    return classes, variables
+
+
+def _declarations(body: str) -> list[tuple[str, str]]:
+    out = []
+    for decl in body.split(";"):
+        if ":" in decl:
+            n, v = decl.split(":", 1)
+            v = v.replace("!important", "").strip()
+            if n.strip() and v:
+                out.append((n.strip().lower(), v))
+    return out
+
+
+class _Canvas:
+    """Premultiplied RGBA float32 canvas with batched opaque fills."""
+
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        self.rgba = np.zeros((height, width, 4), dtype=np.float32)
+        self._batch: list = []
+        self._batch_key = None
+
+    def fill(self, edges, color, evenodd: bool = False) -> None:
+        """Fill one shape; consecutive opaque shapes of one colour share a scan."""
+        if edges is None or color is None:
+            return
+        key = (color, evenodd)
+        if self._batch and key != self._batch_key:
+            self.flush()
+        if color[3] >= 1.0:
+            self._batch.append(edges)
+            self._batch_key = key
+        else:
+            self._composite(_scan([edges], self.width, self.height, evenodd), color)
+
+    def flush(self) -> None:
+        if self._batch:
+            color, evenodd = self._batch_key
+            self._composite(_scan(self._batch, self.width, self.height, evenodd), color)
+            self._batch = []
+
+    def blend(self, x0: int, y0: int, cov: np.ndarray, color) -> None:
+        """Composite a coverage mask placed at ``(x0, y0)`` (clipped)."""
+        self.flush()
+        h, w = cov.shape
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x0 + w, self.width), min(y0 + h, self.height)
+        if cx1 <= cx0 or cy1 <= cy0:
+            return
+        cov = cov[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]
+        self._composite((cx0, cy0, cov), color)
+
+    def _composite(self, placed, color) -> None:
+        if placed is None:
+            return
+        x0, y0, cov = placed
+        h, w = cov.shape
+        paint = np.array((color[0], color[1], color[2], 1.0), dtype=np.float32)
+        region = self.rgba[y0:y0 + h, x0:x0 + w]
+        covered = np.flatnonzero(cov)
+        if len(covered) < cov.size // 4:
+            # Sparse masks (gridlines, outlines): touch covered pixels only
+            rows, cols = np.divmod(covered, w)
+            a = (cov.ravel()[covered] * color[3]).astype(np.float32)[:, None]
+            region[rows, cols] = region[rows, cols] * (1 - a) + a * paint
+            return
+        a = (cov * color[3]).astype(np.float32)[..., None]
+        region *= 1 - a
+        region += a * paint
+
+
+class _Renderer:
+    def __init__(self, canvas: _Canvas, ids: dict, css: str):
+        self.canvas = canvas
+        self.ids = ids
+        self.classes, self.variables = _parse_css(css)
+        # Flattened geometry per (element, scale): shared by every <use>
+        self._geometry: dict = {}
+
+    # -- Style ---------------------------------------------------------------
+
+    def _resolve(self, value: str) -> str:
+        if "var(" not in value:
+            return value
+        return _CSS_VAR.sub(lambda m: self.variables.get(m.group(1), m.group(2) or ""), value)
+
+    def _style(self, attrs: dict, parent: dict):
+        """Inherited style for children and the element's own local properties."""
+        style, local = dict(parent), {}
+        sources = [attrs.items()]
+        for cls in attrs.get("class", "").split():
+            if cls in self.classes:
+                sources.append(self.classes[cls])
+        if "style" in attrs:
+            sources.append(_declarations(attrs["style"]))
+        for source in sources:
+            for n, v in source:
+                if v == "inherit":
+                    continue
+                if n in _INHERITED:
+                    style[n] = self._resolve(v)
+                elif n in _LOCAL:
+                    local[n] = self._resolve(v)
+        return style, local
+
+    def _paint(self, style: dict, prop: str, alpha: float):
+        value = style.get(prop, "none")
+        if value == "currentColor":
+            value = style.get("color", "black")
+        color = _parse_color(value)
+        if color is None:
+            return None
+        a = color[3] * alpha * min(max(_num(style.get(f"{prop}-opacity"), 1.0), 0.0), 1.0)
+        return None if a <= 0 else (color[0], color[1], color[2], a)
+
+    # -- Tree walk -------------------------------------------------------------
+
+    def render(self, nodes, ctm, style: dict, alpha: float) -> None:
+        for tag, attrs, children, text in nodes:
+            if tag in _UNRENDERED:
+                continue
+            own, local = self._style(attrs, style)
+            if local.get("display") == "none":
+                continue
+            a = alpha * min(max(_num(local.get("opacity"), 1.0), 0.0), 1.0)
+            if a <= 0:
+                continue
+            m = _compose(ctm, _transform(attrs["transform"])) if "transform" in attrs else ctm
+            if tag in _CONTAINERS:
+                self.render(children, m, own, a)
+            elif own.get("visibility") in ("hidden", "collapse"):
+                continue
+            elif tag == "use":
+                self._use(attrs, m, own, a)
+            elif tag == "text":
+                self._text(attrs, text, m, own, a)
+            else:
+                self._shape(tag, attrs, m, own, local, a)
+
+    def _use(self, attrs, ctm, style, alpha) -> None:
+        ref = attrs.get("href") or attrs.get("xlink:href") or ""
+        target = self.ids.get(ref[1:]) if ref.startswith("#") else None
+        if target is None:
+            return
+        m = _compose(ctm, (1.0, 0.0, 0.0, 1.0, _num(attrs.get("x")), _num(attrs.get("y"))))
+        if target[0] == "symbol":
+            self.render(target[2], m, style, alpha)
+        else:
+            self.render([target], m, style, alpha)
+
+    def _shape(self, tag, attrs, ctm, style, local, alpha) -> None:
+        k = _scale_of(ctm)
+        key = (id(attrs), k)
+        subpaths = self._geometry.get(key)
+        if subpaths is None:
+            subpaths = self._geometry[key] = _shape_subpaths(tag, attrs, k)
+        if not subpaths:
+            return
+        device = [(_apply(ctm, np.asarray(p, dtype=np.float64)), closed)
+                  for p, closed in subpaths]
+        if tag != "line":
+            fill = self._paint(style, "fill", alpha)
+            if fill is not None:
+                self.canvas.fill(_ring_edges([P for P, _ in device if len(P) >= 3]),
+                                 fill, style.get("fill-rule") == "evenodd")
+        stroke = self._paint(style, "stroke", alpha)
+        hw = _length(style.get("stroke-width", "1"), 1.0) * k / 2
+        if stroke is not None and hw > 0:
+            dash = style.get("stroke-dasharray", "none")
+            pattern = [abs(float(v)) * k for v in _NUMBER.findall(dash)] if dash != "none" else []
+            if not any(pattern):
+                pattern = []
+            offset = _length(style.get("stroke-dashoffset", "0"), 0.0) * k
+            self.canvas.fill(_stroke_edges(device, hw, pattern, offset,
+                                           style.get("stroke-linecap", "butt")), stroke)
+        for prop, at_end in (("marker-start", False), ("marker-end", True)):
+            if prop in local:
+                self._marker(local[prop], subpaths, at_end, ctm, style, alpha)
+
+    def _marker(self, ref, subpaths, at_end, ctm, style, alpha) -> None:
+        m = re.match(r"url\(\s*#([^)\s]+)\s*\)", ref)
+        node = self.ids.get(m.group(1)) if m else None
+        if node is None or node[0] != "marker":
+            return
+        pts = subpaths[-1][0] if at_end else subpaths[0][0]
+        if at_end:
+            (x0, y0), (x1, y1) = pts[-2], pts[-1]
+            px, py = x1, y1
+        else:
+            (x0, y0), (x1, y1) = pts[0], pts[1]
+            px, py = x0, y0
+        attrs = node[1]
+        orient = attrs.get("orient", "0")
+        angle = (math.atan2(y1 - y0, x1 - x0) if orient.startswith("auto")
+                 else math.radians(_num(orient)))
+        cs, sn = math.cos(angle), math.sin(angle)
+        s = (1.0 if attrs.get("markerUnits") == "userSpaceOnUse"
+             else _length(style.get("stroke-width", "1"), 1.0))
+        t = _compose(_compose(ctm, (cs, sn, -sn, cs, px, py)),
+                     (s, 0.0, 0.0, s, -_num(attrs.get("refX")) * s,
+                      -_num(attrs.get("refY")) * s))
+        self.render(node[2], t, dict(_DEFAULT_STYLE), alpha)
+
+    def _text(self, attrs, text, ctm, style, alpha) -> None:
+        text = " ".join(text.split())
+        color = self._paint(style, "fill", alpha)
+        if not text or color is None:
+            return
+        text = "".join(_ASCII_FALLBACK.get(c, c) for c in text)
+        size = _length(style.get("font-size", "16"))
+        u = size / 10                       # font unit: 7 units = cap height
+        x = _num(attrs.get("x")) + _num(attrs.get("dx"))
+        y = _num(attrs.get("y")) + _num(attrs.get("dy"))
+        width = (6 * len(text) - 1) * u
+        anchor = style.get("text-anchor", "start")
+        x -= width / 2 if anchor == "middle" else width if anchor == "end" else 0
+        baseline = style.get("dominant-baseline", "auto")
+        y -= (3.5 * u if baseline in ("middle", "central")
+              else 0.0 if baseline in ("hanging", "text-before-edge") else 7 * u)
+        weight = style.get("font-weight", "normal")
+        bold = weight in ("bold", "bolder") or _num(weight, 400) >= 600
+        bitmap = _text_bitmap(text, bold)
+        rows, cols = bitmap.shape
+
+        a, b, c, d, e, f = ctm
+        if abs(b) < 1e-9 and abs(c) < 1e-9 and a > 0 and d > 0:
+            # Axis aligned: resample the bitmap straight into device pixels
+            X, Y = a * x + e, d * y + f
+            px, py = math.floor(X), math.floor(Y)
+            wy = _box_weights(math.ceil(Y - py + rows * u * d) + 1, Y - py, u * d, rows)
+            wx = _box_weights(math.ceil(X - px + cols * u * a) + 1, X - px, u * a, cols)
+            self.canvas.blend(px, py, wy @ bitmap @ wx.T, color)
+            return
+
+        # Rotated / skewed: resample at device scale, then map each device
+        # pixel back into the unrotated mask (bilinear).
+        k = _scale_of(ctm)
+        mask = (_box_weights(math.ceil(rows * u * k) + 1, 0.0, u * k, rows) @ bitmap
+                @ _box_weights(math.ceil(cols * u * k) + 1, 0.0, u * k, cols).T)
+        mh, mw = mask.shape
+        to_dev = _compose(ctm, (1 / k, 0.0, 0.0, 1 / k, x, y))
+        corners = _apply(to_dev, np.array([[0, 0], [mw, 0], [0, mh], [mw, mh]], float))
+        x0 = max(int(math.floor(corners[:, 0].min())), 0)
+        x1 = min(int(math.ceil(corners[:, 0].max())), self.canvas.width)
+        y0 = max(int(math.floor(corners[:, 1].min())), 0)
+        y1 = min(int(math.ceil(corners[:, 1].max())), self.canvas.height)
+        if x1 <= x0 or y1 <= y0:
+            return
+        A, B, C, D, E, F = to_dev
+        det = A * D - B * C
+        if abs(det) < 1e-12:
+            return
+        gx, gy = np.meshgrid(np.arange(x0, x1) + 0.5 - E, np.arange(y0, y1) + 0.5 - F)
+        mx = (D * gx - C * gy) / det - 0.5
+        my = (-B * gx + A * gy) / det - 0.5
+        padded = np.pad(mask, 1)
+        ix, iy = np.floor(mx).astype(np.int64), np.floor(my).astype(np.int64)
+        fx, fy = mx - ix, my - iy
+        inside = (ix >= -1) & (ix < mw) & (iy >= -1) & (iy < mh)
+        ix, iy = np.clip(ix + 1, 0, mw), np.clip(iy + 1, 0, mh)
+        cov = ((padded[iy, ix] * (1 - fx) + padded[iy, ix + 1] * fx) * (1 - fy)
+               + (padded[iy + 1, ix] * (1 - fx) + padded[iy + 1, ix + 1] * fx) * fy)
+        self.canvas.blend(x0, y0, np.where(inside, cov, 0.0), color)
+
+
+def _root_geometry(root_attrs: dict, scale: float):
+    """Output size and base transform from the root ``<svg>`` attributes."""
+    vb = [float(v) for v in _NUMBER.findall(root_attrs.get("viewBox", ""))]
+    w = _num(root_attrs.get("width"), vb[2] if len(vb) == 4 else 640)
+    h = _num(root_attrs.get("height"), vb[3] if len(vb) == 4 else 480)
+    width, height = max(1, round(w * scale)), max(1, round(h * scale))
+    if len(vb) == 4 and vb[2] > 0 and vb[3] > 0:
+        sx, sy = width / vb[2], height / vb[3]
+        return width, height, (sx, 0.0, 0.0, sy, -vb[0] * sx, -vb[1] * sy)
+    return width, height, (width / w if w else scale, 0.0, 0.0,
+                           height / h if h else scale, 0.0, 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def rasterize(svg: str, scale: float = 1.0, background: str | None = None) -> np.ndarray:
+    """
+    Render a GlyphX SVG document to pixels.
+
+    Args:
+        svg:        A complete SVG document (``Figure.render_svg()``).
+        scale:      Pixels per SVG unit; ``2`` doubles the resolution
+                    (``dpi / 96`` for a target DPI).
+        background: Optional colour painted under the chart; by default
+                    uncovered pixels stay transparent.
+
+    Returns:
+        A ``(height, width, 4)`` ``uint8`` RGBA array (straight alpha).
+
+    Raises:
+        ValueError: If ``svg`` has no ``<svg>`` root or ``scale <= 0``.
+    """
+    if scale <= 0:
+        raise ValueError("scale must be positive.")
+    tree, ids, css = _parse_tree(svg)
+    root = next((n for n in tree[2] if n[0] == "svg"), None)
+    if root is None:
+        raise ValueError("No <svg> root element found.")
+    width, height, ctm = _root_geometry(root[1], scale)
+    canvas = _Canvas(width, height)
+    bg = _parse_color(background) if background else None
+    if bg is not None:
+        canvas.blend(0, 0, np.ones((height, width)), bg)
+    _Renderer(canvas, ids, css).render(root[2], ctm, dict(_DEFAULT_STYLE), 1.0)
+    canvas.flush()
+
+    rgba = canvas.rgba
+    alpha = rgba[..., 3:4]
+    rgb = np.divide(rgba[..., :3], alpha, out=np.zeros_like(rgba[..., :3]), where=alpha > 0)
+    out = np.concatenate((rgb, alpha), axis=2)
+    return (np.clip(out, 0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+
+
+def encode_png(pixels: np.ndarray, level: int = 6) -> bytes:
+    """
+    Encode an ``(H, W, 4)`` RGBA or ``(H, W, 3)`` RGB ``uint8`` array as PNG.
+
+    Rows use the PNG "Up" filter, which turns the flat fills and straight
+    gridlines of a chart into long zero runs for zlib.
+    """
+    pixels = np.ascontiguousarray(pixels, dtype=np.uint8)
+    if pixels.ndim != 3 or pixels.shape[2] not in (3, 4):
+        raise ValueError("Expected an (H, W, 3) or (H, W, 4) array.")
+    h, w, channels = pixels.shape
+    rows = pixels.reshape(h, w * channels)
+    filtered = np.empty((h, w * channels + 1), dtype=np.uint8)
+    filtered[:, 0] = 2                       # filter type: Up
+    filtered[0, 1:] = rows[0]
+    filtered[1:, 1:] = rows[1:] - rows[:-1]  # uint8 arithmetic wraps mod 256
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", w, h, 8, 6 if channels == 4 else 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(filtered.tobytes(), level))
+            + chunk(b"IEND", b""))
+
+
+def svg_to_png(svg: str, scale: float = 1.0, background: str | None = None) -> bytes:
+    """Render ``svg`` with :func:`rasterize` and return PNG file bytes."""
+    return encode_png(rasterize(svg, scale=scale, background=background))
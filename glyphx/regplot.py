@@ -29,42 +29,92 @@ from .series  import ScatterSeries, LineSeries
 from .fill_between import FillBetweenSeries
 
 
-def _lowess(x: np.ndarray, y: np.ndarray, frac: float = 0.3) -> tuple:
+# Cap on the number of (eval point x neighbour) pairs held in memory at once
+_LOWESS_CHUNK = 4_000_000
+
+
+def _knn_windows(xs: np.ndarray, x0: np.ndarray, k: int) -> np.ndarray:
+    """
+    Start index of the ``k`` nearest neighbours of each ``x0`` in sorted ``xs``.
+
+    The neighbours of a point in sorted data form a contiguous window, so it
+    is located with ``searchsorted`` plus a vectorised binary search over
+    window starts — O(m log k) for m query points.
+    """
+    n  = len(xs)
+    p  = np.searchsorted(xs, x0)
+    lo = np.clip(p - k, 0, n - k)
+    hi = np.clip(p, 0, n - k)
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid  = (lo + hi) // 2
+        # Window [mid, mid+k) is worse than [mid+1, mid+k+1) if the left
+        # end is further away than the next point on the right.
+        nxt  = np.minimum(mid + k, n - 1)
+        move = active & (x0 - xs[mid] > xs[nxt] - x0)
+        lo   = np.where(move, mid + 1, lo)
+        hi   = np.where(active & ~move, mid, hi)
+
+
+def _lowess(x: np.ndarray, y: np.ndarray, frac: float = 0.3,
+            x_eval: np.ndarray | None = None) -> tuple:
     """
     LOWESS (locally weighted scatterplot smoothing) -- pure NumPy.
 
+    Each fit uses only the ``frac * n`` nearest neighbours (found as a
+    window via ``searchsorted``; tricube weights are zero outside it) and
+    is solved in closed form from weighted sums, for all evaluation points
+    at once.
+
     Args:
-        x:    X values (sorted).
-        y:    Y values.
-        frac: Smoothing fraction (0-1).  Larger = smoother.
+        x:      X values.
+        y:      Y values.
+        frac:   Smoothing fraction (0-1).  Larger = smoother.
+        x_eval: Points to evaluate the smooth at, e.g. a fixed grid.
+                Defaults to the sorted ``x`` values.
 
     Returns:
-        ``(x_sorted, y_smooth)``
+        ``(x_eval, y_smooth)``
     """
-    n   = len(x)
-    r   = max(1, int(frac * n))
-    order = np.argsort(x)
-    xs, ys = x[order], y[order]
-    yhat  = np.zeros(n)
-
-    for i in range(n):
-        dists    = np.abs(xs - xs[i])
-        sorted_d = np.sort(dists)
-        h        = sorted_d[min(r, n - 1)]
-        if h == 0:
-            h = 1e-10
-        u       = np.clip(dists / h, 0, 1)
-        w       = (1 - u ** 3) ** 3
-        X       = np.vstack([np.ones(n), xs]).T
-        WX      = w[:, None] * X
-        WY      = w * ys
-        try:
-            beta  = np.linalg.lstsq(WX, WY, rcond=None)[0]
-            yhat[i] = beta[0] + beta[1] * xs[i]
-        except np.linalg.LinAlgError:
-            yhat[i] = ys[i]
-
-    return xs, yhat
+    n     = len(x)
+    order = np.argsort(x, kind="stable")
+    xs, ys = np.asarray(x, dtype=float)[order], np.asarray(y, dtype=float)[order]
+    x0_all = xs if x_eval is None else np.asarray(x_eval, dtype=float)
+    k      = min(max(1, int(frac * n)) + 1, n)
+    yhat   = np.empty(len(x0_all))
+    offs   = np.arange(k)
+    step   = max(1, _LOWESS_CHUNK // k)
+
+    for start in range(0, len(x0_all), step):
+        x0  = x0_all[start:start + step]
+        lo  = _knn_windows(xs, x0, k)
+        idx = lo[:, None] + offs
+        d   = xs[idx] - x0[:, None]
+        h   = np.abs(d).max(axis=1)
+        h[h == 0] = 1e-10
+        u   = np.clip(np.abs(d) / h[:, None], 0, 1)
+        w   = (1 - u ** 3) ** 3
+        wy  = w * ys[idx]
+
+        # Weighted least squares of y on (1, x - x0): the fit at x0 is the
+        # intercept, from the 2x2 normal equations.
+        s0, s1, s2 = w.sum(1), (w * d).sum(1), (w * d * d).sum(1)
+        t0, t1     = wy.sum(1), (wy * d).sum(1)
+        det  = s0 * s2 - s1 * s1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fit  = (s2 * t0 - s1 * t1) / det
+            mean = t0 / s0
+        ok   = np.abs(det) > 1e-12 * np.maximum(s0 * s2, 1e-300)
+        fit  = np.where(ok, fit, mean)
+        # Degenerate window (no weight at all): fall back to nearest y
+        bad  = ~np.isfinite(fit)
+        if bad.any():
+            fit[bad] = ys[np.clip(np.searchsorted(xs, x0[bad]), 0, n - 1)]
+        yhat[start:start + step] = fit
+
+    return x0_all, yhat
 
 
 def _logistic_fit(x: np.ndarray, y: np.ndarray, n_iter: int = 200
@@ -93,6 +143,45 @@ def _logistic_fit(x: np.ndarray, y: np.ndarray, n_iter: int = 200
     return b0_raw, b1_raw
 
 
+# Cap on the number of resample x observation counts held in memory at once
+_BOOT_CHUNK = 4_000_000
+
+
+def _bootstrap_coeffs(xn: np.ndarray, y: np.ndarray, order: int,
+                      n_boot: int, seed) -> np.ndarray:
+    """
+    Polynomial coefficients for ``n_boot`` resamples, solved as one batch.
+
+    A resample is represented by how often it draws each observation, so
+    its normal equations ``X'WX b = X'Wy`` need only the weighted power
+    sums ``sum(w * x**m)`` and ``sum(w * y * x**m)``.  Those come from one
+    matrix product per chunk of resamples, and every system is solved by a
+    single batched ``np.linalg.solve``.
+
+    Returns:
+        np.ndarray: ``(n_boot, order + 1)`` coefficients, lowest power first.
+    """
+    rng    = np.random.default_rng(seed)
+    n      = len(xn)
+    powers = xn[:, None] ** np.arange(2 * order + 1)          # (n, 2p+1)
+    ypow   = powers[:, :order + 1] * y[:, None]               # (n, p+1)
+    hankel = np.add.outer(np.arange(order + 1), np.arange(order + 1))
+    out    = np.empty((n_boot, order + 1))
+    step   = max(1, _BOOT_CHUNK // max(n, 1))
+
+    for start in range(0, n_boot, step):
+        b      = min(step, n_boot - start)
+        draws  = rng.integers(0, n, (b, n)) + np.arange(b)[:, None] * n
+        counts = np.bincount(draws.ravel(), minlength=b * n).reshape(b, n)
+        moments = counts @ powers                             # (b, 2p+1)
+        rhs     = counts @ ypow                               # (b, p+1)
+        lhs     = moments[:, hankel]                          # (b, p+1, p+1)
+        # A tiny ridge keeps resamples with too few distinct x solvable
+        lhs    += np.eye(order + 1) * 1e-12 * moments[:, :1, None]
+        out[start:start + b] = np.linalg.solve(lhs, rhs[..., None])[..., 0]
+    return out
+
+
 def _bootstrap_ci(
     x: np.ndarray,
     y: np.ndarray,
@@ -100,16 +189,38 @@ def _bootstrap_ci(
     order:    int   = 1,
     n_boot:   int   = 100,
     ci:       float = 95,
+    n_jobs:   int | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Bootstrap confidence interval for a polynomial regression line."""
-    rng    = np.random.default_rng(42)
-    n      = len(x)
-    preds  = np.zeros((n_boot, len(x_eval)))
+    """
+    Bootstrap confidence interval for a polynomial regression line.
+
+    Resamples are fitted in batches (see :func:`_bootstrap_coeffs`).  With
+    ``n_jobs`` > 1 (or ``-1`` for all cores) the batches are spread over a
+    process pool; each worker gets an independent child seed, so results
+    are reproducible for a given ``n_jobs``.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    # Fit in standardised x for a well-conditioned Vandermonde system
+    mu, sd = x.mean(), x.std() or 1.0
+    xn     = (x - mu) / sd
+    seq    = np.random.SeedSequence(42)
+
+    if n_jobs is not None and n_jobs < 0:
+        import os
+        n_jobs = os.cpu_count() or 1
+    if n_jobs and n_jobs > 1 and n_boot > n_jobs:
+        from concurrent.futures import ProcessPoolExecutor
+        sizes = [len(a) for a in np.array_split(np.arange(n_boot), n_jobs)]
+        seeds = seq.spawn(n_jobs)
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            parts = list(pool.map(_bootstrap_coeffs, [xn] * n_jobs,
+                                  [y] * n_jobs, [order] * n_jobs, sizes, seeds))
+        coeffs = np.concatenate(parts)
+    else:
+        coeffs = _bootstrap_coeffs(xn, y, order, n_boot, seq)
 
-    for b in range(n_boot):
-        idx    = rng.integers(0, n, n)
-        coeffs = np.polyfit(x[idx], y[idx], order)
-        preds[b] = np.polyval(coeffs, x_eval)
+    basis = ((np.asarray(x_eval, dtype=float) - mu) / sd)[:, None] ** np.arange(order + 1)
+    preds = coeffs @ basis.T                                  # (n_boot, m)
 
     lo  = np.percentile(preds, (100 - ci) / 2,      axis=0)
     hi  = np.percentile(preds, 100 - (100 - ci) / 2, axis=0)
@@ -127,6 +238,8 @@ def regplot(
     logistic:  bool          = False,
     ci:        int           = 95,
     n_boot:    int           = 100,
+    n_jobs:    int | None    = None,
+    frac:      float         = 0.3,
     scatter_kw: dict | None  = None,
     line_kw:    dict | None  = None,
     color:     str           = "#2563eb",
@@ -152,6 +265,9 @@ def regplot(
         logistic:   Fit logistic curve (binary Y assumed).
         ci:         Confidence interval level (0-100).  0 disables CI band.
         n_boot:     Bootstrap samples for the CI band.
+        n_jobs:     Worker processes for the bootstrap (``-1`` = all cores);
+                    only worth it for very large ``n_boot``.
+        frac:       LOWESS smoothing fraction (0-1).
         scatter_kw: Extra kwargs for :class:`~glyphx.series.ScatterSeries`.
         line_kw:    Extra kwargs for :class:`~glyphx.series.LineSeries`.
         color:      Shared colour for scatter and fit line.
@@ -214,7 +330,7 @@ def regplot(
 
     # -- Scatter ------------------------------------------------------------
     fig.add(ScatterSeries(
-        arr_x.tolist(), arr_y.tolist(),
+        arr_x, arr_y,
         color=color, size=4,
         label="Observations",
         **scatter_kw,
@@ -224,9 +340,9 @@ def regplot(
     x_eval = np.linspace(arr_x.min(), arr_x.max(), 200)
 
     if lowess:
-        xs, ys = _lowess(arr_x, arr_y, frac=0.3)
+        xs, ys = _lowess(arr_x, arr_y, frac=frac, x_eval=x_eval)
         fig.add(LineSeries(
-            xs.tolist(), ys.tolist(),
+            xs, ys,
             color=color, width=2, label="LOWESS",
             **line_kw,
         ))
@@ -262,7 +378,8 @@ def regplot(
         # CI band
         if ci > 0 and len(arr_x) > 5:
             lo, hi = _bootstrap_ci(arr_x, arr_y, x_eval,
-                                   order=order, n_boot=n_boot, ci=ci)
+                                   order=order, n_boot=n_boot, ci=ci,
+                                   n_jobs=n_jobs)
             fig.add(FillBetweenSeries(
                 list(range(len(x_eval))), lo.tolist(), hi.tolist(),
                 color=color, alpha=alpha,
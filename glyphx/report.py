@@ -0,0 +1,264 @@
+"""
+GlyphX Report -- many charts in one HTML page with a shared runtime.
+
+``grid()``, ``SubplotGrid.render`` and ``Figure.share()`` inline the whole
+interactivity runtime into every document and put every SVG in the DOM
+at load.  A :class:`Report` instead inlines the runtime once and ships each
+chart inert -- in a ``<template>`` or as a gzip-compressed blob -- so the
+browser only parses, lays out and wires a chart when it scrolls near the
+viewport (``IntersectionObserver``).  A table of contents links every
+section and chart::
+
+    from glyphx import Report
+
+    report = Report("Weekly KPIs")
+    report.add_section("Revenue")
+    report.add(fig_revenue, title="Revenue by region")
+    report.add(fig_margin,  caption="Gross margin, trailing 12 weeks")
+    report.save("weekly.html")          # or "weekly.html.gz"
+
+Placeholders reserve each chart's aspect ratio, so mounting never shifts
+the page, and printing mounts every chart first.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import re
+from typing import Any
+
+from .utils import (
+    _minified_scripts,
+    _COMPRESSED_EXTS,
+    html_escape,
+    iter_encoded,
+)
+
+# Runtime inlined once per report: per-chart wiring, then the mounter
+_REPORT_SCRIPTS = ("zoom.js", "brush.js", "accessibility.js", "report.js")
+
+_EMBEDS = ("template", "gzip")
+
+_SIZE = re.compile(r'(?<![\w-])(width|height)="([\d.]+)(?:px)?"')
+
+_CSS = """
+    body { font-family: system-ui, -apple-system, "Segoe UI", sans-serif;
+           margin: 0; color: #1a202c; background: #f7f7f8; }
+    header, main, .gx-toc { max-width: 1200px; margin: 0 auto; padding: 0 24px; }
+    header h1 { font-size: 26px; margin: 28px 0 12px; }
+    .gx-toc ol { padding-left: 20px; margin: 0 0 24px; line-height: 1.7; }
+    .gx-toc a { color: #2563eb; text-decoration: none; }
+    .gx-toc a:hover { text-decoration: underline; }
+    h2.gx-section { font-size: 20px; margin: 32px 0 12px; }
+    .gx-grid { display: grid; gap: 20px;
+               grid-template-columns: repeat(var(--gx-cols), minmax(0, 1fr)); }
+    .gx-card { margin: 0; background: #fff; border: 1px solid #e2e8f0;
+               border-radius: 10px; padding: 16px; }
+    .gx-card figcaption { font-weight: 600; margin-bottom: 8px; }
+    .gx-card p { margin: 8px 0 0; font-size: 13px; color: #4a5568; }
+    .gx-slot { width: 100%; margin: 0 auto; background: #f1f5f9; }
+    .gx-slot.gx-mounted { background: none; }
+    .gx-slot svg { width: 100%; height: auto; display: block; }
+    .glyphx-point { cursor: pointer; }
+    .glyphx-point:hover { stroke: #1a202c; stroke-width: 2; }
+    .glyphx-tooltip { position: fixed; background: rgba(15, 23, 42, 0.92);
+                      color: #f8fafc; padding: 7px 11px; border-radius: 7px;
+                      font-size: 12.5px; line-height: 1.6; pointer-events: none;
+                      display: none; z-index: 9999; max-width: 220px;
+                      box-shadow: 0 4px 14px rgba(0,0,0,0.25); }
+    .glyphx-tooltip .tt-label { font-weight: 600; margin-bottom: 2px; }
+    .glyphx-tooltip .tt-row   { opacity: 0.85; }
+"""
+
+
+def _svg_size(svg: str) -> tuple[float, float]:
+    """``width`` / ``height`` of the root ``<svg>`` tag (default 640 x 480)."""
+    start = svg.find("<svg")
+    root  = svg[start:svg.find(">", start)] if start >= 0 else ""
+    found = dict(_SIZE.findall(root))
+    return float(found.get("width", 640)), float(found.get("height", 480))
+
+
+class Report:
+    """
+    Multi-chart HTML report with one shared runtime and lazily mounted charts.
+
+    Args:
+        title:   Page title and heading.
+        embed:   How chart SVGs are stored until mounted: ``"template"``
+                 (an inert ``<template>``, default) or ``"gzip"`` (gzip +
+                 base64 text, decoded with ``DecompressionStream`` -- a far
+                 smaller page for chart-heavy reports).
+        toc:     Include a table of contents.
+        columns: Charts per row.
+
+    Raises:
+        ValueError: For an unknown ``embed`` mode or ``columns < 1``.
+    """
+
+    def __init__(
+        self,
+        title: str = "GlyphX Report",
+        embed: str = "template",
+        toc: bool = True,
+        columns: int = 1,
+    ) -> None:
+        if embed not in _EMBEDS:
+            raise ValueError(f"embed must be one of {_EMBEDS}, got {embed!r}.")
+        if columns < 1:
+            raise ValueError("columns must be at least 1.")
+        self.title   = title
+        self.embed   = embed
+        self.toc     = toc
+        self.columns = columns
+        # ("section", heading) and ("chart", chart, title, caption) entries
+        self.items: list[tuple] = []
+
+    def __len__(self) -> int:
+        return sum(1 for item in self.items if item[0] == "chart")
+
+    def add_section(self, heading: str) -> Report:
+        """Start a new section (a heading and a table-of-contents group)."""
+        self.items.append(("section", heading))
+        return self
+
+    def add(self, chart: Any, title: str | None = None,
+            caption: str | None = None) -> Report:
+        """
+        Append a chart.
+
+        Args:
+            chart:   A :class:`~glyphx.Figure` (anything with
+                     ``render_svg()``) or a rendered SVG string.  Figures
+                     are rendered when the report is rendered.
+            title:   Heading above the chart (defaults to the figure title).
+            caption: Text below the chart.
+
+        Returns:
+            ``self`` for chaining.
+        """
+        if not isinstance(chart, str) and not hasattr(chart, "render_svg"):
+            raise TypeError("chart must be a Figure or an SVG string.")
+        self.items.append(("chart", chart, title, caption))
+        return self
+
+    # -- Rendering ----------------------------------------------------------
+
+    def _payload(self, svg: str, src_id: str) -> str:
+        if self.embed == "template":
+            return f'<template id="{src_id}">{svg}</template>'
+        blob = base64.b64encode(gzip.compress(svg.encode("utf-8"), mtime=0))
+        return (f'<script type="application/gzip;base64" id="{src_id}">'
+                f'{blob.decode("ascii")}</script>')
+
+    def _parts(self):
+        """Yield the page as text parts, one chart at a time."""
+        yield (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f"<title>{html_escape(self.title)}</title>\n"
+            f"<style>{_CSS}</style>\n</head>\n<body>\n"
+            f"<header><h1>{html_escape(self.title)}</h1></header>\n"
+        )
+
+        # Table of contents: sections with their charts nested beneath
+        labels: list[str] = []
+        n_chart = 0
+        for item in self.items:
+            if item[0] == "chart":
+                chart, title = item[1], item[2]
+                n_chart += 1
+                fig_title = None if isinstance(chart, str) else getattr(chart, "title", None)
+                labels.append(title or fig_title or f"Chart {n_chart}")
+        if self.toc and self.items:
+            toc, open_section, k, s = ['<nav class="gx-toc"><ol>'], False, 0, 0
+            for item in self.items:
+                if item[0] == "section":
+                    if open_section:
+                        toc.append("</ol></li>")
+                    toc.append(f'<li><a href="#gx-section-{s}">'
+                               f'{html_escape(item[1])}</a><ol>')
+                    open_section, s = True, s + 1
+                else:
+                    toc.append(f'<li><a href="#gx-chart-{k}">'
+                               f'{html_escape(labels[k])}</a></li>')
+                    k += 1
+            if open_section:
+                toc.append("</ol></li>")
+            toc.append("</ol></nav>\n")
+            yield "".join(toc)
+
+        yield "<main>\n"
+        grid_open = '<div class="gx-grid" style="--gx-cols:%d">\n' % self.columns
+        in_grid, k, s = False, 0, 0
+        for item in self.items:
+            if item[0] == "section":
+                if in_grid:
+                    yield "</div>\n"
+                    in_grid = False
+                yield (f'<h2 class="gx-section" id="gx-section-{s}">'
+                       f"{html_escape(item[1])}</h2>\n")
+                s += 1
+                continue
+            if not in_grid:
+                yield grid_open
+                in_grid = True
+            chart, caption = item[1], item[3]
+            svg = chart if isinstance(chart, str) else chart.render_svg()
+            w, h = _svg_size(svg)
+            note = f"<p>{html_escape(caption)}</p>" if caption else ""
+            yield (
+                f'<figure class="gx-card" id="gx-chart-{k}">'
+                f"<figcaption>{html_escape(labels[k])}</figcaption>"
+                f'<div class="gx-slot" data-src="gx-src-{k}" '
+                f'style="aspect-ratio:{w:g}/{h:g};max-width:{w:g}px">'
+                + self._payload(svg, f"gx-src-{k}")
+                + f"</div>{note}</figure>\n"
+            )
+            k += 1
+        if in_grid:
+            yield "</div>\n"
+        yield "</main>\n"
+
+        yield '<div class="glyphx-tooltip" id="glyphx-tooltip"></div>\n'
+        yield "".join(f"<script>\n{js}\n</script>\n"
+                      for js in _minified_scripts(_REPORT_SCRIPTS))
+        yield "</body>\n</html>\n"
+
+    def render(self) -> str:
+        """Render the report and return the HTML document."""
+        return "".join(self._parts())
+
+    def save(self, filename: str) -> Report:
+        """
+        Write the report to ``filename``.
+
+        ``.html`` is written as text; ``.html.gz`` / ``.html.br`` are
+        compressed while streaming, chart by chart (``.br`` requires the
+        optional ``brotli`` package).
+
+        Returns:
+            ``self`` for chaining.
+
+        Raises:
+            ValueError: For any other extension.
+        """
+        lower    = str(filename).lower()
+        suffixes = {".html": None}
+        suffixes.update((suffix, method) for suffix, (fmt, method)
+                        in _COMPRESSED_EXTS.items() if fmt == "html")
+        for suffix, compress in suffixes.items():
+            if lower.endswith(suffix):
+                break
+        else:
+            raise ValueError(
+                f"Unsupported report file {filename!r}.  "
+                "Use .html, .html.gz or .html.br."
+            )
+        chunks = iter_encoded(self._parts(), compress)
+        first = next(chunks, b"")            # fail before creating the file
+        with open(filename, "wb") as f:
+            f.write(first)
+            for chunk in chunks:
+                f.write(chunk)
+        return self
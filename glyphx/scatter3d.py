@@ -11,7 +11,7 @@ import math
 
 import numpy as np
 
-from .projection3d import Camera3D, normalize, _format_3d_tick
+from .projection3d import Camera3D, normalize_array, _format_3d_tick
 from .colormaps     import apply_colormap
 from .downsample    import AUTO_THRESHOLD
 from .utils         import svg_escape
@@ -68,7 +68,6 @@ class Scatter3DSeries:
     def to_svg(self, cam: Camera3D,
                x_range: tuple, y_range: tuple, z_range: tuple) -> str:
         """Render as SVG circles with 3D voxel thinning for large datasets."""
-        from .projection3d import normalize as _norm
         from .downsample import voxel_thin_3d, _ds_comment
 
         x_plot, y_plot, z_plot = self.x, self.y, self.z
@@ -91,27 +90,28 @@ class Scatter3DSeries:
         else:
             self.last_downsample_info = None
 
-        xn, xlo, xhi = _norm(x_plot)
-        yn, ylo, yhi = _norm(y_plot)
-        zn, zlo, zhi = _norm(z_plot)
+        xn, xlo, xhi = normalize_array(x_plot)
+        yn, ylo, yhi = normalize_array(y_plot)
+        zn, zlo, zhi = normalize_array(z_plot)
 
-        pts = [cam.project(x, y, z) for x, y, z in zip(xn, yn, zn)]
+        px, py, depth = cam.project_array(xn, yn, zn)
         # Sort back-to-front (painter's algorithm)
-        order = sorted(range(len(pts)), key=lambda i: pts[i].depth)
+        order = np.argsort(depth, kind="stable")
 
         elements: list[str] = [_ds_svg] if _ds_svg else []
-        x_list = list(x_plot); y_list = list(y_plot); z_list = list(z_plot)
-        for i in order:
-            p     = pts[i]
+        x_list = np.asarray(x_plot)[order].tolist()
+        y_list = np.asarray(y_plot)[order].tolist()
+        z_list = np.asarray(z_plot)[order].tolist()
+        for pxi, pyi, i, x_raw, y_raw, z_raw in zip(
+            px[order].tolist(), py[order].tolist(), order.tolist(),
+            x_list, y_list, z_list,
+        ):
             col   = point_colors[i]
-            x_raw = x_list[i]
-            y_raw = y_list[i]
-            z_raw = z_list[i]
             tip   = f"({_format_3d_tick(x_raw)}, {_format_3d_tick(y_raw)}, {_format_3d_tick(z_raw)})"
             if self.label:
                 tip = f"{self.label}: {tip}"
             elements.append(
-                f'<circle cx="{p.px:.1f}" cy="{p.py:.1f}" r="{self.size}" '
+                f'<circle cx="{pxi:.1f}" cy="{pyi:.1f}" r="{self.size}" '
                 f'fill="{col}" fill-opacity="{self.alpha}" '
                 f'stroke="#fff" stroke-width="0.4" '
                 f'data-label="{svg_escape(tip)}"/>'
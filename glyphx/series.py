@@ -9,11 +9,15 @@ import math
 import numpy as np
 
 from .themes import themes as _themes
-from .utils import describe_arc, svg_escape, _format_tick
+from .utils import describe_arc, svg_escape, _format_tick, _as_column, _is_empty, new_chart_id
+from .markers import MARKERS, marker_defs, marker_use
 from .downsample import (
     maybe_downsample_line, voxel_thin_2d,
     AUTO_THRESHOLD, _ds_comment,
 )
+from .hue_mixin import (
+    apply_hue, factorize_hue, hue_color_map, hue_histograms,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -24,9 +28,17 @@ class BaseSeries:
     """
     Base class for all GlyphX series.
 
+    ``x`` and ``y`` are stored as 1-D NumPy columns (see
+    :func:`~glyphx.utils._as_column`): NumPy input is kept as-is and pandas
+    columns are viewed without copying, so large data never round-trips
+    through Python lists.  Call ``.tolist()`` when a list is needed.
+    Assigning either attribute bumps ``_data_version``, which keys the
+    render caches; after mutating a column in place, reassign it
+    (``s.y = s.y``) so the next render picks up the change.
+
     Attributes:
-        x (list): X-axis values.
-        y (list): Y-axis values (``None`` for chart types that don't use axes).
+        x (np.ndarray): X-axis values.
+        y (np.ndarray): Y-axis values (``None`` for chart types that don't use axes).
         color (str): Primary color for this series.
         label (str | None): Legend / tooltip label.
         title (str | None): Per-series subtitle drawn above the chart area.
@@ -41,11 +53,29 @@ class BaseSeries:
         self.title = title
         self.css_class = f"series-{id(self) % 100000}"
 
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, values):
+        self._x = _as_column(values)
+        self._data_version = getattr(self, "_data_version", 0) + 1
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, values):
+        self._y = _as_column(values)
+        self._data_version = getattr(self, "_data_version", 0) + 1
+
     def __repr__(self) -> str:
-        n     = len(self.x) if self.x else 0
+        n     = 0 if _is_empty(self.x) else len(self.x)
         label = f" label={self.label!r}" if self.label else ""
         rng   = ""
-        if self.x and n > 0:
+        if n > 0:
             rng = f" x=[{self.x[0]}..{self.x[-1]}] ({n} pts)"
         return f"<{self.__class__.__name__}{label}{rng} color={self.color}>"
 
@@ -98,19 +128,33 @@ class LineSeries(BaseSeries):
         self.threshold            = None   # override AUTO_THRESHOLD if set
         self.last_downsample_info = None
 
+    # datetime64 X is bucketed on its int64 epoch view (see to_svg), so
+    # Axes.compute_domain skips building a float-seconds _numeric_x copy.
+    _native_datetime = True
+
     def to_svg(self, ax, use_y2=False):
+        from .layout import _cached_on_series, _epoch_view, _ticks_to_seconds
         scale_y = ax.scale_y2 if use_y2 else ax.scale_y
         dash    = self._DASH.get(self.linestyle, "")
 
         # Use numeric X mapping if categorical was detected
         x_vals = getattr(self, "_numeric_x", self.x)
+        _tick_scale = None
+        if getattr(x_vals, "dtype", None) is not None and x_vals.dtype.kind == "M":
+            # Cached so the downsampling cache sees the same array every render
+            x_vals, _tick_scale = _cached_on_series(
+                self, "epoch_view", lambda x=x_vals: _epoch_view(x))
 
         # Two-stage M4 → LTTB pipeline — pixel-aligned downsampling
         _thresh  = self.threshold if self.threshold is not None else AUTO_THRESHOLD
         _orig_n  = len(x_vals)
         x_vals, y_plot = maybe_downsample_line(
-            x_vals, self.y, pixel_width=getattr(ax, 'width', 800), threshold=_thresh
+            x_vals, self.y, pixel_width=getattr(ax, 'width', 800), threshold=_thresh,
+            version=getattr(self, "_data_version", None),
         )
+        if _tick_scale is not None:
+            # Only the surviving points are converted to epoch seconds
+            x_vals = _ticks_to_seconds(x_vals, _tick_scale)
         _downsampled = len(x_vals) < _orig_n
         if _downsampled:
             self.last_downsample_info = {
@@ -234,7 +278,7 @@ class BarSeries(BaseSeries):
         x_vals  = getattr(self, "_numeric_x", self.x)
         elements = []
 
-        if not x_vals:
+        if _is_empty(x_vals):
             return ""
 
         # Each categorical slot is exactly 1 unit wide in our coordinate system.
@@ -309,8 +353,11 @@ class ScatterSeries(BaseSeries):
     Scatter plot with configurable marker type, size, and continuous color encoding.
 
     Args:
-        marker (str): ``"circle"`` or ``"square"``.
-        size (int):   Marker radius / half-width in pixels.
+        marker (str): ``"circle"``, ``"square"``, ``"triangle"``,
+                      ``"diamond"`` or ``"cross"``.  Shapes other than
+                      circles are written once to ``<defs>`` and each
+                      point is a ``<use>`` reference to it.
+        size (int):   Marker radius (square: side length) in pixels.
         c (list | None): Per-point values for color encoding.  When set,
                          each point's color is determined by mapping this
                          value through ``cmap``.  Overrides ``color``.
@@ -333,74 +380,78 @@ class ScatterSeries(BaseSeries):
         self.threshold            = None
         self.last_downsample_info = None
 
-    def _point_color(self, idx: int, total: int) -> str:
-        """Return per-point color via colormap encoding or flat color."""
-        if self.c is not None and idx < len(self.c):
-            from .colormaps import apply_colormap
-            import numpy as np
-            c_arr = np.asarray(self.c, dtype=float)
-            lo, hi = c_arr.min(), c_arr.max()
-            norm = (c_arr[idx] - lo) / (hi - lo) if hi > lo else 0.5
-            return apply_colormap(float(norm), self.cmap)
-        return self.color
+    def _point_colors(self, idx: np.ndarray) -> list:
+        """Return colors for the given point indices (colormap or flat)."""
+        if self.c is None:
+            return [self.color] * len(idx)
+        from .colormaps import apply_colormap
+        c_arr = np.asarray(self.c, dtype=float)
+        lo, hi = c_arr.min(), c_arr.max()
+        norm = (c_arr - lo) / (hi - lo) if hi > lo else np.full(len(c_arr), 0.5)
+        n_c  = len(c_arr)
+        return [apply_colormap(float(norm[i]), self.cmap) if i < n_c else self.color
+                for i in idx]
 
     def to_svg(self, ax, use_y2=False):
         from .downsample import voxel_thin_2d
         scale_y  = ax.scale_y2 if use_y2 else ax.scale_y
-        x_vals   = list(getattr(self, "_numeric_x", self.x))
-        orig_x_all = list(self.x)
-        y_all      = list(self.y)
+        x_vals   = getattr(self, "_numeric_x", self.x)
+        orig_x_all = self.x
+        y_all      = self.y
 
         # Voxel-thin large scatter datasets to keep SVG performant
         _thresh = self.threshold if self.threshold is not None else AUTO_THRESHOLD
         if len(x_vals) > _thresh:
             _orig_n = len(x_vals)
-            x_thin, y_thin, idx_thin = voxel_thin_2d(
+            x_vals, y_all, kept_idx = voxel_thin_2d(
                 x_vals, y_all,
-                c=list(range(len(x_vals))),  # use indices to track orig rows
+                c=np.arange(_orig_n),  # track original rows
                 max_points=_thresh,
+                version=getattr(self, "_data_version", None),
             )
-            kept_idx  = [int(v) for v in idx_thin.tolist()]
-            x_vals    = x_thin.tolist()
-            orig_x_all = [orig_x_all[k] for k in kept_idx]
-            y_all      = y_thin.tolist()
+            orig_x_all = orig_x_all[kept_idx]
             self.last_downsample_info = {
                 'algorithm': 'voxel-2D',
                 'original_n': _orig_n,
                 'thinned_n': len(x_vals),
             }
         else:
-            kept_idx  = list(range(len(x_vals)))
+            kept_idx  = np.arange(len(x_vals))
             self.last_downsample_info = None
 
+        colors = self._point_colors(kept_idx)
         elements = []
 
-        for i, (orig_x, x, y) in enumerate(zip(orig_x_all, x_vals, y_all)):
+        # Non-circle shapes are defined once and placed with <use>
+        marker_id = None
+        if self.marker in MARKERS and self.marker != "circle":
+            chart_id  = getattr(ax, "chart_id", None) or new_chart_id()
+            marker_id = f"{chart_id}-{self.css_class}-m"
+            elements.append(marker_defs(marker_id, self.marker, self.size))
+
+        for orig_x, x, y, color in zip(orig_x_all, x_vals, y_all, colors):
             px      = ax.scale_x(x)
             py      = scale_y(y)
-            color   = self._point_color(kept_idx[i] if kept_idx else i, len(self.x))
             tooltip = (
                 f'data-x="{svg_escape(str(orig_x))}" '
                 f'data-y="{svg_escape(str(y))}" '
                 f'data-label="{svg_escape(self.label or "")}"'
             )
-            if self.marker == "square":
-                elements.append(
-                    f'<rect class="glyphx-point {self.css_class}" '
-                    f'x="{px - self.size / 2}" y="{py - self.size / 2}" '
-                    f'width="{self.size}" height="{self.size}" '
-                    f'fill="{color}" {tooltip}/>'
-                )
+            if marker_id is not None:
+                elements.append(marker_use(
+                    marker_id, px, py,
+                    f'class="glyphx-point {self.css_class}" '
+                    f'fill="{color}" {tooltip}'
+                ))
             else:
                 elements.append(
                     f'<circle class="glyphx-point {self.css_class}" '
-                    f'cx="{px}" cy="{py}" r="{self.size}" '
+                    f'cx="{px:.2f}" cy="{py:.2f}" r="{self.size}" '
                     f'fill="{color}" {tooltip}/>'
                 )
 
         # Colorbar for color-encoded scatter
         if self.c is not None:
-            import numpy as np
             from .colormaps import render_colorbar_svg
             c_arr = np.asarray(self.c, dtype=float)
             elements.append(render_colorbar_svg(
@@ -640,46 +691,147 @@ class HistogramSeries(BaseSeries):
     """
     Frequency distribution histogram.
 
+    Data that does not fit in memory can be binned chunk by chunk with
+    :meth:`from_chunks` and :meth:`update`; rendering only reads the bin
+    counts.
+
     Args:
         data (array-like): Raw numeric values.
-        bins (int): Number of histogram bins.
+        bins (int | array-like): Number of histogram bins, or bin edges.
+        range (tuple | None): ``(lo, hi)`` bin range (as for ``np.histogram``).
         color: Bar fill color.
         label: Legend label.
+        hue (array-like | None): Group label per value; one translucent
+            histogram is drawn per group.  All groups are counted once, at
+            construction, with a single ``np.bincount``.
+        keep_data (bool): Keep the raw ``data`` and ``hue`` after binning.
+            By default both are released once the counts exist, and
+            ``data`` is ``None``.
+
+    Attributes:
+        n_out_of_range (int): Values passed to :meth:`update` that fell
+            outside fixed bin edges and were not counted.
     """
 
     def __init__(self, data, bins=10, color=None, label=None,
-                 hue=None, hue_colors=None, cmap="viridis", alpha=0.65):
-        self.data       = list(data)
+                 hue=None, hue_colors=None, cmap="viridis", alpha=0.65,
+                 range=None, keep_data=False):
+        self.data       = _as_column(data)
         self.hue        = hue
         self.hue_colors = hue_colors
         self.cmap_name  = cmap
         self.alpha_hist = float(alpha)
-        hist, edges = np.histogram(data, bins=bins)
-        x = [(edges[i] + edges[i + 1]) / 2 for i in range(len(hist))]
-        y = hist.tolist()
-        super().__init__(x, y, color or "#1f77b4", label)
+        hist, edges = np.histogram(self.data, bins=bins, range=range)
+        super().__init__((edges[:-1] + edges[1:]) / 2, hist,
+                         color or "#1f77b4", label)
+        self.edges = edges
+        self.bins  = bins
+        self.range = range
+        self.n_out_of_range = 0
+        self._sketch = None
+
+        # Hue mode: per-group counts, rows ordered by sorted group label
+        self._hue_groups = None
+        self._hue_counts = None
+        if hue is not None and len(hue) == len(self.data):
+            codes, groups = factorize_hue(hue)
+            counts = hue_histograms(self.data, codes, len(groups), edges)
+            order  = sorted(enumerate(groups), key=lambda p: p[1])
+            self._hue_groups = [g for _, g in order]
+            self._hue_counts = counts[[i for i, _ in order]]
+        if not keep_data:
+            self.data = None
+            self.hue  = None
+
+    @classmethod
+    def from_chunks(cls, chunks, bins=10, range=None, color=None, label=None,
+                    relative_accuracy=0.01, **kwargs):
+        """
+        Build a histogram from an iterable of data chunks at constant memory.
+
+        With ``range`` given, each chunk is binned straight into fixed
+        edges and discarded.  Without it, chunks are folded into a
+        mergeable :class:`~glyphx.sketch.LogBucketSketch` and the bins are
+        derived from the sketch, so edges follow the observed min/max to
+        within ``relative_accuracy``.
+
+        Args:
+            chunks: Iterable of 1-D array-likes (NumPy arrays, pandas
+                columns from ``read_csv(chunksize=...)``, Arrow arrays...).
+            bins (int | array-like): Number of bins, or bin edges.
+            range (tuple | None): ``(lo, hi)`` of the bins, if known.
+            color: Bar fill color.
+            label: Legend label.
+            relative_accuracy (float): Sketch accuracy when ``range`` is
+                ``None``.
+            **kwargs: Passed to the constructor (``cmap``, ``alpha``).
+
+        Returns:
+            HistogramSeries: Series holding only the bin counts.
+
+        Example::
+
+            reader = pd.read_csv("latency.csv", usecols=["ms"], chunksize=1_000_000)
+            hist = HistogramSeries.from_chunks((c["ms"] for c in reader),
+                                               bins=50, range=(0, 500))
+        """
+        series = cls(np.empty(0), bins=bins, color=color, label=label,
+                     range=range if range is not None else (0.0, 1.0), **kwargs)
+        series.range = range
+        if range is None:
+            from .sketch import LogBucketSketch
+            series._sketch = LogBucketSketch(relative_accuracy)
+        for chunk in chunks:
+            series.update(chunk)
+        return series
+
+    def update(self, chunk) -> "HistogramSeries":
+        """
+        Add a chunk of values to the bin counts.  Returns ``self``.
+
+        Counts are accumulated with one ``np.histogram`` call per chunk
+        (a ``bincount`` over uniform bins), so the chunk can be discarded
+        afterwards.  ``NaN`` and infinite values are ignored.  After the
+        first update ``data`` is set to ``None`` because the raw values no
+        longer describe the counts.
+
+        Raises:
+            ValueError: In hue mode, whose groups need the raw data.
+        """
+        if self._hue_counts is not None:
+            raise ValueError("update() is not supported for hue histograms.")
+        values = np.asarray(chunk, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if self._sketch is not None:
+            self._sketch.add(values)
+            counts, edges = self._sketch.histogram(self.bins, self.range)
+        else:
+            edges = self.edges
+            if np.ndim(self.bins) == 0:
+                counts, _ = np.histogram(values, bins=len(edges) - 1,
+                                         range=(edges[0], edges[-1]))
+            else:
+                counts, _ = np.histogram(values, bins=edges)
+            self.n_out_of_range += int(values.size - counts.sum())
+            counts = self.y + counts
+        self.data  = None
         self.edges = edges
+        self.x     = (edges[:-1] + edges[1:]) / 2
+        self.y     = counts
+        return self
 
     def to_svg(self, ax, use_y2=False):
-        from .colormaps import colormap_colors
         scale_y  = ax.scale_y2 if use_y2 else ax.scale_y
         elements = []
         width    = (ax.scale_x(self.edges[1]) - ax.scale_x(self.edges[0])) * 0.95
 
         # Hue mode: render one overlapping translucent histogram per group
-        if self.hue is not None and len(self.hue) == len(self.data):
-            _groups = list(dict.fromkeys(str(h) for h in self.hue))
-            _colors = (self.hue_colors
-                       or colormap_colors(getattr(self, 'cmap_name', 'viridis'),
-                                          max(len(_groups), 2)))
-            for gi, grp in enumerate(sorted(_groups)):
-                mask   = [str(h) == grp for h in self.hue]
-                g_data = [v for v, m in zip(self.data, mask) if m]
-                if not g_data:
-                    continue
-                counts, _ = np.histogram(g_data, bins=self.edges)
-                g_color   = _colors[gi % len(_colors)]
-                alpha     = getattr(self, 'alpha_hist', 0.55)
+        if self._hue_counts is not None:
+            _colors = hue_color_map(self._hue_groups, self.hue_colors,
+                                    getattr(self, 'cmap_name', 'viridis'))
+            alpha   = getattr(self, 'alpha_hist', 0.55)
+            for grp, counts in zip(self._hue_groups, self._hue_counts):
+                g_color = _colors[grp]
                 for xi, yi in zip(self.x, counts):
                     cx  = ax.scale_x(xi)
                     cy  = scale_y(float(yi))
@@ -715,12 +867,96 @@ class HistogramSeries(BaseSeries):
 # Box plot
 # ---------------------------------------------------------------------------
 
+def _cap_outliers(values: np.ndarray, lo: float, hi: float,
+                  max_outliers: int | None) -> np.ndarray:
+    """
+    Keep at most ``max_outliers`` of the values outside ``[lo, hi]``.
+
+    The budget is shared between both tails (any share one tail cannot use
+    goes to the other), and each tail keeps its most extreme values.
+    """
+    if max_outliers is None or values.size <= max_outliers:
+        return values
+    below = values[values < lo]
+    above = values[values > hi]
+    n_lo  = min(below.size, max(max_outliers // 2, max_outliers - above.size))
+    n_hi  = min(above.size, max_outliers - n_lo)
+    if 0 < n_lo < below.size:
+        below = np.partition(below, n_lo - 1)[:n_lo]
+    if 0 < n_hi < above.size:
+        above = np.partition(above, above.size - n_hi)[above.size - n_hi:]
+    return np.sort(np.concatenate([below[:n_lo], above[above.size - n_hi:]]))
+
+
+def _box_stats(arr, max_outliers: int | None = None) -> dict:
+    """Quartiles, Tukey whiskers and (capped) outliers of one box."""
+    arr = np.asarray(arr, dtype=float)
+    arr = arr[~np.isnan(arr)]
+    q1, q2, q3 = np.percentile(arr, [25, 50, 75])
+    iqr    = q3 - q1
+    whislo = float(max(arr.min(), q1 - 1.5 * iqr))
+    whishi = float(min(arr.max(), q3 + 1.5 * iqr))
+    fliers = arr[(arr < whislo) | (arr > whishi)]
+    return {
+        "q1": float(q1), "q2": float(q2), "q3": float(q3),
+        "whislo": whislo, "whishi": whishi,
+        "fliers":   _cap_outliers(fliers, whislo, whishi, max_outliers),
+        "n_fliers": int(fliers.size),
+    }
+
+
+def _sketch_box_stats(sketch, max_outliers: int | None = None) -> dict:
+    """Box statistics read from a :class:`~glyphx.sketch.LogBucketSketch`.
+
+    Quartiles are accurate to the sketch's ``relative_accuracy``; outliers
+    are the representative values of the buckets beyond the whiskers.
+    """
+    if sketch.count == 0:
+        raise ValueError("Cannot build box statistics from an empty sketch.")
+    q1, q2, q3 = sketch.quantile([0.25, 0.5, 0.75])
+    iqr    = q3 - q1
+    whislo = float(max(sketch.min, q1 - 1.5 * iqr))
+    whishi = float(min(sketch.max, q3 + 1.5 * iqr))
+    values, counts = sketch.buckets()
+    out = (values < whislo) | (values > whishi)
+    return {
+        "q1": float(q1), "q2": float(q2), "q3": float(q3),
+        "whislo": whislo, "whishi": whishi,
+        "fliers":   _cap_outliers(values[out], whislo, whishi, max_outliers),
+        "n_fliers": int(counts[out].sum()),
+    }
+
+
+def _mapping_box_stats(stats: dict, max_outliers: int | None = None) -> dict:
+    """Normalise a user-supplied statistics dict (see ``from_stats``)."""
+    try:
+        q1 = float(stats["q1"])
+        q3 = float(stats["q3"])
+        q2 = float(next(stats[k] for k in ("median", "med", "q2") if k in stats))
+    except (KeyError, StopIteration):
+        raise ValueError(
+            "Box statistics need 'q1', 'q3' and 'median' (or 'med'/'q2')."
+        ) from None
+    iqr    = q3 - q1
+    whislo = float(stats.get("whislo", max(stats.get("min", -math.inf), q1 - 1.5 * iqr)))
+    whishi = float(stats.get("whishi", min(stats.get("max",  math.inf), q3 + 1.5 * iqr)))
+    fliers = np.sort(np.asarray(stats.get("fliers", ()), dtype=float))
+    return {
+        "q1": q1, "q2": q2, "q3": q3,
+        "whislo": whislo, "whishi": whishi,
+        "fliers":   _cap_outliers(fliers, whislo, whishi, max_outliers),
+        "n_fliers": int(stats.get("n_fliers", fliers.size)),
+    }
+
+
 class BoxPlotSeries(BaseSeries):
     """
     Box-and-whisker plot.
 
     Supports a single array (one box) or a list of arrays (multiple boxes
-    drawn at categorical X positions).
+    drawn at categorical X positions).  Statistics are computed once, at
+    construction, and kept in :attr:`stats`; use :meth:`from_stats` to plot
+    quartiles aggregated elsewhere.
 
     Args:
         data (array-like or list of arrays): Input data.
@@ -728,17 +964,27 @@ class BoxPlotSeries(BaseSeries):
         color: Box fill color.
         label: Legend / tooltip label.
         box_width (int): Pixel width of each box.
+        hue (array-like | None): Either one group label per box (colours
+            the boxes) or one label per observation, in which case each
+            box is split into one box per hue group (see
+            :func:`~glyphx.hue_mixin.apply_hue`).
+        hue_colors (list | None): Palette for the hue groups.
+        cmap (str): Colormap used when ``hue_colors`` is not given.
+        max_outliers (int | None): Draw at most this many outliers per box,
+            keeping the most extreme ones; the total is still reported in
+            ``stats[i]["n_fliers"]`` and on the box tooltip.  ``None``
+            draws every outlier.
+
+    Attributes:
+        stats (list[dict]): Per-box ``q1``, ``q2``, ``q3``, ``whislo``,
+            ``whishi``, ``fliers`` (drawn outliers) and ``n_fliers`` (all
+            outliers).
     """
 
     def __init__(self, data, categories=None, color="#1f77b4",
                  label=None, box_width=20, width=None,
-                 hue=None, hue_colors=None, cmap="viridis"):
-        # ``width`` kept for backward-compat; prefer box_width
-        self.color      = color
-        self.label      = label
-        self.box_width  = width or box_width
-        self.css_class  = f"series-{id(self) % 100000}"
-
+                 hue=None, hue_colors=None, cmap="viridis",
+                 max_outliers=1000):
         # Normalise: always store as list-of-arrays
         if isinstance(data[0], (list, np.ndarray)):
             self.datasets    = [np.asarray(d) for d in data]
@@ -747,59 +993,119 @@ class BoxPlotSeries(BaseSeries):
             self.datasets   = [np.asarray(data)]
             self.categories = categories or [""]
 
-        # BaseSeries x/y for domain computation
-        all_vals  = np.concatenate(self.datasets)
-        n         = len(self.datasets)
+        # hue support: resolve one colour per box up front
+        self._box_colors = None
+        if hue is not None:
+            n_obs = sum(len(d) for d in self.datasets)
+            if len(hue) == n_obs and len(hue) != len(self.datasets):
+                multi = len(self.datasets) > 1 or categories is not None
+                self.datasets, self.categories, self._box_colors = apply_hue(
+                    self.datasets if multi else self.datasets[0],
+                    self.categories if multi else None,
+                    hue, hue_colors, cmap,
+                )
+                self.datasets = [np.asarray(d) for d in self.datasets]
+                hue = None
+
+        self.max_outliers = max_outliers
+        self.stats = [_box_stats(d, max_outliers) for d in self.datasets]
+        self._setup(color, label, width or box_width, hue, hue_colors, cmap)
+
+    @classmethod
+    def from_stats(cls, stats, categories=None, color="#1f77b4", label=None,
+                   box_width=20, hue=None, hue_colors=None, cmap="viridis",
+                   max_outliers=1000):
+        """
+        Build a box plot from precomputed statistics instead of raw data.
+
+        Each entry of ``stats`` is either a
+        :class:`~glyphx.sketch.LogBucketSketch` (e.g. merged over chunks,
+        files or workers) or a dict with ``q1``, ``median`` (or ``med`` /
+        ``q2``) and ``q3``, plus optional ``whislo`` / ``whishi`` (default:
+        1.5 × IQR, clipped to ``min`` / ``max`` when given), ``fliers`` and
+        ``n_fliers``.
+
+        Args:
+            stats (dict | LogBucketSketch | list): One entry per box.
+            categories (list | None): Category labels.
+            hue (array-like | None): One group label per box.
+
+        Returns:
+            BoxPlotSeries: A series with ``datasets`` set to ``None``.
+
+        Raises:
+            ValueError: If a dict lacks quartiles or a sketch is empty.
+        """
+        from .sketch import LogBucketSketch
+        if isinstance(stats, (dict, LogBucketSketch)):
+            stats = [stats]
+        self = cls.__new__(cls)
+        self.datasets     = None
+        self.categories   = categories or [str(i) for i in range(len(stats))]
+        self._box_colors  = None
+        self.max_outliers = max_outliers
+        self.stats = [
+            _sketch_box_stats(st, max_outliers) if isinstance(st, LogBucketSketch)
+            else _mapping_box_stats(st, max_outliers)
+            for st in stats
+        ]
+        self._setup(color, label, box_width, hue, hue_colors, cmap)
+        return self
+
+    def _setup(self, color, label, box_width, hue, hue_colors, cmap):
+        """Shared tail of ``__init__`` / ``from_stats`` once ``stats`` exist."""
+        self.color      = color
+        self.label      = label
+        self.box_width  = box_width
+        self.css_class  = f"series-{id(self) % 100000}"
+        self.hue        = hue
+        self.hue_colors = hue_colors
+        self.cmap_name  = cmap
+        if hue is not None:
+            codes, groups = factorize_hue(hue)
+            colors = hue_color_map(groups, hue_colors, cmap)
+            self._box_colors = [colors[groups[c]] for c in codes]
+
+        # BaseSeries x/y for domain computation: whiskers and drawn outliers
+        lo = min(min(st["whislo"], st["fliers"].min(initial=st["whislo"]))
+                 for st in self.stats)
+        hi = max(max(st["whishi"], st["fliers"].max(initial=st["whishi"]))
+                 for st in self.stats)
+        n         = len(self.stats)
         positions = [i + 0.5 for i in range(n)]  # align with grid's i+0.5 label mapping
         super().__init__(
             x=positions,
-            y=[float(all_vals.min()), float(all_vals.max())],
+            y=[float(lo), float(hi)],
             color=color,
             label=label,
         )
-        # Override y so domain covers full whisker range
-        self.y = [float(all_vals.min()), float(all_vals.max())]
         # Set _x_categories so render_grid() draws category names (not raw numbers)
         # and so BoxPlotSeries.to_svg() suppresses its own inline labels.
         self._x_categories = list(self.categories)
-        self._numeric_x    = [i + 0.5 for i in range(len(self.datasets))]
-        # hue support
-        self.hue        = None
-        self.hue_colors = None
-        self.cmap_name  = 'viridis'
+        self._numeric_x    = positions
 
     def to_svg(self, ax, use_y2=False):
-        from .colormaps import colormap_colors
         scale_y  = ax.scale_y2 if use_y2 else ax.scale_y
         elements = []
-        n        = len(self.datasets)
-
-        # Resolve per-box colour (flat or hue-assigned)
-        _palette = self.hue_colors
-        if _palette is None and self.hue is not None:
-            _hue_groups = list(dict.fromkeys(str(h) for h in self.hue))
-            _palette    = colormap_colors(getattr(self, 'cmap_name', 'viridis'),
-                                          max(len(_hue_groups), 2))
-            _hue_map = dict(zip(_hue_groups, _palette))
-        else:
-            _hue_map = None
 
-        for i, arr in enumerate(self.datasets):
+        # Per-box colours were resolved from hue at construction
+        _box_colors = getattr(self, "_box_colors", None)
+        _palette    = self.hue_colors
+
+        for i, st in enumerate(self.stats):
             pos = i + 0.5   # 0-indexed half-slot, aligns with grid label positions
             cx  = ax.scale_x(pos)
 
-            q1          = float(np.percentile(arr, 25))
-            q2          = float(np.percentile(arr, 50))
-            q3          = float(np.percentile(arr, 75))
-            iqr         = q3 - q1
-            whisker_lo  = float(max(arr.min(), q1 - 1.5 * iqr))
-            whisker_hi  = float(min(arr.max(), q3 + 1.5 * iqr))
-            outliers    = arr[(arr < whisker_lo) | (arr > whisker_hi)]
+            q1, q2, q3  = st["q1"], st["q2"], st["q3"]
+            whisker_lo  = st["whislo"]
+            whisker_hi  = st["whishi"]
+            outliers    = st["fliers"]
+            n_outliers  = st["n_fliers"]
 
             # Pick per-box colour from hue mapping or flat colour
-            if _hue_map is not None and self.hue is not None and i < len(self.hue):
-                box_color = _hue_map.get(str(self.hue[i]), self.color)
-            elif _palette is not None and _hue_map is None:
+            if _box_colors is not None and i < len(_box_colors):
+                box_color = _box_colors[i] or self.color
+            elif _palette is not None and _box_colors is None:
                 box_color = _palette[i % len(_palette)]
             else:
                 box_color = self.color
@@ -809,6 +1115,8 @@ class BoxPlotSeries(BaseSeries):
                 f'data-label="{svg_escape(str(self.categories[i]))}" '
                 f'data-q1="{q1:.3g}" data-q2="{q2:.3g}" data-q3="{q3:.3g}"'
             )
+            if n_outliers:
+                tooltip += f' data-outliers="{n_outliers}"'
 
             # Whiskers
             elements.append(
@@ -844,12 +1152,18 @@ class BoxPlotSeries(BaseSeries):
                 f'y1="{scale_y(q2)}" y2="{scale_y(q2)}" '
                 f'stroke="{box_color}" stroke-width="2.5"/>'
             )
-            # Outlier dots
+            # Outlier dots (capped to the most extreme ``max_outliers``)
             for ov in outliers:
                 elements.append(
                     f'<circle cx="{cx}" cy="{scale_y(float(ov))}" r="3" '
                     f'fill="none" stroke="{self.color}" stroke-width="1.5"/>'
                 )
+            hidden = n_outliers - len(outliers)
+            if hidden > 0:
+                elements.append(
+                    f'<text x="{cx + hw + 3}" y="{scale_y(whisker_hi)}" '
+                    f'font-size="9" fill="#888">+{hidden}</text>'
+                )
             # Category label below box — skip if _x_categories is set,
             # because render_grid() will draw the labels via the grid pass.
             if self.categories[i] and not getattr(self, "_x_categories", None):
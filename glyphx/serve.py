@@ -0,0 +1,734 @@
+"""
+GlyphX chart server -- render JSON chart specs over HTTP.
+
+Shelling out to ``glyphx plot`` pays interpreter start-up, the NumPy import
+and a cold render on every chart.  ``glyphx serve`` keeps all of that warm
+in one long-lived process: an asyncio HTTP/1.1 server hands specs to a
+pre-warmed process pool and answers repeats from a content-addressed LRU
+cache::
+
+    glyphx serve --port 8765 --workers 4
+
+    curl -s localhost:8765/render?format=png \\
+         -d '{"kind": "bar", "x": ["a", "b"], "y": [3, 5], "title": "Q1"}'
+
+Endpoints:
+
+    ``POST /render``   JSON spec -> SVG, HTML or PNG (``?format=`` or a
+                       ``"format"`` key; default ``svg``).
+    ``GET  /healthz``  Liveness probe.
+    ``GET  /metrics``  Prometheus text: latency histograms, request counts,
+                       cache hit ratio, timeouts.
+
+A spec describes one chart; either the top level is the single series, or
+``"series"`` lists several::
+
+    {"title": "Revenue", "theme": "dark", "width": 800, "height": 400,
+     "xlabel": "Month", "ylabel": "USD",
+     "series": [{"kind": "bar",  "x": ["Jan", "Feb"], "y": [10, 12], "label": "2024"},
+                {"kind": "line", "x": ["Jan", "Feb"], "y": [9, 14],  "label": "2025"}]}
+
+Every spec is costed before it is dispatched -- data points and histogram
+bins across all series, and output pixels for PNGs -- and rejected with
+413 above the server's budget, so no single request can hold a worker
+for long.  A
+worker that dies (OOM kill, crash) takes the pool down with it; the pool
+is rebuilt, re-warmed and the render retried once.
+
+Only the standard library is used on the server side.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+_FORMATS = {
+    "svg":  "image/svg+xml",
+    "html": "text/html; charset=utf-8",
+    "png":  "image/png",
+}
+_KINDS = ("line", "bar", "scatter", "hist", "box", "pie", "donut", "heatmap")
+
+_MIN_SIZE, _MAX_SIZE = 16, 8192
+_MAX_SCALE = 8.0
+
+# Prometheus default latency buckets (seconds)
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_IDLE_TIMEOUT = 15.0          # keep-alive connections idle this long are closed
+_ROUTES = ("/render", "/healthz", "/metrics")
+
+_REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 408: "Request Timeout", 411: "Length Required",
+    413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 504: "Gateway Timeout",
+}
+
+
+# ---------------------------------------------------------------------------
+# Spec -> Figure  (runs in the worker processes)
+# ---------------------------------------------------------------------------
+
+def _column(spec: dict, *keys: str) -> list:
+    """The first of ``keys`` present in ``spec``, as a non-empty list."""
+    for key in keys:
+        if key in spec and spec[key] is not None:
+            value = spec[key]
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"{key!r} must be a non-empty array.")
+            return value
+    raise ValueError(f"Series is missing {' / '.join(repr(k) for k in keys)}.")
+
+
+def _series_from_spec(spec: dict, default_kind: str):
+    from .series import (
+        LineSeries, BarSeries, ScatterSeries,
+        HistogramSeries, BoxPlotSeries, PieSeries, DonutSeries, HeatmapSeries,
+    )
+
+    kind  = str(spec.get("kind", default_kind)).lower()
+    color = spec.get("color")
+    label = spec.get("label")
+
+    if kind in ("line", "bar", "scatter"):
+        y = _column(spec, "y")
+        x = _column(spec, "x") if spec.get("x") is not None else list(range(len(y)))
+        if len(x) != len(y):
+            raise ValueError(f"'x' and 'y' differ in length ({len(x)} != {len(y)}).")
+        cls = {"line": LineSeries, "bar": BarSeries, "scatter": ScatterSeries}[kind]
+        return cls(x, y, color=color, label=label)
+    if kind == "hist":
+        bins = spec.get("bins", 10)
+        if (isinstance(bins, bool) or not isinstance(bins, (int, float))
+                or not math.isfinite(bins) or bins < 1):
+            raise ValueError("'bins' must be a positive integer.")
+        return HistogramSeries(_column(spec, "data", "y"), bins=int(bins),
+                               color=color, label=label)
+    if kind == "box":
+        return BoxPlotSeries(_column(spec, "data", "y"), categories=spec.get("categories"),
+                             color=color or "#1f77b4", label=label)
+    if kind in ("pie", "donut"):
+        values = _column(spec, "values", "y")
+        labels = spec.get("labels", spec.get("x"))
+        labels = [str(l) for l in labels] if labels else None
+        cls = PieSeries if kind == "pie" else DonutSeries
+        return cls(values, labels=labels)
+    if kind == "heatmap":
+        matrix = _column(spec, "matrix", "z")
+        if not all(isinstance(row, list) for row in matrix):
+            raise ValueError("'matrix' must be an array of rows.")
+        return HeatmapSeries(matrix, row_labels=spec.get("row_labels"),
+                             col_labels=spec.get("col_labels"),
+                             show_values=bool(spec.get("show_values", False)))
+    raise ValueError(f"Unknown chart kind {kind!r}; expected one of {_KINDS}.")
+
+
+def figure_from_spec(spec: dict):
+    """
+    Build a :class:`~glyphx.Figure` from a JSON chart spec.
+
+    Args:
+        spec: Chart options (``title``, ``theme``, ``width``, ``height``,
+              ``xlabel``, ``ylabel``, ``legend``) plus either a
+              ``"series"`` array or the fields of a single series at the
+              top level (``kind``, ``x``, ``y``, ``label``, ``color``;
+              ``data`` / ``bins`` for hist and box, ``values`` / ``labels``
+              for pie and donut, ``matrix`` for heatmap).
+
+    Returns:
+        The figure, not yet rendered.
+
+    Raises:
+        ValueError: For a malformed spec (unknown kind or theme, missing or
+                    mismatched columns, out-of-range size).
+    """
+    from .figure import Figure
+    from .themes import themes
+
+    if not isinstance(spec, dict):
+        raise ValueError("A chart spec must be a JSON object.")
+    size = {}
+    for key, default in (("width", 640), ("height", 480)):
+        value = spec.get(key, default)
+        if not isinstance(value, (int, float)) or not _MIN_SIZE <= value <= _MAX_SIZE:
+            raise ValueError(f"{key!r} must be a number in [{_MIN_SIZE}, {_MAX_SIZE}].")
+        size[key] = int(value)
+    theme = spec.get("theme")
+    if isinstance(theme, str) and theme not in themes:
+        raise ValueError(f"Unknown theme {theme!r}; expected one of {sorted(themes)}.")
+    legend = spec.get("legend", "outside-right")
+    if legend is True:
+        legend = "outside-right"
+
+    fig = Figure(title=spec.get("title"), theme=theme, legend=legend,
+                 auto_display=False, **size)
+    fig.axes.xlabel = spec.get("xlabel")
+    fig.axes.ylabel = spec.get("ylabel")
+
+    series = spec.get("series")
+    if series is None:
+        series = [spec]
+    elif not isinstance(series, list) or not series:
+        raise ValueError("'series' must be a non-empty array.")
+    default_kind = str(spec.get("kind", "line"))
+    for s in series:
+        if not isinstance(s, dict):
+            raise ValueError("Each entry of 'series' must be an object.")
+        fig.add(_series_from_spec(s, default_kind))
+    return fig
+
+
+def render_spec(spec: dict, format: str = "svg") -> bytes:
+    """
+    Render a chart spec to ``format`` (``"svg"``, ``"html"`` or ``"png"``).
+
+    PNGs honour an optional ``"scale"`` key (default 1) and use the same
+    cairosvg-or-builtin rasterizer as ``Figure.save``.
+
+    Raises:
+        ValueError: For a malformed spec or an unknown format.
+    """
+    if format not in _FORMATS:
+        raise ValueError(f"format must be one of {tuple(_FORMATS)}, got {format!r}.")
+    fig = figure_from_spec(spec)
+    if format == "html":
+        return fig.to_bytes("html")
+    svg = fig.render_svg()
+    if format == "svg":
+        return svg.encode("utf-8")
+    scale = spec.get("scale", 1)
+    if not isinstance(scale, (int, float)) or not 0 < scale <= _MAX_SCALE:
+        raise ValueError(f"'scale' must be a number in (0, {_MAX_SCALE:g}].")
+    from .export import _png_bytes
+    return _png_bytes(svg, scale=float(scale))
+
+
+def _spec_cost(spec: dict, format: str) -> tuple[int, float]:
+    """
+    ``(data points, output pixels)`` of a spec, for admission control.
+
+    Points are the values of every column and label list, plus each
+    histogram's ``bins`` -- one bar is drawn per bin however few values
+    there are.
+    """
+    points = 0
+    series = spec.get("series")
+    stack  = [s for s in (series if isinstance(series, list) else [spec])
+              if isinstance(s, dict)]
+    for s in stack:
+        bins = s.get("bins")
+        if isinstance(bins, (int, float)) and not isinstance(bins, bool) and bins > 0:
+            points += int(min(bins, 2 ** 62))
+    stack  = [s.get(k) for s in stack
+              for k in ("x", "y", "data", "values", "matrix", "z", "labels",
+                        "categories", "row_labels", "col_labels")]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif value is not None:
+            points += 1
+    pixels = 0.0
+    if format == "png":
+        scale  = spec.get("scale", 1)
+        scale  = float(scale) if isinstance(scale, (int, float)) else 1.0
+        w, h   = spec.get("width", 640), spec.get("height", 480)
+        if isinstance(w, (int, float)) and isinstance(h, (int, float)):
+            pixels = float(w) * float(h) * scale * scale
+    return points, pixels
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak ``If-None-Match`` comparison (RFC 9110 section 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque
+               for tag in if_none_match.split(","))
+
+
+def _init_worker() -> None:
+    """Pool initializer: leave Ctrl+C to the server, which shuts workers down."""
+    import signal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _warm_worker() -> int:
+    """Pool warm-up: import NumPy and GlyphX and exercise every format once."""
+    spec = {"kind": "line", "x": [0, 1], "y": [0, 1], "width": 32, "height": 32}
+    for fmt in _FORMATS:
+        render_spec(spec, fmt)
+    return os.getpid()
+
+
+# ---------------------------------------------------------------------------
+# Cache and metrics
+# ---------------------------------------------------------------------------
+
+class _LRUCache:
+    """Byte-bounded LRU of rendered bodies keyed by spec digest."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.nbytes      = 0
+        self.evictions   = 0
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> bytes | None:
+        body = self._data.get(key)
+        if body is not None:
+            self._data.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        old = self._data.pop(key, None)
+        if old is not None:
+            self.nbytes -= len(old)
+        self._data[key] = body
+        self.nbytes += len(body)
+        while len(self._data) > self.max_entries or self.nbytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self.nbytes -= len(evicted)
+            self.evictions += 1
+
+
+class _Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus layout."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKETS) + 1)
+        self.total  = 0.0
+        self.count  = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        out, running = [], 0
+        for le, n in zip((*(f"{b:g}" for b in _BUCKETS), "+Inf"), self.counts):
+            running += n
+            out.append(f'{name}_bucket{{{labels},le="{le}"}} {running}')
+        out.append(f"{name}_sum{{{labels}}} {self.total:.6f}")
+        out.append(f"{name}_count{{{labels}}} {self.count}")
+        return out
+
+
+def _spec_key(spec: dict) -> str:
+    """Content address of a spec: SHA-256 of its canonical JSON."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"),
+                           ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str = "") -> None:
+        super().__init__(message)
+        self.status  = status
+        self.message = message or _REASONS.get(status, "")
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class ChartServer:
+    """
+    Asyncio HTTP/1.1 chart-rendering service.
+
+    Args:
+        host:        Interface to bind (default loopback only).
+        port:        TCP port; ``0`` picks a free one (see :meth:`start`).
+        workers:     Render processes (default: CPU count).  ``0`` renders
+                     on a background thread in this process instead.
+        cache_size:  Maximum cached responses (``0`` disables the cache).
+        cache_bytes: Maximum total size of cached responses.
+        timeout:     Seconds a render may take before the request gets a
+                     504.  The worker finishes the job in the background
+                     and its result is still cached.
+        max_body:    Largest accepted request body in bytes (413 beyond).
+        max_points:  Work budget: data values per spec, across all series
+                     (413 beyond).
+        max_pixels:  Work budget: PNG output pixels, ``width * height *
+                     scale**2`` (413 beyond).  Together with
+                     ``max_points`` this bounds how long one render can
+                     occupy a worker; overrunning workers are not killed.
+
+    A worker that dies breaks the process pool; the pool is then rebuilt
+    and re-warmed, and the render that hit it is retried once.
+
+    Example::
+
+        server = ChartServer(port=0, workers=2)
+        host, port = await server.start()
+        ...
+        await server.close()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int | None = None,
+        cache_size: int = 256,
+        cache_bytes: int = 64 << 20,
+        timeout: float = 30.0,
+        max_body: int = 8 << 20,
+        max_points: int = 1_000_000,
+        max_pixels: int = 4096 * 4096,
+    ) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 0:
+            raise ValueError("workers must be >= 0.")
+        if timeout <= 0:
+            raise ValueError("timeout must be positive.")
+        self.host     = host
+        self.port     = port
+        self.workers  = workers
+        self.timeout  = timeout
+        self.max_body = max_body
+        self.max_points = max_points
+        self.max_pixels = max_pixels
+        self.cache    = _LRUCache(cache_size, cache_bytes)
+
+        self._pool     = None
+        self._pool_lock = asyncio.Lock()
+        self._server   = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._clients:  dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+        # Metrics
+        self.hits      = 0
+        self.misses    = 0
+        self.timeouts  = 0
+        self.rejected  = 0
+        self.pool_restarts = 0
+        self._latency: dict[str, _Histogram] = {}
+        self._render:  dict[str, _Histogram] = {}
+        self._status:  dict[tuple[str, int], int] = {}
+
+    # -- Lifecycle ----------------------------------------------------------
+
+    async def start(self) -> tuple[str, int]:
+        """
+        Start the render pool, warm every worker, and begin listening.
+
+        Returns:
+            The bound ``(host, port)``.
+        """
+        await self._start_pool()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def _start_pool(self) -> None:
+        """Create the render pool and warm every worker."""
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        if self.workers == 0:
+            self._pool = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix="glyphx-render")
+            await loop.run_in_executor(self._pool, _warm_worker)
+        else:
+            import multiprocessing
+            # "spawn": forking a process that runs an event loop (and maybe
+            # other threads) is unsafe; warm-up hides the extra start cost.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            # Submitted together, so each lands on (and starts) its own worker
+            await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_worker)
+                                   for _ in range(self.workers)))
+
+    async def _restart_pool(self, broken) -> None:
+        """Replace a broken pool (once, however many renders saw it break)."""
+        async with self._pool_lock:
+            if self._pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.pool_restarts += 1
+                await self._start_pool()
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled, starting the server first if needed."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def run(self) -> None:
+        """Blocking entry point: serve until interrupted."""
+        asyncio.run(self.serve_forever())
+
+    async def close(self) -> None:
+        """Stop listening, drop open connections and shut the pool down."""
+        if self._server is not None:
+            self._server.close()
+            handlers = list(self._clients.values())
+            for writer, task in list(self._clients.items()):
+                writer.close()
+                task.cancel()
+            # Let idle keep-alive handlers unwind before the loop goes away
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # -- Connection handling --------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        self._clients[writer] = asyncio.current_task()
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"),
+                                                  _IDLE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    await self._send(writer, 431, b"", close=True)
+                    return
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    return
+                start = time.perf_counter()
+                path  = "other"
+                try:
+                    method, target, version, headers = self._parse_head(head)
+                    path = urlsplit(target).path
+                    keep_alive = (
+                        headers.get("connection", "").lower() != "close"
+                        if version == "HTTP/1.1"
+                        else headers.get("connection", "").lower() == "keep-alive"
+                    )
+                    body = await self._read_body(reader, headers)
+                    status, ctype, payload, extra = await self._dispatch(
+                        method, target, headers, body)
+                except _HTTPError as exc:
+                    status, ctype, extra = exc.status, "text/plain; charset=utf-8", {}
+                    payload = (exc.message + "\n").encode("utf-8")
+                    if status in (408, 411, 413):
+                        keep_alive = False   # the unread body is still on the wire
+                    if status == 405:
+                        extra = {"Allow": "POST" if path == "/render" else "GET"}
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    return
+                await self._send(writer, status, payload, ctype, extra,
+                                 close=not keep_alive)
+                label = path if path in _ROUTES else "other"
+                self._latency.setdefault(label, _Histogram()).observe(
+                    time.perf_counter() - start)
+                self._status[label, status] = self._status.get((label, status), 0) + 1
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head: bytes) -> tuple[str, str, str, dict[str, str]]:
+        try:
+            lines = head.decode("latin-1").split("\r\n")
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line.")
+        if not version.startswith("HTTP/1."):
+            raise _HTTPError(400, f"Unsupported protocol {version!r}.")
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if line:
+                name, sep, value = line.partition(":")
+                if not sep:
+                    raise _HTTPError(400, "Malformed header line.")
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), target, version, headers
+
+    async def _read_body(self, reader: asyncio.StreamReader,
+                         headers: dict[str, str]) -> bytes:
+        if "transfer-encoding" in headers:
+            raise _HTTPError(411, "Chunked bodies are not supported; send Content-Length.")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise _HTTPError(400, "Invalid Content-Length.")
+        if length < 0:
+            raise _HTTPError(400, "Invalid Content-Length.")
+        if length > self.max_body:
+            raise _HTTPError(413, f"Body exceeds {self.max_body} bytes.")
+        if not length:
+            return b""
+        try:
+            return await asyncio.wait_for(reader.readexactly(length), _IDLE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise _HTTPError(408, f"Body not received within {_IDLE_TIMEOUT:g}s.")
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: int, body: bytes,
+                    ctype: str = "text/plain; charset=utf-8",
+                    extra: dict[str, str] | None = None, close: bool = False) -> None:
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                f"Content-Type: {ctype}",
+                f"Content-Length: {len(body)}",
+                f"Connection: {'close' if close else 'keep-alive'}"]
+        head += [f"{k}: {v}" for k, v in (extra or {}).items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    # -- Routes -----------------------------------------------------------------
+
+    async def _dispatch(self, method: str, target: str, headers: dict[str, str],
+                        body: bytes) -> tuple[int, str, bytes, dict[str, str]]:
+        url = urlsplit(target)
+        if url.path == "/render":
+            if method != "POST":
+                raise _HTTPError(405)
+            return await self._render_route(parse_qs(url.query), headers, body)
+        if url.path == "/healthz":
+            if method != "GET":
+                raise _HTTPError(405)
+            return 200, "text/plain; charset=utf-8", b"ok\n", {}
+        if url.path == "/metrics":
+            if method != "GET":
+                raise _HTTPError(405)
+            return (200, "text/plain; version=0.0.4; charset=utf-8",
+                    self.metrics_text().encode("utf-8"), {})
+        raise _HTTPError(404, f"No route for {url.path}.")
+
+    async def _render_route(self, query: dict[str, list[str]],
+                            headers: dict[str, str], body: bytes):
+        try:
+            spec = json.loads(body)
+        except (ValueError, RecursionError) as exc:
+            raise _HTTPError(400, f"Invalid JSON: {exc}")
+        if not isinstance(spec, dict):
+            raise _HTTPError(400, "A chart spec must be a JSON object.")
+        fmt = str(query.get("format", [spec.pop("format", "svg")])[-1]).lower()
+        if fmt not in _FORMATS:
+            raise _HTTPError(400, f"format must be one of {tuple(_FORMATS)}, got {fmt!r}.")
+
+        points, pixels = _spec_cost(spec, fmt)
+        if points > self.max_points or pixels > self.max_pixels:
+            self.rejected += 1
+            raise _HTTPError(413, (
+                f"Spec exceeds the work budget ({points:,} data values, "
+                f"{pixels:,.0f} pixels; limits {self.max_points:,} and "
+                f"{self.max_pixels:,})."))
+
+        key  = _spec_key({"format": fmt, "spec": spec})
+        # Weak: the spec hash fixes the chart, not its bytes -- every render
+        # embeds a fresh glyphx-chart-<uuid> id.
+        etag = f'W/"{key[:32]}"'
+        if _etag_matches(headers.get("if-none-match", ""), etag):
+            return 304, _FORMATS[fmt], b"", {"ETag": etag}
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            state = "hit"
+        else:
+            task = self._inflight.get(key)
+            if task is not None:           # identical spec already rendering
+                self.hits += 1
+                state = "coalesced"
+            else:
+                self.misses += 1
+                state = "miss"
+                task = asyncio.ensure_future(self._render_and_cache(key, spec, fmt))
+                self._inflight[key] = task
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            try:
+                cached = await asyncio.wait_for(asyncio.shield(task), self.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise _HTTPError(504, f"Render exceeded {self.timeout:g}s.")
+            except (ValueError, TypeError, KeyError) as exc:
+                raise _HTTPError(400, f"Invalid chart spec: {exc}")
+            except Exception as exc:
+                raise _HTTPError(500, f"Render failed: {type(exc).__name__}: {exc}")
+        return 200, _FORMATS[fmt], cached, {"ETag": etag, "X-Cache": state}
+
+    async def _render_and_cache(self, key: str, spec: dict, fmt: str) -> bytes:
+        from concurrent.futures.process import BrokenProcessPool
+
+        loop  = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            pool = self._pool
+            try:
+                body = await loop.run_in_executor(pool, render_spec, spec, fmt)
+            except BrokenProcessPool:
+                await self._restart_pool(pool)
+                body = await loop.run_in_executor(self._pool, render_spec, spec, fmt)
+        finally:
+            self._inflight.pop(key, None)
+        self._render.setdefault(fmt, _Histogram()).observe(time.perf_counter() - start)
+        self.cache.put(key, body)
+        return body
+
+    # -- Metrics ------------------------------------------------------------------
+
+    def metrics_text(self) -> str:
+        """The ``/metrics`` document (Prometheus text exposition format)."""
+        lookups = self.hits + self.misses
+        out = [
+            "# HELP glyphx_request_duration_seconds HTTP request latency by endpoint.",
+            "# TYPE glyphx_request_duration_seconds histogram",
+        ]
+        for path, hist in sorted(self._latency.items()):
+            out += hist.lines("glyphx_request_duration_seconds", f'path="{path}"')
+        out += ["# HELP glyphx_render_duration_seconds Render time of cache misses by format.",
+                "# TYPE glyphx_render_duration_seconds histogram"]
+        for fmt, hist in sorted(self._render.items()):
+            out += hist.lines("glyphx_render_duration_seconds", f'format="{fmt}"')
+        out += ["# HELP glyphx_requests_total HTTP responses by endpoint and status.",
+                "# TYPE glyphx_requests_total counter"]
+        for (path, status), n in sorted(self._status.items()):
+            out.append(f'glyphx_requests_total{{path="{path}",status="{status}"}} {n}')
+        out += [
+            "# TYPE glyphx_cache_hits_total counter",
+            f"glyphx_cache_hits_total {self.hits}",
+            "# TYPE glyphx_cache_misses_total counter",
+            f"glyphx_cache_misses_total {self.misses}",
+            "# TYPE glyphx_cache_hit_ratio gauge",
+            f"glyphx_cache_hit_ratio {self.hits / lookups if lookups else 0.0:.6f}",
+            "# TYPE glyphx_cache_evictions_total counter",
+            f"glyphx_cache_evictions_total {self.cache.evictions}",
+            "# TYPE glyphx_cache_entries gauge",
+            f"glyphx_cache_entries {len(self.cache)}",
+            "# TYPE glyphx_cache_bytes gauge",
+            f"glyphx_cache_bytes {self.cache.nbytes}",
+            "# TYPE glyphx_render_timeouts_total counter",
+            f"glyphx_render_timeouts_total {self.timeouts}",
+            "# TYPE glyphx_rejected_specs_total counter",
+            f"glyphx_rejected_specs_total {self.rejected}",
+            "# TYPE glyphx_pool_restarts_total counter",
+            f"glyphx_pool_restarts_total {self.pool_restarts}",
+            "# TYPE glyphx_renders_in_flight gauge",
+            f"glyphx_renders_in_flight {len(self._inflight)}",
+            "# TYPE glyphx_pool_workers gauge",
+            f"glyphx_pool_workers {self.workers}",
+        ]
+        return "\n".join(out) + "\n"
@@ -0,0 +1,246 @@
+"""
+GlyphX mergeable quantile sketches.
+
+Distribution charts over out-of-core or streaming data cannot hold every
+value in memory.  :class:`LogBucketSketch` summarises a stream in a
+fixed number of logarithmically spaced buckets (the DDSketch / HDR
+histogram idea): every value is counted in the bucket
+``ceil(log_gamma(|v|))``, so any quantile read back from the sketch is
+within ``relative_accuracy`` of the true value, whatever the range of
+the data.
+
+Sketches built over separate chunks, files or processes can be merged
+exactly with :meth:`LogBucketSketch.merge`, which makes them suitable for
+map-reduce style aggregation::
+
+    from glyphx.sketch import LogBucketSketch
+
+    sk = LogBucketSketch(relative_accuracy=0.01)
+    for chunk in pd.read_csv("latency.csv", usecols=["ms"], chunksize=1_000_000):
+        sk.add(chunk["ms"])
+
+    p50, p99 = sk.quantile([0.5, 0.99])
+    counts, edges = sk.histogram(bins=40)
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+class _BucketStore:
+    """Dense, growable ``int64`` counts for a contiguous range of bucket keys."""
+
+    __slots__ = ("offset", "counts")
+
+    def __init__(self) -> None:
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def _extend(self, lo: int, hi: int) -> None:
+        if self.counts.size == 0:
+            self.offset = lo
+            self.counts = np.zeros(hi - lo + 1, dtype=np.int64)
+            return
+        cur_hi = self.offset + self.counts.size - 1
+        new_lo, new_hi = min(lo, self.offset), max(hi, cur_hi)
+        if new_lo == self.offset and new_hi == cur_hi:
+            return
+        grown = np.zeros(new_hi - new_lo + 1, dtype=np.int64)
+        start = self.offset - new_lo
+        grown[start:start + self.counts.size] = self.counts
+        self.offset, self.counts = new_lo, grown
+
+    def add_keys(self, keys: np.ndarray) -> None:
+        if keys.size == 0:
+            return
+        lo, hi = int(keys.min()), int(keys.max())
+        self._extend(lo, hi)
+        start = lo - self.offset
+        self.counts[start:start + hi - lo + 1] += np.bincount(
+            keys - lo, minlength=hi - lo + 1)
+
+    def add_store(self, other: "_BucketStore") -> None:
+        if other.counts.size == 0:
+            return
+        lo = other.offset
+        self._extend(lo, lo + other.counts.size - 1)
+        start = lo - self.offset
+        self.counts[start:start + other.counts.size] += other.counts
+
+    def nonzero(self) -> tuple[np.ndarray, np.ndarray]:
+        idx = np.flatnonzero(self.counts)
+        return idx + self.offset, self.counts[idx]
+
+
+class LogBucketSketch:
+    """
+    Mergeable relative-error quantile sketch with logarithmic buckets.
+
+    Positive and negative values are kept in separate bucket stores and
+    values with ``|v| < min_value`` are counted as zero.  Memory grows with
+    the *dynamic range* of the data (about 115 buckets per decade at 1 %
+    accuracy), never with the number of values added.  NaN and infinite
+    values are ignored.
+
+    Args:
+        relative_accuracy: Maximum relative error of any quantile
+            (default 0.01, i.e. 1 %).  Must be in ``(0, 1)``.
+        min_value: Magnitude below which values are counted as zero.
+
+    Attributes:
+        count (int): Number of values added.
+        sum (float): Sum of the values added.
+        min (float): Smallest value added (``nan`` if empty).
+        max (float): Largest value added (``nan`` if empty).
+
+    Raises:
+        ValueError: If ``relative_accuracy`` is outside ``(0, 1)``.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01,
+                 min_value: float = 1e-12) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = float(relative_accuracy)
+        self.min_value  = float(min_value)
+        self._gamma     = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._pos       = _BucketStore()
+        self._neg       = _BucketStore()
+        self.zero_count = 0
+        self.count      = 0
+        self.sum        = 0.0
+        self.min        = math.nan
+        self.max        = math.nan
+
+    def __repr__(self) -> str:
+        return (f"<LogBucketSketch n={self.count} "
+                f"accuracy={self.relative_accuracy:g}>")
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def _keys(self, magnitudes: np.ndarray) -> np.ndarray:
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def add(self, values) -> "LogBucketSketch":
+        """
+        Add a chunk of values (any 1-D array-like).  Returns ``self``.
+
+        The chunk is bucketed with one vectorised ``log`` and one
+        ``np.bincount`` per sign, so memory use is independent of its size
+        once it has been counted.
+        """
+        arr = np.asarray(values, dtype=float).ravel()
+        arr = arr[np.isfinite(arr)]
+        if arr.size == 0:
+            return self
+        lo, hi = float(arr.min()), float(arr.max())
+        self.min   = lo if self.count == 0 else min(self.min, lo)
+        self.max   = hi if self.count == 0 else max(self.max, hi)
+        self.count += int(arr.size)
+        self.sum   += float(arr.sum())
+
+        pos = arr[arr >= self.min_value]
+        neg = -arr[arr <= -self.min_value]
+        self.zero_count += int(arr.size - pos.size - neg.size)
+        self._pos.add_keys(self._keys(pos))
+        self._neg.add_keys(self._keys(neg))
+        return self
+
+    def merge(self, other: "LogBucketSketch") -> "LogBucketSketch":
+        """
+        Fold another sketch into this one.  Returns ``self``.
+
+        Merging is exact: the result is identical to a sketch that saw both
+        streams.
+
+        Raises:
+            ValueError: If the two sketches use different accuracies.
+        """
+        if (other.relative_accuracy != self.relative_accuracy
+                or other.min_value != self.min_value):
+            raise ValueError("Can only merge sketches with the same "
+                             "relative_accuracy and min_value.")
+        if other.count == 0:
+            return self
+        self.min   = other.min if self.count == 0 else min(self.min, other.min)
+        self.max   = other.max if self.count == 0 else max(self.max, other.max)
+        self.count += other.count
+        self.sum   += other.sum
+        self.zero_count += other.zero_count
+        self._pos.add_store(other._pos)
+        self._neg.add_store(other._neg)
+        return self
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _value(self, keys: np.ndarray) -> np.ndarray:
+        """Representative value of each bucket (relative error <= accuracy)."""
+        return 2.0 * np.exp(keys * self._log_gamma) / (self._gamma + 1.0)
+
+    def buckets(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return ``(values, counts)`` for all non-empty buckets, ascending.
+
+        ``values`` are the bucket representatives clipped to
+        ``[min, max]``.
+        """
+        nk, nc = self._neg.nonzero()
+        pk, pc = self._pos.nonzero()
+        parts_v = [-self._value(nk[::-1]), np.zeros(1 if self.zero_count else 0),
+                   self._value(pk)]
+        parts_c = [nc[::-1], np.array([self.zero_count] if self.zero_count else [],
+                                      dtype=np.int64), pc]
+        values = np.concatenate(parts_v)
+        counts = np.concatenate(parts_c).astype(np.int64)
+        if values.size:
+            values = np.clip(values, self.min, self.max)
+        return values, counts
+
+    def quantile(self, q):
+        """
+        Return the ``q``-quantile(s), ``0 <= q <= 1``.
+
+        Args:
+            q: A float or array-like of floats.
+
+        Returns:
+            float | np.ndarray: ``nan`` for an empty sketch.
+        """
+        q_arr = np.asarray(q, dtype=float)
+        if self.count == 0:
+            out = np.full(q_arr.shape, np.nan)
+        else:
+            values, counts = self.buckets()
+            rank = q_arr * (self.count - 1)
+            idx  = np.searchsorted(np.cumsum(counts), rank, side="right")
+            out  = values[np.minimum(idx, values.size - 1)]
+            out  = np.where(q_arr <= 0, self.min, np.where(q_arr >= 1, self.max, out))
+        return float(out) if out.ndim == 0 else out
+
+    def histogram(self, bins=10, range=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Re-bin the sketch into a regular histogram.
+
+        Each bucket's count is assigned to the histogram bin containing its
+        representative value, so bin boundaries are accurate to within
+        ``relative_accuracy`` of the boundary value.
+
+        Args:
+            bins: Number of bins or explicit edges (as for ``np.histogram``).
+            range: ``(lo, hi)``; defaults to ``(min, max)`` of the data.
+
+        Returns:
+            tuple: ``(counts, edges)`` with integer counts.
+        """
+        values, counts = self.buckets()
+        if range is None:
+            range = (self.min, self.max) if self.count else (0.0, 1.0)
+        hist, edges = np.histogram(values, bins=bins, range=range, weights=counts)
+        return hist.astype(np.int64), edges
@@ -33,7 +33,7 @@ from typing import Iterator
 import numpy as np
 
 from .series import BaseSeries
-from .utils import svg_escape
+from .utils import svg_escape, _is_empty
 
 
 class StreamingSeries(BaseSeries):
@@ -110,7 +110,7 @@ class StreamingSeries(BaseSeries):
     # ── SVG rendering ─────────────────────────────────────────────────────
 
     def to_svg(self, ax: object, use_y2: bool = False) -> str:
-        if not self.x or not self.y:
+        if _is_empty(self.x) or _is_empty(self.y):
             return ""
 
         scale_y  = ax.scale_y2 if use_y2 else ax.scale_y   # type: ignore[union-attr]
@@ -0,0 +1,159 @@
+"""
+GlyphX style deduplication -- move repeated inline styling into CSS classes.
+
+Rendered charts repeat the same presentation attributes on every element:
+each tick label carries ``font-family``, ``font-size``, ``fill`` and
+``text-anchor``; each bar, point and wick its ``fill`` / ``stroke`` /
+``stroke-width``.  :func:`dedupe_styles` collects the distinct style tuples
+of a rendered SVG, emits one ``<style>`` block with a short generated class
+per tuple and references it from each element::
+
+    <text x="10" y="20" font-size="12" fill="#000">A</text>
+    <text x="30" y="20" font-size="12" fill="#000">B</text>
+
+becomes::
+
+    <style>:where(#glyphx-chart-1a2b) .g0{fill:#000;font-size:12px}</style>
+    <text x="10" y="20" class="g0">A</text>
+    <text x="30" y="20" class="g0">B</text>
+
+It is used by ``Figure(css_classes=True)``.  Rules are scoped to the chart's
+``id`` so several charts inlined into one page never share classes, and
+wrapped in ``:where()`` so they keep the specificity of a single class:
+hover and highlight rules (``.glyphx-point:hover``) still win, and inline
+``style=""`` and scripted ``el.style`` changes still override them.
+
+Restyling a chart -- a theme swap, dark mode -- then means editing the
+``<style>`` block alone: each theme colour appears there once per style
+tuple instead of once per element.
+"""
+from __future__ import annotations
+
+import html
+import re
+
+from .coalesce import _TAG, _parse_attrs
+
+# Presentation attributes moved into classes.
+_PRESENTATION = frozenset({
+    "fill", "fill-opacity", "fill-rule", "stroke", "stroke-width",
+    "stroke-opacity", "stroke-dasharray", "stroke-dashoffset",
+    "stroke-linecap", "stroke-linejoin", "stroke-miterlimit", "opacity",
+    "font-family", "font-size", "font-weight", "font-style",
+    "text-anchor", "dominant-baseline", "shape-rendering",
+})
+# Properties that need an explicit unit in CSS (attributes are unitless).
+_LENGTHS = frozenset({"font-size", "stroke-width", "stroke-dashoffset",
+                      "stroke-dasharray"})
+_NUMBER  = re.compile(r"-?(?:\d+\.?\d*|\.\d+)$")
+# Values that could escape their declaration are left inline.
+_UNSAFE  = re.compile(r"[;{}<>\\]|/\*")
+_RAW     = ("script", "style")
+
+
+def _css_value(name: str, value: str) -> str | None:
+    """CSS form of an attribute value, or ``None`` if it cannot be moved."""
+    value = html.unescape(value).strip()
+    if not value or _UNSAFE.search(value):
+        return None
+    if name in _LENGTHS:
+        parts = re.split(r"(\s*,\s*|\s+)", value)
+        value = "".join(p + "px" if _NUMBER.match(p) else p for p in parts)
+    return value.replace("&", "&amp;")
+
+
+def _class_name(i: int) -> str:
+    """Short class name ``g0``, ``g1``, ... ``gz``, ``g10``... (base 36)."""
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while True:
+        i, r = divmod(i, 36)
+        out = digits[r] + out
+        if not i:
+            return "g" + out
+
+
+def dedupe_styles(svg: str, chart_id: str) -> str:
+    """
+    Replace repeated presentation attributes with generated CSS classes.
+
+    Args:
+        svg:      A complete SVG document (as from ``wrap_svg_canvas``).
+        chart_id: The ``id`` of its root ``<svg>`` element, used to scope
+                  the generated rules.
+
+    Returns:
+        The document with a ``<style>`` block inserted after the root tag.
+        Style tuples used by a single element stay inline; a document with
+        no repeated tuple is returned unchanged.
+    """
+    # Pass 1: the style tuple of every element that has one
+    found: list[tuple[re.Match, list[tuple[str, str]], tuple]] = []
+    counts: dict[tuple, int] = {}
+    pos = 0
+    while True:
+        m = _TAG.search(svg, pos)
+        if m is None:
+            break
+        pos = m.end()
+        closing, name, rest, self_closing = m.groups()
+        lname = name.lower()
+        if closing or lname == "svg":
+            continue
+        if lname in _RAW and not self_closing:
+            end = svg.find(f"</{name}", pos)
+            pos = len(svg) if end < 0 else end
+            continue
+        attrs = _parse_attrs(rest)
+        if not attrs:
+            continue
+        style = []
+        for n, v in attrs:
+            if n in _PRESENTATION:
+                css = _css_value(n, v)
+                if css is not None:
+                    style.append((n, css))
+        if not style:
+            continue
+        key = tuple(sorted(style))
+        counts[key] = counts.get(key, 0) + 1
+        found.append((m, attrs, key))
+
+    # Most frequent tuples get the shortest names
+    shared = sorted((k for k, c in counts.items() if c > 1),
+                    key=lambda k: -counts[k])
+    if not shared:
+        return svg
+    names = {k: _class_name(i) for i, k in enumerate(shared)}
+
+    # Pass 2: rewrite the tags of elements with a shared tuple
+    out, last = [], 0
+    for m, attrs, key in found:
+        cls = names.get(key)
+        if cls is None:
+            continue
+        moved = {n for n, _ in key}
+        parts, has_class = [], False
+        for n, v in attrs:
+            if n in moved:
+                continue
+            if n == "class":
+                v, has_class = f"{v} {cls}".strip(), True
+            parts.append(f' {n}="{v}"')
+        if not has_class:
+            parts.append(f' class="{cls}"')
+        _, name, _, self_closing = m.groups()
+        out.append(svg[last:m.start()])
+        out.append(f"<{name}{''.join(parts)}{self_closing}>")
+        last = m.end()
+    out.append(svg[last:])
+    doc = "".join(out)
+
+    scope = f":where(#{chart_id})"
+    rules = "".join(
+        f"{scope} .{names[k]}{{{';'.join(f'{n}:{v}' for n, v in k)}}}"
+        for k in shared
+    )
+    root = _TAG.search(doc)
+    at = root.end() if root is not None else 0
+    return doc[:at] + f"<style>{rules}</style>" + doc[at:]
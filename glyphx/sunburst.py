@@ -19,9 +19,10 @@ to the TreemapSeries and is currently a Plotly-exclusive feature.
 from __future__ import annotations
 
 import math
-from collections import defaultdict
+from collections import deque
 
-from .colormaps import apply_colormap, colormap_colors
+from .colormaps import colormap_colors
+from .hierarchy import HierarchyIndex
 from .utils import svg_escape, _format_tick
 
 
@@ -78,24 +79,20 @@ class SunburstSeries:
         self.label         = label
         self.css_class     = f"series-{id(self) % 100000}"
 
-        # Build tree
-        self._children: dict[str, list[str]] = defaultdict(list)
-        self._value:    dict[str, float]      = {}
-        self._color:    dict[str, str]        = {}
+        # Compile the hierarchy once: children, top-level ancestors and
+        # subtree sums are array lookups from here on.
+        self._index = HierarchyIndex(labels, parents)
+        roots = [i for i in self._index.roots if parents[i] == ""]
+        if not roots:
+            raise ValueError("SunburstSeries needs a root node (parent == \"\").")
+        self._root = labels[roots[0]]
+        self._root_idx = int(roots[0])
 
-        for lbl, par, val in zip(labels, parents, values):
-            self._children[par].append(lbl)
-            self._value[lbl] = float(val)
-
-        # Find root
-        self._root = next(lbl for lbl, par in zip(labels, parents) if par == "")
-
-        # Sum internal node values bottom-up
-        self._summed: dict[str, float] = {}
-        self._sum_tree(self._root)
+        # Sum internal node values bottom-up (explicit values override sums)
+        self._summed = self._index.subtree_sums(values, explicit_internal=True)
 
         # Assign colors to top-level children (auto or explicit)
-        top_children = self._children.get(self._root, [])
+        top_children = [labels[i] for i in self._index.children(self._root_idx)]
         if colors:
             color_map = dict(zip(labels, colors))
             self._base_colors = {lbl: color_map.get(lbl, "#888") for lbl in top_children}
@@ -107,40 +104,12 @@ class SunburstSeries:
         self.x = None
         self.y = None
 
-    def _sum_tree(self, node: str) -> float:
-        children = self._children.get(node, [])
-        if not children:
-            s = self._value.get(node, 0.0)
-        else:
-            s = sum(self._sum_tree(c) for c in children)
-            if self._value.get(node, 0.0) > 0:
-                s = self._value[node]  # explicit value overrides sum
-        self._summed[node] = s
-        return s
-
-    def _get_color(self, node: str, parent: str) -> str:
-        """Inherit/derive color from top-level ancestor."""
-        if node in self._base_colors:
-            return self._base_colors[node]
-        if parent in self._base_colors:
-            return self._base_colors[parent]
-        # Walk up to find base color
-        for top, col in self._base_colors.items():
-            if self._is_descendant(node, top):
-                # Lighten slightly for depth
-                return col
-        return "#888888"
-
-    def _is_descendant(self, node: str, ancestor: str) -> bool:
-        visited: set[str] = set()
-        cur = node
-        parent_map = dict(zip(self.labels, self.parents))
-        while cur and cur not in visited:
-            visited.add(cur)
-            if cur == ancestor:
-                return True
-            cur = parent_map.get(cur, "")
-        return False
+    def _get_color(self, node: int) -> str:
+        """Color of the node's top-level ancestor (one array lookup)."""
+        top = self._index.top[node]
+        if top < 0:
+            return "#888888"
+        return self._base_colors.get(self.labels[top], "#888888")
 
     @staticmethod
     def _arc_path(cx: float, cy: float, r_inner: float, r_outer: float,
@@ -178,8 +147,8 @@ class SunburstSeries:
 
         # Centre dot / root label
         cr = self.inner_radius * 0.6
-        root_total = self._summed[self._root]
-        root_lbl   = self.labels[self.labels.index(self._root)] if self._root in self.labels else ""
+        root_total = self._summed[self._root_idx]
+        root_lbl   = self._root
         elements.append(
             f'<circle cx="{cx}" cy="{cy}" r="{cr:.1f}" '
             f'fill="#f0f0f0" stroke="#ccc" stroke-width="1"/>'
@@ -192,24 +161,26 @@ class SunburstSeries:
             )
 
         # BFS to render rings level by level
-        from collections import deque
-        queue: deque[tuple[str, str, float, float, float, int]] = deque()
-        # (node, parent, angle_start, angle_end, depth)
-        top_children = self._children.get(self._root, [])
+        idx    = self._index
+        labels = self.labels
+        queue: deque[tuple[int, float, float, int]] = deque()
+        # (node, angle_start, angle_end, depth)
+        top_children = idx.children(self._root_idx)
         angle_per_val = (360.0 - self.padding_angle * len(top_children)) / root_total if root_total else 0
         cur_angle = -90.0  # start at top
 
         for child in top_children:
             span = self._summed[child] * angle_per_val
-            queue.append((child, self._root, cur_angle, cur_angle + span, 1))
+            queue.append((child, cur_angle, cur_angle + span, 1))
             cur_angle += span + self.padding_angle
 
         while queue:
-            node, parent, a_start, a_end, depth = queue.popleft()
+            node, a_start, a_end, depth = queue.popleft()
             r_inner = self.inner_radius + (depth - 1) * self.ring_width
             r_outer = r_inner + self.ring_width - 1
 
-            color = self._get_color(node, parent)
+            color = self._get_color(node)
+            name  = str(labels[node])
 
             # Slightly lighten for deeper levels
             if depth > 1:
@@ -219,9 +190,9 @@ class SunburstSeries:
                 fill_attr = f'fill="{color}"'
 
             path = self._arc_path(cx, cy, r_inner, r_outer, a_start, a_end)
-            val  = self._summed[node]
+            val  = float(self._summed[node])
             tooltip = (
-                f'data-label="{svg_escape(node)}" '
+                f'data-label="{svg_escape(name)}" '
                 f'data-value="{svg_escape(_format_tick(val))}"'
             )
             elements.append(
@@ -239,7 +210,7 @@ class SunburstSeries:
                 ly = cy + mid_r * math.sin(mid_rad)
                 font_sz = max(8, min(12, int(arc_len / 6)))
                 # Truncate long labels
-                display_lbl = node if len(node) <= 12 else node[:10] + "…"
+                display_lbl = name if len(name) <= 12 else name[:10] + "…"
                 elements.append(
                     f'<text x="{lx:.1f}" y="{ly:.1f}" text-anchor="middle" '
                     f'dominant-baseline="middle" font-size="{font_sz}" '
@@ -249,8 +220,8 @@ class SunburstSeries:
                 )
 
             # Enqueue children
-            children = self._children.get(node, [])
-            if children and val > 0:
+            children = idx.children(node)
+            if len(children) and val > 0:
                 child_angle_per = (
                     (a_end - a_start - self.padding_angle * len(children))
                     / val
@@ -258,7 +229,7 @@ class SunburstSeries:
                 cur = a_start
                 for ch in children:
                     ch_span = self._summed[ch] * child_angle_per
-                    queue.append((ch, node, cur, cur + ch_span, depth + 1))
+                    queue.append((ch, cur, cur + ch_span, depth + 1))
                     cur += ch_span + self.padding_angle
 
         return "\n".join(elements)
@@ -10,11 +10,32 @@ from __future__ import annotations
 import math
 import numpy as np
 
-from .projection3d import Camera3D, normalize, _format_3d_tick
-from .colormaps     import apply_colormap
+from .projection3d import Camera3D, normalize_array, _format_3d_tick
+from .colormaps     import apply_colormap_array
+from .downsample    import MIN_FACE_AREA, quad_areas
 from .utils         import svg_escape
 
 
+def _format_faces(vertex_pts: list[str], quads: np.ndarray, colors: list[str],
+                  alpha: float, wire_color: str | None) -> str:
+    """
+    Serialise quads as SVG polygons in bulk.
+
+    ``vertex_pts`` holds the pre-formatted ``"x,y"`` string of every grid
+    vertex, so each shared vertex is formatted once rather than once per
+    face; ``quads`` is ``(n, 4)`` vertex indices.  With ``wire_color`` every
+    filled polygon is followed by an outline polygon.
+    """
+    fill = f'<polygon points="%s" fill="%s" fill-opacity="{alpha}" stroke="none"/>'
+    pts  = [" ".join(v) for v in zip(*(
+        [vertex_pts[k] for k in col] for col in quads.T.tolist()))]
+    if wire_color is None:
+        return "\n".join(fill % pc for pc in zip(pts, colors))
+    tpl = (fill + "\n" + '<polygon points="%s" fill="none" '
+           f'stroke="{wire_color}" stroke-width="0.4"/>')
+    return "\n".join(tpl % (p, c, p) for p, c in zip(pts, colors))
+
+
 class Surface3DSeries:
     """
     3D surface plot — z = f(x, y) over a regular grid.
@@ -54,14 +75,11 @@ class Surface3DSeries:
 
         # Pre-compute face colours from Z values
         z_arr = np.asarray(z, dtype=float)
+        self._z_grid = z_arr
         self._z_min = float(z_arr.min())
         self._z_max = float(z_arr.max())
         self._z_span = self._z_max - self._z_min or 1.0
 
-    def _face_color(self, z_val: float) -> str:
-        norm = (z_val - self._z_min) / self._z_span
-        return apply_colormap(norm, self.cmap)
-
     def to_svg(self, cam: Camera3D,
                x_range, y_range, z_range) -> str:
         """
@@ -69,13 +87,13 @@ class Surface3DSeries:
 
         Quads are sorted back-to-front by their average projected depth.
         """
-        from .downsample import decimate_grid, cull_faces, _ds_comment, AUTO_THRESHOLD
+        from .downsample import decimate_grid, AUTO_THRESHOLD
 
         # Decimate grid before projection to keep face count manageable
         _thresh = self.threshold if self.threshold is not None else AUTO_THRESHOLD
         _orig_nx, _orig_ny = len(self.x_1d), len(self.y_1d)
         x_1d, y_1d, z_arr_dec = decimate_grid(
-            self.x_1d, self.y_1d, self.z_mat, max_faces=_thresh
+            self.x_1d, self.y_1d, self._z_grid, max_faces=_thresh
         )
         _orig_faces = (_orig_nx - 1) * (_orig_ny - 1)
         _new_faces  = (len(x_1d) - 1) * (len(y_1d) - 1)
@@ -87,65 +105,38 @@ class Surface3DSeries:
             }
         else:
             self.last_downsample_info = None
-            x_1d = self.x_1d; y_1d = self.y_1d; z_arr_dec = self.z_mat
-
-        import numpy as _np
-        z_mat_use = [[float(v) for v in row] for row in z_arr_dec]
-
-        nx = len(x_1d)
-        ny = len(y_1d)
-
-        # Normalise to [-1, 1]
-        xn, xlo, xhi = normalize(x_1d)
-        yn, ylo, yhi = normalize(y_1d)
-        z_flat = [v for row in z_mat_use for v in row]
-        zn_flat, zlo, zhi = normalize(z_flat)
-        z_norm = [zn_flat[j * nx + i] for j in range(ny) for i in range(nx)]
-
-        def znv(j, i):
-            return z_norm[j * nx + i]
-
-        # Project all grid vertices
-        verts: list[list] = []
-        for j in range(ny):
-            row = []
-            for i in range(nx):
-                p = cam.project(xn[i], yn[j], znv(j, i))
-                row.append(p)
-            verts.append(row)
-
-        # Build quads (i, j) → (i+1, j) → (i+1, j+1) → (i, j+1)
-        faces = []
-        for j in range(ny - 1):
-            for i in range(nx - 1):
-                ps = [verts[j][i], verts[j][i+1],
-                      verts[j+1][i+1], verts[j+1][i]]
-                depth = sum(p.depth for p in ps) / 4
-                # Average Z value for colour
-                z_vals = [z_mat_use[j][i],  z_mat_use[j][i+1],
-                          z_mat_use[j+1][i+1], z_mat_use[j+1][i]]
-                avg_z = sum(z_vals) / 4
-                faces.append((depth, ps, avg_z))
-
-        # Sub-pixel face culling then back-to-front sort
-        faces = cull_faces(faces)
-        faces.sort(key=lambda f: f[0])
-
-        elements: list[str] = []
-        for depth, ps, avg_z in faces:
-            pts = " ".join(f"{p.px:.1f},{p.py:.1f}" for p in ps)
-            col = self._face_color(avg_z)
-            elements.append(
-                f'<polygon points="{pts}" fill="{col}" '
-                f'fill-opacity="{self.alpha}" stroke="none"/>'
-            )
-            if self.wireframe:
-                elements.append(
-                    f'<polygon points="{pts}" fill="none" '
-                    f'stroke="{self.wire_color}" stroke-width="0.4"/>'
-                )
-
-        return "\n".join(elements)
+            x_1d = self.x_1d; y_1d = self.y_1d; z_arr_dec = self._z_grid
+
+        z_grid = np.asarray(z_arr_dec, dtype=float)
+
+        # Normalise to [-1, 1] and project every grid vertex in one pass
+        xn, xlo, xhi = normalize_array(x_1d)
+        yn, ylo, yhi = normalize_array(y_1d)
+        zn, zlo, zhi = normalize_array(z_grid)
+        px, py, depth = cam.project_array(xn[None, :], yn[:, None], zn)
+
+        # Quads (i, j) → (i+1, j) → (i+1, j+1) → (i, j+1) over the whole
+        # (ny-1) × (nx-1) grid, each as a (n_faces, 4) corner array
+        def corners(a):
+            return np.stack([a[:-1, :-1], a[:-1, 1:], a[1:, 1:], a[1:, :-1]],
+                            axis=-1).reshape(-1, 4)
+
+        qx, qy = corners(px), corners(py)
+        qd, qz = corners(depth), corners(z_grid)
+        face_depth = (((qd[:, 0] + qd[:, 1]) + qd[:, 2]) + qd[:, 3]) / 4
+        avg_z      = (((qz[:, 0] + qz[:, 1]) + qz[:, 2]) + qz[:, 3]) / 4
+
+        # Sub-pixel face culling then back-to-front sort (one argsort)
+        keep  = np.flatnonzero(quad_areas(qx, qy) >= MIN_FACE_AREA)
+        order = keep[np.argsort(face_depth[keep], kind="stable")]
+
+        colors = apply_colormap_array(
+            (avg_z[order] - self._z_min) / self._z_span, self.cmap)
+        vertex_pts = [f"{a:.1f},{b:.1f}"
+                      for a, b in zip(px.ravel().tolist(), py.ravel().tolist())]
+        quads = corners(np.arange(px.size).reshape(px.shape))[order]
+        return _format_faces(vertex_pts, quads, colors, self.alpha,
+                             self.wire_color if self.wireframe else None)
 
     def to_threejs_data(self) -> dict:
         return {
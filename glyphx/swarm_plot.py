@@ -1,18 +1,41 @@
 import numpy as np
 from collections import defaultdict
 
+from .markers import MARKERS, marker_path_data
+
+
 class SwarmPlotSeries:
-    def __init__(self, data, categories=None, color="#1f77b4", size=4, jitter=6):
+    """
+    Beeswarm-style strip plot: points sharing a value are spread sideways.
+
+    The points carry no tooltips, so the whole swarm is drawn as a single
+    ``<path>`` with one marker subpath per point.
+
+    Args:
+        data:       List of value lists, one per category.
+        categories: Category labels (defaults to ``0..n-1``).
+        color:      Marker fill color.
+        size:       Marker radius in pixels.
+        jitter:     Horizontal spacing between coincident points.
+        marker:     ``"circle"``, ``"square"``, ``"triangle"``,
+                    ``"diamond"`` or ``"cross"``.
+    """
+
+    def __init__(self, data, categories=None, color="#1f77b4", size=4, jitter=6,
+                 marker="circle"):
+        if marker not in MARKERS:
+            raise ValueError(f"Unknown marker {marker!r}; expected one of {MARKERS}.")
         self.data = data  # List of lists: one per category
         self.categories = categories or list(range(len(data)))
         self.color = color
         self.size = size
         self.jitter = jitter
+        self.marker = marker
 
     def to_svg(self, ax, use_y2=False):
         scale_y = ax.scale_y2 if use_y2 else ax.scale_y
         scale_x = ax.scale_x
-        elements = []
+        xs, ys = [], []
 
         for i, values in enumerate(self.data):
             y_buckets = defaultdict(list)
@@ -24,8 +47,10 @@ class SwarmPlotSeries:
                 count = len(vlist)
                 for j, v in enumerate(vlist):
                     offset = (j - count // 2) * self.jitter
-                    cx = scale_x(i) + offset
-                    cy = scale_y(v)
-                    elements.append(f'<circle cx="{cx}" cy="{cy}" r="{self.size}" fill="{self.color}"/>')
+                    xs.append(scale_x(i) + offset)
+                    ys.append(scale_y(v))
 
-        return "\n".join(elements)
\ No newline at end of file
+        if not xs:
+            return ""
+        d = marker_path_data(self.marker, self.size, np.asarray(xs), np.asarray(ys))
+        return f'<path d="{d}" fill="{self.color}"/>'
@@ -14,12 +14,23 @@ ratios so rectangles are as square as possible.
         values=[4200, 1800, 1200, 900, 400],
     ))
     fig.show()
+
+Pass ``parents`` (one parent label per node, ``""`` for top-level nodes)
+for a nested, multi-level treemap; internal nodes are sized by the sum of
+their leaves and drawn as labelled frames around their children::
+
+    fig.add(TreemapSeries(
+        labels =["src", "docs", "core.py", "io.py", "index.md"],
+        parents=["",    "",     "src",     "src",   "docs"],
+        values =[0,     0,      5400,      2100,    800],
+    ))
 """
 from __future__ import annotations
 
 import math
 
 from .colormaps import colormap_colors, apply_colormap
+from .hierarchy import HierarchyIndex
 from .utils import svg_escape, _format_tick
 
 
@@ -27,15 +38,13 @@ from .utils import svg_escape, _format_tick
 # Squarification algorithm
 # ---------------------------------------------------------------------------
 
-def _worst_ratio(row: list[float], side: float) -> float:
-    """Worst (max) aspect ratio in a current candidate row."""
-    s = sum(row)
-    if s == 0 or side == 0:
+def _worst_ratio(row_sum: float, row_min: float, row_max: float,
+                 side: float) -> float:
+    """Worst (max) aspect ratio of a row, from its sum, min and max."""
+    if row_sum == 0 or side == 0 or row_min == 0:
         return float("inf")
-    return max(
-        max(side * side * r / (s * s), (s * s) / (side * side * r))
-        for r in row
-    )
+    s2, w2 = row_sum * row_sum, side * side
+    return max(w2 * row_max / s2, s2 / (w2 * row_min))
 
 
 def _squarify(values: list[float], x: float, y: float,
@@ -45,14 +54,16 @@ def _squarify(values: list[float], x: float, y: float,
 
     Returns list of (x, y, w, h) rectangles in the same order as *values*.
     """
-    if not values:
+    if len(values) == 0:
         return []
 
     if len(values) == 1 or w <= 0 or h <= 0:
-        return [(x, y, w, h)]
+        return [(x, y, w, h)] * len(values)
 
     # Normalise values to area
-    total    = sum(values)
+    total    = float(sum(values))
+    if total <= 0:
+        return [(x, y, 0.0, 0.0)] * len(values)
     area     = w * h
     normed   = [v / total * area for v in values]
 
@@ -66,48 +77,92 @@ def _squarify_normed(
     x: float, y: float, w: float, h: float,
     rects: list[tuple[float, float, float, float]],
 ) -> None:
-    """Recursive squarification on normalised areas."""
-    if not normed:
-        return
-    if len(normed) == 1:
-        rects.append((x, y, w, h))
-        return
-
-    side      = min(w, h)
-    current   = []
-    remaining = list(normed)
-
-    while remaining:
-        candidate = current + [remaining[0]]
-        if not current or _worst_ratio(candidate, side) <= _worst_ratio(current, side):
-            current.append(remaining.pop(0))
+    """
+    Iterative squarification on normalised areas.
+
+    Each row is grown while its worst aspect ratio does not get worse.  The
+    row sum, minimum and maximum are tracked incrementally, so every value
+    is visited a constant number of times and deep inputs never recurse.
+    """
+    n = len(normed)
+    i = 0
+    while i < n:
+        if i == n - 1:
+            rects.append((x, y, w, h))
+            return
+
+        side    = min(w, h)
+        row_sum = row_min = row_max = normed[i]
+        worst   = _worst_ratio(row_sum, row_min, row_max, side)
+        j = i + 1
+        while j < n:
+            v         = normed[j]
+            cand_sum  = row_sum + v
+            cand_min  = min(row_min, v)
+            cand_max  = max(row_max, v)
+            cand_worst = _worst_ratio(cand_sum, cand_min, cand_max, side)
+            if cand_worst > worst:
+                break
+            row_sum, row_min, row_max, worst = cand_sum, cand_min, cand_max, cand_worst
+            j += 1
+
+        if w <= h:
+            # Stack along top, advance y
+            row_h = row_sum / w
+            cx    = x
+            for val in normed[i:j]:
+                cw = val / row_sum * w if row_sum else 0.0
+                rects.append((cx, y, cw, row_h))
+                cx += cw
+            y, h = y + row_h, h - row_h
         else:
-            break
-
-    # Guard: ensure at least one item was consumed
-    if not current:
-        current.append(remaining.pop(0))
-
-    row_sum = sum(current)
-
-    if w <= h:
-        # Stack along top, advance y
-        row_h = row_sum / w
-        cx    = x
-        for val in current:
-            cw = val / row_sum * w
-            rects.append((cx, y, cw, row_h))
-            cx += cw
-        _squarify_normed(remaining, x, y + row_h, w, h - row_h, rects)
-    else:
-        # Stack along left, advance x
-        row_w = row_sum / h
-        cy    = y
-        for val in current:
-            ch = val / row_sum * h
-            rects.append((x, cy, row_w, ch))
-            cy += ch
-        _squarify_normed(remaining, x + row_w, y, w - row_w, h, rects)
+            # Stack along left, advance x
+            row_w = row_sum / h
+            cy    = y
+            for val in normed[i:j]:
+                ch = val / row_sum * h if row_sum else 0.0
+                rects.append((x, cy, row_w, ch))
+                cy += ch
+            x, w = x + row_w, w - row_w
+        i = j
+
+
+def _nested_layout(index, sums, x: float, y: float, w: float, h: float,
+                   padding: float, header: float):
+    """
+    Lay out a whole hierarchy, level by level, with squarify.
+
+    Roots share the full area; every internal node's children are
+    squarified (largest first) inside the node's rectangle, inset by
+    ``padding`` and by a ``header`` strip for the node's label when the
+    rectangle is tall enough.
+
+    Returns:
+        np.ndarray: ``(n, 4)`` rectangles ``(x, y, w, h)``; ``NaN`` rows for
+        nodes that receive no area.
+    """
+    import numpy as np
+
+    rects = np.full((len(index), 4), np.nan)
+
+    def place(nodes, bx, by, bw, bh):
+        nodes = nodes[sums[nodes] > 0]
+        if nodes.size == 0 or bw <= 0 or bh <= 0:
+            return
+        nodes = nodes[np.argsort(-sums[nodes], kind="stable")]
+        rects[nodes] = _squarify(sums[nodes].tolist(), bx, by, bw, bh)
+
+    place(index.roots[index.depth[index.roots] == 0], x, y, w, h)
+    n_children = index.n_children()
+    for level in index.levels:
+        for node in level[n_children[level] > 0]:
+            rx, ry, rw, rh = rects[node]
+            if np.isnan(rx):
+                continue
+            top = header if rh > 2 * header + 2 * padding else 0.0
+            place(index.children(node), rx + padding, ry + padding + top,
+                  rw - 2 * padding, rh - 2 * padding - top)
+    return rects
 
 
 # ---------------------------------------------------------------------------
@@ -127,6 +182,11 @@ class TreemapSeries:
         show_values:    Overlay the numeric value in each rectangle.
         min_font:       Minimum font size; hides label if rect too small.
         label:          Legend label (unused but kept for API consistency).
+        parents:        Parent label per node (``""`` for top-level nodes)
+                        for a nested treemap.  Leaves carry the values;
+                        internal nodes are sized by the sum of their leaves.
+        header:         Height in px of the label strip at the top of each
+                        internal node in a nested treemap.
     """
 
     def __init__(
@@ -139,12 +199,20 @@ class TreemapSeries:
         show_values: bool = True,
         min_font: int = 9,
         label: str | None = None,
+        parents: list[str] | None = None,
+        header: float = 16.0,
     ) -> None:
         if len(labels) != len(values):
             raise ValueError(
                 f"labels and values must be the same length "
                 f"({len(labels)} vs {len(values)})."
             )
+        self.parents = parents
+        self.header  = float(header)
+        if parents is not None:
+            self._init_nested(labels, values, parents, colors, cmap,
+                              padding, show_values, min_font, label)
+            return
 
         # Sort descending (squarify works best on sorted input)
         paired        = sorted(zip(values, labels), reverse=True)
@@ -174,6 +242,111 @@ class TreemapSeries:
         self.x = None
         self.y = None
 
+    def _init_nested(self, labels, values, parents, colors, cmap,
+                     padding, show_values, min_font, label) -> None:
+        """Set up a multi-level treemap from a labels/parents hierarchy."""
+        if len(parents) != len(labels):
+            raise ValueError(
+                f"labels and parents must be the same length "
+                f"({len(labels)} vs {len(parents)})."
+            )
+        self.labels      = list(labels)
+        self.values      = list(values)
+        self.cmap        = cmap
+        self.padding     = padding
+        self.show_values = show_values
+        self.min_font    = min_font
+        self.label       = label
+        self.css_class   = f"series-{id(self) % 100000}"
+
+        self._index  = HierarchyIndex(self.labels, parents)
+        self._summed = self._index.subtree_sums(values)
+
+        # Colour by top-level group: the children of a single root, or the
+        # roots themselves when there are several.
+        idx   = self._index
+        group = idx.top if len(idx.roots) == 1 else idx.root
+        if colors:
+            color_map   = dict(zip(labels, colors))
+            self.colors = [color_map.get(lbl, apply_colormap(0.5, cmap))
+                           for lbl in self.labels]
+        else:
+            keys    = [int(g) for g in dict.fromkeys(group[group >= 0].tolist())]
+            palette = colormap_colors(cmap, max(len(keys), 1))
+            by_key  = dict(zip(keys, palette))
+            self.colors = [by_key.get(int(g), "#888888") for g in group]
+
+        self.x = None
+        self.y = None
+
+    def _nested_svg(self, plot_x, plot_y, plot_w, plot_h, font, tc) -> str:
+        """Render a multi-level treemap: frames for internal nodes, filled leaves."""
+        idx      = self._index
+        rects    = _nested_layout(idx, self._summed, plot_x, plot_y, plot_w,
+                                  plot_h, self.padding, self.header)
+        total    = float(self._summed[idx.roots].sum()) or 1.0
+        internal = idx.n_children() > 0
+        p        = self.padding / 2
+        elements: list[str] = []
+
+        for level in idx.levels:
+            for node in level:
+                rx, ry, rw, rh = rects[node]
+                if rx != rx:   # NaN: no area
+                    continue
+                rx, ry, rw, rh = rx + p, ry + p, rw - 2 * p, rh - 2 * p
+                if rw <= 0 or rh <= 0:
+                    continue
+                lbl, val, color = self.labels[node], float(self._summed[node]), self.colors[node]
+                tooltip = (
+                    f'data-label="{svg_escape(str(lbl))}" '
+                    f'data-value="{svg_escape(_format_tick(val))}"'
+                )
+                if internal[node]:
+                    elements.append(
+                        f'<rect class="glyphx-point {self.css_class}" '
+                        f'x="{rx:.1f}" y="{ry:.1f}" '
+                        f'width="{rw:.1f}" height="{rh:.1f}" '
+                        f'fill="{color}" fill-opacity="0.15" stroke="{color}" '
+                        f'stroke-width="1" rx="3" {tooltip}/>'
+                    )
+                    if rw > 30 and rh > 2 * self.header:
+                        elements.append(
+                            f'<text x="{rx + 4:.1f}" y="{ry + self.header - 4:.1f}" '
+                            f'font-size="{self.min_font + 1}" font-family="{font}" '
+                            f'fill="{color}" font-weight="600">'
+                            f'{svg_escape(str(lbl))}</text>'
+                        )
+                    continue
+
+                elements.append(
+                    f'<rect class="glyphx-point {self.css_class}" '
+                    f'x="{rx:.1f}" y="{ry:.1f}" '
+                    f'width="{rw:.1f}" height="{rh:.1f}" '
+                    f'fill="{color}" rx="3" {tooltip}/>'
+                )
+                font_size = min(14, max(self.min_font, int(rh * 0.22)))
+                if rw > 30 and rh > font_size * 2:
+                    elements.append(
+                        f'<text x="{rx + rw / 2:.1f}" y="{ry + rh / 2:.1f}" '
+                        f'text-anchor="middle" dominant-baseline="middle" '
+                        f'font-size="{font_size}" font-family="{font}" '
+                        f'fill="{tc}" font-weight="600">'
+                        f'{svg_escape(str(lbl))}</text>'
+                    )
+                    if self.show_values and rh > font_size * 3.5:
+                        val_size = max(self.min_font, font_size - 2)
+                        elements.append(
+                            f'<text x="{rx + rw / 2:.1f}" '
+                            f'y="{ry + rh / 2 + font_size:.1f}" '
+                            f'text-anchor="middle" font-size="{val_size}" '
+                            f'font-family="{font}" fill="{tc}" opacity="0.85">'
+                            f'{svg_escape(_format_tick(val))} '
+                            f'({val / total * 100:.1f}%)</text>'
+                        )
+
+        return "\n".join(elements)
+
     def to_svg(self, ax: object = None) -> str:   # type: ignore[override]
         """Render the treemap into SVG rectangles."""
         if ax is None:
@@ -191,6 +364,9 @@ class TreemapSeries:
             font   = theme.get("font", "sans-serif")
             tc     = "#fff"   # white text looks good on colored rects
 
+        if self.parents is not None:
+            return self._nested_svg(plot_x, plot_y, plot_w, plot_h, font, tc)
+
         rects    = _squarify(self.values, plot_x, plot_y, plot_w, plot_h)
         total    = sum(self.values)
         elements: list[str] = []
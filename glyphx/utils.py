@@ -9,8 +9,11 @@ GlyphX utility functions: SVG helpers, display detection, legend rendering.
 import html
 import os
 import math
+import re
 import tempfile
 import webbrowser
+import zlib
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 
@@ -39,6 +42,60 @@ def normalize(data):
     return (arr - lo) / (hi - lo)
 
 
+def _as_column(values):
+    """
+    Return series data as a 1-D NumPy column, avoiding copies where possible.
+
+    NumPy arrays pass through untouched, pandas ``Series``/``Index`` and
+    Arrow arrays are converted with ``to_numpy()`` (a zero-copy view for
+    numeric and naive ``datetime64`` data), and Python sequences become a
+    numeric array when every element is numeric.  Anything else — strings,
+    datetimes, mixed values or ``None`` gaps — becomes an ``object`` array
+    that keeps the original Python objects, so category labels and tooltip
+    text are unchanged.
+
+    ``None`` and values that are not 1-D sequences are returned as-is.
+
+    Args:
+        values: Array-like series data, or ``None``.
+
+    Returns:
+        np.ndarray | None: Column view of ``values``.
+    """
+    import numpy as np
+    if values is None or isinstance(values, np.ndarray):
+        return values
+    if hasattr(values, "to_numpy") and not isinstance(values, (list, tuple)):
+        try:
+            arr = values.to_numpy()
+        except TypeError:
+            arr = values.to_numpy(zero_copy_only=False)   # pyarrow.Array
+        return arr if getattr(arr, "ndim", 0) == 1 else values
+    if isinstance(values, (str, bytes, dict)) or not hasattr(values, "__len__"):
+        return values
+    try:
+        arr = np.asarray(values)
+    except (ValueError, TypeError):
+        return values
+    if arr.ndim != 1:
+        return values
+    if arr.dtype.kind in "biuf":
+        return arr
+    # Strings, datetimes, mixed content: keep the original Python objects
+    # (np.asarray would coerce ``["a", 1]`` to ``["a", "1"]``).
+    out = np.empty(len(arr), dtype=object)
+    out[:] = list(values)
+    return out
+
+
+def _is_empty(values) -> bool:
+    """Return True if ``values`` is ``None`` or has no elements.
+
+    Safe for NumPy arrays, whose truth value is ambiguous.
+    """
+    return values is None or len(values) == 0
+
+
 def _format_tick(val, is_log: bool = False):
     """
     Format a numeric tick label intelligently.
@@ -109,6 +166,132 @@ def svg_escape(text):
     return html.escape(str(text), quote=True)
 
 
+# ---------------------------------------------------------------------------
+# Asset cache
+# ---------------------------------------------------------------------------
+
+_ASSETS_DIR = Path(__file__).parent / "assets"
+_TEMPLATE   = "responsive_template.html"
+
+# name -> (mtime_ns, text) of every asset read so far
+_asset_texts: dict[str, tuple[int, str]] = {}
+# key -> (mtime signature of its assets, built value)
+_asset_builds: dict[Any, tuple[tuple, Any]] = {}
+# Concurrent misses may both rebuild; each stores an equivalent value.
+
+
+def _asset_mtime(name: str) -> int | None:
+    try:
+        return (_ASSETS_DIR / name).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_asset(name: str) -> str | None:
+    """Text of an asset file (``None`` if missing), re-read only when its mtime changes."""
+    mtime = _asset_mtime(name)
+    if mtime is None:
+        _asset_texts.pop(name, None)
+        return None
+    hit = _asset_texts.get(name)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    text = (_ASSETS_DIR / name).read_text(encoding="utf-8")
+    _asset_texts[name] = (mtime, text)
+    return text
+
+
+def _asset_build(key, names: tuple[str, ...], build):
+    """
+    ``build()`` cached under ``key`` until any of ``names`` changes on disk.
+
+    Values derived from assets (minified bundles, split templates, page
+    halves) are rebuilt only when an asset's mtime changes, so wrapping a
+    chart costs one ``stat`` per asset instead of reading every file.
+    """
+    signature = tuple(_asset_mtime(n) for n in names)
+    hit = _asset_builds.get(key)
+    if hit is not None and hit[0] == signature:
+        return hit[1]
+    value = build()
+    _asset_builds[key] = (signature, value)
+    return value
+
+
+def _minify_js(source: str) -> str:
+    """
+    Conservative, line-based JavaScript minification.
+
+    Drops indentation, blank lines, ``//`` comment lines and ``/* */``
+    blocks that start a line.  Line breaks are kept, so automatic semicolon
+    insertion is unaffected, and lines inside multi-line template literals
+    are copied verbatim.
+    """
+    out: list[str] = []
+    in_template = in_comment = False
+    for line in source.splitlines():
+        if in_template:
+            out.append(line)
+            in_template = line.count("`") % 2 == 0
+            continue
+        text = line.strip()
+        if in_comment:
+            if "*/" not in text:
+                continue
+            in_comment, text = False, text.split("*/", 1)[1].strip()
+        elif text.startswith("/*"):
+            if "*/" not in text:
+                in_comment = True
+                continue
+            text = text.split("*/", 1)[1].strip()
+        if not text or text.startswith("//"):
+            continue
+        if text.count("`") % 2:
+            text = line.lstrip()                # keep the literal's trailing text
+            in_template = True
+        out.append(text)
+    return "\n".join(out)
+
+
+def _minified_scripts(names: tuple[str, ...]) -> list[str]:
+    """Minified text of every existing asset in ``names``, cached as a bundle."""
+    def build():
+        return [_minify_js(t) for t in map(_read_asset, names) if t]
+    return _asset_build(("js", names), names, build)
+
+
+def _fill_template(values: dict[str, str]) -> tuple[str, str]:
+    """
+    The HTML template around ``{{svg_content}}``, with ``values`` filled in.
+
+    The template is split on its ``{{placeholder}}`` markers once (and again
+    only when it changes), so filling is a single join per half rather than
+    chained ``str.replace`` calls over the whole page.
+
+    Raises:
+        FileNotFoundError: If the template asset is missing.
+    """
+    def split():
+        text = _read_asset(_TEMPLATE)
+        if text is None:
+            raise FileNotFoundError(
+                f"Missing {_TEMPLATE} in assets folder: {_ASSETS_DIR / _TEMPLATE}"
+            )
+        return re.split(r"\{\{(\w+)\}\}", text)
+
+    segments = _asset_build("template", (_TEMPLATE,), split)
+    halves: list[list[str]] = [[], []]
+    half = 0
+    for i, seg in enumerate(segments):
+        if i % 2 == 0:
+            halves[half].append(seg)
+        elif seg == "svg_content" and half == 0:
+            half = 1
+        else:
+            halves[half].append(values.get(seg, "{{%s}}" % seg))
+    return "".join(halves[0]), "".join(halves[1])
+
+
 # ---------------------------------------------------------------------------
 # SVG/HTML wrapping
 # ---------------------------------------------------------------------------
@@ -132,22 +315,29 @@ def wrap_svg_with_template(svg_string: str) -> str:
     Raises:
         FileNotFoundError: If the HTML template asset is missing.
     """
-    template_path = Path(__file__).parent / "assets" / "responsive_template.html"
-    zoom_path = Path(__file__).parent / "assets" / "zoom.js"
+    head, tail = _html_parts(svg_string)
+    return head + svg_string + tail
 
-    if not template_path.exists():
-        raise FileNotFoundError(
-            f"Missing responsive_template.html in assets folder: {template_path}"
-        )
 
-    html_content = template_path.read_text(encoding="utf-8")
+def _html_parts(svg_string: str) -> tuple[str, str]:
+    """
+    The HTML page that goes before and after ``svg_string``.
+
+    Split out of :func:`wrap_svg_with_template` so that writers can stream
+    ``head``, the SVG and ``tail`` without building the page in memory.
+    ``svg_string`` is only inspected (MathJax is included when it contains
+    math text).  Both halves are built once and cached until an asset
+    changes on disk.
+
+    Raises:
+        FileNotFoundError: If the HTML template asset is missing.
+    """
+    has_math = 'data-has-math="true"' in svg_string
+    return _asset_build(("page", has_math), _PAGE_ASSETS,
+                        lambda: _build_page_parts(has_math))
 
-    zoom_script = ""
-    if zoom_path.exists():
-        zoom_content = zoom_path.read_text(encoding="utf-8")
-        zoom_script = f"<script>\n{zoom_content}\n</script>"
 
-    legend_js = """
+_LEGEND_JS = """
     <script>
     document.querySelectorAll('.legend-icon, .legend-label').forEach(el => {
       el.addEventListener('click', () => {
@@ -161,41 +351,32 @@ def wrap_svg_with_template(svg_string: str) -> str:
     </script>
     """
 
-    # MathJax -- inject only when the SVG contains $...$ math text
-    mathjax_script = ""
-    if 'data-has-math="true"' in svg_string:
-        mathjax_script = (
-            '<script>MathJax={tex:{inlineMath:[["$","$"]]}}</script>\n'
-            '<script async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-svg.js"></script>\n'
-        )
+_MATHJAX_JS = (
+    '<script>MathJax={tex:{inlineMath:[["$","$"]]}}</script>\n'
+    '<script async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-svg.js"></script>\n'
+)
 
-    brush_script = ""
-    brush_path = Path(__file__).parent / "assets" / "brush.js"
-    if brush_path.exists():
-        brush_content = brush_path.read_text(encoding="utf-8")
-        brush_script = f"<script>\n{brush_content}\n</script>"
+# Scripts inlined by wrap_svg_with_template, in page order
+_PAGE_SCRIPTS = ("zoom.js", "brush.js", "interact.js", "accessibility.js")
+_PAGE_ASSETS  = (_TEMPLATE,) + _PAGE_SCRIPTS
 
-    interact_script = ""
-    interact_path = Path(__file__).parent / "assets" / "interact.js"
-    if interact_path.exists():
-        interact_content = interact_path.read_text(encoding="utf-8")
-        interact_script = f"<script>\n{interact_content}\n</script>"
 
-    a11y_path = Path(__file__).parent / "assets" / "accessibility.js"
-    a11y_script = ""
-    if a11y_path.exists():
-        a11y_content = a11y_path.read_text(encoding="utf-8")
-        a11y_script = f"<script>\n{a11y_content}\n</script>"
+def _build_page_parts(has_math: bool) -> tuple[str, str]:
+    extra = ((_MATHJAX_JS if has_math else "")
+             + "".join(f"<script>\n{js}\n</script>"
+                       for js in _minified_scripts(_PAGE_SCRIPTS))
+             + _LEGEND_JS)
+    return _fill_template({"extra_scripts": extra})
 
-    return (
-        html_content
-        .replace("{{svg_content}}", svg_string)
-        .replace("{{extra_scripts}}", mathjax_script + zoom_script + brush_script + interact_script + a11y_script + legend_js)
-    )
+
+def new_chart_id() -> str:
+    """A fresh ``glyphx-chart-<uuid>`` id for one rendered SVG document."""
+    import uuid
+    return f"glyphx-chart-{uuid.uuid4().hex[:12]}"
 
 
 def wrap_svg_canvas(svg_content: str, width: int = 640, height: int = 480,
-                    has_math: bool = False) -> str:
+                    has_math: bool = False, chart_id: str | None = None) -> str:
     """
     Wrap raw SVG elements in a full <svg> root element.
 
@@ -208,12 +389,12 @@ def wrap_svg_canvas(svg_content: str, width: int = 640, height: int = 480,
         height (int):      Canvas height in pixels.
         has_math (bool):   When True, embeds a MathJax data attribute so
                            wrap_svg_with_template injects the CDN script.
+        chart_id (str):    Root ``id`` (default: a fresh :func:`new_chart_id`).
 
     Returns:
         str: Complete SVG document string.
     """
-    import uuid
-    chart_id  = f"glyphx-chart-{uuid.uuid4().hex[:12]}"
+    chart_id  = chart_id or new_chart_id()
     math_attr = ' data-has-math="true"' if has_math else ""
     return (
         f'<svg id="{chart_id}" data-glyphx="true"{math_attr} '
@@ -276,22 +457,133 @@ def wrap_svg_with_css_vars(svg_string: str, light_theme: dict, dark_theme: dict,
     )
 
 
+# ---------------------------------------------------------------------------
+# Compressed output
+# ---------------------------------------------------------------------------
+
+# Characters encoded per step when streaming text into a compressor.
+_ENCODE_CHUNK = 1 << 16
+
+# Compound extensions of pre-compressed artifacts -> (format, compression)
+_COMPRESSED_EXTS = {
+    ".svgz":     ("svg",  "gzip"),
+    ".svg.gz":   ("svg",  "gzip"),
+    ".svg.br":   ("svg",  "br"),
+    ".html.gz":  ("html", "gzip"),
+    ".html.br":  ("html", "br"),
+}
+
+
+def _compressor(compress: str | None):
+    """``(feed, flush)`` callables of a streaming compressor."""
+    if compress is None:
+        return (lambda data: data), (lambda: b"")
+    if compress == "gzip":
+        # wbits=31 writes a gzip container; its mtime is 0, so the same
+        # chart always compresses to the same bytes (stable CDN ETags)
+        c = zlib.compressobj(9, zlib.DEFLATED, 31)
+        return c.compress, c.flush
+    if compress == "br":
+        try:
+            import brotli
+        except ImportError:
+            raise RuntimeError(
+                "Brotli output requires the brotli package.  Install it with:\n"
+                "    pip install brotli"
+            )
+        c = brotli.Compressor(mode=brotli.MODE_TEXT)
+        return c.process, c.finish
+    raise ValueError(
+        f"Unsupported compression {compress!r}.  Use None, 'gzip' or 'br'."
+    )
+
+
+def iter_encoded(parts: Iterable[str], compress: str | None = None) -> Iterator[bytes]:
+    """
+    UTF-8 encode text parts, optionally compressing, one chunk at a time.
+
+    Text is encoded in slices of ``_ENCODE_CHUNK`` characters and fed
+    straight into the compressor, so neither a full UTF-8 copy of the
+    document nor the concatenated parts are ever held in memory.
+
+    Args:
+        parts:    Text pieces of the document, in order.
+        compress: ``None``, ``"gzip"`` or ``"br"`` (requires ``brotli``).
+
+    Yields:
+        bytes: Successive (compressed) output chunks.
+
+    Raises:
+        ValueError:   For an unknown ``compress`` value.
+        RuntimeError: If ``"br"`` is requested and brotli is not installed.
+    """
+    feed, flush = _compressor(compress)
+    for part in parts:
+        for i in range(0, len(part), _ENCODE_CHUNK):
+            out = feed(part[i:i + _ENCODE_CHUNK].encode("utf-8"))
+            if out:
+                yield out
+    tail = flush()
+    if tail:
+        yield tail
+
+
+def document_parts(svg_string: str, format: str = "svg") -> tuple[str, ...]:
+    """
+    The text pieces of a chart document, in order.
+
+    Args:
+        svg_string: Rendered SVG markup.
+        format:     ``"svg"`` (the markup itself) or ``"html"`` (the
+                    interactive page of :func:`wrap_svg_with_template`).
+
+    Raises:
+        ValueError: For an unknown ``format``.
+    """
+    if format == "svg":
+        return (svg_string,)
+    if format == "html":
+        head, tail = _html_parts(svg_string)
+        return head, svg_string, tail
+    raise ValueError(f"Unsupported format {format!r}.  Use 'svg' or 'html'.")
+
+
 def write_svg_file(svg_string: str, filename: str, **kwargs):
     """
     Save a chart to file.  Supports .svg, .html, .png, and .jpg.
 
-    PNG/JPG export requires the optional ``cairosvg`` package::
+    Pre-compressed artifacts are written for ``.svgz`` / ``.svg.gz`` and
+    ``.html.gz`` (gzip), and ``.svg.br`` / ``.html.br`` (Brotli, requires the
+    optional ``brotli`` package); the compressed bytes are streamed to disk.
+
+    PNG/JPG export uses the optional ``cairosvg`` package::
 
         pip install cairosvg
 
+    Without it, PNG files are drawn by GlyphX's built-in NumPy rasterizer
+    (:mod:`glyphx.raster`), which covers the SVG GlyphX emits but draws
+    text in a bitmap font.
+
     Args:
         svg_string (str): Raw SVG content.
         filename (str): Output path.  Extension determines format.
 
     Raises:
         ValueError: For unsupported extensions.
-        RuntimeError: If cairosvg is not installed when exporting raster images.
+        RuntimeError: If cairosvg is not installed when exporting JPG images,
+                      or brotli when writing a ``.br`` file.
     """
+    lower = str(filename).lower()
+    for suffix, (fmt, compress) in _COMPRESSED_EXTS.items():
+        if lower.endswith(suffix):
+            chunks = iter_encoded(document_parts(svg_string, fmt), compress)
+            first  = next(chunks, b"")       # fail before creating the file
+            with open(filename, "wb") as f:
+                f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+            return
+
     ext = os.path.splitext(filename)[-1].lower()
 
     if ext == ".html":
@@ -304,23 +596,30 @@ def write_svg_file(svg_string: str, filename: str, **kwargs):
             f.write(svg_string)
 
     elif ext in {".png", ".jpg", ".jpeg"}:
+        # dpi may be passed as a keyword via write_svg_file(... dpi=192)
+        _dpi = kwargs.get("dpi", 96)
+        _scale = _dpi / 96.0   # cairosvg scale=2 doubles resolution
+        if ext == ".png":
+            from .export import _png_bytes
+            data = _png_bytes(svg_string, scale=_scale)
+            with open(filename, "wb") as f:
+                f.write(data)
+            return
         try:
             import cairosvg
-        except ImportError:
+        except (ImportError, OSError):     # OSError: libcairo missing
             raise RuntimeError(
-                "PNG/JPG export requires cairosvg.  Install it with:\n"
-                "    pip install cairosvg"
+                "JPG export requires cairosvg.  Install it with:\n"
+                "    pip install cairosvg\n"
+                "or save as .png to use the built-in rasterizer."
             )
-        # dpi may be passed as a keyword via write_svg_file(... dpi=192)
-        _dpi = kwargs.get("dpi", 96)
-        _scale = _dpi / 96.0   # cairosvg scale=2 doubles resolution
         cairosvg.svg2png(bytestring=svg_string.encode(),
                          write_to=filename, scale=_scale)
 
     else:
         raise ValueError(
             f"Unsupported file extension '{ext}'.  "
-            "Use .svg, .html, .png, or .jpg."
+            "Use .svg, .svgz, .html, .html.gz, .png, or .jpg."
         )
 
 
@@ -543,37 +842,9 @@ def make_shareable_html(svg_string: str, title: str = "GlyphX Chart") -> str:
     """
     import datetime
 
-    assets_dir = Path(__file__).parent / "assets"
-
-    def _read_js(name: str) -> str:
-        p = assets_dir / name
-        return p.read_text(encoding="utf-8") if p.exists() else ""
-
-    tooltip_js  = _read_js("tooltip.js")   # legacy path -- already in template
-    zoom_js     = _read_js("zoom.js")
-    brush_js    = _read_js("brush.js")
-    interact_js = _read_js("interact.js")
-    export_js   = _read_js("export.js")
-
-    # Read template and replace placeholders
-    template_path = assets_dir / "responsive_template.html"
-    if not template_path.exists():
-        raise FileNotFoundError(f"Missing template: {template_path}")
-
-    html = template_path.read_text(encoding="utf-8")
-
-    # Replace title
-    html = html.replace("<title>GlyphX Chart</title>", f"<title>{html_escape(title)}</title>")
-
-    # Inline all JS into {{extra_scripts}}
-    a11y_js = _read_js("accessibility.js")
-    inlined_scripts = "\n".join(filter(None, [
-        f"<script>\n{zoom_js}\n</script>"     if zoom_js     else "",
-        f"<script>\n{brush_js}\n</script>"    if brush_js    else "",
-        f"<script>\n{interact_js}\n</script>" if interact_js else "",
-        f"<script>\n{a11y_js}\n</script>"     if a11y_js     else "",
-        f"<script>\n{export_js}\n</script>"   if export_js   else "",
-    ]))
+    head, tail = _asset_build("share", _SHARE_ASSETS, _build_share_parts)
+    head = head.replace("<title>GlyphX Chart</title>",
+                        f"<title>{html_escape(title)}</title>")
 
     # Metadata comment
     meta = (
@@ -582,13 +853,18 @@ def make_shareable_html(svg_string: str, title: str = "GlyphX Chart") -> str:
         f"     Zero external dependencies -- share freely\n-->\n"
     )
 
-    html = (
-        html
-        .replace("{{svg_content}}",  svg_string)
-        .replace("{{extra_scripts}}", inlined_scripts)
-    )
+    return meta + head + svg_string + tail
+
+
+# Scripts inlined by make_shareable_html, in page order
+_SHARE_SCRIPTS = ("zoom.js", "brush.js", "interact.js", "accessibility.js", "export.js")
+_SHARE_ASSETS  = (_TEMPLATE,) + _SHARE_SCRIPTS
+
 
-    return meta + html
+def _build_share_parts() -> tuple[str, str]:
+    inlined_scripts = "\n".join(f"<script>\n{js}\n</script>"
+                                 for js in _minified_scripts(_SHARE_SCRIPTS))
+    return _fill_template({"extra_scripts": inlined_scripts})
 
 
 def html_escape(text: str) -> str:
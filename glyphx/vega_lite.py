@@ -29,6 +29,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .utils import _is_empty
+
 
 # ---------------------------------------------------------------------------
 # Series-level converters
@@ -38,15 +40,11 @@ def _series_to_layer(series, use_y2: bool = False) -> dict | None:
     """Convert a single GlyphX series to a Vega-Lite layer dict."""
     cls = series.__class__.__name__
 
-    # Base data
-    x_vals = getattr(series, "_numeric_x", series.x) if series.x else []
-    y_vals = series.y or []
-
-    if not x_vals or not y_vals:
+    # Base data — ``.tolist()`` turns NumPy columns into JSON-native values
+    if _is_empty(series.x) or _is_empty(series.y):
         return None
-
-    # Build inline data records
-    x_raw   = series.x or x_vals   # prefer original labels for categorical
+    x_raw  = _as_list(series.x)   # prefer original labels for categorical
+    y_vals = _as_list(series.y)
     records = []
     for x, y in zip(x_raw, y_vals):
         records.append({"x": x, "y": float(y) if isinstance(y, (int, float)) else y})
@@ -101,6 +99,16 @@ def _series_to_layer(series, use_y2: bool = False) -> dict | None:
 
     if cls == "HistogramSeries":
         raw_data = getattr(series, "data", [])
+        if raw_data is None:
+            # Chunk-built histogram: only the bin counts exist
+            return {
+                "data":   {"values": records},
+                "mark":   {"type": "bar", "color": series.color},
+                "encoding": {
+                    "x": {"field": "x", "type": "quantitative", "title": ""},
+                    "y": {"field": "y", "type": "quantitative"},
+                },
+            }
         recs = [{"v": float(v)} for v in raw_data]
         return {
             "data":   {"values": recs},
@@ -149,6 +157,20 @@ def _cmap_to_vl(cmap: str) -> str:
     return mapping.get(cmap, "viridis")
 
 
+def _as_list(values) -> list:
+    """Return series data as a list of JSON-native values.
+
+    NumPy columns are converted with ``tolist()``; ``datetime64`` columns
+    become ISO-8601 strings so Vega-Lite reads them as temporal fields.
+    """
+    import numpy as np
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "M":
+            return np.datetime_as_string(values).tolist()
+        return values.tolist()
+    return list(values)
+
+
 def _infer_type(values: list) -> str:
     """Guess Vega-Lite field type from a list of values."""
     if not values:
@@ -4,6 +4,8 @@ GlyphX ViolinPlotSeries — replaces scipy gaussian_kde with a pure-numpy implem
 
 import numpy as np
 
+from .hue_mixin import apply_hue, factorize_hue, hue_color_map
+
 
 def _numpy_kde(data, bandwidth=None):
     """
@@ -43,18 +45,37 @@ class ViolinPlotSeries:
         show_median (bool): Draw a horizontal median marker.
         show_box (bool): Overlay a thin IQR box inside the violin.
         label (str | None): Legend label.
+        hue (array-like | None): One group label per violin, or one per
+            observation (all arrays concatenated), in which case every
+            violin is split into one violin per hue group.
+        hue_colors (list | None): Palette for the hue groups.
+        cmap (str): Colormap used when ``hue_colors`` is not given.
     """
 
     def __init__(self, data, positions=None, color="#1f77b4",
                  width=50, show_median=True, show_box=True, label=None,
                  hue=None, hue_colors=None, cmap="viridis", categories=None):
         self.data        = data
-        self.positions   = positions or list(range(len(data)))
         self.color       = color
         self.hue         = hue
         self.hue_colors  = hue_colors
         self.cmap_name   = cmap
         self.categories  = categories
+
+        # Resolve one colour per violin up front
+        self._violin_colors = None
+        if hue is not None:
+            n_obs = sum(len(d) for d in data)
+            if len(hue) == n_obs and len(hue) != len(data):
+                cats = categories or [str(i) for i in range(len(data))]
+                self.data, self.categories, self._violin_colors = apply_hue(
+                    data, cats, hue, hue_colors, cmap)
+                positions = None
+            else:
+                codes, groups = factorize_hue(hue)
+                colors = hue_color_map(groups, hue_colors, cmap)
+                self._violin_colors = [colors[groups[c]] for c in codes]
+        self.positions   = positions or list(range(len(self.data)))
         self.width       = width
         self.show_median = show_median
         self.show_box    = show_box
@@ -63,41 +84,44 @@ class ViolinPlotSeries:
 
         # Expose x/y for Axes domain computation
         self.x = self.positions
-        all_vals = np.concatenate([np.asarray(d) for d in data])
+        all_vals = np.concatenate([np.asarray(d) for d in self.data])
         self.y   = [float(all_vals.min()), float(all_vals.max())]
 
+        # KDE profile and quartiles depend only on the data: compute once
+        self._profiles = [self._profile(d) for d in self.data]
+
+    @staticmethod
+    def _profile(values):
+        """``(y_vals, density, q1, median, q3)`` for one violin, or ``None``."""
+        arr = np.asarray(values, dtype=float)
+        if len(arr) < 2:
+            return None
+        kde    = _numpy_kde(arr)
+        y_vals = np.linspace(arr.min(), arr.max(), 100)
+        dens   = kde(y_vals)
+        dens   = dens / (dens.max() or 1)
+        q1, med, q3 = np.percentile(arr, [25, 50, 75])
+        return y_vals, dens, float(q1), float(med), float(q3)
+
     def to_svg(self, ax, use_y2=False):
-        from glyphx.colormaps import colormap_colors
         scale_y  = ax.scale_y2 if use_y2 else ax.scale_y
         elements = []
+        _violin_colors = getattr(self, "_violin_colors", None)
 
-        # Resolve hue colour mapping before the loop
-        _hue_colors = self.hue_colors
-        _hue_map    = None
-        if self.hue is not None:
-            _hue_vals   = list(dict.fromkeys(str(h) for h in self.hue))
-            _hue_colors = _hue_colors or colormap_colors(
-                getattr(self, "cmap_name", "viridis"), max(len(_hue_vals), 2)
-            )
-            _hue_map = dict(zip(_hue_vals, _hue_colors))
-
-        for i, values in enumerate(self.data):
+        for i in range(len(self.data)):
             # Per-violin colour
-            if _hue_map is not None and self.hue is not None and i < len(self.hue):
-                _vc = _hue_map.get(str(self.hue[i]), self.color)
-            elif _hue_colors is not None:
-                _vc = list(_hue_colors)[i % len(list(_hue_colors))]
+            if _violin_colors is not None and i < len(_violin_colors):
+                _vc = _violin_colors[i] or self.color
+            elif self.hue_colors is not None:
+                _vc = self.hue_colors[i % len(self.hue_colors)]
             else:
                 _vc = self.color
-            arr = np.asarray(values, dtype=float)
-            if len(arr) < 2:
+            profile = self._profiles[i]
+            if profile is None:
                 continue
 
-            kde    = _numpy_kde(arr)
-            y_vals = np.linspace(arr.min(), arr.max(), 100)
-            dens   = kde(y_vals)
-            max_d  = dens.max() or 1
-            dens   = dens / max_d * (self.width / 2)
+            y_vals, dens, q1, med, q3 = profile
+            dens   = dens * (self.width / 2)
 
             cx = ax.scale_x(self.positions[i])
 
@@ -113,8 +137,6 @@ class ViolinPlotSeries:
             )
 
             if self.show_box:
-                q1  = float(np.percentile(arr, 25))
-                q3  = float(np.percentile(arr, 75))
                 top = min(scale_y(q1), scale_y(q3))
                 h   = abs(scale_y(q3) - scale_y(q1))
                 elements.append(
@@ -123,7 +145,6 @@ class ViolinPlotSeries:
                 )
 
             if self.show_median:
-                med = float(np.median(arr))
                 elements.append(
                     f'<line x1="{cx - 7}" x2="{cx + 7}" '
                     f'y1="{scale_y(med)}" y2="{scale_y(med)}" '
@@ -418,10 +418,10 @@ def test_axes_categorical_x_does_not_mutate_series():
     s  = BarSeries(["A", "B", "C"], [1, 2, 3])
     ax = _finalize_with(_make_axes(), s)
     # Original x must be unchanged
-    assert s.x == ["A", "B", "C"]
+    assert list(s.x) == ["A", "B", "C"]
     # Numeric mapping stored separately
     assert hasattr(s, "_numeric_x")
-    assert s._numeric_x == [0.5, 1.5, 2.5]
+    assert list(s._numeric_x) == [0.5, 1.5, 2.5]
 
 
 def test_axes_dual_y():
@@ -34,6 +34,7 @@ from glyphx.downsample import (
     voxel_thin_2d, voxel_thin_3d,
     lttb_3d, decimate_grid, cull_faces,
     enable, disable, is_enabled,
+    cache_info, cache_clear, set_cache_size, DEFAULT_CACHE_SIZE,
     AUTO_THRESHOLD, _lttb3d_cache, _data_fingerprint,
 )
 from glyphx.projection3d import Camera3D
@@ -259,6 +260,108 @@ class TestVoxelThin2D(unittest.TestCase):
         self.assertEqual(len(xt), 30_000)
 
 
+class TestResultCache2D(unittest.TestCase):
+
+    def setUp(self):
+        cache_clear()
+
+    def tearDown(self):
+        set_cache_size(DEFAULT_CACHE_SIZE)
+        cache_clear()
+
+    def test_line_second_call_hits(self):
+        x, y = _line(60_000)
+        xd1, yd1 = maybe_downsample_line(x, y, pixel_width=800)
+        xd2, yd2 = maybe_downsample_line(x, y, pixel_width=800)
+        info = cache_info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 1)
+        self.assertIs(xd1, xd2)
+        np.testing.assert_array_equal(yd1, yd2)
+
+    def test_pixel_width_is_part_of_key(self):
+        x, y = _line(60_000)
+        maybe_downsample_line(x, y, pixel_width=800)
+        maybe_downsample_line(x, y, pixel_width=400)
+        self.assertEqual(cache_info()["misses"], 2)
+
+    def test_in_place_mutation_invalidates(self):
+        x, y = _line(20_000)
+        _, yd1 = maybe_downsample_line(x, y)
+        y[:] = y * 10
+        _, yd2 = maybe_downsample_line(x, y)
+        self.assertEqual(cache_info()["hits"], 0)
+        self.assertGreater(float(np.abs(yd2).max()), float(np.abs(yd1).max()))
+
+    def test_cached_arrays_read_only(self):
+        x, y = _line(20_000)
+        xd, _ = maybe_downsample_line(x, y)
+        with self.assertRaises(ValueError):
+            xd[0] = 1.0
+
+    def test_below_threshold_bypasses_cache(self):
+        x, y = _line(100)
+        maybe_downsample_line(x, y)
+        self.assertEqual(cache_info(), {"hits": 0, "misses": 0,
+                                        "size": 0, "maxsize": DEFAULT_CACHE_SIZE})
+
+    def test_voxel_hit_rethreads_new_c(self):
+        x, y = _scatter_2d(20_000)
+        _, _, c1 = voxel_thin_2d(x, y, c=np.arange(20_000))
+        _, _, c2 = voxel_thin_2d(x, y, c=np.arange(20_000) * 2)
+        self.assertEqual(cache_info()["hits"], 1)
+        np.testing.assert_array_equal(c2, c1 * 2)
+
+    def test_lru_bound(self):
+        set_cache_size(2)
+        for n in (6_000, 7_000, 8_000):
+            maybe_downsample_line(*_line(n))
+        self.assertEqual(cache_info()["size"], 2)
+
+    def test_size_zero_disables(self):
+        set_cache_size(0)
+        x, y = _line(20_000)
+        maybe_downsample_line(x, y)
+        maybe_downsample_line(x, y)
+        self.assertEqual(cache_info()["hits"], 0)
+
+    def test_version_keys_on_identity(self):
+        x, y = _line(20_000)
+        xd1, _ = maybe_downsample_line(x, y, version=1)
+        y[:] = y * 10
+        xd2, _ = maybe_downsample_line(x, y, version=1)
+        self.assertIs(xd1, xd2)                      # same arrays + version: no rescan
+        _, yd3 = maybe_downsample_line(x, y, version=2)
+        self.assertEqual(cache_info()["misses"], 2)
+        self.assertGreater(float(np.abs(yd3).max()), 5.0)
+        maybe_downsample_line(x.copy(), y, version=2)
+        self.assertEqual(cache_info()["misses"], 3)  # equal data, different array
+
+    def test_series_mutation_bumps_version(self):
+        from glyphx import Figure
+        from glyphx.series import LineSeries
+        x, y = _line(60_000)
+        s = LineSeries(x, y)
+        fig = Figure(auto_display=False).add(s)
+        fig.render_svg()
+        s.y[:] = s.y * 10
+        s.y = s.y
+        fig.render_svg()
+        self.assertEqual(cache_info()["misses"], 2)
+        self.assertEqual(cache_info()["hits"], 0)
+
+    def test_figure_rerender_downsamples_once(self):
+        from glyphx import Figure
+        from glyphx.series import LineSeries
+        x, y = _line(60_000)
+        fig = Figure(auto_display=False).add(LineSeries(x.tolist(), y.tolist()))
+        fig.render_svg()
+        fig.render_svg()
+        fig.render_svg()
+        self.assertEqual(cache_info()["misses"], 1)
+        self.assertEqual(cache_info()["hits"], 2)
+
+
 class TestVoxelThin3D(unittest.TestCase):
 
     def test_reduces_large_cloud(self):
@@ -335,6 +335,21 @@ class TestCLI:
         assert os.path.exists(out)
         assert "<svg" in open(out, encoding="utf-8").read()
 
+    def test_plot_to_svgz(self, tmp_path):
+        import gzip
+        csv = self._csv(tmp_path)
+        out = str(tmp_path / "chart.svgz")
+        code, _, _ = self._run(["plot", csv, "--x", "month", "--y", "revenue", "-o", out])
+        assert code == 0
+        assert b"<svg" in gzip.decompress(open(out, "rb").read())
+
+    def test_plot_help_lists_compressed_outputs(self, capsys):
+        code, _, _ = self._run(["plot", "--help"])
+        assert code == 0
+        help_text = capsys.readouterr().out
+        for ext in (".svgz", ".html.gz", ".svg.br", ".html.br"):
+            assert ext in help_text
+
     def test_plot_hist(self, tmp_path):
         csv = self._csv(tmp_path)
         out = str(tmp_path / "hist.svg")
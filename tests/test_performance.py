@@ -0,0 +1,1940 @@
+"""
+Tests for GlyphX large-data performance work:
+  Columnar storage – series hold NumPy columns instead of Python lists
+  Domain engine    – vectorised, cached Axes.compute_domain
+  Time axis        – zero-copy datetime64 path and calendar-aware ticks
+  Chunked histograms – HistogramSeries.from_chunks / update, LogBucketSketch
+  Hue engine       – factorized, single-pass hue group-by for distributions
+  Box statistics   – cached stats, BoxPlotSeries.from_stats, outlier capping
+  Hierarchy index  – compiled parent/children arrays for sunburst & treemap
+  Treemap layout   – iterative squarify and nested treemaps
+  Regression       – windowed LOWESS and batched bootstrap for regplot
+  3-D projection   – vectorised Camera3D.project_array
+  Surface faces    – array-built faces, one argsort, bulk colormap/format
+  3-D HTML payload – base64 typed arrays for Figure3D.render_html
+  Choropleth paths – flattened rings, vectorised Mercator, simplification
+  Geo base map     – cached, topology-preserving paths shared by renders
+  OHLC resampling  – reduceat candle buckets and merged candlestick paths
+  Element coalescing – same-style primitives merged into one path per group
+  Style classes    – repeated presentation attributes moved into CSS classes
+  Marker symbols   – <defs>/<use> markers and single-path static swarms
+  Compressed output – .svgz / .html.gz / .br artifacts and Figure.to_bytes
+  Asset cache      – mtime-invalidated assets, minified bundle, split template
+  Report builder   – one shared runtime, lazily mounted charts, TOC
+  Rasterizer       – NumPy scanline rasterizer and zlib PNG writer
+  Batch export     – rasterize_many on a bounded process pool, PPTX decks
+  Chart server     – glyphx serve: warmed pool, LRU cache, timeouts, metrics
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+import sys as _sys, os as _os
+_sys.path.insert(0, _os.path.dirname(_os.path.abspath(__file__)))
+try:
+    import pytest
+except ImportError:
+    import pytest_shim as pytest  # noqa: F401
+    _sys.modules["pytest"] = pytest
+
+from glyphx import Figure
+from glyphx.layout import Axes
+from glyphx.series import LineSeries, BarSeries, ScatterSeries, HistogramSeries
+from glyphx.utils import _as_column, _is_empty
+
+
+# ============================================================
+# Columnar storage
+# ============================================================
+
+class TestColumnarStorage:
+
+    def test_numpy_input_is_not_copied(self):
+        x = np.arange(10.0)
+        y = x ** 2
+        s = LineSeries(x, y)
+        assert s.x is x
+        assert s.y is y
+
+    def test_pandas_column_is_zero_copy_view(self):
+        df = pd.DataFrame({"a": np.arange(1000.0), "b": np.ones(1000)})
+        s  = LineSeries(df["a"], df["b"])
+        assert isinstance(s.x, np.ndarray)
+        assert np.shares_memory(s.x, df["a"].to_numpy())
+
+    def test_numeric_list_becomes_numeric_array_of_inferred_dtype(self):
+        # Integer lists stay integer (no float copy); float lists are float
+        s = LineSeries([1, 2, 3], [4.5, 5.5, 6.5])
+        assert s.x.dtype.kind == "i"
+        assert s.y.dtype.kind == "f"
+
+    def test_string_list_keeps_python_objects(self):
+        s = BarSeries(["A", "B", "C"], [1, 2, 3])
+        assert s.x.dtype == object
+        assert list(s.x) == ["A", "B", "C"]
+
+    def test_mixed_list_is_not_coerced_to_strings(self):
+        col = _as_column(["a", 1, None])
+        assert col.dtype == object
+        assert col[1] == 1 and col[2] is None
+
+    def test_none_and_scalars_pass_through(self):
+        assert _as_column(None) is None
+        assert _as_column("abc") == "abc"
+        assert _as_column(5) == 5
+
+    def test_two_dimensional_input_unchanged(self):
+        grid = [[1, 2], [3, 4]]
+        assert _as_column(grid) is grid
+
+    def test_is_empty(self):
+        assert _is_empty(None)
+        assert _is_empty([])
+        assert _is_empty(np.array([]))
+        assert not _is_empty(np.array([0.0]))
+
+    def test_assignment_bumps_data_version(self):
+        s  = LineSeries([1, 2], [3, 4])
+        v0 = s._data_version
+        s.y = [5, 6]
+        assert s._data_version == v0 + 1
+
+    def test_histogram_stores_array(self):
+        data = np.random.default_rng(0).normal(size=500)
+        h    = HistogramSeries(data, bins=20, keep_data=True)
+        assert h.data is data
+        assert len(h.x) == 20 and int(h.y.sum()) == 500
+
+    def test_figure_renders_numpy_and_pandas_series(self):
+        df  = pd.DataFrame({"x": np.arange(50), "y": np.sin(np.arange(50))})
+        fig = Figure(auto_display=False)
+        fig.add(LineSeries(df["x"], df["y"], label="sin"))
+        fig.add(BarSeries(np.array(["a", "b"]), np.array([1.0, 2.0])))
+        svg = fig.render_svg()
+        assert "<polyline" in svg and "<rect" in svg
+
+    def test_accessor_uses_numpy_columns(self):
+        df  = pd.DataFrame({"t": np.arange(20), "v": np.arange(20.0) * 2})
+        fig = df.glyphx.line(x="t", y="v", auto_display=False)
+        s   = fig.series[0][0]
+        assert isinstance(s.x, np.ndarray)
+        assert np.shares_memory(s.y, df["v"].to_numpy())
+
+    def test_scatter_colormap_matches_per_point(self):
+        c   = np.linspace(0, 1, 6)
+        s   = ScatterSeries(np.arange(6), np.arange(6), c=c, cmap="viridis")
+        fig = Figure(auto_display=False)
+        fig.add(s)
+        svg = fig.render_svg()
+        from glyphx.colormaps import apply_colormap
+        assert f'fill="{apply_colormap(0.0, "viridis")}"' in svg
+        assert f'fill="{apply_colormap(1.0, "viridis")}"' in svg
+
+    def test_datetime64_column_renders(self):
+        x   = np.arange("2024-01-01", "2024-01-11", dtype="datetime64[D]")
+        fig = Figure(auto_display=False)
+        fig.add(LineSeries(x, np.arange(10.0)))
+        svg = fig.render_svg()
+        assert "<polyline" in svg
+
+    def test_vega_lite_records_are_json_native(self):
+        import json
+        from glyphx.vega_lite import to_vega_lite
+        fig = Figure(auto_display=False)
+        fig.add(LineSeries(np.arange(3), np.array([1.0, 2.0, 3.0])))
+        json.dumps(to_vega_lite(fig))
+
+
+# ============================================================
+# Domain engine
+# ============================================================
+
+class TestComputeDomain:
+
+    def test_categories_keep_first_appearance_order_across_series(self):
+        a  = BarSeries(["b", "a", "b"], [1, 2, 3])
+        b  = BarSeries(["c", "a"], [4, 5])
+        ax = Axes()
+        x_dom, _ = ax.compute_domain([a, b])
+        assert x_dom == (0.0, 3.0)
+        assert list(a._numeric_x) == [0.5, 1.5, 0.5]
+        assert list(b._numeric_x) == [2.5, 1.5]
+        assert a._x_categories == ["b", "a", "b"]
+
+    def test_nan_values_are_ignored(self):
+        s  = LineSeries([1, 2, 3], [np.nan, 5.0, 7.0])
+        _, (y_lo, y_hi) = Axes().compute_domain([s])
+        assert y_lo < 5.0 < 7.0 < y_hi
+
+    def test_all_nan_series_yields_no_domain(self):
+        s = LineSeries([1, 2], [np.nan, np.nan])
+        assert Axes().compute_domain([s]) == (None, None)
+
+    def test_datetime64_converted_to_epoch_seconds(self):
+        x = np.array(["1970-01-01T00:00", "1970-01-01T00:01"], dtype="datetime64[m]")
+        s = LineSeries(x, [1.0, 2.0])
+        x_dom, _ = Axes().compute_domain([s])
+        assert x_dom == (-0.5, 60.5)
+        assert s._datetime_x is True
+
+    def test_category_positions_reused_across_renders(self):
+        from glyphx.downsample import cache_clear, cache_info
+        n = 20_000
+        s = ScatterSeries(np.array([f"c{i % 50}" for i in range(n)], dtype=object),
+                          np.random.default_rng(0).random(n))
+        ax = Axes()
+        ax.compute_domain([s])
+        first = s._numeric_x
+        ax.compute_domain([s])
+        assert s._numeric_x is first
+        # A new category ahead of this series' ones moves its positions
+        ax.compute_domain([BarSeries(["new"], [1]), s])
+        assert s._numeric_x is not first and s._numeric_x.min() == 1.5
+
+        cache_clear()
+        fig = Figure(auto_display=False).add(s)
+        for _ in range(3):
+            fig.render_svg()
+        assert cache_info()["misses"] == 1 and cache_info()["hits"] == 2
+        cache_clear()
+
+    def test_grid_labels_built_from_unique_categories(self):
+        from glyphx.layout import _category_labels
+        s   = LineSeries(["b", "a", "b", "a"] * 1000, np.arange(4000.0))
+        svg = Figure(auto_display=False).add(s).render_svg()
+        assert ">b</text>" in svg and ">a</text>" in svg
+        # One entry per category, taken from the factorized uniques
+        assert _category_labels(s) == {0.5: "b", 1.5: "a"}
+        s._x_categories = None
+        assert _category_labels(s) == {0.5: "b", 1.5: "a"}
+
+    def test_extent_is_cached_until_data_changes(self):
+        s  = LineSeries(np.arange(5.0), np.arange(5.0))
+        ax = Axes()
+        ax.compute_domain([s])
+        key_before = s._domain_cache["y_extent"][0]
+        ax.compute_domain([s])
+        assert s._domain_cache["y_extent"][0] == key_before
+        s.y = np.arange(5.0) * 10
+        _, (_, y_hi) = ax.compute_domain([s])
+        assert y_hi > 40
+
+
+# ============================================================
+# Time axis
+# ============================================================
+
+def _epoch(iso):
+    return float(np.datetime64(iso, "s").astype(np.int64))
+
+
+class TestDatetimeAxis:
+
+    def test_epoch_view_is_zero_copy(self):
+        from glyphx.layout import _epoch_view
+        x = np.arange("2024-01-01", "2024-01-02", dtype="datetime64[m]")
+        ticks, scale = _epoch_view(x)
+        assert ticks.dtype == np.int64 and scale == 60
+        assert np.shares_memory(ticks, x)
+
+    def test_nat_is_excluded_from_extent(self):
+        from glyphx.layout import _epoch_extent, _to_timestamps
+        x = np.array(["1970-01-01T00:00:10", "NaT", "1970-01-01T00:00:20"],
+                     dtype="datetime64[s]")
+        assert _epoch_extent(x) == (10.0, 20.0)
+        assert np.isnan(_to_timestamps(x)[1])
+
+    def test_line_series_skips_float_copy(self):
+        x  = np.arange("2024-01-01", "2024-01-11", dtype="datetime64[D]")
+        s  = LineSeries(x, np.arange(10.0))
+        x_dom, _ = Axes().compute_domain([s])
+        assert not hasattr(s, "_numeric_x")
+        assert x_dom == (_epoch("2024-01-01") - 0.5, _epoch("2024-01-10") + 0.5)
+
+    def test_scatter_still_gets_numeric_seconds(self):
+        x = np.array(["1970-01-01T00:01"], dtype="datetime64[m]")
+        s = ScatterSeries(x, [1.0])
+        Axes().compute_domain([s])
+        assert list(s._numeric_x) == [60.0]
+
+    def test_downsampling_buckets_int64_view(self):
+        from glyphx.downsample import maybe_downsample_line
+        ticks = np.arange(100_000, dtype=np.int64) * 10**9
+        x_d, _ = maybe_downsample_line(ticks, np.sin(np.arange(100_000.0)),
+                                       pixel_width=400, threshold=1_000)
+        assert x_d.dtype == np.int64 and len(x_d) <= 1_000
+
+    def test_large_datetime_line_renders_downsampled(self):
+        x   = np.arange(200_000).astype("datetime64[s]")
+        s   = LineSeries(x, np.random.default_rng(1).normal(size=200_000))
+        fig = Figure(auto_display=False)
+        fig.add(s)
+        svg = fig.render_svg()
+        assert s.last_downsample_info["thinned_n"] < 200_000
+        assert "nan" not in svg
+
+    @pytest.mark.parametrize("lo, hi, expected", [
+        ("2024-01-01T00:00", "2024-01-01T02:00",
+         ["1 Jan", "00:30", "01:00", "01:30", "02:00"]),
+        ("2024-01-01", "2024-01-04", ["1 Jan", "2 Jan", "3 Jan", "4 Jan"]),
+        ("2024-01-01", "2024-01-20", ["1 Jan", "8 Jan", "15 Jan"]),
+        ("2024-01-01", "2024-02-18", ["8 Jan", "22 Jan", "5 Feb"]),
+        ("2024-01-01", "2024-04-01", ["Jan 2024", "Feb 2024", "Mar 2024", "Apr 2024"]),
+        ("2000-01-01", "2024-01-01", ["2000", "2005", "2010", "2015", "2020"]),
+    ])
+    def test_calendar_aligned_ticks(self, lo, hi, expected):
+        from glyphx.layout import _datetime_ticks
+        _, labels = _datetime_ticks(_epoch(lo), _epoch(hi), 5)
+        assert labels == expected
+
+    @pytest.mark.parametrize("hi", ["2024-02-25", "2024-03-20"])
+    def test_weekly_ticks_fall_on_mondays(self, hi):
+        from glyphx.layout import _datetime_ticks
+        pos, _ = _datetime_ticks(_epoch("2024-02-01"), _epoch(hi), 5)
+        weekdays = (np.array(pos) // 86400 + 3) % 7   # 0 == Monday
+        assert len(pos) >= 3 and set(weekdays.tolist()) == {0}
+
+    def test_time_axis_uses_calendar_labels(self):
+        x   = np.arange("2024-01-01", "2024-04-01", dtype="datetime64[D]")
+        fig = Figure(auto_display=False)
+        fig.add(LineSeries(x, np.arange(len(x), dtype=float)))
+        svg = fig.render_svg()
+        assert ">Feb 2024</text>" in svg
+
+
+# ============================================================
+# Chunked histograms
+# ============================================================
+
+class TestChunkedHistogram:
+
+    def _data(self):
+        return np.random.default_rng(7).lognormal(3, 1, 200_000)
+
+    def test_fixed_range_matches_np_histogram(self):
+        data = self._data()
+        h    = HistogramSeries.from_chunks(np.array_split(data, 7),
+                                           bins=25, range=(0, 150))
+        ref, edges = np.histogram(data, bins=25, range=(0, 150))
+        assert h.y.tolist() == ref.tolist()
+        assert np.allclose(h.edges, edges)
+        assert h.n_out_of_range == int((data > 150).sum())
+        assert h.data is None
+
+    def test_unknown_range_uses_sketch(self):
+        data = self._data()
+        h    = HistogramSeries.from_chunks(iter(np.array_split(data, 4)), bins=20)
+        ref, edges = np.histogram(data, bins=20)
+        assert int(h.y.sum()) == len(data)
+        assert np.allclose(h.edges, edges)
+        # Only values within 1 % of a bin edge may land in a neighbour bin
+        assert np.abs(h.y - ref).sum() < 0.01 * len(data)
+
+    def test_update_accumulates_counts(self):
+        h = HistogramSeries([1, 2, 3, 4], bins=4)
+        h.update([1, 1, np.nan, 99])
+        assert h.y.tolist() == [3, 1, 1, 1]
+        assert h.n_out_of_range == 1
+
+    def test_update_rejected_in_hue_mode(self):
+        h = HistogramSeries([1, 2, 3], hue=["a", "b", "a"])
+        with pytest.raises(ValueError):
+            h.update([1])
+
+    def test_chunked_histogram_renders_and_exports(self):
+        import json
+        from glyphx.vega_lite import to_vega_lite
+        h   = HistogramSeries.from_chunks([np.arange(10.0)] * 3, bins=5)
+        fig = Figure(auto_display=False)
+        fig.add(h)
+        assert fig.render_svg().count("<rect") >= 5
+        json.dumps(to_vega_lite(fig))
+
+
+class TestLogBucketSketch:
+
+    def test_quantiles_within_relative_accuracy(self):
+        from glyphx.sketch import LogBucketSketch
+        data = np.random.default_rng(3).exponential(50, 100_000)
+        sk   = LogBucketSketch(relative_accuracy=0.01).add(data)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = np.quantile(data, q)
+            assert abs(sk.quantile(q) - exact) <= 0.011 * exact
+        assert sk.quantile(0) == data.min() and sk.quantile(1) == data.max()
+
+    def test_merge_equals_single_pass(self):
+        from glyphx.sketch import LogBucketSketch
+        data = np.random.default_rng(4).normal(0, 10, 50_000)
+        whole = LogBucketSketch().add(data)
+        a = LogBucketSketch().add(data[:20_000])
+        b = LogBucketSketch().add(data[20_000:])
+        a.merge(b)
+        assert a.count == whole.count
+        assert np.array_equal(a.buckets()[1], whole.buckets()[1])
+        assert a.quantile(0.5) == whole.quantile(0.5)
+
+    def test_negative_zero_and_nan(self):
+        from glyphx.sketch import LogBucketSketch
+        sk = LogBucketSketch().add([-4, 0, 0, 2, np.nan, np.inf])
+        assert sk.count == 4 and sk.zero_count == 2
+        assert sk.min == -4 and sk.max == 2
+
+    def test_merge_rejects_different_accuracy(self):
+        from glyphx.sketch import LogBucketSketch
+        with pytest.raises(ValueError):
+            LogBucketSketch(0.01).merge(LogBucketSketch(0.02).add([1]))
+
+
+# ============================================================
+# Hue engine
+# ============================================================
+
+class TestHueEngine:
+
+    def test_factorize_keeps_first_appearance_order(self):
+        from glyphx.hue_mixin import factorize_hue
+        codes, groups = factorize_hue(["b", "a", "b", 1, "1", "c"])
+        assert groups == ["b", "a", "1", "c"]
+        assert codes.tolist() == [0, 1, 0, 2, 2, 3]
+
+    def test_hue_histograms_match_numpy(self):
+        from glyphx.hue_mixin import factorize_hue, hue_histograms
+        rng    = np.random.default_rng(5)
+        values = rng.normal(size=20_000)
+        hue    = rng.choice(["eu", "us", "ap"], size=values.size)
+        edges  = np.histogram_bin_edges(values, bins=25)
+        codes, groups = factorize_hue(hue)
+        counts = hue_histograms(values, codes, len(groups), edges)
+        for g, row in zip(groups, counts):
+            expected, _ = np.histogram(values[hue == g], bins=edges)
+            assert np.array_equal(row, expected)
+
+    def test_split_by_hue_is_stable(self):
+        from glyphx.hue_mixin import split_by_hue
+        parts = split_by_hue([10, 20, 30, 40, 50], np.array([1, 0, 1, 0, 1]), 2)
+        assert [p.tolist() for p in parts] == [[20, 40], [10, 30, 50]]
+
+    def test_histogram_hue_renders_and_drops_data(self):
+        rng  = np.random.default_rng(6)
+        data = rng.normal(size=5_000)
+        hue  = rng.choice(["a", "b", "c"], size=data.size)
+        h    = HistogramSeries(data, bins=15, hue=hue)
+        assert h.data is None and h.hue is None
+        assert h._hue_groups == ["a", "b", "c"]
+        assert int(h._hue_counts.sum()) == data.size
+        fig = Figure(auto_display=False)
+        fig.add(h)
+        svg = fig.render_svg()
+        assert svg.count("<rect") >= 3 * 15
+
+    def test_box_splits_observations_by_hue(self):
+        from glyphx.series import BoxPlotSeries
+        data = np.arange(12.0)
+        hue  = ["x", "y"] * 6
+        b    = BoxPlotSeries(data, hue=hue, hue_colors=["#111111", "#222222"])
+        assert len(b.datasets) == 2
+        assert b.datasets[0].tolist() == [0, 2, 4, 6, 8, 10]
+        assert b._box_colors == ["#111111", "#222222"]
+
+    def test_box_hue_per_box_colours(self):
+        from glyphx.series import BoxPlotSeries
+        b = BoxPlotSeries([[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+                          hue=["m", "f", "m"], hue_colors=["#aa0000", "#00aa00"])
+        assert b._box_colors == ["#aa0000", "#00aa00", "#aa0000"]
+
+
+# ============================================================
+# Box statistics
+# ============================================================
+
+class TestBoxStats:
+
+    def test_stats_computed_once_at_construction(self):
+        from glyphx.series import BoxPlotSeries
+        data = np.random.default_rng(7).normal(size=1_000)
+        b    = BoxPlotSeries(data)
+        q1, q2, q3 = np.percentile(data, [25, 50, 75])
+        st = b.stats[0]
+        assert (st["q1"], st["q2"], st["q3"]) == (q1, q2, q3)
+        assert st["n_fliers"] == len(st["fliers"])
+
+    def test_outliers_capped_to_most_extreme(self):
+        from glyphx.series import BoxPlotSeries
+        data = np.r_[np.random.default_rng(8).normal(size=10_000),
+                     np.linspace(20, 40, 500), -np.linspace(20, 30, 500)]
+        b  = BoxPlotSeries(data, max_outliers=10)
+        st = b.stats[0]
+        assert len(st["fliers"]) == 10 and st["n_fliers"] >= 1_000
+        assert st["fliers"].max() == 40 and st["fliers"].min() == -30
+        fig = Figure(auto_display=False)
+        fig.add(b)
+        svg = fig.render_svg()
+        assert svg.count('r="3" fill="none"') == 10
+        assert f'data-outliers="{st["n_fliers"]}"' in svg
+
+    def test_from_stats_dicts(self):
+        from glyphx.series import BoxPlotSeries
+        b = BoxPlotSeries.from_stats(
+            [{"q1": 1, "median": 2, "q3": 3, "min": 0, "max": 10, "fliers": [9, 10]},
+             {"q1": 5, "med": 6, "q3": 8, "whislo": 4, "whishi": 9}],
+            categories=["a", "b"])
+        assert b.datasets is None
+        assert b.stats[0]["whislo"] == 0 and b.stats[0]["whishi"] == 6
+        assert b.stats[0]["n_fliers"] == 2
+        assert list(b.y) == [0.0, 10.0]
+        fig = Figure(auto_display=False)
+        fig.add(b)
+        assert 'data-q2="6"' in fig.render_svg()
+
+    def test_from_stats_rejects_missing_quartiles(self):
+        from glyphx.series import BoxPlotSeries
+        with pytest.raises(ValueError):
+            BoxPlotSeries.from_stats({"q1": 1, "q3": 2})
+
+    def test_from_merged_sketches(self):
+        from glyphx.series import BoxPlotSeries
+        from glyphx.sketch import LogBucketSketch
+        data = np.random.default_rng(9).lognormal(3, 1, 60_000)
+        sk = LogBucketSketch()
+        for chunk in np.array_split(data, 6):
+            sk.merge(LogBucketSketch().add(chunk))
+        b  = BoxPlotSeries.from_stats(sk, max_outliers=25)
+        st = b.stats[0]
+        for key, q in (("q1", 25), ("q2", 50), ("q3", 75)):
+            exact = np.percentile(data, q)
+            assert abs(st[key] - exact) <= 0.011 * exact
+        assert len(st["fliers"]) <= 25 and st["n_fliers"] > 25
+
+
+# ============================================================
+# Hierarchy index
+# ============================================================
+
+def _random_tree(n, seed=0):
+    rng     = np.random.default_rng(seed)
+    labels  = [f"n{i}" for i in range(n)]
+    parents = [""] + [f"n{rng.integers(0, i)}" for i in range(1, n)]
+    return labels, parents
+
+
+class TestHierarchyIndex:
+
+    def test_children_depth_and_top(self):
+        from glyphx.hierarchy import HierarchyIndex
+        idx = HierarchyIndex(["T", "S", "A", "E", "G"], ["", "T", "S", "S", "T"])
+        assert idx.children(0).tolist() == [1, 4]
+        assert idx.children(1).tolist() == [2, 3]
+        assert idx.depth.tolist() == [0, 1, 2, 2, 1]
+        assert idx.top.tolist() == [-1, 1, 1, 1, 4]
+        assert [lv.tolist() for lv in idx.levels] == [[0], [1, 4], [2, 3]]
+
+    def test_subtree_sums_match_recursive_definition(self):
+        from glyphx.hierarchy import HierarchyIndex
+        labels, parents = _random_tree(2_000, seed=1)
+        values = np.random.default_rng(2).integers(0, 10, len(labels)).astype(float)
+        idx    = HierarchyIndex(labels, parents)
+        sums   = idx.subtree_sums(values)
+        expected = values.copy()
+        internal = idx.n_children() > 0
+        expected[internal] = 0
+        for node in np.argsort(-idx.depth):
+            if idx.parent[node] >= 0:
+                expected[idx.parent[node]] += expected[node]
+        assert np.allclose(sums, expected)
+
+    def test_deep_chain_and_cycle_do_not_recurse(self):
+        from glyphx.hierarchy import HierarchyIndex
+        n       = 20_000
+        labels  = [str(i) for i in range(n)] + ["x", "y"]
+        parents = [""] + [str(i) for i in range(n - 1)] + ["y", "x"]
+        idx     = HierarchyIndex(labels, parents)
+        assert idx.depth[n - 1] == n - 1
+        assert idx.depth[n] == idx.depth[n + 1] == -1
+        assert idx.subtree_sums(np.ones(n + 2))[0] == 1   # only the leaf counts
+
+    def test_sunburst_explicit_internal_values(self):
+        from glyphx.sunburst import SunburstSeries
+        s = SunburstSeries(labels=["T", "A", "a1", "B"], parents=["", "T", "A", "T"],
+                           values=[0, 50, 5, 7])
+        assert s._summed.tolist() == [57, 50, 5, 7]
+        assert s._get_color(2) == s._get_color(1)
+
+    def test_large_sunburst_renders(self):
+        from glyphx.sunburst import SunburstSeries
+        labels, parents = _random_tree(20_000, seed=3)
+        s   = SunburstSeries(labels, parents, np.ones(len(labels)), show_labels=False)
+        svg = s.to_svg()
+        assert svg.count("<path") == len(labels) - 1
+
+
+# ============================================================
+# Treemap layout
+# ============================================================
+
+class TestTreemapLayout:
+
+    def test_squarify_100k_leaves_without_recursion(self):
+        from glyphx.treemap import _squarify
+        values = np.sort(np.random.default_rng(10).pareto(1.5, 100_000) + 1)[::-1]
+        rects  = np.array(_squarify(values.tolist(), 0, 0, 1000, 800))
+        assert rects.shape == (100_000, 4)
+        areas = rects[:, 2] * rects[:, 3]
+        assert np.allclose(areas, values / values.sum() * 800_000)
+        assert rects[:, 0].min() >= -1e-6 and (rects[:, 0] + rects[:, 2]).max() <= 1000 + 1e-6
+
+    def test_squarify_matches_reference_rows(self):
+        from glyphx.treemap import _squarify
+        rects = _squarify([6, 6, 4, 3, 2, 2, 1], 0, 0, 6, 4)
+        # The classic Bruls et al. example: first row holds the two 6s
+        assert rects[0][:2] == (0, 0) and rects[1][0] == 0
+        assert abs(rects[0][2] - 3) < 1e-9 and abs(rects[0][3] - 2) < 1e-9
+
+    def test_nested_children_inside_parents(self):
+        from glyphx.treemap import TreemapSeries, _nested_layout
+        labels, parents = _random_tree(3_000, seed=11)
+        values = np.random.default_rng(12).random(len(labels))
+        t      = TreemapSeries(labels, values, parents=parents, padding=1)
+        rects  = _nested_layout(t._index, t._summed, 0, 0, 800, 600, 1, 16)
+        parent = t._index.parent
+        ok     = ~np.isnan(rects[:, 0]) & (parent >= 0)
+        child, par = rects[ok], rects[parent[ok]]
+        assert np.all(child[:, 0] >= par[:, 0] - 1e-6)
+        assert np.all(child[:, 1] >= par[:, 1] - 1e-6)
+        assert np.all(child[:, 0] + child[:, 2] <= par[:, 0] + par[:, 2] + 1e-6)
+        assert np.all(child[:, 1] + child[:, 3] <= par[:, 1] + par[:, 3] + 1e-6)
+
+    def test_nested_treemap_renders_groups(self):
+        fig = Figure(width=700, height=500, auto_display=False)
+        fig.treemap(labels=["src", "docs", "core.py", "io.py", "index.md"],
+                    values=[0, 0, 5400, 2100, 800],
+                    parents=["", "", "src", "src", "docs"])
+        svg = fig.render_svg()
+        for lbl in ("src", "core.py", "index.md"):
+            assert lbl in svg
+        assert 'data-label="src" data-value="7,500"' in svg
+
+
+# ============================================================
+# Regression
+# ============================================================
+
+def _lowess_reference(x, y, frac, x_eval):
+    """Brute-force LOWESS: full distance sort and lstsq per point."""
+    n  = len(x)
+    r  = max(1, int(frac * n))
+    out = []
+    for x0 in x_eval:
+        d  = np.abs(x - x0)
+        h  = np.sort(d)[min(r, n - 1)] or 1e-10
+        sw = np.sqrt((1 - np.clip(d / h, 0, 1) ** 3) ** 3)
+        X  = np.vstack([np.ones(n), x - x0]).T
+        out.append(np.linalg.lstsq(sw[:, None] * X, sw * y, rcond=None)[0][0])
+    return np.array(out)
+
+
+class TestRegression:
+
+    def test_knn_windows_are_nearest(self):
+        from glyphx.regplot import _knn_windows
+        xs = np.sort(np.random.default_rng(13).uniform(0, 1, 300))
+        q  = np.random.default_rng(14).uniform(-0.1, 1.1, 50)
+        lo = _knn_windows(xs, q, 20)
+        for x0, start in zip(q, lo):
+            kth = np.sort(np.abs(xs - x0))[19]
+            assert np.abs(xs[start:start + 20] - x0).max() == kth
+
+    def test_lowess_matches_brute_force(self):
+        from glyphx.regplot import _lowess
+        rng  = np.random.default_rng(15)
+        x    = np.round(rng.uniform(0, 10, 400), 1)      # includes ties
+        y    = np.sin(x) + rng.normal(0, 0.3, x.size)
+        grid = np.linspace(0, 10, 40)
+        xe, ye = _lowess(x, y, frac=0.3, x_eval=grid)
+        assert np.array_equal(xe, grid)
+        assert np.allclose(ye, _lowess_reference(x, y, 0.3, grid))
+        xs, ys = _lowess(x, y, frac=0.3)
+        assert np.array_equal(xs, np.sort(x)) and len(ys) == len(x)
+
+    def test_batched_bootstrap_matches_polyfit(self):
+        from glyphx.regplot import _bootstrap_coeffs
+        rng = np.random.default_rng(16)
+        x   = rng.normal(size=300)
+        y   = 1 + 2 * x - 0.5 * x ** 2 + rng.normal(size=300)
+        coeffs = _bootstrap_coeffs(x, y, 2, 5, 7)
+        draw   = np.random.default_rng(7).integers(0, 300, (5, 300))
+        for b in range(5):
+            expected = np.polyfit(x[draw[b]], y[draw[b]], 2)[::-1]
+            assert np.allclose(coeffs[b], expected)
+
+    def test_bootstrap_ci_brackets_fit(self):
+        from glyphx.regplot import _bootstrap_ci
+        rng = np.random.default_rng(17)
+        x   = rng.uniform(0, 10, 20_000)
+        y   = 3 * x + rng.normal(0, 2, x.size)
+        ev  = np.linspace(0, 10, 50)
+        lo, hi = _bootstrap_ci(x, y, ev, order=1, n_boot=500)
+        fit = np.polyval(np.polyfit(x, y, 1), ev)
+        assert np.all(lo <= fit) and np.all(fit <= hi)
+        assert np.all(hi - lo < 0.2)
+
+    def test_regplot_lowess_large(self):
+        from glyphx.regplot import regplot
+        rng = np.random.default_rng(18)
+        x   = rng.uniform(0, 10, 20_000)
+        fig = regplot(None, x_vals=x, y_vals=np.sin(x) + rng.normal(0, 0.2, x.size),
+                      lowess=True)
+        line = [s for s, _ in fig.series if isinstance(s, LineSeries)][0]
+        assert len(line.x) == 200
+        assert np.abs(np.asarray(line.y) - np.sin(np.asarray(line.x))).max() < 0.5
+
+
+# ============================================================
+# 3-D projection
+# ============================================================
+
+class TestProjectArray:
+
+    def test_matches_scalar_project(self):
+        from glyphx.projection3d import Camera3D
+        cam = Camera3D(azimuth=37, elevation=22, cx=300, cy=200, scale=150)
+        pts = np.random.default_rng(19).uniform(-1, 1, (100, 3))
+        px, py, depth = cam.project_array(pts[:, 0], pts[:, 1], pts[:, 2])
+        for k, (x, y, z) in enumerate(pts):
+            p = cam.project(x, y, z)
+            assert np.allclose((px[k], py[k], depth[k]), (p.px, p.py, p.depth))
+
+    def test_broadcasts_over_grid(self):
+        from glyphx.projection3d import Camera3D
+        cam = Camera3D(cx=10, cy=10, scale=5)
+        x, y = np.linspace(-1, 1, 7), np.linspace(-1, 1, 4)
+        z = np.outer(y, x)
+        px, py, depth = cam.project_array(x[None, :], y[:, None], z)
+        assert px.shape == (4, 7)
+        p = cam.project(x[3], y[2], z[2, 3])
+        assert np.allclose((px[2, 3], py[2, 3], depth[2, 3]), p)
+
+    def test_project_all_returns_projected(self):
+        from glyphx.projection3d import Camera3D, Projected
+        pts = Camera3D().project_all([0, 1], [0, 1], [0, 1])
+        assert all(isinstance(p, Projected) for p in pts)
+        assert pts[1] == Camera3D().project(1, 1, 1)
+
+    def test_scatter3d_painter_order(self):
+        from glyphx.projection3d import Camera3D, normalize_array, _format_3d_tick
+        from glyphx.scatter3d import Scatter3DSeries
+        rng = np.random.default_rng(20)
+        x, y, z = rng.normal(size=(3, 200))
+        cam = Camera3D(cx=300, cy=200, scale=100)
+        svg = Scatter3DSeries(x, y, z).to_svg(cam, None, None, None)
+        _, _, depth = cam.project_array(*(normalize_array(v)[0] for v in (x, y, z)))
+        first = np.argsort(depth, kind="stable")[0]
+        assert f"({_format_3d_tick(x[first])}, " in svg.split("\n")[0]
+
+    def test_figure3d_renders_all_series(self):
+        from glyphx.figure3d import Figure3D
+        g   = np.linspace(-2, 2, 40)
+        fig = Figure3D()
+        fig.surface(g, g, np.sin(g[None, :]) * np.cos(g[:, None]))
+        fig.bar3d([1, 2, 3], [1, 2], [[1, 2, 3], [4, 5, 6]])
+        fig.line3d(g, g, g)
+        svg = fig.render_svg()
+        assert svg.count("<polygon") > 39 * 39 and "<polyline" in svg
+
+
+# ============================================================
+# Surface faces
+# ============================================================
+
+class TestSurfaceFaces:
+
+    def test_colormap_array_matches_scalar(self):
+        from glyphx.colormaps import apply_colormap, apply_colormap_array
+        v = np.r_[np.random.default_rng(21).random(2_000), 0, 0.5, 1, -0.3, 1.7]
+        for cmap in ("viridis", "coolwarm", ["#000000", "#ff8000", "#ffffff"]):
+            assert apply_colormap_array(v, cmap) == [apply_colormap(x, cmap) for x in v]
+
+    def test_quad_areas(self):
+        from glyphx.downsample import quad_areas
+        px = np.array([[0, 2, 2, 0], [0, 1, 1, 0]], dtype=float)
+        py = np.array([[0, 0, 3, 3], [0, 0, 0.1, 0.1]], dtype=float)
+        assert quad_areas(px, py).tolist() == [6.0, pytest.approx(0.1)]
+
+    def test_faces_sorted_back_to_front(self):
+        from glyphx.colormaps import apply_colormap
+        from glyphx.projection3d import Camera3D, normalize_array
+        from glyphx.surface3d import Surface3DSeries
+        g   = np.linspace(-2, 2, 30)
+        z   = np.sin(g[None, :]) * np.cos(g[:, None])
+        s   = Surface3DSeries(g, g, z, wireframe=False)
+        cam = Camera3D(azimuth=30, elevation=25, cx=300, cy=250, scale=180)
+        svg = s.to_svg(cam, None, None, None).split("\n")
+        assert len(svg) == 29 * 29
+        _, _, depth = cam.project_array(normalize_array(g)[0][None, :],
+                                        normalize_array(g)[0][:, None],
+                                        normalize_array(z)[0])
+        face = (depth[:-1, :-1] + depth[:-1, 1:] + depth[1:, 1:] + depth[1:, :-1]) / 4
+        j, i = np.unravel_index(np.argmax(face), face.shape)
+        avg = (z[j, i] + z[j, i + 1] + z[j + 1, i + 1] + z[j + 1, i]) / 4
+        expected = apply_colormap((avg - z.min()) / (z.max() - z.min()), "viridis")
+        assert f'fill="{expected}"' in svg[-1]
+
+    def test_wireframe_follows_each_face(self):
+        from glyphx.projection3d import Camera3D
+        from glyphx.surface3d import Surface3DSeries
+        g   = np.linspace(0, 1, 6)
+        svg = Surface3DSeries(g, g, np.add.outer(g, g)).to_svg(
+            Camera3D(cx=200, cy=200, scale=150), None, None, None).split("\n")
+        assert len(svg) == 2 * 25
+        for fill, wire in zip(svg[::2], svg[1::2]):
+            assert fill.split('"')[1] == wire.split('"')[1]
+            assert 'fill="none"' in wire
+
+
+# ============================================================
+# 3-D HTML payload
+# ============================================================
+
+def _html_data(fig):
+    import json, re
+    html = fig.render_html()
+    data = json.loads(re.search(r"const DATA    = (.*);\n", html).group(1))
+    ranges = json.loads(re.search(r"const RANGES  = (.*);\n", html).group(1))
+    return data, ranges
+
+
+def _unpack(b64, dtype):
+    import base64
+    return np.frombuffer(base64.b64decode(b64), dtype=dtype)
+
+
+class TestThreejsPayload:
+
+    def test_colormap_rgb_matches_hex(self):
+        from glyphx.colormaps import apply_colormap, colormap_rgb_array, _hex_to_rgb
+        v = np.r_[np.random.default_rng(3).random(500), 0, 1, -1, 2]
+        rgb = colormap_rgb_array(v, "plasma")
+        assert rgb.dtype == np.uint8 and rgb.shape == (len(v), 3)
+        assert [tuple(c) for c in rgb.tolist()] == [_hex_to_rgb(apply_colormap(x, "plasma")) for x in v]
+
+    def test_scatter_positions_and_colors(self):
+        from glyphx.figure3d import Figure3D
+        from glyphx.scatter3d import Scatter3DSeries
+        from glyphx.colormaps import colormap_rgb_array
+        rng = np.random.default_rng(4)
+        x, y, z = rng.normal(size=(3, 1_000))
+        fig = Figure3D()
+        fig.add(Scatter3DSeries(x, y, z, c=z))
+        (d,), ranges = _html_data(fig)
+        assert "x" not in d and "colors" not in d and d["n"] == 1_000
+        pos = _unpack(d["pos"], "<f4").reshape(-1, 3)
+        norm = lambda v, r: (v - r[0]) / (r[1] - r[0]) * 2 - 1
+        # Three.js is Y-up: columns are (x, z, y)
+        np.testing.assert_allclose(pos[:, 0], norm(x, ranges["x"]), atol=1e-6)
+        np.testing.assert_allclose(pos[:, 1], norm(z, ranges["z"]), atol=1e-6)
+        np.testing.assert_allclose(pos[:, 2], norm(y, ranges["y"]), atol=1e-6)
+        rgb = _unpack(d["rgb"], np.uint8).reshape(-1, 3)
+        assert (rgb == colormap_rgb_array((z - z.min()) / np.ptp(z))).all()
+
+    def test_uniform_scatter_sends_no_vertex_colors(self):
+        from glyphx.figure3d import Figure3D
+        from glyphx.scatter3d import Scatter3DSeries
+        fig = Figure3D()
+        fig.add(Scatter3DSeries([1, 2], [3, 4], [5, 6], color="red"))
+        (d,), _ = _html_data(fig)
+        assert d["rgb"] is None and d["color"] == "red"
+
+    def test_surface_and_bars(self):
+        from glyphx.figure3d import Figure3D
+        from glyphx.surface3d import Surface3DSeries
+        from glyphx.bar3d import Bar3DSeries
+        gx, gy = np.linspace(0, 1, 5), np.linspace(0, 2, 4)
+        z = np.add.outer(gy, gx)
+        fig = Figure3D()
+        fig.add(Surface3DSeries(gx, gy, z))
+        fig.add(Bar3DSeries([0, 1], [0, 2], [[1, 2], [3, 4]]))
+        (surf, bars), ranges = _html_data(fig)
+        assert (surf["nx"], surf["ny"]) == (5, 4)
+        pos = _unpack(surf["pos"], "<f4").reshape(4, 5, 3)
+        assert ranges["z"] == [0.0, 4.0]
+        np.testing.assert_allclose(pos[..., 1], z / 4 * 2 - 1, atol=1e-6)
+        assert len(_unpack(surf["rgb"], np.uint8)) == 4 * 5 * 3
+        assert bars["n"] == 4
+        bpos = _unpack(bars["pos"], "<f4").reshape(-1, 3)
+        np.testing.assert_allclose(bpos[:, 1], np.array([1, 2, 3, 4]) / 4 * 2 - 1, atol=1e-6)
+
+    def test_empty_figure(self):
+        from glyphx.figure3d import Figure3D
+        assert "No data" in Figure3D().render_html()
+
+
+# ============================================================
+# Choropleth paths
+# ============================================================
+
+def _dp_reference(x, y, tol):
+    keep = np.zeros(len(x), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(x) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        sx, sy = x[i + 1:j] - x[i], y[i + 1:j] - y[i]
+        seg2 = dx * dx + dy * dy
+        d2 = (sx * dy - sy * dx) ** 2 / seg2 if seg2 > 0 else sx * sx + sy * sy
+        k = int(np.argmax(d2))
+        if d2[k] > tol * tol:
+            keep[i + 1 + k] = True
+            stack += [(i, i + 1 + k), (i + 1 + k, j)]
+    return keep
+
+
+def _circle_geo(n_feat=20, verts=200, seed=0):
+    rng = np.random.default_rng(seed)
+    feats = []
+    for f in range(n_feat):
+        t = np.linspace(0, 2 * np.pi, verts)
+        ring = np.column_stack([rng.uniform(-120, -70) + np.cos(t),
+                                rng.uniform(25, 45) + np.sin(t)])
+        ring[-1] = ring[0]
+        feats.append({"properties": {"name": f"f{f}"},
+                      "geometry": {"type": "Polygon", "coordinates": [ring.tolist()]}})
+    return feats
+
+
+class TestChoroplethPaths:
+
+    def test_paths_match_scalar_projection(self):
+        import math, re
+        from glyphx.choropleth import ChoroplethSeries, _mercator_xy
+        feats = [
+            {"properties": {"name": "a"},
+             "geometry": {"type": "Polygon",
+                          "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 0]]]}},
+            {"properties": {"name": "b"},
+             "geometry": {"type": "MultiPolygon",
+                          "coordinates": [[[[20, 5], [25, 5], [None, 1], [3], [20, 5]]], [[]]]}},
+            {"properties": {"name": "p"},
+             "geometry": {"type": "Point", "coordinates": [-30, 60]}},
+        ]
+        svg = ChoroplethSeries(feats, {"a": 1, "b": 2}).to_svg()
+        paths = re.findall(r' d="([^"]*)"', svg)
+        assert len(paths) == 2
+        xs, ys = zip(*(_mercator_xy(*p) for p in [(0, 0), (10, 10), (25, 5), (-30, 60)]))
+        x0, x1, y0, y1 = min(xs), max(xs), min(ys), max(ys)
+        def px(lon, lat):
+            mx, my = _mercator_xy(lon, lat)
+            return f"{10 + (mx - x0) / (x1 - x0) * 780:.2f},{10 + (y1 - my) / (y1 - y0) * 480:.2f}"
+        assert paths[0] == "M " + " L ".join(px(*p) for p in [(0, 0), (10, 0), (10, 10), (0, 0)]) + " Z"
+        assert paths[1] == "M " + " L ".join(px(*p) for p in [(20, 5), (25, 5), (20, 5)]) + " Z"
+
+    def test_paths_cached_per_size(self):
+        from glyphx.choropleth import ChoroplethSeries
+        s = ChoroplethSeries(_circle_geo(), {})
+        first = s._feature_paths(800, 500)
+        assert s._feature_paths(800, 500) is first
+        assert s._feature_paths(400, 250) is not first
+
+    def test_batched_douglas_peucker(self):
+        from glyphx.choropleth import _douglas_peucker
+        rng  = np.random.default_rng(8)
+        offs = np.r_[0, np.cumsum(rng.integers(0, 50, 200))]
+        x, y = np.cumsum(rng.normal(size=(2, offs[-1])), axis=1)
+        x[offs[1:6] - 1], y[offs[1:6] - 1] = x[offs[:5]], y[offs[:5]]   # closed rings
+        keep = _douglas_peucker(x, y, offs, 1.5)
+        expected = np.concatenate([_dp_reference(x[a:b], y[a:b], 1.5)
+                                   for a, b in zip(offs[:-1], offs[1:]) if b > a])
+        assert (keep == expected).all()
+
+    def test_simplify_shrinks_output(self):
+        import re
+        from glyphx.choropleth import ChoroplethSeries
+        feats = _circle_geo(verts=2_000)
+        feats.append({"properties": {"name": "dot"},
+                      "geometry": {"type": "Polygon",
+                                   "coordinates": [[[-100, 35], [-100.001, 35], [-100, 35.001], [-100, 35]]]}})
+        full = ChoroplethSeries(feats, {}).to_svg()
+        simp = ChoroplethSeries(feats, {}, simplify=0.5).to_svg()
+        assert len(simp) < len(full) / 5
+        assert len(re.findall(" d=", simp)) == 20      # sub-pixel ring dropped
+        assert simp.count(" Z") == 20
+
+
+# ============================================================
+# Geo base map
+# ============================================================
+
+def _two_neighbours(n=400, seed=5):
+    """Two polygons sharing a long, wiggly border (walked in opposite directions)."""
+    rng  = np.random.default_rng(seed)
+    lat  = np.linspace(30, 40, n)
+    lon  = -100 + np.cumsum(rng.normal(0, 0.01, n))
+    edge = np.column_stack([lon, lat]).tolist()
+    west = edge + [[-105, 40], [-105, 30]]
+    east = edge[::-1] + [[-95, 30], [-95, 40]]
+    # Start the west ring in the middle of the shared border
+    west = west[n // 2:] + west[:n // 2]
+    rings = [west + west[:1], east + east[:1]]
+    return [{"properties": {"name": k},
+             "geometry": {"type": "Polygon", "coordinates": [r]}}
+            for k, r in zip("we", rings)]
+
+
+class TestGeoBaseMap:
+
+    def test_renders_share_cached_paths(self):
+        from glyphx.choropleth import ChoroplethSeries, GeoBaseMap
+        base = GeoBaseMap(_circle_geo())
+        a = ChoroplethSeries(base, {"f1": 1.0, "f2": 2.0})
+        b = ChoroplethSeries(base, {"f1": 5.0})
+        assert a._feature_paths(800, 500) is b._feature_paths(800, 500)
+        plain = ChoroplethSeries(_circle_geo(), {"f1": 1.0, "f2": 2.0})
+        assert a.to_svg().replace(a.css_class, "") == plain.to_svg().replace(plain.css_class, "")
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        from glyphx.choropleth import GeoBaseMap
+        paths = GeoBaseMap(_circle_geo(), simplify=0.5, cache_dir=tmp_path).paths(640, 480)
+        files = list(tmp_path.glob("basemap-*.json"))
+        assert len(files) == 1
+        fresh = GeoBaseMap(_circle_geo(), simplify=0.5, cache_dir=tmp_path)
+        fresh._build = None            # a disk hit must not rebuild
+        assert fresh.paths(640, 480) == paths
+        other = GeoBaseMap(_circle_geo(seed=1), simplify=0.5, cache_dir=tmp_path)
+        assert other.paths(640, 480) != paths
+        assert len(list(tmp_path.glob("basemap-*.json"))) == 2
+
+    def test_shared_border_simplified_identically(self):
+        import re
+        from glyphx.choropleth import GeoBaseMap
+        feats = _two_neighbours()
+        tokens = lambda d: set(re.findall(r"-?[\d.]+,-?[\d.]+", d))
+        full = GeoBaseMap(feats).paths(800, 500)
+        shared = tokens(full[0]) & tokens(full[1])
+        assert len(shared) == 400
+        west, east = GeoBaseMap(feats, simplify=1.0).paths(800, 500)
+        kept_w, kept_e = tokens(west) & shared, tokens(east) & shared
+        assert kept_w == kept_e
+        assert 2 < len(kept_w) < len(shared) / 4
+
+
+# ============================================================
+# OHLC resampling
+# ============================================================
+
+def _ohlc(n, seed=0):
+    rng = np.random.default_rng(seed)
+    c = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    o = np.r_[100.0, c[:-1]]
+    h = np.maximum(o, c) + rng.random(n)
+    l = np.minimum(o, c) - rng.random(n)
+    return o, h, l, c, rng.integers(1, 1_000, n)
+
+
+class TestOHLCResampling:
+
+    def test_resample_matches_loop(self):
+        from glyphx.candlestick import resample_ohlc
+        o, h, l, c, v = _ohlc(1_003)
+        b = resample_ohlc(o, h, l, c, 100, volume=v)
+        assert len(b["start"]) <= 100 and b["stop"][-1] == 1_003
+        for k, (a, z) in enumerate(zip(b["start"], b["stop"])):
+            assert b["open"][k] == o[a] and b["close"][k] == c[z - 1]
+            assert b["high"][k] == h[a:z].max() and b["low"][k] == l[a:z].min()
+            assert b["volume"][k] == v[a:z].sum()
+        assert resample_ohlc(o, h, l, c, 100)["volume"] is None
+
+    def test_small_series_keeps_per_candle_elements(self):
+        from glyphx.candlestick import CandlestickSeries
+        o, h, l, c, v = _ohlc(50)
+        fig = Figure(auto_display=False)
+        s = CandlestickSeries(list(range(50)), o, h, l, c, volume=v)
+        fig.add(s)
+        svg = fig.render_svg()
+        assert svg.count(f'<rect class="glyphx-point {s.css_class}"') == 50
+        assert f"V:{v[0]}" in svg
+        assert s.last_downsample_info is None
+
+    def test_large_series_resampled_to_merged_paths(self):
+        from glyphx.candlestick import CandlestickSeries
+        o, h, l, c, _ = _ohlc(100_000)
+        fig = Figure(width=1000, auto_display=False)
+        s = CandlestickSeries([str(i) for i in range(100_000)], o, h, l, c)
+        fig.add(s)
+        svg = fig.render_svg()
+        info = s.last_downsample_info
+        assert info["algorithm"] == "OHLC" and info["original_n"] == 100_000
+        assert info["thinned_n"] <= (1000 - 2 * fig.axes.padding) / 3
+        assert svg.count(f'class="{s.css_class}"') == 4     # wick + body per color
+        assert svg.count("<text") < 40                       # category ticks thinned
+        series_svg = s.to_svg(fig.axes)
+        assert series_svg.count("Z") == info["thinned_n"]   # one body subpath per candle
+
+    def test_threshold_and_resample_options(self):
+        from glyphx.candlestick import CandlestickSeries
+        o, h, l, c, _ = _ohlc(600)
+        fig = Figure(width=640, auto_display=False)
+        s = CandlestickSeries(list(range(600)), o, h, l, c, threshold=100, resample=False)
+        fig.add(s)
+        fig.render_svg()
+        assert s.to_svg(fig.axes).count("Z") == 600
+        assert s.last_downsample_info is None
+        s.resample = 10
+        n_out = s.to_svg(fig.axes).count("Z")
+        assert n_out == s.last_downsample_info["thinned_n"] <= (640 - 2 * fig.axes.padding) / 10
+
+
+# ============================================================
+# Element coalescing
+# ============================================================
+
+class TestCoalesce:
+
+    def test_rect_line_circle_geometry(self):
+        from glyphx.coalesce import coalesce_svg
+        svg = ('<rect x="10" y="20" width="5" height="30" fill="#f00"/>'
+               '<rect x="20.25" y="10" width="5" height="40" fill="#f00"/>'
+               '<line x1="0" y1="1" x2="9" y2="1" stroke="#000"/>'
+               '<line x1="0" y1="5" x2="9" y2="5" stroke="#000"/>'
+               '<circle cx="5" cy="5" r="2" fill="#0f0"/>'
+               '<circle cx="9" cy="5" r="2" fill="#0f0"/>')
+        out = coalesce_svg(svg)
+        assert '<path d="M10,20h5v30h-5Z M20.25,10h5v40h-5Z" fill="#f00"/>' in out
+        assert '<path d="M0,1L9,1 M0,5L9,5" stroke="#000" fill="none"/>' in out
+        assert 'M3,5a2,2 0 1,0 4,0a2,2 0 1,0 -4,0Z M7,5' in out
+        assert "<rect" not in out and "<line" not in out and "<circle" not in out
+
+    def test_styles_and_containers_kept_apart(self):
+        from glyphx.coalesce import coalesce_svg
+        svg = ('<rect x="0" y="0" width="1" height="1" fill="#f00"/>'
+               '<rect x="2" y="0" width="1" height="1" fill="#00f"/>'
+               '<g><rect x="4" y="0" width="1" height="1" fill="#f00"/></g>'
+               '<rect x="6" y="0" width="1" height="1" fill="#f00" rx="2"/>'
+               '<defs><rect width="1" height="1"/><rect width="2" height="2"/></defs>')
+        assert coalesce_svg(svg) == svg
+
+    def test_interactive_points_kept_unless_all(self):
+        from glyphx.coalesce import coalesce_svg
+        svg = ('<rect class="glyphx-point s1" x="0" y="0" width="1" height="1" '
+               'fill="#f00" data-x="a" data-y="1"/>\n'
+               '<rect class="glyphx-point s1" x="2" y="0" width="1" height="1" '
+               'fill="#f00" data-x="b" data-y="2"/>\n')
+        assert coalesce_svg(svg) == svg
+        out = coalesce_svg(svg, interactive=False)
+        assert out == '<path d="M0,0h1v1h-1Z M2,0h1v1h-1Z" class="s1" fill="#f00"/>\n'
+
+    def test_figure_modes(self):
+        cats = [f"c{i}" for i in range(40)]
+        svgs = {}
+        for mode in (False, True, "all"):
+            fig = Figure(coalesce=mode, auto_display=False)
+            fig.add(BarSeries(cats, np.arange(40) + 1.0))
+            svgs[mode] = fig.render_svg()
+        assert Figure(auto_display=False).coalesce is False
+        assert svgs[False].count("<line") > 40              # grid + axes + ticks
+        assert svgs[True].count("<line") == 0
+        assert svgs[True].count("glyphx-point") == svgs[False].count("glyphx-point")
+        assert svgs["all"].count("glyphx-point") == 0
+        assert svgs["all"].count("<rect") == 1              # background only
+        assert len(svgs["all"]) < len(svgs[False]) / 2
+
+    def test_fragments_not_merged_across_series(self):
+        fig = Figure(coalesce="all", auto_display=False)
+        fig.add(ScatterSeries([1, 2, 3], [1, 2, 3], color="#123456"))
+        fig.add(ScatterSeries([1, 2, 3], [3, 2, 1], color="#123456"))
+        svg = fig.render_svg()
+        assert svg.count('fill="#123456"') >= 2
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError):
+            Figure(coalesce="some")
+
+    def test_error_bars_painted_over_their_bars(self):
+        fig = Figure(coalesce=True, auto_display=False)
+        fig.add(BarSeries(["a", "b", "c"], [3, 5, 2], yerr=[1, 1, 1]))
+        svg  = fig.render_svg()
+        body = svg[svg.index('<rect class="glyphx-point'):]
+        tags = re.findall(r"<(rect|path|line)\b", body)
+        assert tags == ["rect", "rect", "rect", "path"]
+
+    def test_overlapping_siblings_keep_paint_order(self):
+        from glyphx.coalesce import coalesce_svg
+        svg = ('<rect x="0" y="0" width="10" height="10" fill="#f00"/>'
+               '<rect x="5" y="5" width="10" height="10" fill="#00f"/>'
+               '<rect x="50" y="0" width="10" height="10" fill="#f00"/>'
+               '<rect x="70" y="0" width="10" height="10" fill="#f00"/>')
+        out = coalesce_svg(svg)
+        # The first red square stays under the blue one; the others merge
+        assert out.index('x="0"') < out.index('fill="#00f"')
+        assert '<path d="M50,0h10v10h-10Z M70,0h10v10h-10Z" fill="#f00"/>' in out
+        assert out.endswith("/>") and out.count("<rect") == 2
+
+
+# ============================================================
+# Style classes
+# ============================================================
+
+class TestStyleClasses:
+
+    def test_repeated_tuples_become_scoped_classes(self):
+        from glyphx.styleclasses import dedupe_styles
+        svg = ('<svg id="c1" width="10">'
+               '<text x="1" font-size="12" fill="#000">A</text>'
+               '<text x="2" fill="#000" font-size="12">B</text>'
+               '<rect class="glyphx-point s1" width="1" fill="red"/>'
+               '<rect class="glyphx-point s1" width="2" fill="red"/>'
+               '<circle r="1" fill="blue"/></svg>')
+        out = dedupe_styles(svg, "c1")
+        assert out.startswith('<svg id="c1" width="10"><style>'
+                              ':where(#c1) .g0{fill:#000;font-size:12px}'
+                              ':where(#c1) .g1{fill:red}</style>')
+        assert '<text x="1" class="g0">A</text>' in out
+        assert '<rect class="glyphx-point s1 g1" width="2"/>' in out
+        assert '<circle r="1" fill="blue"/>' in out        # used once: inline
+
+    def test_nothing_shared_is_unchanged(self):
+        from glyphx.styleclasses import dedupe_styles
+        svg = '<svg id="c"><rect fill="a"/><rect fill="b"/><style>x{}</style></svg>'
+        assert dedupe_styles(svg, "c") == svg
+
+    def test_unsafe_values_stay_inline(self):
+        from glyphx.styleclasses import dedupe_styles
+        svg = ('<svg id="c"><text font-family="a;b" fill="#000">x</text>'
+               '<text font-family="a;b" fill="#000">y</text></svg>')
+        out = dedupe_styles(svg, "c")
+        assert out.count('font-family="a;b"') == 2
+        assert ".g0{fill:#000}" in out
+
+    def test_dasharray_and_class_names(self):
+        from glyphx.styleclasses import _class_name, _css_value
+        assert _css_value("stroke-dasharray", "5,3") == "5px,3px"
+        assert _css_value("font-family", "&quot;A&quot; &amp; B") == '"A" &amp; B'
+        assert [_class_name(i) for i in (0, 35, 36)] == ["g0", "gz", "g10"]
+
+    def test_figure_output_smaller_and_same_elements(self):
+        import re
+        def render(css):
+            fig = Figure(css_classes=css, auto_display=False)
+            fig.add(BarSeries([f"c{i}" for i in range(40)], np.arange(40) + 1.0))
+            return fig.render_svg()
+        plain, classed = render(False), render(True)
+        tags = lambda s: re.findall(r"<(\w+)", s)
+        assert [t for t in tags(classed) if t != "style"] == tags(plain)
+        assert len(classed) < 0.85 * len(plain)
+        cid = re.search(r'id="(glyphx-chart-[^"]+)"', classed).group(1)
+        assert f":where(#{cid}) .g0{{" in classed
+        assert classed.count("glyphx-point") == plain.count("glyphx-point")
+
+
+# ============================================================
+# Marker symbols
+# ============================================================
+
+class TestMarkerSymbols:
+
+    def test_shapes_and_path_data(self):
+        from glyphx.markers import MARKERS, marker_defs, marker_path_data, marker_use
+        assert marker_defs("m", "square", 4) == (
+            '<defs><rect id="m" x="-2" y="-2" width="4" height="4"/></defs>')
+        assert marker_defs("m", "diamond", 2) == (
+            '<defs><path id="m" d="M0,-2l2,2l-2,2l-2,-2Z"/></defs>')
+        assert marker_use("m", 1.005, 2.5, 'fill="red"') == (
+            '<use href="#m" x="1" y="2.5" fill="red"/>')
+        d = marker_path_data("diamond", 2, [10, np.nan, 20], [5, 5, 6])
+        assert d == "M10,3l2,2l-2,2l-2,-2Z M20,4l2,2l-2,2l-2,-2Z"
+        for m in MARKERS:
+            assert marker_path_data(m, 3, [0.0], [0.0]).endswith("Z")
+        with pytest.raises(ValueError):
+            marker_defs("m", "star", 3)
+
+    def test_scatter_markers_defined_once(self):
+        for marker in ("square", "triangle", "diamond", "cross"):
+            fig = Figure(auto_display=False)
+            s = ScatterSeries(np.arange(200.0), np.arange(200.0) ** 0.5, marker=marker)
+            fig.add(s)
+            svg = fig.render_svg()
+            cid = re.search(r'<svg[^>]* id="(glyphx-chart-[0-9a-f]+)"', svg).group(1)
+            mid = f"{cid}-{s.css_class}-m"
+            assert svg.count(f'id="{mid}"') == 1
+            assert svg.count(f'<use href="#{mid}"') == 200
+            assert svg.count('class="glyphx-point') == 200
+            assert 'tabindex="0"' in svg
+
+    def test_marker_ids_unique_across_documents(self):
+        from glyphx import Report
+        report, defs = Report(), {}
+        for marker in ("triangle", "diamond", "cross", "square"):
+            fig = Figure(auto_display=False)
+            fig.add(ScatterSeries([1.0, 2.0], [1.0, 2.0], marker=marker))
+            svg = fig.render_svg()
+            report.add(svg)
+            (mid,) = re.findall(r'<(?:path|rect) id="([^"]+-m)"', svg)
+            defs[mid] = marker
+        assert len(defs) == 4
+        page = report.render()
+        assert all(page.count(f'id="{mid}"') == 1 for mid in defs)
+
+    def test_circle_markers_unchanged_shape(self):
+        fig = Figure(auto_display=False)
+        s = ScatterSeries([1.0, 2.0, 3.0], [1.0, 2.0, 4.0])
+        fig.add(s)
+        fig.render_svg()
+        svg = s.to_svg(fig.axes)
+        assert svg.count("<circle") == 3 and "<use" not in svg
+
+    def test_swarm_is_one_path(self):
+        from glyphx.swarm_plot import SwarmPlotSeries
+        fig = Figure(auto_display=False)
+        fig.add(ScatterSeries([0, 1], [0, 10]))
+        fig.render_svg()
+        sw = SwarmPlotSeries([[1, 2, 2, 3], [2, 2, 2]], marker="triangle")
+        svg = sw.to_svg(fig.axes)
+        assert svg.count("<path") == 1 and svg.count("M") == 7
+        with pytest.raises(ValueError):
+            SwarmPlotSeries([[1]], marker="star")
+
+    def test_bubble_and_raincloud_shared_paint_on_group(self):
+        from glyphx.bubble import BubbleSeries
+        from glyphx.raincloud import RaincloudSeries
+        fig = Figure(auto_display=False)
+        fig.add(BubbleSeries([1, 2, 3], [1, 2, 3], size=[1, 2, 3], alpha=0.5))
+        svg = fig.render_svg()
+        assert svg.count('fill-opacity="0.5"') == 1
+        assert svg.count("<circle class=\"glyphx-point") == 3
+        fig = Figure(auto_display=False)
+        fig.add(RaincloudSeries([[1, 2, 3, 4], [2, 3, 4, 5]]))
+        svg = fig.render_svg()
+        assert svg.count('fill-opacity="0.55"') == 2
+        assert svg.count("<circle class=\"glyphx-point") == 8
+
+
+# ============================================================
+# Compressed output
+# ============================================================
+
+def _bar_fig():
+    fig = Figure(auto_display=False)
+    fig.add(BarSeries([f"c{i}" for i in range(30)], np.arange(30) + 1.0))
+    return fig
+
+
+class TestCompressedOutput:
+
+    def test_to_bytes_round_trips(self):
+        import gzip
+        fig = _bar_fig()
+        svg = fig.to_bytes()
+        assert svg.startswith(b"<svg") and svg.endswith(b"</svg>")
+        gz = fig.to_bytes("svg", compress="gzip")
+        assert len(gz) * 3 < len(svg)
+        text = gzip.decompress(gz).decode("utf-8")
+        assert text.startswith("<svg") and text.count("<rect") == svg.count(b"<rect")
+        page = gzip.decompress(fig.to_bytes("html", compress="gzip")).decode()
+        assert page.startswith("<!DOCTYPE html>") and "<svg" in page
+
+    def test_gzip_is_deterministic(self):
+        from glyphx.utils import iter_encoded
+        a = b"".join(iter_encoded(["<svg>", "x" * 200_000, "</svg>"], "gzip"))
+        b = b"".join(iter_encoded(["<svg>", "x" * 200_000, "</svg>"], "gzip"))
+        assert a == b
+
+    def test_streaming_encodes_multibyte_text_in_chunks(self):
+        from glyphx import utils
+        text = "é€" * 100_000
+        chunks = list(utils.iter_encoded([text, "end"]))
+        assert len(chunks) > 1
+        assert b"".join(chunks) == (text + "end").encode("utf-8")
+
+    def test_html_parts_match_template(self):
+        from glyphx.utils import document_parts, wrap_svg_with_template
+        svg = _bar_fig().render_svg()
+        assert "".join(document_parts(svg, "html")) == wrap_svg_with_template(svg)
+        assert document_parts(svg) == (svg,)
+        with pytest.raises(ValueError):
+            document_parts(svg, "pdf")
+
+    def test_compressed_files(self, tmp_path):
+        import gzip
+        fig = _bar_fig()
+        svg = fig.render_svg()
+        for name in ("chart.svgz", "chart.svg.gz", "chart.html.gz"):
+            fig.save(str(tmp_path / name))
+        assert gzip.decompress((tmp_path / "chart.svgz").read_bytes()).startswith(b"<svg")
+        assert (len(gzip.decompress((tmp_path / "chart.svgz").read_bytes()))
+                == len(gzip.decompress((tmp_path / "chart.svg.gz").read_bytes())))
+        page = gzip.decompress((tmp_path / "chart.html.gz").read_bytes()).decode()
+        assert page.startswith("<!DOCTYPE html>") and len(page) > len(svg)
+
+    def test_brotli_if_available(self, tmp_path):
+        fig = _bar_fig()
+        try:
+            import brotli
+        except ImportError:
+            with pytest.raises(RuntimeError):
+                fig.to_bytes(compress="br")
+            with pytest.raises(RuntimeError):
+                fig.save(str(tmp_path / "chart.svg.br"))
+            assert not (tmp_path / "chart.svg.br").exists()
+            return
+        body = fig.to_bytes(compress="br")
+        assert brotli.decompress(body).startswith(b"<svg")
+
+    def test_unknown_compression_rejected(self):
+        with pytest.raises(ValueError):
+            _bar_fig().to_bytes(compress="lzma")
+
+
+# ============================================================
+# Asset cache
+# ============================================================
+
+@pytest.fixture
+def asset_dir(tmp_path, monkeypatch):
+    """A private copy of the HTML assets with empty caches."""
+    import shutil
+    from glyphx import utils
+    for f in utils._ASSETS_DIR.iterdir():
+        if f.suffix in (".js", ".html"):
+            shutil.copy(f, tmp_path / f.name)
+    monkeypatch.setattr(utils, "_ASSETS_DIR", tmp_path)
+    monkeypatch.setattr(utils, "_asset_texts", {})
+    monkeypatch.setattr(utils, "_asset_builds", {})
+    return tmp_path
+
+
+class TestAssetCache:
+
+    def test_assets_read_once(self, asset_dir, monkeypatch):
+        from glyphx import utils
+        reads = []
+        real = utils.Path.read_text
+        monkeypatch.setattr(utils.Path, "read_text",
+                            lambda self, *a, **k: reads.append(self.name) or real(self, *a, **k))
+        first = utils.wrap_svg_with_template("<svg></svg>")
+        n = len(reads)
+        assert n == 1 + len(utils._PAGE_SCRIPTS)
+        for _ in range(5):
+            assert utils.wrap_svg_with_template("<svg></svg>") == first
+        utils.make_shareable_html("<svg></svg>")
+        assert len(reads) == n + 1                 # only export.js is new
+
+    def test_mtime_change_invalidates(self, asset_dir):
+        import os
+        from glyphx import utils
+        assert "EDITED" not in utils.wrap_svg_with_template("<svg></svg>")
+        path = asset_dir / "zoom.js"
+        path.write_text(path.read_text() + "\nconst EDITED = 1;\n")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert "const EDITED = 1;" in utils.wrap_svg_with_template("<svg></svg>")
+        os.remove(path)
+        assert "EDITED" not in utils.wrap_svg_with_template("<svg></svg>")
+
+    def test_missing_template_raises(self, asset_dir):
+        import os
+        from glyphx import utils
+        os.remove(asset_dir / utils._TEMPLATE)
+        with pytest.raises(FileNotFoundError):
+            utils.wrap_svg_with_template("<svg></svg>")
+
+    def test_template_filled_once_around_svg(self):
+        from glyphx.utils import make_shareable_html, wrap_svg_with_template
+        svg = '<svg data-has-math="true"><text>{{extra_scripts}}</text></svg>'
+        html = wrap_svg_with_template(svg)
+        assert html.count(svg) == 1 and "{{" not in html.replace(svg, "")
+        assert "mathjax" in html and "mathjax" not in wrap_svg_with_template("<svg/>")
+        share = make_shareable_html("<svg/>", title="Q3 <Report>")
+        assert "<title>Q3 &lt;Report&gt;</title>" in share
+        assert "GlyphX self-contained export" in share
+
+    def test_minify_js(self):
+        from glyphx.utils import _minify_js
+        src = ("/* header\n   comment */\n(function () {\n"
+               "  // note\n\n  const a = 'http://x';   \n"
+               "  const t = `line one\n    kept   \n  end`;\n})();\n")
+        assert _minify_js(src) == ("(function () {\nconst a = 'http://x';\n"
+                                   "const t = `line one\n    kept   \n  end`;\n})();")
+
+
+# ============================================================
+# Report builder
+# ============================================================
+
+def _report(embed="template", n=6):
+    from glyphx import Report
+    r = Report("Weekly <KPIs>", embed=embed, columns=2)
+    r.add_section("Revenue")
+    for i in range(n):
+        if i == n // 2:
+            r.add_section("Costs")
+        fig = Figure(width=500, height=300, title=f"KPI {i}", auto_display=False)
+        fig.add(LineSeries([1, 2, 3], [i, i + 1, i + 3]))
+        r.add(fig, caption="weekly" if i == 0 else None)
+    return r
+
+
+class TestReport:
+
+    def test_charts_inert_runtime_once(self):
+        r = _report()
+        html = r.render()
+        assert len(r) == 6
+        assert html.count("<template") == 6
+        assert html.count('class="gx-slot"') == 6
+        assert html.count("glyphxMounters") >= 3      # zoom, brush, a11y hooks
+        assert html.count("IntersectionObserver") >= 1
+        assert html.count("function wireZoom") == 1
+        assert "responsive_template" not in html and "{{" not in html
+        # every SVG sits inside its template, nothing is live at load
+        outside = re.sub(r"<template.*?</template>", "", html, flags=re.S)
+        assert "<svg" not in outside
+
+    def test_table_of_contents_and_sections(self):
+        html = _report().render()
+        toc = html[html.index('<nav class="gx-toc">'):html.index("</nav>")]
+        assert toc.count('href="#gx-section-') == 2
+        assert toc.count('href="#gx-chart-') == 6
+        assert ">KPI 4</a>" in toc
+        assert '<h2 class="gx-section" id="gx-section-1">Costs</h2>' in html
+        assert "<title>Weekly &lt;KPIs&gt;</title>" in html
+        assert 'style="aspect-ratio:500/300;max-width:500px"' in html
+        assert "<p>weekly</p>" in html
+        assert '<nav class="gx-toc">' not in _report_without_toc().render()
+
+    def test_gzip_embed_round_trips(self):
+        import base64, gzip
+        html = _report("gzip").render()
+        blobs = re.findall(r'<script type="application/gzip;base64" id="gx-src-\d+">'
+                           r'([A-Za-z0-9+/=]+)</script>', html)
+        assert len(blobs) == 6 and "<template" not in html
+        svg = gzip.decompress(base64.b64decode(blobs[0])).decode()
+        assert svg.startswith("<svg") and "KPI 0" in svg
+        assert len(html) < len(_report().render())
+
+    def test_save_plain_and_compressed(self, tmp_path):
+        import gzip
+        r = _report(n=2)
+        r.save(str(tmp_path / "r.html")).save(str(tmp_path / "r.html.gz"))
+        plain = (tmp_path / "r.html").read_text(encoding="utf-8")
+        assert plain.startswith("<!DOCTYPE html>") and plain.count("<template") == 2
+        unzipped = gzip.decompress((tmp_path / "r.html.gz").read_bytes()).decode()
+        assert unzipped.count("<template") == 2
+
+    @pytest.mark.parametrize("name", ["r.svg", "r.png", "r.htm", "r.gz", "r.svgz"])
+    def test_save_rejects_other_extensions(self, tmp_path, name):
+        with pytest.raises(ValueError, match="Unsupported report file"):
+            _report(n=1).save(str(tmp_path / name))
+        assert not (tmp_path / name).exists()
+
+    def test_svg_strings_and_validation(self):
+        from glyphx import Report
+        from glyphx.report import _svg_size
+        assert _svg_size('<svg stroke-width="3" width="320" height="200">') == (320, 200)
+        assert _svg_size("<svg>") == (640, 480)
+        html = Report().add('<svg width="100" height="50"></svg>').render()
+        assert ">Chart 1</a>" in html and "aspect-ratio:100/50" in html
+        with pytest.raises(ValueError):
+            Report(embed="zip")
+        with pytest.raises(TypeError):
+            Report().add(42)
+
+
+def _report_without_toc():
+    from glyphx import Report
+    return Report(toc=False).add("<svg></svg>")
+
+
+# ============================================================
+# Rasterizer
+# ============================================================
+
+def _decode_png(data):
+    """Pixels of a PNG written by encode_png (8-bit, Up filter)."""
+    import struct
+    import zlib
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, idat, header = 8, b"", None
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos:pos + 4])
+        kind, body = data[pos + 4:pos + 8], data[pos + 8:pos + 8 + length]
+        crc = struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])[0]
+        assert crc == zlib.crc32(kind + body) & 0xFFFFFFFF
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif kind == b"IDAT":
+            idat += body
+        pos += 12 + length
+    w, h, _, color_type, *_ = header
+    channels = 4 if color_type == 6 else 3
+    rows = np.frombuffer(zlib.decompress(idat), np.uint8).reshape(h, -1)
+    assert (rows[:, 0] == 2).all()
+    return np.cumsum(rows[:, 1:], axis=0, dtype=np.uint8).reshape(h, w, channels)
+
+
+def _svg(body, w=40, h=20):
+    return f'<svg width="{w}" height="{h}" xmlns="http://www.w3.org/2000/svg">{body}</svg>'
+
+
+class TestRasterizer:
+
+    def test_png_round_trip(self):
+        from glyphx.raster import encode_png
+        rng = np.random.default_rng(0)
+        for shape in ((7, 5, 4), (3, 9, 3)):
+            pixels = rng.integers(0, 256, shape, dtype=np.uint8)
+            assert np.array_equal(_decode_png(encode_png(pixels)), pixels)
+        with pytest.raises(ValueError):
+            encode_png(np.zeros((4, 4)))
+
+    def test_rect_coverage_is_exact(self):
+        from glyphx.raster import rasterize
+        a = rasterize(_svg('<rect x="2.5" y="4" width="10" height="6" fill="#ff0000"/>'))
+        assert a.shape == (20, 40, 4)
+        assert (a[4:10, 3:12] == (255, 0, 0, 255)).all()
+        assert abs(int(a[6, 2, 3]) - 128) <= 1 and abs(int(a[6, 12, 3]) - 128) <= 1
+        assert a[3, :, 3].max() == 0 and a[10, :, 3].max() == 0
+        assert rasterize(_svg(""), scale=2).shape == (40, 80, 4)
+
+    def test_fill_rules_and_opacity(self):
+        from glyphx.raster import rasterize
+        # Outer square and inner square drawn in the same direction
+        d = "M0,0H20V20H0Z M5,5H15V15H5Z"
+        nonzero = rasterize(_svg(f'<path d="{d}" fill="#000"/>'))
+        evenodd = rasterize(_svg(f'<path d="{d}" fill="#000" fill-rule="evenodd"/>'))
+        assert nonzero[10, 10, 3] == 255 and evenodd[10, 10, 3] == 0
+        assert evenodd[2, 2, 3] == 255
+        half = rasterize(_svg('<g opacity="0.5"><rect width="10" height="10" '
+                              'fill="#00f" fill-opacity="0.5"/></g>'))
+        assert abs(int(half[5, 5, 3]) - 64) <= 1 and tuple(half[5, 5, :3]) == (0, 0, 255)
+
+    def test_strokes_dashes_and_curves(self):
+        from glyphx.raster import rasterize
+        solid = rasterize(_svg('<line x1="0" y1="10" x2="40" y2="10" stroke="#000" stroke-width="2"/>'))
+        assert (solid[9:11, :, 3] == 255).all() and solid[8, :, 3].max() == 0
+        dashed = rasterize(_svg('<line x1="0" y1="10" x2="40" y2="10" stroke="#000" '
+                                'stroke-width="2" stroke-dasharray="4,4"/>'))
+        assert (dashed[10, 1:3, 3] == 255).all() and dashed[10, 5:7, 3].max() == 0
+        circle = rasterize(_svg('<circle cx="10" cy="10" r="8" fill="#000"/>'))
+        arcs = rasterize(_svg('<path d="M2,10a8,8 0 1,0 16,0a8,8 0 1,0 -16,0Z" fill="#000"/>'))
+        assert np.abs(circle.astype(int) - arcs.astype(int)).max() <= 12
+        assert abs(circle[..., 3].sum() / 255 - np.pi * 64) < 1
+
+    def test_use_classes_and_transforms(self):
+        from glyphx.raster import rasterize
+        body = ('<style>:where(#c) .g0{fill:#00ff00}</style>'
+                '<defs><rect id="m" x="-2" y="-2" width="4" height="4"/></defs>'
+                '<g transform="translate(20,0)"><use href="#m" x="5" y="10" class="g0"/></g>')
+        a = rasterize(_svg(body))
+        assert tuple(a[10, 25]) == (0, 255, 0, 255)
+        assert a[10, 5, 3] == 0
+
+    def test_text_anchor_and_rotation(self):
+        from glyphx.raster import rasterize
+        start  = rasterize(_svg('<text x="20" y="15" font-size="10">Hi</text>', h=30))
+        middle = rasterize(_svg('<text x="20" y="15" font-size="10" text-anchor="middle">Hi</text>', h=30))
+        cols_s = np.flatnonzero(start[..., 3].max(axis=0))
+        cols_m = np.flatnonzero(middle[..., 3].max(axis=0))
+        assert cols_s.min() >= 20 and cols_m.min() < 20 < cols_m.max()
+        rows = np.flatnonzero(start[..., 3].max(axis=1))
+        assert rows.min() >= 7 and rows.max() <= 15
+        rotated = rasterize(_svg('<text x="20" y="20" font-size="10" '
+                                 'transform="rotate(-90, 20, 20)">Hello</text>', h=40))
+        r_rows = np.flatnonzero(rotated[..., 3].max(axis=1))
+        r_cols = np.flatnonzero(rotated[..., 3].max(axis=0))
+        assert len(r_rows) > len(r_cols)       # runs bottom to top
+
+    def test_figure_png_without_cairosvg(self, tmp_path, monkeypatch):
+        from glyphx.raster import rasterize
+        monkeypatch.setitem(_sys.modules, "cairosvg", None)
+        fig = Figure(width=320, height=200, title="Raster", auto_display=False)
+        fig.add(BarSeries(["a", "b", "c"], [3, 5, 2]))
+        out = tmp_path / "chart.png"
+        fig.save(str(out), dpi=192)
+        pixels = _decode_png(out.read_bytes())
+        assert pixels.shape == (400, 640, 4)
+        assert np.array_equal(pixels, rasterize(fig.render_svg(), scale=2))
+        with pytest.raises(RuntimeError, match="cairosvg"):
+            fig.save(str(tmp_path / "chart.jpg"))
+
+
+# ============================================================
+# Batch export
+# ============================================================
+
+def _small_figs(n=4):
+    figs = []
+    for i in range(n):
+        fig = Figure(width=160, height=120, title=f"F{i}", auto_display=False)
+        fig.add(BarSeries(["a", "b"], [i + 1, 2]))
+        figs.append(fig)
+    return figs
+
+
+class TestBatchExport:
+
+    def test_inline_bytes_match_single_render(self):
+        from glyphx.export import rasterize_many
+        from glyphx.raster import svg_to_png
+        svgs = [f.render_svg() for f in _small_figs(3)]
+        pngs = rasterize_many(svgs, workers=0, dpi=192, backend="builtin")
+        assert pngs == [svg_to_png(s, scale=2) for s in svgs]
+        assert _decode_png(pngs[0]).shape == (240, 320, 4)
+
+    def test_pool_writes_files_in_order(self, tmp_path):
+        from glyphx.export import rasterize_many
+        from glyphx.raster import rasterize
+        svgs  = [f.render_svg() for f in _small_figs(5)]
+        items = [(svg, str(tmp_path / f"c{i}.png")) for i, svg in enumerate(svgs)]
+        paths = rasterize_many(items, workers=2, backend="builtin")
+        assert paths == [p for _, p in items]
+        for svg, path in items:
+            with open(path, "rb") as f:
+                assert np.array_equal(_decode_png(f.read()), rasterize(svg))
+
+    def test_pool_bounds_items_in_flight(self):
+        from glyphx.export import iter_rasterize
+        svg = _small_figs(1)[0].render_svg()
+        consumed = []
+
+        def items():
+            for i in range(10):
+                consumed.append(i)
+                yield svg
+
+        results = iter_rasterize(items(), workers=2, max_pending=3, backend="builtin")
+        next(results)
+        assert len(consumed) <= 4
+        assert len(list(results)) == 9 and len(consumed) == 10
+
+    def test_backend_validation(self, monkeypatch):
+        from glyphx.export import rasterize_many
+        with pytest.raises(ValueError):
+            rasterize_many(["<svg></svg>"], workers=0, backend="skia")
+        with pytest.raises(TypeError):
+            rasterize_many([42], workers=0)
+        monkeypatch.setitem(_sys.modules, "cairosvg", None)
+        with pytest.raises(RuntimeError, match="cairosvg"):
+            rasterize_many(["<svg></svg>"], workers=0, backend="cairosvg")
+        assert rasterize_many(['<svg width="4" height="4"></svg>'], workers=0)[0][:4] == b"\x89PNG"
+
+    def test_build_pptx(self, tmp_path):
+        from glyphx.export import build_pptx
+        out = str(tmp_path / "deck.pptx")
+        try:
+            import pptx
+        except ImportError:
+            with pytest.raises(RuntimeError, match="python-pptx"):
+                build_pptx(_small_figs(2), out, workers=0)
+            return
+        build_pptx(_small_figs(3), out, workers=2, backend="builtin")
+        deck = pptx.Presentation(out)
+        assert len(deck.slides) == 3
+        texts = [sh.text_frame.text for sh in deck.slides[2].shapes if sh.has_text_frame]
+        assert "F2" in texts
+
+
+# ============================================================
+# Chart server
+# ============================================================
+
+import contextlib
+import http.client
+import json
+
+
+@contextlib.contextmanager
+def _serving(**kwargs):
+    """Run a ChartServer on a free localhost port in a background loop."""
+    import asyncio
+    import threading
+    from glyphx.serve import ChartServer
+    server = ChartServer(port=0, **kwargs)
+    loop   = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result(60)
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(30)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+        loop.close()
+
+
+def _request(server, method, path, body=None, headers=None, conn=None):
+    conn = conn or http.client.HTTPConnection(server.host, server.port, timeout=30)
+    if isinstance(body, dict):
+        body = json.dumps(body)
+    conn.request(method, path, body=body, headers=headers or {})
+    resp = conn.getresponse()
+    return resp.status, resp, resp.read()
+
+
+_SPEC = {"kind": "bar", "x": ["a", "b", "c"], "y": [3, 5, 2], "title": "Q1",
+         "width": 200, "height": 150}
+
+
+class TestChartServer:
+
+    def test_figure_from_spec(self):
+        from glyphx.serve import figure_from_spec, render_spec
+        fig = figure_from_spec({
+            "title": "Mixed", "theme": "dark", "xlabel": "Month",
+            "series": [{"kind": "bar", "x": ["Jan", "Feb"], "y": [1, 2], "label": "a"},
+                       {"kind": "line", "x": ["Jan", "Feb"], "y": [2, 1], "label": "b"}]})
+        assert len(fig.series) == 2 and fig.axes.xlabel == "Month"
+        assert render_spec({"kind": "pie", "values": [1, 2], "labels": ["x", "y"]}).startswith(b"<svg")
+        for bad in ({"kind": "nope", "y": [1]}, {"y": []}, {"x": [1, 2], "y": [1]},
+                    {"y": [1], "theme": "neon"}, {"y": [1], "width": 10 ** 6}, []):
+            with pytest.raises(ValueError):
+                figure_from_spec(bad)
+
+    def test_render_formats_and_cache(self):
+        with _serving(workers=0) as server:
+            conn = http.client.HTTPConnection(server.host, server.port, timeout=30)
+            status, resp, svg = _request(server, "POST", "/render", _SPEC, conn=conn)
+            assert status == 200 and resp.getheader("X-Cache") == "miss"
+            assert resp.getheader("Content-Type") == "image/svg+xml"
+            assert svg.startswith(b"<svg")
+            # Same connection (keep-alive), key order irrelevant -> cache hit
+            reordered = dict(reversed(list(_SPEC.items())))
+            status, resp, again = _request(server, "POST", "/render", reordered, conn=conn)
+            assert resp.getheader("X-Cache") == "hit" and again == svg
+            etag = resp.getheader("ETag")
+            assert etag.startswith('W/"')      # bytes differ per render (chart uuid)
+            status, _, body = _request(server, "POST", "/render", _SPEC,
+                                       headers={"If-None-Match": etag}, conn=conn)
+            assert status == 304 and body == b""
+            status, _, _ = _request(server, "POST", "/render", _SPEC, conn=conn,
+                                    headers={"If-None-Match": f'"x", {etag[2:]}'})
+            assert status == 304
+
+            status, resp, png = _request(server, "POST", "/render?format=png",
+                                         dict(_SPEC, scale=2))
+            assert status == 200 and resp.getheader("Content-Type") == "image/png"
+            assert _decode_png(png).shape == (300, 400, 4)
+            status, resp, html = _request(server, "POST", "/render",
+                                          dict(_SPEC, format="html"))
+            assert status == 200 and b"<svg" in html and b"<html" in html.lower()
+            assert server.hits == 1 and server.misses == 3
+
+    def test_error_statuses(self):
+        with _serving(workers=0, max_body=1024) as server:
+            assert _request(server, "POST", "/render", "{not json")[0] == 400
+            status, _, body = _request(server, "POST", "/render", {"kind": "nope", "y": [1]})
+            assert status == 400 and b"Unknown chart kind" in body
+            assert _request(server, "POST", "/render?format=gif", _SPEC)[0] == 400
+            assert _request(server, "GET", "/nowhere")[0] == 404
+            status, resp, _ = _request(server, "GET", "/render")
+            assert status == 405 and resp.getheader("Allow") == "POST"
+            assert _request(server, "POST", "/render", {"y": list(range(500))})[0] == 413
+            status, _, body = _request(server, "GET", "/healthz")
+            assert status == 200 and body == b"ok\n"
+            assert len(server.cache) == 0
+
+    def test_timeout_returns_504(self):
+        rng  = np.random.default_rng(0)
+        spec = {"kind": "scatter", "x": rng.random(20_000).tolist(),
+                "y": rng.random(20_000).tolist()}
+        with _serving(workers=0, timeout=1e-4) as server:
+            status, _, body = _request(server, "POST", "/render", spec)
+            assert status == 504 and b"exceeded" in body
+            assert server.timeouts == 1
+
+    def test_metrics_exposition(self):
+        with _serving(workers=0) as server:
+            for _ in range(3):
+                _request(server, "POST", "/render", _SPEC)
+            _request(server, "GET", "/nowhere")
+            status, resp, body = _request(server, "GET", "/metrics")
+            assert status == 200 and resp.getheader("Content-Type").startswith("text/plain")
+        text = body.decode()
+        assert "glyphx_cache_hits_total 2" in text
+        assert "glyphx_cache_misses_total 1" in text
+        assert "glyphx_cache_hit_ratio 0.666667" in text
+        assert 'glyphx_requests_total{path="/render",status="200"} 3' in text
+        assert 'glyphx_requests_total{path="other",status="404"} 1' in text
+        buckets = [int(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+                   if line.startswith('glyphx_request_duration_seconds_bucket{path="/render"')]
+        assert buckets == sorted(buckets) and buckets[-1] == 3
+        assert 'glyphx_render_duration_seconds_count{format="svg"} 1' in text
+
+    def test_work_budget_rejects_oversized_specs(self):
+        with _serving(workers=0, max_points=1000, max_pixels=1000 * 1000) as server:
+            status, _, body = _request(server, "POST", "/render", {"y": list(range(1001))})
+            assert status == 413 and b"work budget" in body
+            huge_png = dict(_SPEC, width=8192, height=8192, scale=8)
+            assert _request(server, "POST", "/render?format=png", huge_png)[0] == 413
+            # The same spec is fine as SVG: only PNGs pay for pixels
+            assert _request(server, "POST", "/render", huge_png)[0] == 200
+            assert server.rejected == 2 and server.misses == 1
+            assert _request(server, "POST", "/render", "[" * 100_000)[0] == 400
+
+    def test_work_budget_counts_histogram_bins(self):
+        from glyphx.serve import _spec_cost
+        hist = {"kind": "hist", "y": [1, 2, 3], "bins": 1_000_000}
+        assert _spec_cost(hist, "svg")[0] == 1_000_003
+        with _serving(workers=0) as server:
+            status, _, body = _request(server, "POST", "/render", hist)
+            assert status == 413 and b"work budget" in body
+            assert _request(server, "POST", "/render", dict(hist, bins=1e400))[0] == 413
+            for bins in (0, float("nan"), "many", True):
+                assert _request(server, "POST", "/render", dict(hist, bins=bins))[0] == 400
+            assert _request(server, "POST", "/render", dict(hist, bins=4))[0] == 200
+
+    def test_stalled_body_times_out(self, monkeypatch):
+        import socket
+        import glyphx.serve
+        monkeypatch.setattr(glyphx.serve, "_IDLE_TIMEOUT", 0.3)
+        with _serving(workers=0) as server:
+            with socket.create_connection((server.host, server.port), timeout=10) as sock:
+                sock.sendall(b"POST /render HTTP/1.1\r\nHost: x\r\n"
+                             b"Content-Length: 100000\r\n\r\n{\"kind\":")
+                reply = b""
+                while chunk := sock.recv(4096):
+                    reply += chunk
+            assert reply.startswith(b"HTTP/1.1 408 ") and b"Connection: close" in reply
+            assert not server._clients
+
+    def test_pool_rebuilt_after_worker_dies(self):
+        import signal
+        with _serving(workers=1) as server:
+            assert _request(server, "POST", "/render", _SPEC)[0] == 200
+            pool = server._pool
+            for proc in list(pool._processes.values()):
+                _os.kill(proc.pid, signal.SIGKILL)
+                proc.join(10)
+            for i in range(3):
+                status, _, body = _request(server, "POST", "/render", dict(_SPEC, title=f"T{i}"))
+                assert status == 200 and body.startswith(b"<svg")
+            assert server._pool is not pool and server.pool_restarts == 1
+            _, _, metrics = _request(server, "GET", "/metrics")
+            assert b"glyphx_pool_restarts_total 1" in metrics
+
+    def test_lru_cache_bounds(self):
+        from glyphx.serve import _LRUCache
+        cache = _LRUCache(max_entries=2, max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        assert cache.get("a") == b"1234"          # "a" now most recent
+        cache.put("c", b"1234")                   # evicts "b" by count
+        assert cache.get("b") is None and len(cache) == 2
+        cache.put("d", b"12345678")               # evicts by bytes
+        assert cache.nbytes <= 10 and cache.get("d") is not None
+        cache.put("huge", b"x" * 11)              # larger than the cache: skipped
+        assert cache.get("huge") is None and cache.evictions == 3
+
+    def test_process_pool_coalesces_identical_requests(self):
+        from concurrent.futures import ThreadPoolExecutor
+        spec = dict(_SPEC, title="Pool")
+        with _serving(workers=1) as server:
+            with ThreadPoolExecutor(4) as ex:
+                results = list(ex.map(lambda _: _request(server, "POST", "/render", spec),
+                                      range(4)))
+            assert all(status == 200 for status, _, _ in results)
+            assert len({body for _, _, body in results}) == 1
+            assert server.misses == 1 and server.hits == 3
+            states = sorted(resp.getheader("X-Cache") for _, resp, _ in results)
+            assert states.count("miss") == 1
@@ -139,7 +139,7 @@ class TestECDF:
         from glyphx.ecdf import ECDFSeries
         data = [3,1,4,1,5,9,2,6]
         s    = ECDFSeries(data)
-        assert s.x == sorted(data)
+        assert list(s.x) == sorted(data)
 
     def test_ecdf_y_range(self):
         from glyphx.ecdf import ECDFSeries
@@ -455,7 +455,7 @@ class TestStreaming:
         for i in range(10):
             s.push(float(i))
         assert len(s.x) == 5
-        assert s.y == [5.0, 6.0, 7.0, 8.0, 9.0]
+        assert list(s.y) == [5.0, 6.0, 7.0, 8.0, 9.0]
 
     def test_streaming_push_many(self):
         from glyphx.streaming import StreamingSeries